@@ -284,6 +284,15 @@ CIRCUIT_BREAKER_SUCCESS_THRESHOLD = 3
 STREAMING_METRICS_TTL = 3600
 STREAMING_METRICS_WINDOW = 300
 
+# ================================================================================
+# DEFAULT LOGGING SETTINGS
+# ================================================================================
+
+# dictConfig plus optional queue-based handlers (services.core.logging)
+LOGGING_CONFIG = "services.core.logging.configure_logging"
+# Run log redaction, formatting and IO on a listener thread instead of the caller
+LOGGING_ASYNC_HANDLERS = os.environ.get("LOGGING_ASYNC_HANDLERS", "False").lower() == "true"
+
 # ================================================================================
 # ACCOUNT STATE SETTINGS
 # ================================================================================
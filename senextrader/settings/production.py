@@ -240,6 +240,7 @@ STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
 # ================================================================================
 
 LOGGING = copy.deepcopy(BASE_LOGGING)
+LOGGING_ASYNC_HANDLERS = os.environ.get("LOGGING_ASYNC_HANDLERS", "True").lower() == "true"
 
 if CONTAINER_MODE:
     # Container mode: Log to stdout/stderr only (Docker/Kubernetes best practice)
@@ -7,6 +7,7 @@ from django.utils import timezone
 from django.utils.dateparse import parse_datetime
 
 from services.core.cache import CacheManager, CacheTTL
+from services.core.cache_index import set_tracked
 from services.core.logging import get_logger
 from services.core.utils.async_utils import run_async
 
@@ -126,7 +127,9 @@ class AccountStateService:
                 "stale": False,
                 "available": True,
             }
-            cache.set(cache_key, sdk_data, self.cache_ttl)
+            set_tracked(
+                CacheManager.account_state_family(user.id), cache_key, sdk_data, self.cache_ttl
+            )
             return self._normalize_state(sdk_data)
 
         except Exception as e:
@@ -11,184 +11,160 @@ Strategy:
 - 0-30 days: 1-second resolution (raw streaming data)
 - 30 days - 1 year: 1-minute resolution (aggregated)
 - 1+ years: 5-minute resolution (aggregated)
+
+Design:
+- Set-based: each bucket keeps the last value in it, written with one
+  INSERT ... SELECT DISTINCT ON ... ON CONFLICT per chunk on PostgreSQL,
+  followed by one DELETE of the rows that are not on a bucket boundary
+- Chunked: one time window (GREEKS_ROLLUP_CHUNK_SECONDS) per transaction, so
+  locks are short and a failure only rolls back the current chunk
+- Resumable: the end of the last committed chunk is checkpointed per
+  resolution and the next run starts there; losing the checkpoint only costs
+  a rescan, since re-rolling an already rolled-up window is a no-op
+- Other databases (SQLite in development) use a batched ORM fallback with the
+  same semantics
+- dry_run=True returns a size estimate for the pending work without writing
 """
 
-from datetime import timedelta
+import math
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
-from django.db import transaction
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Count, Min
 from django.utils import timezone
 
+from services.core.cache import CacheManager
+from services.core.constants import GREEKS_ROLLUP_BATCH_SIZE, GREEKS_ROLLUP_CHUNK_SECONDS
 from services.core.logging import get_logger
 from trading.models import HistoricalGreeks
 
 logger = get_logger(__name__)
 
+# Columns copied from the last row of each bucket
+GREEKS_VALUE_FIELDS = (
+    "underlying_symbol",
+    "delta",
+    "gamma",
+    "theta",
+    "vega",
+    "rho",
+    "implied_volatility",
+    "strike",
+    "expiration_date",
+    "option_type",
+)
+
+
+@dataclass(frozen=True)
+class GreeksRollup:
+    """One step of the progressive compression."""
+
+    resolution: str
+    bucket_seconds: int
+    min_age: timedelta
+
 
-def aggregate_greeks_to_1min() -> dict[str, Any]:
+ONE_MINUTE_ROLLUP = GreeksRollup("1min", 60, timedelta(days=30))
+FIVE_MINUTE_ROLLUP = GreeksRollup("5min", 300, timedelta(days=365))
+
+
+def aggregate_greeks_to_1min(
+    dry_run: bool = False, max_chunks: int | None = None
+) -> dict[str, Any]:
     """
     Aggregate HistoricalGreeks older than 30 days to 1-minute resolution.
 
     Process:
-    1. Find records 30+ days old
-    2. Group by (option_symbol, minute)
+    1. Find records 30+ days old (resuming from the last checkpoint)
+    2. Group by (option_symbol, minute), one chunk of time at a time
     3. Take last value in each minute (representative sample)
-    4. Replace with 1-minute aggregated records
+    4. Upsert the 1-minute aggregated records
     5. Delete original 1-second records
 
     Returns:
         Dict with status and statistics
     """
-    try:
-        cutoff_date = timezone.now() - timedelta(days=30)
-
-        # Get distinct option symbols that need aggregation
-        symbols_to_aggregate = list(
-            HistoricalGreeks.objects.filter(timestamp__lt=cutoff_date)
-            .values_list("option_symbol", flat=True)
-            .distinct()
-        )
+    return rollup_greeks(ONE_MINUTE_ROLLUP, dry_run=dry_run, max_chunks=max_chunks)
 
-        total_aggregated = 0
-        total_deleted = 0
 
-        for option_symbol in symbols_to_aggregate:
-            with transaction.atomic():
-                # Get all records for this symbol older than 30 days
-                old_records = HistoricalGreeks.objects.filter(
-                    option_symbol=option_symbol, timestamp__lt=cutoff_date
-                ).order_by("timestamp")
-
-                # Group by minute and take the last record in each minute
-                minute_records = {}
-                for record in old_records.iterator():
-                    # Truncate to minute
-                    record_minute = record.timestamp.replace(second=0, microsecond=0)
-                    # Keep last record for each minute (overwrites previous)
-                    minute_records[record_minute] = record
-
-                # Create new 1-minute resolution records
-                for minute_ts, last_record in minute_records.items():
-                    HistoricalGreeks.objects.update_or_create(
-                        option_symbol=last_record.option_symbol,
-                        timestamp=minute_ts,
-                        defaults={
-                            "underlying_symbol": last_record.underlying_symbol,
-                            "delta": last_record.delta,
-                            "gamma": last_record.gamma,
-                            "theta": last_record.theta,
-                            "vega": last_record.vega,
-                            "rho": last_record.rho,
-                            "implied_volatility": last_record.implied_volatility,
-                            "strike": last_record.strike,
-                            "expiration_date": last_record.expiration_date,
-                            "option_type": last_record.option_type,
-                        },
-                    )
-                    total_aggregated += 1
-
-                # Delete original 1-second records
-                deleted_count, _ = old_records.delete()
-                total_deleted += deleted_count
-
-        logger.info(
-            f"Aggregated to 1-min: {total_aggregated} minutes from {total_deleted} second-level records",
-            extra={
-                "aggregated_count": total_aggregated,
-                "deleted_count": total_deleted,
-                "symbols_processed": len(symbols_to_aggregate),
-            },
-        )
+def aggregate_greeks_to_5min(
+    dry_run: bool = False, max_chunks: int | None = None
+) -> dict[str, Any]:
+    """
+    Aggregate HistoricalGreeks older than 1 year to 5-minute resolution.
 
-        return {
-            "status": "success",
-            "aggregated": total_aggregated,
-            "deleted": total_deleted,
-            "symbols_processed": len(symbols_to_aggregate),
-        }
+    Same process as aggregate_greeks_to_1min with 5-minute intervals
+    (0, 5, 10, ...) replacing the 1-minute records.
 
-    except Exception as e:
-        logger.error(f"Error aggregating Greeks to 1min: {e}", exc_info=True)
-        return {"status": "error", "message": str(e)}
+    Returns:
+        Dict with status and statistics
+    """
+    return rollup_greeks(FIVE_MINUTE_ROLLUP, dry_run=dry_run, max_chunks=max_chunks)
 
 
-def aggregate_greeks_to_5min() -> dict[str, Any]:
+def rollup_greeks(
+    rollup: GreeksRollup, *, dry_run: bool = False, max_chunks: int | None = None
+) -> dict[str, Any]:
     """
-    Aggregate HistoricalGreeks older than 1 year to 5-minute resolution.
+    Roll HistoricalGreeks older than rollup.min_age up to rollup.bucket_seconds.
 
-    Process:
-    1. Find 1-min records 1+ years old
-    2. Group by (option_symbol, 5-minute interval)
-    3. Take last value in each 5-minute interval
-    4. Replace with 5-minute aggregated records
-    5. Delete original 1-minute records
+    Args:
+        rollup: Resolution step to run
+        dry_run: Only estimate the pending work
+        max_chunks: Stop after this many chunks; the next run resumes from the checkpoint
 
     Returns:
-        Dict with status and statistics
+        Dict with status and statistics ("complete" is False when max_chunks cut the run short)
     """
     try:
-        cutoff_date = timezone.now() - timedelta(days=365)
-
-        # Get distinct option symbols that need aggregation
-        symbols_to_aggregate = list(
-            HistoricalGreeks.objects.filter(timestamp__lt=cutoff_date)
-            .values_list("option_symbol", flat=True)
-            .distinct()
+        cutoff = _floor(timezone.now() - rollup.min_age, rollup.bucket_seconds)
+        checkpoint = _get_checkpoint(rollup)
+        start = _pending_start(checkpoint, cutoff)
+
+        if dry_run:
+            return _estimate(rollup, start, cutoff)
+
+        if start is None:
+            logger.info(f"Greeks rollup to {rollup.resolution}: nothing pending")
+            return {
+                "status": "success",
+                "aggregated": 0,
+                "deleted": 0,
+                "chunks": 0,
+                "complete": True,
+            }
+
+        roll_chunk = (
+            _rollup_chunk_sql if connection.vendor == "postgresql" else _rollup_chunk_batched
         )
 
         total_aggregated = 0
         total_deleted = 0
-
-        for option_symbol in symbols_to_aggregate:
+        chunks = 0
+        complete = True
+        for chunk_start, chunk_end in _chunk_windows(start, cutoff):
+            if max_chunks is not None and chunks >= max_chunks:
+                complete = False
+                break
             with transaction.atomic():
-                # Get all 1-min records for this symbol older than 1 year
-                # (identified by having second=0, microsecond=0)
-                old_records = HistoricalGreeks.objects.filter(
-                    option_symbol=option_symbol, timestamp__lt=cutoff_date
-                ).order_by("timestamp")
-
-                # Group by 5-minute intervals and take the last record in each
-                interval_records = {}
-                for record in old_records.iterator():
-                    # Truncate to 5-minute intervals (0, 5, 10, 15, ...)
-                    minute = record.timestamp.minute
-                    interval_minute = (minute // 5) * 5
-                    record_interval = record.timestamp.replace(
-                        minute=interval_minute, second=0, microsecond=0
-                    )
-                    # Keep last record for each interval (overwrites previous)
-                    interval_records[record_interval] = record
-
-                # Create new 5-minute resolution records
-                for interval_ts, last_record in interval_records.items():
-                    HistoricalGreeks.objects.update_or_create(
-                        option_symbol=last_record.option_symbol,
-                        timestamp=interval_ts,
-                        defaults={
-                            "underlying_symbol": last_record.underlying_symbol,
-                            "delta": last_record.delta,
-                            "gamma": last_record.gamma,
-                            "theta": last_record.theta,
-                            "vega": last_record.vega,
-                            "rho": last_record.rho,
-                            "implied_volatility": last_record.implied_volatility,
-                            "strike": last_record.strike,
-                            "expiration_date": last_record.expiration_date,
-                            "option_type": last_record.option_type,
-                        },
-                    )
-                    total_aggregated += 1
-
-                # Delete original 1-minute records
-                deleted_count, _ = old_records.delete()
-                total_deleted += deleted_count
+                aggregated, deleted = roll_chunk(rollup, chunk_start, chunk_end)
+            cache.set(CacheManager.greeks_rollup_checkpoint(rollup.resolution), chunk_end, None)
+            total_aggregated += aggregated
+            total_deleted += deleted
+            chunks += 1
 
         logger.info(
-            f"Aggregated to 5-min: {total_aggregated} intervals from {total_deleted} 1-min records",
+            f"Aggregated to {rollup.resolution}: {total_aggregated} buckets from "
+            f"{total_deleted} higher-resolution records in {chunks} chunks",
             extra={
                 "aggregated_count": total_aggregated,
                 "deleted_count": total_deleted,
-                "symbols_processed": len(symbols_to_aggregate),
+                "chunks": chunks,
+                "complete": complete,
             },
         )
 
@@ -196,9 +172,134 @@ def aggregate_greeks_to_5min() -> dict[str, Any]:
             "status": "success",
             "aggregated": total_aggregated,
             "deleted": total_deleted,
-            "symbols_processed": len(symbols_to_aggregate),
+            "chunks": chunks,
+            "resumed_from": checkpoint.isoformat() if checkpoint else None,
+            "complete": complete,
         }
 
     except Exception as e:
-        logger.error(f"Error aggregating Greeks to 5min: {e}", exc_info=True)
+        logger.error(f"Error aggregating Greeks to {rollup.resolution}: {e}", exc_info=True)
         return {"status": "error", "message": str(e)}
+
+
+def _get_checkpoint(rollup: GreeksRollup) -> datetime | None:
+    return cache.get(CacheManager.greeks_rollup_checkpoint(rollup.resolution))
+
+
+def _pending_start(checkpoint: datetime | None, cutoff: datetime) -> datetime | None:
+    """Oldest row still to roll up, skipping everything before the checkpoint."""
+    pending = HistoricalGreeks.objects.filter(timestamp__lt=cutoff)
+    if checkpoint is not None:
+        pending = pending.filter(timestamp__gte=checkpoint)
+    return pending.aggregate(oldest=Min("timestamp"))["oldest"]
+
+
+def _floor(value: datetime, seconds: int) -> datetime:
+    epoch = math.floor(value.timestamp() / seconds) * seconds
+    return datetime.fromtimestamp(epoch, tz=UTC)
+
+
+def _chunk_windows(start: datetime, end: datetime) -> Iterator[tuple[datetime, datetime]]:
+    """Chunk-aligned [start, end) windows; chunk size is a multiple of every bucket size."""
+    chunk_start = _floor(start, GREEKS_ROLLUP_CHUNK_SECONDS)
+    step = timedelta(seconds=GREEKS_ROLLUP_CHUNK_SECONDS)
+    while chunk_start < end:
+        chunk_end = min(chunk_start + step, end)
+        yield chunk_start, chunk_end
+        chunk_start = chunk_end
+
+
+def _estimate(rollup: GreeksRollup, start: datetime | None, cutoff: datetime) -> dict[str, Any]:
+    """Size of the pending rollup, without touching the data."""
+    if start is None:
+        return {"status": "dry_run", "resolution": rollup.resolution, "rows": 0, "chunks": 0}
+
+    stats = HistoricalGreeks.objects.filter(timestamp__gte=start, timestamp__lt=cutoff).aggregate(
+        rows=Count("id"), symbols=Count("option_symbol", distinct=True)
+    )
+    span_buckets = math.ceil((cutoff - start).total_seconds() / rollup.bucket_seconds)
+    max_buckets = min(stats["rows"], stats["symbols"] * span_buckets)
+
+    return {
+        "status": "dry_run",
+        "resolution": rollup.resolution,
+        "window_start": start.isoformat(),
+        "window_end": cutoff.isoformat(),
+        "rows": stats["rows"],
+        "symbols": stats["symbols"],
+        "chunks": sum(1 for _ in _chunk_windows(start, cutoff)),
+        "max_buckets": max_buckets,
+        "min_rows_deleted": stats["rows"] - max_buckets,
+    }
+
+
+def _rollup_chunk_sql(rollup: GreeksRollup, start: datetime, end: datetime) -> tuple[int, int]:
+    """PostgreSQL: one upsert and one delete for the whole window."""
+    qn = connection.ops.quote_name
+    opts = HistoricalGreeks._meta
+    table = qn(opts.db_table)
+    symbol = qn(opts.get_field("option_symbol").column)
+    ts = qn(opts.get_field("timestamp").column)
+    values = [qn(opts.get_field(name).column) for name in GREEKS_VALUE_FIELDS]
+    bucket = f"to_timestamp(floor(extract(epoch FROM {ts}) / %s) * %s)"
+    value_list = ", ".join(values)
+    updates = ", ".join(f"{column} = EXCLUDED.{column}" for column in values)
+
+    # Identifiers come from model metadata; all values are bound parameters
+    upsert = (
+        f"INSERT INTO {table} ({symbol}, {ts}, {value_list}) "  # noqa: S608
+        f"SELECT DISTINCT ON ({symbol}, bucket) {symbol}, bucket, {value_list} "
+        f"FROM (SELECT *, {bucket} AS bucket FROM {table} "
+        f"WHERE {ts} >= %s AND {ts} < %s) AS src "
+        f"ORDER BY {symbol}, bucket, {ts} DESC "
+        f"ON CONFLICT ({symbol}, {ts}) DO UPDATE SET {updates}"
+    )
+    delete = f"DELETE FROM {table} WHERE {ts} >= %s AND {ts} < %s AND {ts} <> {bucket}"  # noqa: S608
+
+    seconds = rollup.bucket_seconds
+    with connection.cursor() as cursor:
+        cursor.execute(upsert, [seconds, seconds, start, end])
+        aggregated = cursor.rowcount
+        cursor.execute(delete, [start, end, seconds, seconds])
+        deleted = cursor.rowcount
+    return aggregated, deleted
+
+
+def _rollup_chunk_batched(rollup: GreeksRollup, start: datetime, end: datetime) -> tuple[int, int]:
+    """Portable fallback: stream the window once, upsert and delete in batches."""
+    rows = (
+        HistoricalGreeks.objects.filter(timestamp__gte=start, timestamp__lt=end)
+        .order_by("option_symbol", "timestamp")
+        .values_list("id", "option_symbol", "timestamp", *GREEKS_VALUE_FIELDS)
+        .iterator(chunk_size=GREEKS_ROLLUP_BATCH_SIZE)
+    )
+
+    latest: dict[tuple[str, datetime], tuple] = {}
+    stale_ids: list[int] = []
+    for row_id, option_symbol, timestamp, *values in rows:
+        bucket = _floor(timestamp, rollup.bucket_seconds)
+        # Ordered by timestamp, so the last row seen wins
+        latest[(option_symbol, bucket)] = values
+        if timestamp != bucket:
+            stale_ids.append(row_id)
+
+    HistoricalGreeks.objects.bulk_create(
+        [
+            HistoricalGreeks(
+                option_symbol=option_symbol,
+                timestamp=bucket,
+                **dict(zip(GREEKS_VALUE_FIELDS, values, strict=True)),
+            )
+            for (option_symbol, bucket), values in latest.items()
+        ],
+        batch_size=GREEKS_ROLLUP_BATCH_SIZE,
+        update_conflicts=True,
+        unique_fields=["option_symbol", "timestamp"],
+        update_fields=list(GREEKS_VALUE_FIELDS),
+    )
+
+    deleted = 0
+    for i in range(0, len(stale_ids), GREEKS_ROLLUP_BATCH_SIZE):
+        batch = stale_ids[i : i + GREEKS_ROLLUP_BATCH_SIZE]
+        deleted += HistoricalGreeks.objects.filter(id__in=batch).delete()[0]
+    return len(latest), deleted
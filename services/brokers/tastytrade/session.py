@@ -17,6 +17,7 @@ from services.core.exceptions import MissingSecretError
 from services.core.logging import get_logger
 
 from .session_helpers import SessionErrorType, categorize_error
+from .session_pool import session_pool
 
 logger = get_logger(__name__)
 
@@ -34,17 +35,17 @@ class TastyTradeSessionConfig:
 
 class TastyTradeSessionService:
     """
-    Service for managing TastyTrade SDK sessions with session-per-task pattern.
+    Service for managing TastyTrade SDK sessions.
 
     Handles:
-    - Fresh session creation for each task (no caching)
+    - Pooled session reuse per (user_id, is_test) via session_pool
     - OAuth authentication with TastyTrade API
     - Session validation and error handling
     - Enhanced logging for debugging event loop issues
 
     NOTE: This service previously used ClassVar caching which caused "Event loop is closed"
-    errors in production when Celery workers recycled. The session-per-task approach
-    eliminates this issue by creating fresh sessions for each task execution.
+    errors in production when Celery workers recycled. The session pool avoids this by
+    keeping one Session per event loop and sharing only the token between loops.
     """
 
     def __init__(self, config: TastyTradeSessionConfig | None = None, is_test: bool | None = None):
@@ -367,10 +368,11 @@ class TastyTradeSessionService:
         cls, user_id: int, refresh_token: str, is_test: bool = False
     ) -> dict:
         """
-        Create fresh session for user (session-per-task pattern).
+        Get a pooled session for user, creating one only on a miss.
 
         This is the main entry point for getting TastyTrade sessions.
-        Creates a new session for each call - NO CACHING.
+        Sessions are reused until shortly before their access token expires;
+        creation/refresh is single-flight per user (see session_pool).
 
         Args:
             user_id: User ID for logging/tracking
@@ -378,7 +380,8 @@ class TastyTradeSessionService:
             is_test: Whether to use test/cert environment (default: False for production)
 
         Returns:
-            Dict with success status, session, and error details if applicable
+            Dict with success status, session, and error details if applicable.
+            Successful results carry "validated": True (no re-validation needed).
         """
         import os
 
@@ -389,8 +392,8 @@ class TastyTradeSessionService:
         except RuntimeError:
             loop_id = None
 
-        logger.info(
-            f"Creating fresh session for user {user_id}",
+        logger.debug(
+            f"Getting session for user {user_id}",
             extra={
                 "user_id": user_id,
                 "is_test": is_test,
@@ -402,16 +405,17 @@ class TastyTradeSessionService:
             },
         )
 
-        # Create new session (no caching)
-        service = cls(is_test=is_test)
-        result = await service.create_session(refresh_token)
+        async def _create(token: str) -> dict:
+            return await cls(is_test=is_test).create_session(token)
+
+        result = await session_pool.acquire(user_id, refresh_token, is_test, _create)
 
         if result.get("success"):
-            logger.info(
-                f"Session created successfully for user {user_id}",
+            logger.debug(
+                f"Session ready for user {user_id}",
                 extra={"user_id": user_id, "worker_pid": os.getpid()},
             )
-            return {"success": True, "session": result.get("session")}
+            return {"success": True, "session": result.get("session"), "validated": True}
 
         # Handle persistent authentication failures
         error_type = result.get("error_type")
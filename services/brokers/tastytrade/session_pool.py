@@ -0,0 +1,232 @@
+"""
+TastyTrade Session Pool
+
+Per-process pool of OAuth sessions keyed by (user_id, is_test).
+
+Design:
+- Access tokens live ~15 minutes. A pooled session is reused until
+  SESSION_POOL_REFRESH_MARGIN seconds before its token expires, then
+  refreshed in place (one OAuth call, no re-validation)
+- Creation and refresh are single-flight per key: concurrent callers on the
+  same event loop await one in-flight future instead of each hitting the API
+- httpx clients are bound to the event loop that created them, so every loop
+  (ASGI loop, each Celery run_async loop) gets its own Session object. Loops
+  share the token via Session.serialize()/deserialize(), so a new loop does
+  not cost an OAuth round trip
+- Forked children (Celery prefork workers) start with an empty pool
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import os
+import time
+import weakref
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from tastytrade import Session
+
+from services.core.constants import SESSION_POOL_REFRESH_MARGIN, SESSION_TOKEN_LIFETIME
+from services.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+PoolKey = tuple[int, bool]
+SessionFactory = Callable[[str], Awaitable[dict]]
+
+
+@dataclass
+class _PoolEntry:
+    """Token state for one (user_id, is_test) plus a Session per event loop."""
+
+    refresh_token: str
+    expires_at: float
+    state: str | None = None
+    sessions: weakref.WeakKeyDictionary = field(default_factory=weakref.WeakKeyDictionary)
+
+
+def _token_expiry(session) -> float:
+    """Epoch seconds when the session's access token expires."""
+    expiration = getattr(session, "session_expiration", None)
+    if isinstance(expiration, datetime):
+        return expiration.timestamp()
+    if isinstance(expiration, int | float) and expiration > 0:
+        return float(expiration)
+    return time.time() + SESSION_TOKEN_LIFETIME
+
+
+def _serialize(session) -> str | None:
+    """Serialized token state for rehydrating on another loop, if supported."""
+    try:
+        state = session.serialize()
+    except Exception:
+        return None
+    return state if isinstance(state, str) else None
+
+
+async def _refresh(session) -> None:
+    """Force an access token refresh across SDK versions (a_refresh / async refresh)."""
+    if hasattr(session, "a_refresh"):
+        await session.a_refresh()
+        return
+    try:
+        result = session.refresh(force=True)
+    except TypeError:
+        result = session.refresh()
+    if inspect.isawaitable(result):
+        await result
+
+
+class TastyTradeSessionPool:
+    """Reuses validated OAuth sessions until shortly before their tokens expire."""
+
+    def __init__(self, refresh_margin: float = SESSION_POOL_REFRESH_MARGIN):
+        self.refresh_margin = refresh_margin
+        self._entries: dict[PoolKey, _PoolEntry] = {}
+        self._inflight: dict[tuple[PoolKey, int], asyncio.Future] = {}
+        self._reset_counters()
+
+    def _reset_counters(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.rehydrations = 0
+        self.failures = 0
+
+    async def acquire(
+        self, user_id: int, refresh_token: str, is_test: bool, factory: SessionFactory
+    ) -> dict:
+        """
+        Get a session for the user, creating or refreshing it at most once at a time.
+
+        Args:
+            user_id: User the session belongs to
+            refresh_token: Current OAuth refresh token (a change evicts the entry)
+            is_test: Whether the session targets the cert environment
+            factory: Coroutine function creating and validating a new session
+                from a refresh token; returns the create_session() result dict
+
+        Returns:
+            Dict in the create_session() format. Successful results include
+            "validated": True since pooled tokens are known to be unexpired.
+        """
+        key = (user_id, is_test)
+        loop = asyncio.get_running_loop()
+
+        session = self._lookup(key, refresh_token, loop)
+        if session is not None:
+            self.hits += 1
+            return {"success": True, "session": session, "validated": True}
+
+        flight_key = (key, id(loop))
+        inflight = self._inflight.get(flight_key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = loop.create_future()
+        self._inflight[flight_key] = future
+        try:
+            result = await self._load(key, refresh_token, loop, factory)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            result = {"success": False, "error": f"Session pool load failed: {e!s}"}
+        finally:
+            self._inflight.pop(flight_key, None)
+
+        future.set_result(result)
+        return result
+
+    def _lookup(self, key: PoolKey, refresh_token: str, loop) -> Session | None:
+        entry = self._entries.get(key)
+        if entry is None or entry.refresh_token != refresh_token:
+            return None
+        if time.time() >= entry.expires_at - self.refresh_margin:
+            return None
+
+        session = entry.sessions.get(loop)
+        if session is not None:
+            return session
+        if entry.state is None:
+            return None
+
+        try:
+            session = Session.deserialize(entry.state)
+        except Exception as e:
+            logger.debug(f"User {key[0]}: Could not rehydrate pooled session: {e}")
+            return None
+        entry.sessions[loop] = session
+        self.rehydrations += 1
+        return session
+
+    async def _load(self, key: PoolKey, refresh_token: str, loop, factory: SessionFactory) -> dict:
+        # Another caller may have populated the pool while this one waited
+        session = self._lookup(key, refresh_token, loop)
+        if session is not None:
+            self.hits += 1
+            return {"success": True, "session": session, "validated": True}
+
+        entry = self._entries.get(key)
+        if entry is not None and entry.refresh_token == refresh_token:
+            session = entry.sessions.get(loop)
+            if session is not None:
+                try:
+                    await _refresh(session)
+                    self.refreshes += 1
+                    self._store(key, refresh_token, session, loop)
+                    logger.debug(f"User {key[0]}: Refreshed pooled TastyTrade session")
+                    return {"success": True, "session": session, "validated": True}
+                except Exception as e:
+                    logger.info(f"User {key[0]}: Pooled session refresh failed ({e}), recreating")
+
+        self.misses += 1
+        result = await factory(refresh_token)
+        if result.get("success") and result.get("session") is not None:
+            self._store(key, refresh_token, result["session"], loop)
+            return {**result, "validated": True}
+
+        self.failures += 1
+        self._entries.pop(key, None)
+        return result
+
+    def _store(self, key: PoolKey, refresh_token: str, session, loop) -> None:
+        entry = _PoolEntry(
+            refresh_token=refresh_token,
+            expires_at=_token_expiry(session),
+            state=_serialize(session),
+        )
+        entry.sessions[loop] = session
+        self._entries[key] = entry
+
+    def invalidate(self, user_id: int, is_test: bool | None = None) -> None:
+        """Drop pooled sessions for a user (both environments unless is_test is given)."""
+        for key in [k for k in self._entries if k[0] == user_id]:
+            if is_test is None or key[1] == is_test:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._inflight.clear()
+        self._reset_counters()
+
+    def get_stats(self) -> dict:
+        lookups = self.hits + self.misses + self.refreshes
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "rehydrations": self.rehydrations,
+            "failures": self.failures,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "pid": os.getpid(),
+        }
+
+
+# Process-wide pool; sessions and sockets must not be inherited across fork
+session_pool = TastyTradeSessionPool()
+os.register_at_fork(after_in_child=session_pool.clear)
@@ -4,12 +4,15 @@ Centralized cache management for the entire Senex Trader application.
 This module provides:
 1. Cache TTL configuration (CacheTTL class)
 2. Cache key management (CacheManager class)
+3. Hit/miss/latency counters (CacheStats class)
 
 All cache keys use colon (:) as separators for consistency.
 """
 
 from datetime import date
 
+from django.utils import timezone
+
 
 class CacheTTL:
     """
@@ -46,6 +49,47 @@ class CacheTTL:
         return getattr(cls, category.upper(), cls.ACCOUNT_STATE)
 
 
+class CacheStats:
+    """Track cache operation statistics for monitoring."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.sets = 0
+        self.deletes = 0
+        self.batch_operations = 0
+        self.total_latency = 0.0
+        self.operation_count = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Calculate cache hit rate as percentage."""
+        total = self.hits + self.misses
+        return (self.hits / total * 100) if total > 0 else 0.0
+
+    @property
+    def average_latency(self) -> float:
+        """Calculate average operation latency in milliseconds."""
+        return (
+            (self.total_latency / self.operation_count * 1000) if self.operation_count > 0 else 0.0
+        )
+
+    def get_stats(self) -> dict[str, int | float]:
+        """Get all statistics as a dictionary."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "sets": self.sets,
+            "deletes": self.deletes,
+            "batch_operations": self.batch_operations,
+            "hit_rate": self.hit_rate,
+            "average_latency_ms": self.average_latency,
+            "total_operations": self.operation_count,
+        }
+
+
 class CacheManager:
     """Centralized cache key management for all operations."""
 
@@ -58,6 +102,7 @@ class CacheManager:
     DXFEED_PREFIX = "dxfeed"
     SESSION_PREFIX = "session"
     DATA_FETCH_PREFIX = "data_fetch"
+    INDEX_PREFIX = "cache_index"
 
     # Standard TTL values (seconds)
     SHORT_TTL = 300  # 5 minutes - real-time data
@@ -121,7 +166,7 @@ class CacheManager:
         Returns:
             Cache key string
         """
-        today = date.today()
+        today = timezone.localdate()
         return f"{CacheManager.OPTION_CHAIN_PREFIX}:{symbol}:{expiration}:{today}"
 
     @staticmethod
@@ -137,6 +182,22 @@ class CacheManager:
         """
         return f"{CacheManager.OPTION_CHAIN_PREFIX}:nested:{symbol}"
 
+    @staticmethod
+    def option_chain_snapshot(symbol: str) -> str:
+        """
+        Cache key for the compact all-expirations chain (OptionChainSnapshot bytes).
+
+        Includes current date suffix so a new trading day starts from a fresh chain.
+
+        Args:
+            symbol: Underlying symbol
+
+        Returns:
+            Cache key string
+        """
+        today = timezone.localdate()
+        return f"{CacheManager.OPTION_CHAIN_PREFIX}:snapshot:{symbol}:{today}"
+
     @staticmethod
     def option_chain_expirations(symbol: str) -> str:
         """
@@ -164,9 +225,25 @@ class CacheManager:
         Returns:
             Cache key string
         """
-        today = date.today()
+        today = timezone.localdate()
         return f"{CacheManager.OPTION_CHAIN_PREFIX}:{symbol}:dte_{target_dte}:{today}"
 
+    @staticmethod
+    def full_option_chain(symbol: str) -> str:
+        """
+        Cache key for the default-DTE strike chain used by options streaming.
+
+        Includes current date suffix to ensure midnight rollover invalidates cached chains.
+
+        Args:
+            symbol: Underlying symbol
+
+        Returns:
+            Cache key string
+        """
+        today = timezone.localdate()
+        return f"{CacheManager.OPTION_CHAIN_PREFIX}:full:{symbol}:{today}"
+
     # === DXFeed Streaming Keys ===
     @staticmethod
     def dxfeed_underlying(symbol: str) -> str:
@@ -208,6 +285,16 @@ class CacheManager:
         """Cache key for position status hash."""
         return f"position_status:{user_id}:{account_number}"
 
+    @staticmethod
+    def position_greeks(position_id: int) -> str:
+        """Cache key for short-lived per-position Greeks."""
+        return f"position_greeks_{position_id}"
+
+    @staticmethod
+    def portfolio_greeks(user_id: int) -> str:
+        """Cache key for short-lived per-user portfolio Greeks."""
+        return f"portfolio_greeks_{user_id}"
+
     # === Stream Manager Keys ===
     @staticmethod
     def stream_manager_health(user_id: int) -> str:
@@ -225,16 +312,59 @@ class CacheManager:
         """Cache key for historical price data."""
         return f"historical:{symbol}:{days}days"
 
+    @staticmethod
+    def technical_indicators(symbol: str) -> str:
+        """Cache key for a symbol's technical indicator record (one per symbol)."""
+        return f"historical:indicators:{symbol}"
+
+    @staticmethod
+    def greeks_rollup_checkpoint(resolution: str) -> str:
+        """Cache key for the HistoricalGreeks rollup progress checkpoint."""
+        return f"historical:greeks_rollup:{resolution}"
+
+    @staticmethod
+    def greeks_persisted_at(occ_symbol: str) -> str:
+        """Cache key for the updated_at of the last persisted Greeks snapshot."""
+        sanitized = CacheManager._sanitize_symbol(occ_symbol)
+        return f"historical:greeks_persisted:{sanitized}"
+
+    # === Key Registry (see services.core.cache_index) ===
+    @staticmethod
+    def key_index(family: str) -> str:
+        """Cache key for the set of keys registered under a key family."""
+        return f"{CacheManager.INDEX_PREFIX}:{family}"
+
+    @staticmethod
+    def option_chain_family(day: date) -> str:
+        """Key family for option chains cached on a given day (date-suffixed keys)."""
+        return f"{CacheManager.OPTION_CHAIN_PREFIX}:{day}"
+
+    @staticmethod
+    def position_greeks_family(user_id: int) -> str:
+        """Key family for a user's cached position and portfolio Greeks."""
+        return f"greeks:{user_id}"
+
+    @staticmethod
+    def account_state_family(user_id: int) -> str:
+        """Key family for a user's cached account state (all accounts)."""
+        return f"{CacheManager.ACCOUNT_STATE_PREFIX}:{user_id}"
+
     # === Utility Methods ===
     @staticmethod
-    def clear_pattern(pattern: str) -> None:
+    def clear_pattern(pattern: str) -> int:
         """
         Clear all cache keys matching a pattern.
 
-        Note: Actual implementation depends on cache backend.
-        This is a placeholder for documentation purposes.
+        Uses incremental SCAN (never KEYS), so it is safe on the shared Redis
+        instance but still walks the keyspace. Prefer registering keys in a
+        family and calling cache_index.invalidate_family().
 
         Args:
-            pattern: Cache key pattern to match
+            pattern: Cache key pattern to match (glob-style, without key prefix)
+
+        Returns:
+            Number of keys deleted (0 on backends without pattern support)
         """
-        pass  # Implementation would use cache backend's pattern matching
+        from services.core.cache_index import scan_delete
+
+        return scan_delete(pattern)
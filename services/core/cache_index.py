@@ -0,0 +1,176 @@
+"""
+Cache key registry for index-tracked invalidation.
+
+The Redis instance behind the Django cache also serves the channel layer and
+Celery, so a KEYS over the whole keyspace stalls live streaming. Key families
+that need bulk invalidation record their keys as they are written, and
+invalidation deletes exactly those keys.
+
+Design:
+- Each family (option chains per day, per-user position Greeks, per-user
+  account state) has an index under CacheManager.key_index(family)
+- Redis backend: the index is a Redis set (SADD when a key is first
+  written, SSCAN on invalidation); it expires CACHE_INDEX_TTL_MARGIN after the keys it tracks,
+  so an index never outlives its family for long
+- Other backends (LocMem): the index is a cached Python set
+- invalidate_family() is O(keys in family); scan_delete() serves ad-hoc
+  pattern deletes and uses incremental SCAN, never KEYS
+- Registry failures are logged and never fail the cache write they follow
+"""
+
+import asyncio
+from collections.abc import Iterable
+from typing import Any
+
+from django.core.cache import cache
+
+from services.core.cache import CacheManager
+from services.core.constants import CACHE_INDEX_TTL_MARGIN, CACHE_SCAN_BATCH_SIZE
+from services.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def _redis_client():
+    """Raw Redis client behind the default cache, or None for other backends."""
+    get_client = getattr(getattr(cache, "_cache", None), "get_client", None)
+    if get_client is None:
+        return None
+    try:
+        return get_client(write=True)
+    except Exception as e:
+        logger.debug(f"Redis client unavailable for cache registry: {e}")
+        return None
+
+
+def register_keys(family: str, keys: Iterable[str], ttl: int) -> None:
+    """
+    Record cache keys under a key family.
+
+    Args:
+        family: Key family name (see CacheManager.*_family)
+        keys: Cache keys (unprefixed, as passed to cache.set)
+        ttl: TTL of the registered keys in seconds
+    """
+    keys = list(keys)
+    if not keys:
+        return
+
+    index_key = CacheManager.key_index(family)
+    index_ttl = ttl + CACHE_INDEX_TTL_MARGIN
+    try:
+        client = _redis_client()
+        if client is not None:
+            raw_index = cache.make_key(index_key)
+            pipe = client.pipeline()
+            pipe.sadd(raw_index, *keys)
+            pipe.expire(raw_index, index_ttl)
+            pipe.execute()
+            return
+
+        registered = cache.get(index_key) or set()
+        registered.update(keys)
+        cache.set(index_key, registered, index_ttl)
+    except Exception as e:
+        logger.warning(f"Failed to register {len(keys)} keys in cache family '{family}': {e}")
+
+
+def set_tracked(family: str, key: str, value: Any, ttl: int) -> None:
+    """
+    cache.set() that registers the key under a family when it creates the key.
+
+    Registration is a Redis round trip, so it happens once per key lifetime
+    (when cache.add creates the key); overwriting a live key is a plain set.
+    The writers here are read-through caches that write on a miss, and the
+    index outlives its keys by CACHE_INDEX_TTL_MARGIN.
+    """
+    if cache.add(key, value, ttl):
+        register_keys(family, [key], ttl)
+    else:
+        cache.set(key, value, ttl)
+
+
+async def aregister_keys(family: str, keys: Iterable[str], ttl: int) -> None:
+    """Async variant of register_keys()."""
+    await asyncio.to_thread(register_keys, family, list(keys), ttl)
+
+
+def invalidate_family(family: str) -> int:
+    """
+    Delete every key registered under a family, then the index itself.
+
+    Args:
+        family: Key family name (see CacheManager.*_family)
+
+    Returns:
+        Number of registered keys removed (including ones that had already expired)
+    """
+    index_key = CacheManager.key_index(family)
+    removed = 0
+    try:
+        client = _redis_client()
+        if client is None:
+            keys = list(cache.get(index_key) or ())
+            if keys:
+                cache.delete_many(keys)
+            cache.delete(index_key)
+            return len(keys)
+
+        raw_index = cache.make_key(index_key)
+        batch = []
+        for member in client.sscan_iter(raw_index, count=CACHE_SCAN_BATCH_SIZE):
+            batch.append(member.decode() if isinstance(member, bytes) else member)
+            if len(batch) >= CACHE_SCAN_BATCH_SIZE:
+                cache.delete_many(batch)
+                removed += len(batch)
+                batch = []
+        if batch:
+            cache.delete_many(batch)
+            removed += len(batch)
+        client.delete(raw_index)
+    except Exception as e:
+        logger.error(f"Failed to invalidate cache family '{family}': {e}", exc_info=True)
+
+    if removed:
+        logger.debug(f"Invalidated {removed} keys in cache family '{family}'")
+    return removed
+
+
+async def ainvalidate_family(family: str) -> int:
+    """Async variant of invalidate_family()."""
+    return await asyncio.to_thread(invalidate_family, family)
+
+
+def scan_delete(pattern: str) -> int:
+    """
+    Delete keys matching a glob pattern with incremental SCAN.
+
+    Fallback for keys that were never registered in a family. Each SCAN page
+    is a short command, so other Redis clients keep being served, but the
+    whole keyspace is still walked - use invalidate_family() where possible.
+
+    Args:
+        pattern: Glob pattern over unprefixed cache keys (e.g. "option_chain:*:2025-01-02")
+
+    Returns:
+        Number of keys deleted (0 on backends without pattern support)
+    """
+    client = _redis_client()
+    if client is None:
+        logger.debug(f"Cache backend has no pattern scan, skipping delete of '{pattern}'")
+        return 0
+
+    deleted = 0
+    batch = []
+    try:
+        for raw_key in client.scan_iter(match=cache.make_key(pattern), count=CACHE_SCAN_BATCH_SIZE):
+            batch.append(raw_key)
+            if len(batch) >= CACHE_SCAN_BATCH_SIZE:
+                deleted += client.delete(*batch)
+                batch = []
+        if batch:
+            deleted += client.delete(*batch)
+    except Exception as e:
+        logger.error(f"Failed to scan-delete cache pattern '{pattern}': {e}", exc_info=True)
+
+    return deleted
@@ -11,3 +11,56 @@ API_TIMEOUT_SHORT = 15  # Short timeout for broker API calls (TastyTrade)
 
 # Cache TTLs (seconds) - Complement to cache_config.py for service-specific values
 OPTION_CHAIN_CACHE_TTL = 300  # 5 minutes - option chain data
+
+# TastyTrade session pool (seconds)
+SESSION_TOKEN_LIFETIME = 900  # OAuth access token lifetime when the SDK does not report one
+SESSION_POOL_REFRESH_MARGIN = 120  # Refresh pooled sessions this long before token expiry
+
+# Incremental broker sync (order history / transactions)
+SYNC_WATERMARK_OVERLAP = 86400  # Re-fetch this far behind the watermark (seconds) to absorb late updates
+SYNC_BULK_BATCH_SIZE = 500  # Rows per bulk upsert statement
+POSITION_SYNC_HASH_TTL = 900  # Unchanged broker positions skip the sync for at most this long
+
+# Reconciliation concurrency (ReconciliationOptions.concurrent)
+RECONCILIATION_MAX_CONCURRENT_USERS = 8  # Users reconciled at the same time
+RECONCILIATION_BROKER_PHASE_RATE = 5.0  # Broker-bound phase starts per second, per broker
+
+# Shared market analysis (MarketConditionReport) cache
+MARKET_REPORT_CACHE_TTL = 120  # Seconds a per-symbol report is shared across users
+MARKET_REPORT_PREFETCH_CONCURRENCY = 5  # Symbols analyzed at once when prefetching watchlists
+SUGGESTION_USER_CONCURRENCY = 4  # Users processed at once by batch suggestion/automation jobs
+MARKET_METRICS_BATCH_SIZE = 50  # Symbols per multi-symbol market metrics API call
+
+# Bulk email delivery (EmailDeliveryQueue)
+EMAIL_SENDER_CONCURRENCY = 2  # Delivery workers (each with its own SMTP connection) per email job
+EMAIL_CONNECTION_MAX_MESSAGES = 50  # Messages per SMTP connection before a worker reconnects
+
+# Expiration scans (find_expiration_with_optimal_strikes, delta-selected verticals)
+EXPIRATION_SCAN_CONCURRENCY = 4  # Candidate expirations evaluated at once (1 = sequential walk)
+
+# StrategySelector per-strategy budgets (seconds)
+STRATEGY_SCORE_TIMEOUT = 15  # Scoring one strategy; a timeout scores 0
+STRATEGY_GENERATION_TIMEOUT = 45  # Context preparation + pricing (covers CACHE_WAIT_TIMEOUT)
+
+# HistoricalGreeks rollup (progressive 1min / 5min compression)
+GREEKS_ROLLUP_CHUNK_SECONDS = 86400  # Time window rolled up per transaction (one day)
+GREEKS_ROLLUP_BATCH_SIZE = 2000  # Rows per statement in the batched (non-PostgreSQL) fallback
+GREEKS_PERSIST_MARKER_TTL = 86400  # Remembers each symbol's last persisted Greeks updated_at
+
+# Cache key registry (index-tracked invalidation instead of KEYS scans)
+CACHE_INDEX_TTL_MARGIN = 3600  # Index sets outlive the longest-lived key they track by this long
+CACHE_SCAN_BATCH_SIZE = 500  # Keys per SSCAN/SCAN page and per delete round trip
+
+# Single-flight fetch coalescing (option chains, market metrics, quotes, historical prices)
+SINGLE_FLIGHT_LEASE_TTL = 30  # Cross-worker fetch lease; expires on its own if the holder dies
+SINGLE_FLIGHT_WAIT_TIMEOUT = 10  # Longest wait for another worker's fetch before fetching anyway
+SINGLE_FLIGHT_POLL_INTERVAL = 0.25  # Seconds between cache checks while another worker fetches
+
+# In-process L1 cache in front of Redis (streaming-derived quotes and Greeks)
+L1_CACHE_MAX_ENTRIES = 20000  # Entries kept per process before least-recently-used eviction
+L1_QUOTE_TTL = 0.5  # Seconds a quote stays in L1 (outlives one QUOTE_BOOK_FLUSH_INTERVAL)
+L1_GREEKS_TTL = 2.0  # Seconds Greeks stay in L1
+
+# Logging pipeline sampling (RateLimitFilter)
+LOG_RATE_LIMIT_BURST = 5  # Records per call site let through each interval by RateLimitFilter
+LOG_RATE_LIMIT_INTERVAL = 10.0  # Seconds per RateLimitFilter window
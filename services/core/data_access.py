@@ -125,8 +125,8 @@ async def get_oauth_session(user):
     Eliminates repetitive session management code.
 
     This function now includes validation and auto-refresh:
-    - Gets session from TastyTradeSessionService
-    - Validates the session before returning
+    - Gets session from TastyTradeSessionService (pooled per user)
+    - Validates the session before returning unless the pool vouches for it
     - Auto-refreshes expired sessions
     - Logs refresh events appropriately
 
@@ -157,7 +157,12 @@ async def get_oauth_session(user):
 
         session = session_result.get("session")
 
-        validation_result = await _validate_and_refresh_session(session, user)
+        # Pooled sessions are validated at creation and reused only while unexpired
+        validation_result = (
+            {"success": True, "session": session}
+            if session_result.get("validated")
+            else await _validate_and_refresh_session(session, user)
+        )
 
         if validation_result.get("success"):
             validated_session = validation_result.get("session")
@@ -175,6 +180,38 @@ async def get_oauth_session(user):
         return None
 
 
+def invalidate_oauth_session(user_id: int, error: Exception | None = None) -> bool:
+    """
+    Evict a user's pooled TastyTrade sessions after a broker auth failure.
+
+    Pooled sessions are handed out without re-validation, so a revoked or
+    expired token would otherwise keep being reused until its pool entry
+    expires. The next get_oauth_session() creates and validates a new one.
+
+    Args:
+        user_id: User whose sessions to evict
+        error: Broker error that triggered this; non-auth errors are ignored
+
+    Returns:
+        True if the pooled sessions were evicted
+    """
+    from services.brokers.tastytrade.session_helpers import (
+        SessionErrorType,
+        categorize_refresh_error,
+    )
+    from services.brokers.tastytrade.session_pool import session_pool
+
+    if error is not None and categorize_refresh_error(error) not in (
+        SessionErrorType.EXPIRED_TOKEN,
+        SessionErrorType.AUTHENTICATION_ERROR,
+    ):
+        return False
+
+    session_pool.invalidate(user_id)
+    logger.info(f"Evicted pooled TastyTrade session for user {user_id} after auth failure")
+    return True
+
+
 async def get_oauth_session_for_account(user, account_number: str):
     """
     Get OAuth session for specific account number.
@@ -0,0 +1,171 @@
+"""
+In-process L1 cache in front of Redis for streaming-derived reads.
+
+Positions pages, the metrics loop and strategy pricing read quotes and
+Greeks key by key from Redis, usually in the same process that streamed and
+wrote them a moment earlier. An L1Cache keeps those payloads in memory for a
+very short time so repeated reads skip the Redis round trip.
+
+Design:
+- Bounded LRU (OrderedDict) with a per-entry monotonic expiry; TTLs are
+  sub-second for quotes and a few seconds for Greeks (L1_QUOTE_TTL,
+  L1_GREEKS_TTL), far below their Redis TTLs, so L1 never serves data Redis
+  would already have replaced for long
+- Read-through: get()/get_many() fall back to Django cache (Redis) for
+  missing or expired keys and keep what they find; misses are not cached
+- Populated on write: the streaming gateway put()s payloads as it writes
+  them to Redis, so same-process readers hit L1 immediately. Other processes
+  read Redis and warm their own L1
+- Payloads are shared between readers and must not be mutated (same
+  contract as the quote book)
+- Hits, misses (Redis read-throughs), puts and evictions are counted in a
+  CacheStats, exposed through get_stats()
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Any
+
+from django.core.cache import cache
+
+from services.core.cache import CacheStats
+from services.core.constants import L1_CACHE_MAX_ENTRIES
+
+
+class L1Cache:
+    """Bounded LRU/TTL layer reading through to the shared Django cache."""
+
+    def __init__(self, max_entries: int = L1_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        # Sync views read from worker threads while the event loop writes
+        self._lock = threading.Lock()
+        self.evictions = 0
+        self.stats = CacheStats()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _lookup(self, key: str, now: float) -> Any:
+        """Fresh L1 value for key (refreshing its LRU position), or None. Caller holds lock."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < now:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _store(self, key: str, value: Any, expires_at: float) -> None:
+        """Insert or replace an entry, evicting the least recently used. Caller holds lock."""
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        self.stats.sets += 1
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get(self, key: str, ttl: float) -> Any:
+        """
+        Value for key from L1, else from Redis (kept in L1 for ttl seconds).
+
+        Returns None when neither has the key.
+        """
+        with self._lock:
+            value = self._lookup(key, time.monotonic())
+            if value is not None:
+                self.stats.hits += 1
+                return value
+            self.stats.misses += 1
+
+        started = time.perf_counter()
+        value = cache.get(key)
+        self._record_remote_read(started)
+        if value is not None:
+            self.put(key, value, ttl)
+        return value
+
+    def get_many(self, keys: Iterable[str], ttl: float) -> dict[str, Any]:
+        """
+        Values for many keys; L1 misses are read from Redis with one get_many.
+
+        Keys found nowhere are omitted, like cache.get_many.
+        """
+        result: dict[str, Any] = {}
+        missing: list[str] = []
+        with self._lock:
+            now = time.monotonic()
+            for key in dict.fromkeys(keys):
+                value = self._lookup(key, now)
+                if value is None:
+                    missing.append(key)
+                else:
+                    result[key] = value
+            self.stats.hits += len(result)
+            self.stats.misses += len(missing)
+
+        if missing:
+            started = time.perf_counter()
+            fetched = cache.get_many(missing)
+            self._record_remote_read(started)
+            self.stats.batch_operations += 1
+            fetched = {key: value for key, value in fetched.items() if value is not None}
+            self.put_many(fetched, ttl)
+            result.update(fetched)
+        return result
+
+    def _record_remote_read(self, started: float) -> None:
+        self.stats.total_latency += time.perf_counter() - started
+        self.stats.operation_count += 1
+
+    def put(self, key: str, value: Any, ttl: float) -> None:
+        """Store a value in L1 only (the caller writes Redis itself)."""
+        with self._lock:
+            self._store(key, value, time.monotonic() + ttl)
+
+    def put_many(self, data: dict[str, Any], ttl: float) -> None:
+        """Store many values in L1 only, all with the same TTL."""
+        if not data:
+            return
+        with self._lock:
+            expires_at = time.monotonic() + ttl
+            for key, value in data.items():
+                self._store(key, value, expires_at)
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self.stats.deletes += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.evictions = 0
+            self.stats = CacheStats()
+
+    def _after_fork(self) -> None:
+        # The parent's lock may have been held mid-operation when it forked
+        self._lock = threading.Lock()
+        self.clear()
+
+    def get_stats(self) -> dict:
+        """CacheStats counters plus size and eviction count."""
+        return {
+            **self.stats.get_stats(),
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "evictions": self.evictions,
+        }
+
+
+# Process-wide instance written by streaming.services.market_data_gateway
+l1_cache = L1Cache()
+
+os.register_at_fork(after_in_child=l1_cache._after_fork)
@@ -3,12 +3,32 @@ Structured logging configuration for Senex Trader.
 
 This module provides comprehensive logging setup for development and production
 environments, with proper handlers, formatters, and loggers for all application components.
+
+Keeping logging off the hot paths (stream manager, API views):
+- SensitiveDataFilter redacts with one precompiled regex, skipped entirely
+  for strings without a sensitive keyword or digit run
+- With LOGGING_ASYNC_HANDLERS, configure_logging() moves every configured
+  logger's handlers behind an AsyncQueueHandler; redaction, formatting and
+  IO happen on one listener thread
+- RateLimitFilter caps per-call-site INFO/DEBUG volume on high-frequency
+  loggers (quote lookups, per-position metrics)
 """
 
+import atexit
+import copy
 import logging
+import logging.config
+import os
+import queue
 import re
+import threading
+import time
+from decimal import Decimal
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
+from services.core.constants import LOG_RATE_LIMIT_BURST, LOG_RATE_LIMIT_INTERVAL
+
 # Get the base directory for log files (project root, not services/)
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 LOGS_DIR = BASE_DIR / "logs"
@@ -17,59 +37,74 @@ LOGS_DIR = BASE_DIR / "logs"
 LOGS_DIR.mkdir(exist_ok=True)
 
 
+# Sensitive data patterns: (group name, prefix kept before the redaction
+# marker or None to replace the whole match, value pattern, replacement)
+_VALUE = r"[^\"'\s,}]+"
+_SENSITIVE_PATTERNS = [
+    # OAuth tokens (Bearer tokens, access tokens)
+    ("bearer", r"bearer\s+", r"[a-zA-Z0-9\-._~+/]+=*", "[REDACTED_TOKEN]"),
+    ("access_token", r"access[_-]?token[\"']?\s*[:=]\s*[\"']?", _VALUE, "[REDACTED_TOKEN]"),
+    # Passwords
+    ("password", r"password[\"']?\s*[:=]\s*[\"']?", _VALUE, "[REDACTED_PASSWORD]"),
+    ("pwd", r"pwd[\"']?\s*[:=]\s*[\"']?", _VALUE, "[REDACTED_PASSWORD]"),
+    # Match 'pass' only in assignment contexts (quoted key or =value)
+    # Avoids matching "PASS: sufficient" status messages
+    ("pass", r"[\"']pass[\"']?\s*[:=]\s*[\"']?|(?<=\s)pass=", _VALUE, "[REDACTED_PASSWORD]"),
+    # API keys and secrets
+    ("api_key", r"api[_-]?key[\"']?\s*[:=]\s*[\"']?", _VALUE, "[REDACTED_API_KEY]"),
+    ("secret_key", r"secret[_-]?key[\"']?\s*[:=]\s*[\"']?", _VALUE, "[REDACTED_SECRET]"),
+    ("client_secret", r"client[_-]?secret[\"']?\s*[:=]\s*[\"']?", _VALUE, "[REDACTED_SECRET]"),
+    # Credit card numbers (basic patterns for common formats)
+    ("credit_card", None, r"\b(?:\d{4}[\s\-]?){3}\d{4}\b", "[REDACTED_CREDIT_CARD]"),
+    # SSNs (XXX-XX-XXXX format)
+    ("ssn", None, r"\b\d{3}-\d{2}-\d{4}\b", "[REDACTED_SSN]"),
+]
+
+# Every keyword pattern needs one of these (lower-cased) literals
+_SENSITIVE_KEYWORDS = ("bearer", "token", "pass", "pwd", "key", "secret")
+# Card numbers and SSNs need a run like "123-45" / "1234 5678"
+_NUMBER_HINT = re.compile(r"\d{3}[\s\-]?\d{2}")
+
+
 class SensitiveDataFilter(logging.Filter):
     """
     Logging filter that redacts sensitive information from log messages.
 
     This filter identifies and replaces sensitive data patterns such as OAuth tokens,
     passwords, API keys, credit card numbers, and SSNs with redacted placeholders.
+
+    All patterns are combined into one case-insensitive alternation, applied in
+    a single pass, and only to strings that contain one of the pattern
+    keywords or a digit run. Handler-level filters only run for records the
+    handler will emit; a record shared by several handlers is redacted once.
     """
 
-    def __init__(self):
-        super().__init__()
-        # Define regex patterns for sensitive data (case-insensitive)
-        self.patterns = [
-            # OAuth tokens (Bearer tokens, access tokens)
-            (re.compile(r"(bearer\s+)[a-zA-Z0-9\-._~+/]+=*", re.IGNORECASE), r"\1[REDACTED_TOKEN]"),
-            (
-                re.compile(r"(access[_-]?token[\"']?\s*[:=]\s*[\"']?)([^\"'\s,}]+)", re.IGNORECASE),
-                r"\1[REDACTED_TOKEN]",
-            ),
-            # Passwords
-            (
-                re.compile(r"(password[\"']?\s*[:=]\s*[\"']?)([^\"'\s,}]+)", re.IGNORECASE),
-                r"\1[REDACTED_PASSWORD]",
-            ),
-            (
-                re.compile(r"(pwd[\"']?\s*[:=]\s*[\"']?)([^\"'\s,}]+)", re.IGNORECASE),
-                r"\1[REDACTED_PASSWORD]",
-            ),
-            (
-                # Match 'pass' only in assignment contexts (quoted key or =value)
-                # Avoids matching "PASS: sufficient" status messages
-                re.compile(r"([\"']pass[\"']?\s*[:=]\s*[\"']?|(?<=\s)pass=)([^\"'\s,}]+)", re.IGNORECASE),
-                r"\1[REDACTED_PASSWORD]",
-            ),
-            # API keys and secrets
-            (
-                re.compile(r"(api[_-]?key[\"']?\s*[:=]\s*[\"']?)([^\"'\s,}]+)", re.IGNORECASE),
-                r"\1[REDACTED_API_KEY]",
-            ),
-            (
-                re.compile(r"(secret[_-]?key[\"']?\s*[:=]\s*[\"']?)([^\"'\s,}]+)", re.IGNORECASE),
-                r"\1[REDACTED_SECRET]",
-            ),
-            (
-                re.compile(
-                    r"(client[_-]?secret[\"']?\s*[:=]\s*[\"']?)([^\"'\s,}]+)", re.IGNORECASE
-                ),
-                r"\1[REDACTED_SECRET]",
-            ),
-            # Credit card numbers (basic patterns for common formats)
-            (re.compile(r"\b(?:\d{4}[\s\-]?){3}\d{4}\b"), "[REDACTED_CREDIT_CARD]"),
-            # SSNs (XXX-XX-XXXX format)
-            (re.compile(r"\b\d{3}-\d{2}-\d{4}\b"), "[REDACTED_SSN]"),
-        ]
+    _pattern = re.compile(
+        "|".join(
+            f"(?P<{name}>{prefix})(?:{value})" if prefix else f"(?P<{name}>{value})"
+            for name, prefix, value, _ in _SENSITIVE_PATTERNS
+        ),
+        re.IGNORECASE,
+    )
+    _replacements = {
+        name: (replacement, prefix is not None)
+        for name, prefix, _, replacement in _SENSITIVE_PATTERNS
+    }
+
+    @classmethod
+    def _replace(cls, match: re.Match) -> str:
+        replacement, keep_prefix = cls._replacements[match.lastgroup]
+        return match.group(match.lastgroup) + replacement if keep_prefix else replacement
+
+    @classmethod
+    def redact(cls, text: str) -> str:
+        """Text with every sensitive value replaced by its redaction marker."""
+        lowered = text.lower()
+        if not any(keyword in lowered for keyword in _SENSITIVE_KEYWORDS) and (
+            _NUMBER_HINT.search(text) is None
+        ):
+            return text
+        return cls._pattern.sub(cls._replace, text)
 
     def filter(self, record):
         """
@@ -81,47 +116,226 @@ class SensitiveDataFilter(logging.Filter):
         Returns:
             bool: True to allow the record to be logged, False to suppress it
         """
+        # Already redacted by another handler's filter (same msg and args objects)
+        redacted = getattr(record, "redacted", None)
+        if redacted and redacted[0] is record.msg and redacted[1] is record.args:
+            return True
+
         # Redact sensitive data from the message
         if hasattr(record, "msg"):
-            msg = str(record.msg)
-            for pattern, replacement in self.patterns:
-                msg = pattern.sub(replacement, msg)
-            record.msg = msg
+            record.msg = self.redact(str(record.msg))
 
-        # Redact sensitive data from args if present
+        # Redact sensitive data from args if present (only string values;
+        # floats, ints etc. are preserved for %-formatting)
         if hasattr(record, "args") and record.args:
             if isinstance(record.args, dict):
-                # Handle dictionary args - only process string values
-                filtered_args = {}
-                for key, value in record.args.items():
-                    if isinstance(value, str):
-                        filtered_value = value
-                        for pattern, replacement in self.patterns:
-                            filtered_value = pattern.sub(replacement, filtered_value)
-                        filtered_args[key] = filtered_value
-                    else:
-                        # Preserve non-string types (floats, ints, etc.)
-                        filtered_args[key] = value
-                record.args = filtered_args
+                record.args = {
+                    key: self.redact(value) if isinstance(value, str) else value
+                    for key, value in record.args.items()
+                }
             elif isinstance(record.args, (list, tuple)):
-                # Handle list/tuple args - only process string values
-                filtered_args = []
-                for arg in record.args:
-                    if isinstance(arg, str):
-                        filtered_arg = arg
-                        for pattern, replacement in self.patterns:
-                            filtered_arg = pattern.sub(replacement, filtered_arg)
-                        filtered_args.append(filtered_arg)
-                    else:
-                        # Preserve non-string types
-                        filtered_args.append(arg)
+                filtered_args = [
+                    self.redact(arg) if isinstance(arg, str) else arg for arg in record.args
+                ]
                 record.args = (
                     tuple(filtered_args) if isinstance(record.args, tuple) else filtered_args
                 )
 
+        record.redacted = (record.msg, record.args)
         return True  # Always allow the record through (just with redacted content)
 
 
+class RateLimitFilter(logging.Filter):
+    """
+    Sampling filter for high-frequency loggers.
+
+    Lets at most burst records per call site (file and line) through every
+    interval seconds; WARNING and above always pass. The first record let
+    through after a suppressed stretch says how many were dropped. Attach it
+    to a logger (not a handler) so suppressed records are dropped before any
+    handler, queue or formatter sees them.
+
+    Expired windows are pruned (at most once per interval) whenever some call
+    site rolls over to a new window. A call site that goes quiet after being
+    suppressed never reports its trailing count; it is dropped with the window.
+    """
+
+    def __init__(
+        self, burst: int = LOG_RATE_LIMIT_BURST, interval: float = LOG_RATE_LIMIT_INTERVAL
+    ):
+        super().__init__()
+        self.burst = burst
+        self.interval = interval
+        # (pathname, lineno) -> [window start, records let through, suppressed]
+        self._windows: dict[tuple[str, int], list] = {}
+        self._next_prune = 0.0
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING:
+            return True
+
+        key = (record.pathname, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self.interval:
+                suppressed = window[2] if window else 0
+                if now >= self._next_prune:
+                    self._prune(now)
+                self._windows[key] = [now, 1, 0]
+            elif window[1] < self.burst:
+                window[1] += 1
+                suppressed = 0
+            else:
+                window[2] += 1
+                return False
+
+        if suppressed:
+            record.msg = f"{record.getMessage()} [{suppressed} similar records suppressed]"
+            record.args = None
+        return True
+
+    def _prune(self, now: float) -> None:
+        """Drop expired windows; called with the lock held."""
+        expired = [key for key, window in self._windows.items() if now - window[0] >= self.interval]
+        for key in expired:
+            del self._windows[key]
+        self._next_prune = now + self.interval
+
+
+# Arg types that can't change between the log call and the listener formatting it
+_IMMUTABLE_ARG_TYPES = (str, int, float, bool, Decimal, type(None))
+
+
+class AsyncQueueHandler(QueueHandler):
+    """
+    Hands records to the listener thread for the handlers it replaced.
+
+    Only the level check and a shallow copy of the record happen on the
+    logging thread. Filters (redaction), formatting and IO run on the listener
+    thread; records with mutable args are merged eagerly so the message
+    reflects the values at call time.
+    """
+
+    def __init__(self, log_queue, handlers: list[logging.Handler]):
+        super().__init__(log_queue)
+        self.target_handlers = tuple(handlers)
+        # Don't queue records none of the target handlers would emit
+        self.setLevel(min(handler.level for handler in handlers))
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        args = record.args
+        if args:
+            values = args.values() if isinstance(args, dict) else args
+            if not all(isinstance(value, _IMMUTABLE_ARG_TYPES) for value in values):
+                record.msg = record.getMessage()
+                record.args = None
+        record.target_handlers = self.target_handlers
+        return record
+
+
+class _DispatchingListener(QueueListener):
+    """Emits each queued record to the handlers of the AsyncQueueHandler that queued it."""
+
+    def handle(self, record):
+        for handler in record.target_handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+class AsyncLogging:
+    """Owns the listener thread and the AsyncQueueHandlers installed on loggers."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._wrapped: list[tuple[logging.Logger, AsyncQueueHandler]] = []
+        self._listener: _DispatchingListener | None = None
+
+    def start(self, loggers: list[logging.Logger] | None = None) -> None:
+        """
+        Move configured loggers' handlers behind one listener thread.
+
+        Each logger with handlers gets a single AsyncQueueHandler wrapping them.
+        Call after dictConfig; calling again while running is a no-op.
+
+        Args:
+            loggers: Loggers to wrap (default: root and every logger created so far)
+        """
+        with self._lock:
+            if self._listener is not None:
+                return
+
+            if loggers is None:
+                loggers = [logging.getLogger()] + [
+                    logger
+                    for logger in list(logging.Logger.manager.loggerDict.values())
+                    if isinstance(logger, logging.Logger)
+                ]
+
+            log_queue = queue.SimpleQueue()
+            for logger in loggers:
+                handlers = [h for h in logger.handlers if not isinstance(h, AsyncQueueHandler)]
+                if not handlers:
+                    continue
+                queue_handler = AsyncQueueHandler(log_queue, handlers)
+                for handler in handlers:
+                    logger.removeHandler(handler)
+                logger.addHandler(queue_handler)
+                self._wrapped.append((logger, queue_handler))
+
+            self._listener = _DispatchingListener(log_queue)
+            self._listener.start()
+
+    def stop(self) -> None:
+        """Flush queued records, stop the listener and put the original handlers back."""
+        with self._lock:
+            if self._listener is None:
+                return
+            self._listener.stop()
+            self._listener = None
+
+            for logger, queue_handler in self._wrapped:
+                logger.removeHandler(queue_handler)
+                for handler in queue_handler.target_handlers:
+                    logger.addHandler(handler)
+            self._wrapped.clear()
+
+    def _after_fork(self) -> None:
+        # The listener thread doesn't survive fork (prefork Celery workers, Gunicorn)
+        self._lock = threading.Lock()
+        if self._listener is None:
+            return
+        log_queue = queue.SimpleQueue()
+        for _, queue_handler in self._wrapped:
+            queue_handler.queue = log_queue
+        self._listener = _DispatchingListener(log_queue)
+        self._listener.start()
+
+
+# Process-wide instance, started by configure_logging()
+async_logging = AsyncLogging()
+
+atexit.register(async_logging.stop)
+os.register_at_fork(after_in_child=async_logging._after_fork)
+
+
+def configure_logging(config: dict) -> None:
+    """
+    LOGGING_CONFIG entry point: dictConfig, then async handlers if enabled.
+
+    Async handlers are enabled by the LOGGING_ASYNC_HANDLERS setting.
+    """
+    from django.conf import settings
+
+    # dictConfig replaces handlers; re-wrap whatever it installs
+    async_logging.stop()
+    logging.config.dictConfig(config)
+    if getattr(settings, "LOGGING_ASYNC_HANDLERS", False):
+        async_logging.start()
+
+
 # Base logging configuration
 LOGGING = {
     "version": 1,
@@ -129,7 +343,10 @@ LOGGING = {
     "filters": {
         "sensitive_data": {
             "()": "services.core.logging.SensitiveDataFilter",
-        }
+        },
+        "rate_limited": {
+            "()": "services.core.logging.RateLimitFilter",
+        },
     },
     "formatters": {
         "verbose": {
@@ -233,6 +450,13 @@ LOGGING = {
             "level": "INFO",  # Reduced from DEBUG to avoid cache operation logs
             "propagate": False,
         },
+        # High-frequency loggers: per-lookup / per-position INFO is sampled
+        "services.streaming.options_cache": {
+            "filters": ["rate_limited"],
+        },
+        "streaming.services.position_metrics_calculator": {
+            "filters": ["rate_limited"],
+        },
         "streaming.services.enhanced_cache": {
             "handlers": ["console", "file_structured"],
             "level": "INFO",  # Suppress verbose cache DEBUG logs
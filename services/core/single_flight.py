@@ -0,0 +1,200 @@
+"""
+Single-flight coalescing for cache-miss fetches.
+
+When several users, strategies or tasks miss the cache for the same resource
+at the same moment (market open, the 10 AM automation run), each of them
+would otherwise call the broker API for identical data. A SingleFlight makes
+one caller fetch while the others wait for its result.
+
+Design:
+- In-process: a future per key and event loop; concurrent callers await the
+  leader's future (like MarketReportCache and the session pool)
+- Cross-worker: the leader takes a Redis lease (cache.add on
+  CacheManager.data_fetch_lock). A worker that finds the lease held polls the
+  shared cache until the holder has written the result, the lease is
+  released, or SINGLE_FLIGHT_WAIT_TIMEOUT passes - then it fetches itself
+  (fetches backed by the database re-check it, so a released lease usually
+  means the data is already there)
+- The lease expires after SINGLE_FLIGHT_LEASE_TTL, so a crashed holder never
+  blocks a resource for long
+- Waiters get a copy of the leader's result; failures are not shared beyond
+  the callers already waiting
+- Counters per flight (leaders, coalesced, remote hits, lease timeouts) are
+  exposed through get_stats() / single_flight_stats()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import os
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from django.core.cache import cache
+
+from services.core.cache import CacheManager
+from services.core.constants import (
+    SINGLE_FLIGHT_LEASE_TTL,
+    SINGLE_FLIGHT_POLL_INTERVAL,
+    SINGLE_FLIGHT_WAIT_TIMEOUT,
+)
+from services.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Coalesces concurrent fetches of the same key, in-process and across workers."""
+
+    _registry: dict[str, SingleFlight] = {}
+
+    def __init__(
+        self,
+        name: str,
+        lease_ttl: int = SINGLE_FLIGHT_LEASE_TTL,
+        wait_timeout: float = SINGLE_FLIGHT_WAIT_TIMEOUT,
+        poll_interval: float = SINGLE_FLIGHT_POLL_INTERVAL,
+    ):
+        self.name = name
+        self.lease_ttl = lease_ttl
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self._inflight: dict[tuple[str, int], asyncio.Future] = {}
+        self._reset_counters()
+        SingleFlight._registry[name] = self
+
+    def _reset_counters(self) -> None:
+        self.leaders = 0
+        self.coalesced = 0
+        self.remote_hits = 0
+        self.lease_timeouts = 0
+        self.failures = 0
+
+    async def run(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[T]],
+        cached: Callable[[], T | None] | None = None,
+    ) -> T:
+        """
+        Run fetch for key unless an identical fetch is already in flight.
+
+        Args:
+            key: Resource key (typically the cache key the result is stored under)
+            fetch: Coroutine function doing the actual fetch (and cache write)
+            cached: Reads the shared cache, so a worker waiting on another
+                worker's lease can return its result. Without it the waiter
+                only waits for the lease to be released and then calls fetch,
+                which must re-check its own source (e.g. the database).
+
+        Raises:
+            Whatever fetch raises
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (key, id(loop))
+        inflight = self._inflight.get(flight_key)
+        if inflight is not None:
+            self.coalesced += 1
+            logger.debug(f"Single-flight {self.name}: coalesced request for {key}")
+            return copy.deepcopy(await asyncio.shield(inflight))
+
+        future = loop.create_future()
+        self._inflight[flight_key] = future
+        try:
+            result = await self._fetch_once(key, fetch, cached)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            self.failures += 1
+            future.set_exception(e)
+            # Waiters re-raise it; don't warn about an unretrieved exception
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(flight_key, None)
+
+        future.set_result(result)
+        return result
+
+    async def _fetch_once(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[T]],
+        cached: Callable[[], T | None] | None,
+    ) -> T:
+        lease_key = CacheManager.data_fetch_lock(f"{self.name}:{key}")
+        token = uuid.uuid4().hex
+        if not cache.add(lease_key, token, self.lease_ttl):
+            result = await self._wait_for_holder(lease_key, cached)
+            if result is not None:
+                self.remote_hits += 1
+                logger.debug(f"Single-flight {self.name}: {key} fetched by another worker")
+                return result
+            # Holder failed, released without a result, or is too slow: take over
+            cache.add(lease_key, token, self.lease_ttl)
+
+        self.leaders += 1
+        try:
+            return await fetch()
+        finally:
+            if cache.get(lease_key) == token:
+                cache.delete(lease_key)
+
+    async def _wait_for_holder(self, lease_key: str, cached: Callable[[], Any] | None) -> Any:
+        """Poll the shared cache while another worker holds the lease."""
+        deadline = time.monotonic() + self.wait_timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.poll_interval)
+            result = cached() if cached is not None else None
+            if result is not None:
+                return result
+            if cache.get(lease_key) is None:
+                return None
+        self.lease_timeouts += 1
+        logger.warning(
+            f"Single-flight {self.name}: gave up waiting {self.wait_timeout}s for "
+            f"lease {lease_key}, fetching directly"
+        )
+        return cached() if cached is not None else None
+
+    def clear(self) -> None:
+        self._inflight.clear()
+        self._reset_counters()
+
+    def get_stats(self) -> dict:
+        requests = self.leaders + self.coalesced + self.remote_hits
+        return {
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+            "remote_hits": self.remote_hits,
+            "lease_timeouts": self.lease_timeouts,
+            "failures": self.failures,
+            "coalesce_rate": (
+                round((self.coalesced + self.remote_hits) / requests, 3) if requests else 0.0
+            ),
+        }
+
+
+def single_flight_stats() -> dict[str, dict]:
+    """Counters for every single-flight in this process, keyed by name."""
+    return {name: flight.get_stats() for name, flight in SingleFlight._registry.items()}
+
+
+def _clear_all() -> None:
+    for flight in SingleFlight._registry.values():
+        flight.clear()
+
+
+# Broker / market data fetches shared across users
+option_chain_flight = SingleFlight("option_chain")
+market_metrics_flight = SingleFlight("market_metrics")
+quote_flight = SingleFlight("quote")
+historical_flight = SingleFlight("historical_prices")
+
+os.register_at_fork(after_in_child=_clear_all)
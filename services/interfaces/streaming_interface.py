@@ -43,12 +43,15 @@ class StreamerProtocol(Protocol):
         """
         ...
 
-    async def ensure_streaming_for_automation(self, symbols: list[str]) -> bool:
+    async def ensure_streaming_for_automation(
+        self, symbols: list[str], data_kinds: tuple[str, ...] = ("quote",)
+    ) -> bool:
         """
         Ensure streaming is active for automated trading.
 
         Args:
             symbols: List of symbols to ensure streaming for
+            data_kinds: First data to wait for per symbol ("quote", "greeks", "summary")
 
         Returns:
             True if streaming is active
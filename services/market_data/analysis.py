@@ -715,6 +715,45 @@ class MarketAnalyzer:
 
     async def a_analyze_market_conditions(
         self, user: AbstractBaseUser, symbol: str, market_snapshot: dict[str, Any] | None = None
+    ) -> MarketConditionReport:
+        """
+        Analyze market conditions, sharing the result across users.
+
+        Without a market_snapshot the report depends only on the symbol, so it
+        comes from the process-wide market_report_cache (short TTL,
+        single-flight). A caller-supplied snapshot bypasses the cache.
+        """
+        if market_snapshot:
+            return await self._a_compute_market_conditions(user, symbol, market_snapshot)
+
+        from services.market_data.analysis_cache import market_report_cache
+
+        return await market_report_cache.get_or_compute(
+            symbol, lambda sym: self._a_compute_market_conditions(user, sym, {})
+        )
+
+    async def a_prefetch_market_conditions(
+        self, symbols: list[str]
+    ) -> dict[str, MarketConditionReport]:
+        """
+        Warm the shared report cache for many symbols at once (batch jobs).
+
+        Market metrics for every symbol are fetched up front with batched API
+        calls, so the per-symbol analyses read them from cache.
+
+        Returns:
+            Reports keyed by upper-cased symbol; failed symbols are omitted
+        """
+        from services.market_data.analysis_cache import market_report_cache
+
+        await self.market_service.get_market_metrics_many([symbol.upper() for symbol in symbols])
+
+        return await market_report_cache.prefetch(
+            symbols, lambda sym: self._a_compute_market_conditions(self.user, sym, {})
+        )
+
+    async def _a_compute_market_conditions(
+        self, user: AbstractBaseUser, symbol: str, market_snapshot: dict[str, Any] | None = None
     ) -> MarketConditionReport:
         """
         Analyze market conditions - returns DATA, not decisions.
@@ -0,0 +1,175 @@
+"""
+Shared MarketConditionReport cache.
+
+A market analysis (quote, market metrics, earnings, dividends, technical
+indicators) depends only on the symbol, yet every StrategySelector and
+strategy computed its own copy per user. This cache lets all users in a
+process share one report per symbol.
+
+Design:
+- Symbol-scoped, in-process, short TTL (MARKET_REPORT_CACHE_TTL) so reports
+  never drift far from live data
+- Single-flight: concurrent requests for the same symbol on the same event
+  loop await one computation instead of each hitting the APIs
+- Callers get a copy of the cached report, so one caller cannot leak
+  changes into another user's analysis
+- Failed computations and reports built on stale or missing prices are not
+  cached, so retries (e.g. at market open) recompute from fresh data
+- prefetch() warms many symbols at once with bounded concurrency (batch jobs
+  prefetch the union of all watchlists before fanning out per user)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import os
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from typing import TYPE_CHECKING
+
+from services.core.constants import MARKET_REPORT_CACHE_TTL, MARKET_REPORT_PREFETCH_CONCURRENCY
+from services.core.logging import get_logger
+
+if TYPE_CHECKING:
+    from services.market_data.analysis import MarketConditionReport
+
+logger = get_logger(__name__)
+
+ReportFactory = Callable[[str], Awaitable["MarketConditionReport"]]
+
+
+class MarketReportCache:
+    """Per-process, per-symbol cache of market analysis reports."""
+
+    def __init__(self, ttl: float = MARKET_REPORT_CACHE_TTL):
+        self.ttl = ttl
+        self._reports: dict[str, tuple[float, MarketConditionReport]] = {}
+        self._inflight: dict[tuple[str, int], asyncio.Future] = {}
+        self._reset_counters()
+
+    def _reset_counters(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.failures = 0
+
+    def get(self, symbol: str) -> MarketConditionReport | None:
+        """Cached report for symbol if still fresh."""
+        entry = self._reports.get(symbol.upper())
+        if entry is None:
+            return None
+        expires_at, report = entry
+        if time.monotonic() >= expires_at:
+            self._reports.pop(symbol.upper(), None)
+            return None
+        return copy.deepcopy(report)
+
+    async def get_or_compute(self, symbol: str, factory: ReportFactory) -> MarketConditionReport:
+        """
+        Return the cached report for symbol, computing it at most once at a time.
+
+        Args:
+            symbol: Underlying symbol
+            factory: Coroutine function computing a fresh report for a symbol
+
+        Raises:
+            Whatever factory raises; failures are not cached
+        """
+        key = symbol.upper()
+        report = self.get(key)
+        if report is not None:
+            self.hits += 1
+            return report
+
+        loop = asyncio.get_running_loop()
+        flight_key = (key, id(loop))
+        inflight = self._inflight.get(flight_key)
+        if inflight is not None:
+            self.coalesced += 1
+            return copy.deepcopy(await asyncio.shield(inflight))
+
+        self.misses += 1
+        future = loop.create_future()
+        self._inflight[flight_key] = future
+        try:
+            report = await factory(symbol)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            self.failures += 1
+            future.set_exception(e)
+            # Waiters re-raise it; don't warn about an unretrieved exception
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(flight_key, None)
+
+        if self._is_cacheable(report):
+            self._reports[key] = (time.monotonic() + self.ttl, report)
+        future.set_result(report)
+        return copy.deepcopy(report)
+
+    @staticmethod
+    def _is_cacheable(report: MarketConditionReport) -> bool:
+        return not report.is_data_stale and report.current_price > 0
+
+    async def prefetch(
+        self,
+        symbols: Iterable[str],
+        factory: ReportFactory,
+        concurrency: int = MARKET_REPORT_PREFETCH_CONCURRENCY,
+    ) -> dict[str, MarketConditionReport]:
+        """
+        Warm the cache for many symbols with bounded concurrency.
+
+        Returns:
+            Reports keyed by symbol; symbols whose analysis failed are omitted
+        """
+        unique = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def load(symbol: str) -> MarketConditionReport:
+            async with semaphore:
+                return await self.get_or_compute(symbol, factory)
+
+        results = await asyncio.gather(*(load(symbol) for symbol in unique), return_exceptions=True)
+
+        reports = {}
+        for symbol, result in zip(unique, results, strict=True):
+            if isinstance(result, Exception):
+                logger.warning(f"Market analysis prefetch failed for {symbol}: {result}")
+                continue
+            reports[symbol] = result
+
+        logger.info(f"Prefetched market analysis for {len(reports)}/{len(unique)} symbols")
+        return reports
+
+    def invalidate(self, symbol: str | None = None) -> None:
+        """Drop one symbol's report, or all reports."""
+        if symbol is None:
+            self._reports.clear()
+        else:
+            self._reports.pop(symbol.upper(), None)
+
+    def clear(self) -> None:
+        self._reports.clear()
+        self._inflight.clear()
+        self._reset_counters()
+
+    def get_stats(self) -> dict:
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "entries": len(self._reports),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "failures": self.failures,
+            "hit_rate": round((self.hits + self.coalesced) / lookups, 3) if lookups else 0.0,
+        }
+
+
+# Process-wide cache shared by every user's analyzer
+market_report_cache = MarketReportCache()
+os.register_at_fork(after_in_child=market_report_cache.clear)
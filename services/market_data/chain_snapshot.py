@@ -0,0 +1,301 @@
+"""
+Compact columnar option chain representation.
+
+The nested chain from TastyTrade (chain -> expiration -> strike objects) is
+large once pickled, and per-expiration chains used to be rebuilt from it as
+lists of strike dicts, with Decimal strike sets re-derived and re-sorted by
+every consumer. An OptionChainSnapshot holds the whole chain for a symbol as
+one compact payload instead.
+
+Design:
+- One ExpirationStrikes per expiration: strikes as a sorted float64 array,
+  put/call OCC and streamer symbols as parallel lists (None where a side is
+  not listed)
+- Serialized with msgpack; each expiration is its own msgpack blob holding
+  the raw NumPy strike bytes, and is only decoded when that expiration is
+  first accessed (SPX/QQQ chains have dozens of expirations, callers
+  usually need one or two)
+- Binary-search helpers replace linear scans: nearest strike, width-offset
+  strike, and iteration in delta order (far OTM towards ITM)
+- to_strike_dicts() materializes the legacy strikes list for code that
+  still consumes chain["strikes"]
+"""
+
+from __future__ import annotations
+
+import bisect
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from datetime import date
+from decimal import Decimal
+from typing import Literal
+
+import msgpack
+import numpy as np
+
+OptionSide = Literal["put", "call"]
+
+PAYLOAD_VERSION = 1
+
+
+def nearest_strike(sorted_strikes: Sequence[Decimal], target: Decimal) -> Decimal | None:
+    """
+    Closest strike to target in an ascending sequence (binary search).
+
+    Ties resolve to the lower strike, matching min(..., key=distance).
+    """
+    if not sorted_strikes:
+        return None
+    index = bisect.bisect_left(sorted_strikes, target)
+    if index == 0:
+        return sorted_strikes[0]
+    if index == len(sorted_strikes):
+        return sorted_strikes[-1]
+    lower, upper = sorted_strikes[index - 1], sorted_strikes[index]
+    return lower if abs(target - lower) <= abs(upper - target) else upper
+
+
+def _to_decimal(value: float) -> Decimal:
+    # repr() is the shortest round-trip form, so 252.5 -> Decimal("252.5")
+    return Decimal(repr(float(value)))
+
+
+@dataclass(slots=True)
+class ExpirationStrikes:
+    """All strikes of one expiration as sorted parallel columns."""
+
+    expiration: date
+    strikes: np.ndarray  # float64, ascending, unique
+    puts: list[str | None]
+    calls: list[str | None]
+    put_streamer_symbols: list[str | None]
+    call_streamer_symbols: list[str | None]
+    _sides: dict[str, tuple[np.ndarray, list[Decimal]]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def __len__(self) -> int:
+        return len(self.strikes)
+
+    @classmethod
+    def from_rows(
+        cls,
+        expiration: date,
+        rows: Iterable[tuple[Decimal, str | None, str | None, str | None, str | None]],
+    ) -> ExpirationStrikes:
+        """Build from (strike, put, call, put_streamer, call_streamer) rows in any order."""
+        by_strike = {float(row[0]): row for row in rows}
+        ordered = [by_strike[strike] for strike in sorted(by_strike)]
+        return cls(
+            expiration=expiration,
+            strikes=np.array([float(row[0]) for row in ordered], dtype=np.float64),
+            puts=[row[1] for row in ordered],
+            calls=[row[2] for row in ordered],
+            put_streamer_symbols=[row[3] for row in ordered],
+            call_streamer_symbols=[row[4] for row in ordered],
+        )
+
+    # === Serialization ===
+    def encode(self) -> bytes:
+        return msgpack.packb(
+            [
+                self.strikes.astype("<f8").tobytes(),
+                self.puts,
+                self.calls,
+                self.put_streamer_symbols,
+                self.call_streamer_symbols,
+            ]
+        )
+
+    @classmethod
+    def decode(cls, expiration: date, payload: bytes) -> ExpirationStrikes:
+        strikes, puts, calls, put_streamers, call_streamers = msgpack.unpackb(payload)
+        return cls(
+            expiration=expiration,
+            strikes=np.frombuffer(strikes, dtype="<f8"),
+            puts=puts,
+            calls=calls,
+            put_streamer_symbols=put_streamers,
+            call_streamer_symbols=call_streamers,
+        )
+
+    # === Strike lookups ===
+    def _side(self, option_type: OptionSide | None) -> tuple[np.ndarray, list[Decimal]]:
+        """Sorted strikes (float and Decimal) listed for a side; both sides if None."""
+        key = option_type or "any"
+        if key not in self._sides:
+            if option_type is None:
+                mask = np.ones(len(self.strikes), dtype=bool)
+            else:
+                symbols = self.puts if option_type == "put" else self.calls
+                mask = np.array([bool(symbol) for symbol in symbols], dtype=bool)
+            floats = self.strikes[mask]
+            self._sides[key] = (floats, [_to_decimal(strike) for strike in floats])
+        return self._sides[key]
+
+    def put_strikes(self) -> list[Decimal]:
+        """Ascending strikes with a listed put (do not mutate; shared)."""
+        return self._side("put")[1]
+
+    def call_strikes(self) -> list[Decimal]:
+        """Ascending strikes with a listed call (do not mutate; shared)."""
+        return self._side("call")[1]
+
+    def has_strike(self, strike: Decimal, option_type: OptionSide | None = None) -> bool:
+        floats = self._side(option_type)[0]
+        index = int(np.searchsorted(floats, float(strike)))
+        return index < len(floats) and floats[index] == float(strike)
+
+    def nearest_strike(
+        self, target: Decimal, option_type: OptionSide | None = None
+    ) -> Decimal | None:
+        """Closest listed strike to target; ties resolve to the lower strike."""
+        floats, decimals = self._side(option_type)
+        if not len(floats):
+            return None
+        value = float(target)
+        index = int(np.searchsorted(floats, value))
+        if index == 0:
+            return decimals[0]
+        if index == len(floats):
+            return decimals[-1]
+        lower, upper = floats[index - 1], floats[index]
+        return decimals[index - 1] if value - lower <= upper - value else decimals[index]
+
+    def offset_strike(
+        self, strike: Decimal, width: Decimal | float, option_type: OptionSide | None = None
+    ) -> Decimal | None:
+        """Listed strike closest to strike + width (negative width moves down)."""
+        return self.nearest_strike(Decimal(str(strike)) + Decimal(str(width)), option_type)
+
+    def iter_by_delta(self, option_type: OptionSide) -> Iterator[Decimal]:
+        """
+        Strikes in order of increasing absolute delta (far OTM towards ITM).
+
+        Put deltas grow in magnitude with the strike, call deltas shrink, so
+        this is an ordered walk without reading any Greeks; delta searches can
+        stop as soon as they pass their target.
+        """
+        decimals = self._side(option_type)[1]
+        return iter(decimals) if option_type == "put" else reversed(decimals)
+
+    def symbols_for(
+        self, strike: Decimal, option_type: OptionSide
+    ) -> tuple[str | None, str | None]:
+        """(OCC symbol, streamer symbol) for a strike and side, or (None, None)."""
+        index = int(np.searchsorted(self.strikes, float(strike)))
+        if index >= len(self.strikes) or self.strikes[index] != float(strike):
+            return None, None
+        if option_type == "put":
+            return self.puts[index], self.put_streamer_symbols[index]
+        return self.calls[index], self.call_streamer_symbols[index]
+
+    def to_strike_dicts(self) -> list[dict]:
+        """Legacy chain["strikes"] format (one dict per strike)."""
+        return [
+            {
+                "strike_price": str(_to_decimal(strike)),
+                "call": self.calls[i],
+                "put": self.puts[i],
+                "call_streamer_symbol": self.call_streamer_symbols[i],
+                "put_streamer_symbol": self.put_streamer_symbols[i],
+            }
+            for i, strike in enumerate(self.strikes)
+        ]
+
+
+class OptionChainSnapshot:
+    """Every expiration of a symbol's option chain, decoded per expiration on demand."""
+
+    __slots__ = ("_decoded", "_payloads", "fetched_at", "symbol")
+
+    def __init__(self, symbol: str, payloads: dict[date, bytes], fetched_at: str | None = None):
+        self.symbol = symbol
+        self.fetched_at = fetched_at
+        self._payloads = payloads
+        self._decoded: dict[date, ExpirationStrikes] = {}
+
+    @classmethod
+    def from_nested_chains(
+        cls, symbol: str, chains: Iterable, fetched_at: str | None = None
+    ) -> OptionChainSnapshot:
+        """
+        Build from TastyTrade NestedOptionChain objects.
+
+        When several chains (e.g. SPX and SPXW roots) list the same date, the
+        last one wins, as in the previous per-expiration extraction.
+        """
+        expirations: dict[date, ExpirationStrikes] = {}
+        for chain in chains or ():
+            for expiration_obj in getattr(chain, "expirations", None) or ():
+                exp_date = expiration_obj.expiration_date
+                if hasattr(exp_date, "date"):
+                    exp_date = exp_date.date()
+                expirations[exp_date] = ExpirationStrikes.from_rows(
+                    exp_date,
+                    (
+                        (
+                            Decimal(str(strike.strike_price)),
+                            getattr(strike, "put", None),
+                            getattr(strike, "call", None),
+                            getattr(strike, "put_streamer_symbol", None),
+                            getattr(strike, "call_streamer_symbol", None),
+                        )
+                        for strike in getattr(expiration_obj, "strikes", None) or ()
+                    ),
+                )
+
+        snapshot = cls(
+            symbol,
+            {exp_date: strikes.encode() for exp_date, strikes in expirations.items()},
+            fetched_at,
+        )
+        snapshot._decoded.update(expirations)
+        return snapshot
+
+    @property
+    def expirations(self) -> list[date]:
+        """All expiration dates, ascending."""
+        return sorted(self._payloads)
+
+    def __contains__(self, expiration: date) -> bool:
+        return expiration in self._payloads
+
+    def expiration(self, expiration: date) -> ExpirationStrikes | None:
+        """Strikes for one expiration (decoded on first access), or None if not listed."""
+        strikes = self._decoded.get(expiration)
+        if strikes is None:
+            payload = self._payloads.get(expiration)
+            if payload is None:
+                return None
+            strikes = ExpirationStrikes.decode(expiration, payload)
+            self._decoded[expiration] = strikes
+        return strikes
+
+    # === Serialization ===
+    def to_bytes(self) -> bytes:
+        return msgpack.packb(
+            {
+                "v": PAYLOAD_VERSION,
+                "symbol": self.symbol,
+                "fetched_at": self.fetched_at,
+                "expirations": {
+                    exp_date.isoformat(): payload for exp_date, payload in self._payloads.items()
+                },
+            }
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> OptionChainSnapshot | None:
+        """Decode a to_bytes() payload; expiration blobs stay encoded. None if unreadable."""
+        try:
+            raw = msgpack.unpackb(data)
+        except Exception:
+            return None
+        if not isinstance(raw, dict) or raw.get("v") != PAYLOAD_VERSION:
+            return None
+        return cls(
+            raw["symbol"],
+            {date.fromisoformat(iso): payload for iso, payload in raw["expirations"].items()},
+            raw.get("fetched_at"),
+        )
@@ -8,21 +8,39 @@ ARCHITECTURE:
 - Generic leg extraction from Trade.order_legs JSONField
 - Works with 2-leg, 3-leg, 4-leg positions
 - Uses cached DXFeed Greeks data from streaming service
+- Batch path: all legs of all positions read with one cache get_many, one
+  HistoricalGreeks query for misses, aggregated as NumPy arrays
+- Position and portfolio Greeks are cached for 5 seconds, so polling views
+  and the metrics loop reuse them instead of recomputing every position
 - Follows SIMPLICITY FIRST principle - direct implementation
 """
 
-from decimal import Decimal
+from collections.abc import Iterable
+from datetime import timedelta
 from typing import Any
 
 from django.contrib.auth.models import AbstractBaseUser
 from django.core.cache import cache
+from django.db.models import OuterRef, Subquery
+
+import numpy as np
+from tastytrade.instruments import Option
 
 from services.core.cache import CacheManager
+from services.core.cache_index import register_keys, set_tracked
+from services.core.constants import L1_GREEKS_TTL
+from services.core.l1_cache import l1_cache
 from services.core.logging import get_logger
 from trading.models import Position
 
 logger = get_logger(__name__)
 
+GREEK_NAMES = ("delta", "gamma", "theta", "vega", "rho")
+OPTIONS_CONTRACT_MULTIPLIER = 100
+DB_GREEKS_MAX_AGE = 3600  # Reject database fallback Greeks older than 60 minutes
+DB_GREEKS_STALE_AGE = 600  # Flag database fallback Greeks older than 10 minutes as stale
+POSITION_GREEKS_CACHE_TTL = 5  # Seconds position/portfolio Greeks are reused across polls
+
 
 class GreeksService:
     """
@@ -53,65 +71,85 @@ class GreeksService:
             Dict with delta, gamma, theta, vega, rho or None if no data
         """
         try:
+            return self.get_greeks_for_positions([position]).get(position.id)
+        except Exception as e:
+            logger.error(f"Error calculating position Greeks: {e}", exc_info=True)
+            return None
+
+    def get_greeks_for_positions(self, positions: Iterable[Position]) -> dict[int, dict[str, Any]]:
+        """
+        Get Greeks for many positions with one cache read and one DB fallback query.
+
+        Collects every leg across all positions, fetches leg Greeks in bulk
+        (get_greeks_many), then aggregates with NumPy:
+        position Greeks = sum over legs of direction x quantity x leg Greeks x 100.
+
+        Args:
+            positions: Position model instances
+
+        Returns:
+            Dict mapping position id to Greeks dict (delta, gamma, theta, vega,
+            rho, source). Positions without legs metadata are omitted.
+        """
+        position_ids: list[int] = []
+        leg_positions: list[int] = []
+        leg_symbols: list[str] = []
+        leg_weights: list[int] = []
+
+        for position in positions:
             # Always use broker metadata as source of truth
-            if not position.metadata or not position.metadata.get("legs"):
+            legs = (position.metadata or {}).get("legs")
+            if not legs:
                 logger.warning(
                     f"No legs data found in Position.metadata for position {position.id}"
                 )
-                return None
-
-            legs = position.metadata["legs"]
-
-            # Aggregate Greeks from all legs
-            portfolio_greeks = {
-                "delta": Decimal("0"),
-                "gamma": Decimal("0"),
-                "theta": Decimal("0"),
-                "vega": Decimal("0"),
-                "rho": Decimal("0"),
-            }
+                continue
 
+            index = len(position_ids)
+            position_ids.append(position.id)
             for leg in legs:
                 # Each leg has: symbol (OCC), quantity, quantity_direction
                 occ_symbol = leg.get("symbol")
-                direction = leg.get("quantity_direction", "").lower()
-                qty = leg.get("quantity", 0)
-
                 if not occ_symbol:
                     logger.warning(f"Leg missing OCC symbol: {leg}")
                     continue
+                try:
+                    qty = int(leg.get("quantity", 0))
+                except (TypeError, ValueError):
+                    logger.warning(f"Leg has invalid quantity: {leg}")
+                    continue
 
-                # Determine action from quantity_direction or quantity sign
-                action = "SELL" if direction == "short" or qty < 0 else "BUY"
-                leg_quantity = abs(int(qty))
+                # Direction from quantity_direction or quantity sign: long +1, short -1
+                direction = (leg.get("quantity_direction") or "").lower()
+                sign = -1 if direction == "short" or qty < 0 else 1
 
-                # Fetch Greeks from cache
-                leg_greeks = self._get_leg_greeks(occ_symbol)
+                leg_positions.append(index)
+                leg_symbols.append(occ_symbol)
+                leg_weights.append(sign * abs(qty))
 
-                if leg_greeks:
-                    # Direction multiplier: BUY = long (+1), SELL = short (-1)
-                    multiplier = 1 if action == "BUY" else -1
+        if not position_ids:
+            return {}
 
-                    # Aggregate Greeks (metadata.legs already contains total quantities)
-                    for greek in portfolio_greeks:
-                        value = leg_greeks.get(greek, 0)
-                        portfolio_greeks[greek] += Decimal(str(value)) * multiplier * leg_quantity
+        leg_greeks = self.get_greeks_many(set(leg_symbols)) if leg_symbols else {}
 
-            # Apply standard options contract multiplier
-            OPTIONS_CONTRACT_MULTIPLIER = 100
+        # (legs x greeks) matrix; legs without data contribute zero
+        values = np.zeros((len(leg_symbols), len(GREEK_NAMES)))
+        for row, symbol in enumerate(leg_symbols):
+            greeks = leg_greeks.get(symbol)
+            if greeks:
+                values[row] = [float(greeks.get(name) or 0) for name in GREEK_NAMES]
 
-            return {
-                "delta": float(portfolio_greeks["delta"]) * OPTIONS_CONTRACT_MULTIPLIER,
-                "gamma": float(portfolio_greeks["gamma"]) * OPTIONS_CONTRACT_MULTIPLIER,
-                "theta": float(portfolio_greeks["theta"]) * OPTIONS_CONTRACT_MULTIPLIER,
-                "vega": float(portfolio_greeks["vega"]) * OPTIONS_CONTRACT_MULTIPLIER,
-                "rho": float(portfolio_greeks["rho"]) * OPTIONS_CONTRACT_MULTIPLIER,
+        weights = np.asarray(leg_weights, dtype=float) * OPTIONS_CONTRACT_MULTIPLIER
+        totals = np.zeros((len(position_ids), len(GREEK_NAMES)))
+        np.add.at(totals, np.asarray(leg_positions, dtype=int), values * weights[:, None])
+
+        return {
+            position_id: {
+                **{name: float(value) for name, value in zip(GREEK_NAMES, row, strict=True)},
                 "source": "dxfeed_streaming",
             }
-
-        except Exception as e:
-            logger.error(f"Error calculating position Greeks: {e}", exc_info=True)
-            return None
+            for position_id, row in zip(position_ids, totals, strict=True)
+        }
 
     def get_portfolio_greeks(self, user: AbstractBaseUser) -> dict[str, Any]:
         """
@@ -130,25 +168,9 @@ class GreeksService:
                 user=user,
                 is_app_managed=True,
                 lifecycle_state__in=["open_full", "open_partial", "closing"],
-            )
+            ).only("id", "metadata")
 
-            portfolio = {
-                "delta": 0.0,
-                "gamma": 0.0,
-                "theta": 0.0,
-                "vega": 0.0,
-                "rho": 0.0,
-                "position_count": 0,
-            }
-
-            for position in open_positions:
-                pos_greeks = self.get_position_greeks(position)
-                if pos_greeks:
-                    for greek in ["delta", "gamma", "theta", "vega", "rho"]:
-                        portfolio[greek] += pos_greeks[greek]
-                    portfolio["position_count"] += 1
-
-            return portfolio
+            return self.aggregate_portfolio(self.get_greeks_for_positions(open_positions))
 
         except Exception as e:
             logger.error(f"Error calculating portfolio Greeks: {e}", exc_info=True)
@@ -162,51 +184,112 @@ class GreeksService:
                 "error": str(e),
             }
 
+    @staticmethod
+    def aggregate_portfolio(position_greeks: dict[int, dict[str, Any]]) -> dict[str, Any]:
+        """Sum per-position Greeks (from get_greeks_for_positions) into portfolio totals."""
+        portfolio: dict[str, Any] = dict.fromkeys(GREEK_NAMES, 0.0)
+        for greeks in position_greeks.values():
+            for name in GREEK_NAMES:
+                portfolio[name] += greeks[name]
+        portfolio["position_count"] = len(position_greeks)
+        return portfolio
+
     def _get_leg_greeks(self, occ_symbol: str) -> dict[str, Any] | None:
         """
         Get Greeks for a single option leg from cache, with database fallback.
 
-        Data priority:
-        1. Redis cache (OCC format)
-        2. Redis cache (streamer format)
-        3. HistoricalGreeks database (< 60 min old)
+        See get_greeks_many for the data priority.
+        """
+        return self.get_greeks_many([occ_symbol]).get(occ_symbol)
 
-        Tries OCC format first, then falls back to streamer format.
-        This matches the pattern used in options_cache.py for quote lookups.
+    def get_greeks_many(self, occ_symbols: Iterable[str]) -> dict[str, dict[str, Any]]:
+        """
+        Get Greeks for many option legs with one cache read.
+
+        Data priority:
+        1. In-process L1, then Redis (dxfeed:greeks, streamer format) - single get_many
+        2. HistoricalGreeks database (< 60 min old) - single query for all misses
 
         Args:
-            occ_symbol: OCC-formatted option symbol (e.g., 'SPY   251107P00591000')
+            occ_symbols: OCC-formatted option symbols (or underlying symbols)
 
         Returns:
-            Dict with delta, gamma, theta, vega, rho or None
+            Dict mapping symbol to Greeks dict; symbols without data are omitted
         """
         # Cache uses streamer format (matches DXFeed event_symbol)
-        greeks: dict[str, Any] | None = None
-
-        # Check for spaces to identify option symbols vs underlying symbols
-        if " " in occ_symbol:
-            try:
-                from tastytrade.instruments import Option
-
-                streamer_symbol = Option.occ_to_streamer_symbol(occ_symbol)
-                streamer_key = CacheManager.dxfeed_greeks(streamer_symbol)
-                greeks = cache.get(streamer_key)
-            except Exception as e:
-                logger.warning(f"Failed to convert OCC symbol {occ_symbol} to streamer format: {e}")
-        else:
-            # For underlying symbols, use symbol directly
-            key = CacheManager.dxfeed_greeks(occ_symbol)
-            greeks = cache.get(key)
-
-        # Fall back to HistoricalGreeks database if cache miss
-        if not greeks:
-            greeks = self._get_greeks_from_database(occ_symbol)
-            if greeks:
+        key_to_symbol: dict[str, str] = {}
+        for occ_symbol in occ_symbols:
+            # Check for spaces to identify option symbols vs underlying symbols
+            if " " in occ_symbol:
+                try:
+                    streamer_symbol = Option.occ_to_streamer_symbol(occ_symbol)
+                except Exception as e:
+                    logger.warning(
+                        f"Failed to convert OCC symbol {occ_symbol} to streamer format: {e}"
+                    )
+                    continue
+                key_to_symbol[CacheManager.dxfeed_greeks(streamer_symbol)] = occ_symbol
+            else:
+                key_to_symbol[CacheManager.dxfeed_greeks(occ_symbol)] = occ_symbol
+
+        cached = l1_cache.get_many(key_to_symbol, L1_GREEKS_TTL) if key_to_symbol else {}
+        result = {key_to_symbol[key]: greeks for key, greeks in cached.items() if greeks}
+
+        # Fall back to HistoricalGreeks database for cache misses
+        misses = [symbol for symbol in key_to_symbol.values() if symbol not in result]
+        if misses:
+            fallback = self._get_greeks_from_database_many(misses)
+            for symbol, greeks in fallback.items():
                 logger.info(
-                    f"Using database fallback for {occ_symbol} (age: {greeks.get('age_seconds')}s)"
+                    f"Using database fallback for {symbol} (age: {greeks.get('age_seconds')}s)"
                 )
+            result.update(fallback)
 
-        return greeks
+        return result
+
+    def _get_greeks_from_database_many(self, occ_symbols: list[str]) -> dict[str, dict[str, Any]]:
+        """
+        Fetch the latest HistoricalGreeks row for each symbol in one query.
+
+        Same staleness rules as _get_greeks_from_database.
+        """
+        try:
+            from django.utils import timezone
+
+            from trading.models import HistoricalGreeks
+
+            now = timezone.now()
+            latest_timestamp = (
+                HistoricalGreeks.objects.filter(option_symbol=OuterRef("option_symbol"))
+                .order_by("-timestamp")
+                .values("timestamp")[:1]
+            )
+            rows = HistoricalGreeks.objects.filter(
+                option_symbol__in=occ_symbols,
+                timestamp__gte=now - timedelta(seconds=DB_GREEKS_MAX_AGE),
+                timestamp=Subquery(latest_timestamp),
+            )
+
+            return {row.option_symbol: self._historical_greeks_payload(row, now) for row in rows}
+
+        except Exception as e:
+            logger.error(f"Error fetching Greeks from database: {e}", exc_info=True)
+            return {}
+
+    @staticmethod
+    def _historical_greeks_payload(row, now) -> dict[str, Any]:
+        age_seconds = (now - row.timestamp).total_seconds()
+        return {
+            "delta": float(row.delta),
+            "gamma": float(row.gamma),
+            "theta": float(row.theta),
+            "vega": float(row.vega),
+            "rho": float(row.rho) if row.rho else 0,
+            # Mark as stale if > 10 minutes old
+            "is_stale": age_seconds > DB_GREEKS_STALE_AGE,
+            "age_seconds": int(age_seconds),
+            "source": "database_fallback",
+        }
 
     def _get_greeks_from_database(self, occ_symbol: str) -> dict[str, Any] | None:
         """
@@ -238,26 +321,15 @@ class GreeksService:
                 logger.debug(f"No historical Greeks found for {occ_symbol}")
                 return None
 
-            age_seconds = (timezone.now() - latest.timestamp).total_seconds()
+            now = timezone.now()
+            age_seconds = (now - latest.timestamp).total_seconds()
 
             # Reject data > 60 minutes old (user preference: moderate staleness tolerance)
-            if age_seconds > 3600:
+            if age_seconds > DB_GREEKS_MAX_AGE:
                 logger.debug(f"Database Greeks too stale for {occ_symbol}: {int(age_seconds)}s old")
                 return None
 
-            # Mark as stale if > 10 minutes old
-            is_stale = age_seconds > 600
-
-            return {
-                "delta": float(latest.delta),
-                "gamma": float(latest.gamma),
-                "theta": float(latest.theta),
-                "vega": float(latest.vega),
-                "rho": float(latest.rho) if latest.rho else 0,
-                "is_stale": is_stale,
-                "age_seconds": int(age_seconds),
-                "source": "database_fallback",
-            }
+            return self._historical_greeks_payload(latest, now)
 
         except Exception as e:
             logger.error(
@@ -278,7 +350,7 @@ class GreeksService:
         Returns:
             Dict with delta, gamma, theta, vega, rho or None if no data
         """
-        cache_key: str = f"position_greeks_{position.id}"
+        cache_key: str = CacheManager.position_greeks(position.id)
         cached: dict[str, Any] | None = cache.get(cache_key)
 
         if cached:
@@ -290,7 +362,12 @@ class GreeksService:
 
         # Cache result if available (5 second TTL)
         if greeks:
-            cache.set(cache_key, greeks, 5)
+            set_tracked(
+                CacheManager.position_greeks_family(position.user_id),
+                cache_key,
+                greeks,
+                POSITION_GREEKS_CACHE_TTL,
+            )
             logger.debug(f"Cached Greeks for position {position.id}")
 
         return greeks
@@ -308,7 +385,7 @@ class GreeksService:
         Returns:
             Dict with aggregated portfolio Greeks
         """
-        cache_key: str = f"portfolio_greeks_{user.id}"
+        cache_key: str = CacheManager.portfolio_greeks(user.id)
         cached: dict[str, Any] | None = cache.get(cache_key)
 
         if cached:
@@ -319,7 +396,57 @@ class GreeksService:
         greeks: dict[str, Any] = self.get_portfolio_greeks(user)
 
         # Cache result (5 second TTL)
-        cache.set(cache_key, greeks, 5)
+        set_tracked(
+            CacheManager.position_greeks_family(user.id),
+            cache_key,
+            greeks,
+            POSITION_GREEKS_CACHE_TTL,
+        )
         logger.debug(f"Cached portfolio Greeks for user {user.id}")
 
         return greeks
+
+    def get_greeks_for_positions_cached(
+        self, positions: Iterable[Position]
+    ) -> dict[int, dict[str, Any]]:
+        """
+        get_greeks_for_positions() behind the 5-second per-position cache.
+
+        Shares entries with get_position_greeks_cached: one get_many for all
+        positions, then one batch calculation for the ones not cached.
+
+        Args:
+            positions: Position model instances
+
+        Returns:
+            Dict mapping position id to Greeks dict
+        """
+        by_key = {CacheManager.position_greeks(position.id): position for position in positions}
+        if not by_key:
+            return {}
+
+        cached = cache.get_many(list(by_key))
+        result = {by_key[key].id: greeks for key, greeks in cached.items() if greeks}
+        missing = [position for key, position in by_key.items() if not cached.get(key)]
+        if not missing:
+            logger.debug(f"Cache hit for Greeks of {len(result)} positions")
+            return result
+
+        fresh = self.get_greeks_for_positions(missing)
+        to_cache: dict[int, dict[str, dict[str, Any]]] = {}  # user id -> cache entries
+        for position in missing:
+            greeks = fresh.get(position.id)
+            if greeks:
+                result[position.id] = greeks
+                to_cache.setdefault(position.user_id, {})[
+                    CacheManager.position_greeks(position.id)
+                ] = greeks
+
+        for user_id, entries in to_cache.items():
+            cache.set_many(entries, POSITION_GREEKS_CACHE_TTL)
+            register_keys(
+                CacheManager.position_greeks_family(user_id),
+                list(entries),
+                POSITION_GREEKS_CACHE_TTL,
+            )
+        return result
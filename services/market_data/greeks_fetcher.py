@@ -3,7 +3,7 @@ Greeks fetcher for strike selection.
 
 Provides Greeks data for delta-based strike selection with:
 - Cache integration with configurable TTL (default 90s)
-- Streaming + historical fallback
+- Streaming + historical fallback, each read once for the whole batch
 - Market stress bypass (bypass cache when stress > threshold)
 
 This is distinct from GreeksService which handles position/portfolio Greeks.
@@ -19,6 +19,8 @@ from typing import TYPE_CHECKING
 
 from django.core.cache import cache
 
+from asgiref.sync import sync_to_async
+
 from services.core.logging import get_logger
 from services.market_data.greeks import GreeksService
 
@@ -99,59 +101,75 @@ class GreeksFetcher:
         # Ensure streaming subscription (best effort)
         await self._ensure_subscription(symbol, normalized_expiration, symbols)
 
+        keys = {occ_symbol: f"{self.CACHE_PREFIX}:{occ_symbol}" for occ_symbol in symbols}
+
+        # Check cache first (unless bypassing)
         results: dict[str, dict] = {}
-        for occ_symbol in symbols:
-            cache_key = f"{self.CACHE_PREFIX}:{occ_symbol}"
-
-            # Check cache first (unless bypassing)
-            if not bypass_cache:
-                cached = cache.get(cache_key)
-                if cached:
-                    results[occ_symbol] = cached
-                    continue
-
-            # Try streaming data
-            snapshot = self._read_streaming_greeks(occ_symbol)
-
-            # Fallback to historical if streaming unavailable
-            if not snapshot:
-                snapshot = self._read_historical_greeks(occ_symbol)
-                if snapshot:
-                    logger.debug(
-                        f"Using database fallback for {occ_symbol} "
-                        f"(age: {snapshot.get('age_seconds', 'unknown')}s)"
-                    )
-
-            # Cache and add to results
-            if snapshot:
-                cache.set(cache_key, snapshot, self.ttl_seconds)
-                results[occ_symbol] = snapshot
+        if not bypass_cache:
+            cached = cache.get_many(list(keys.values()))
+            for occ_symbol, key in keys.items():
+                if cached.get(key):
+                    results[occ_symbol] = cached[key]
+
+        # Streaming snapshot for every miss in one read
+        misses = [occ_symbol for occ_symbol in symbols if occ_symbol not in results]
+        fresh = self._read_streaming_greeks_many(misses) if misses else {}
+
+        # Fallback to historical for whatever streaming could not serve
+        missing = [occ_symbol for occ_symbol in misses if occ_symbol not in fresh]
+        if missing:
+            historical = await sync_to_async(self._read_historical_greeks_many)(missing)
+            for occ_symbol, snapshot in historical.items():
+                logger.debug(
+                    f"Using database fallback for {occ_symbol} "
+                    f"(age: {snapshot.get('age_seconds', 'unknown')}s)"
+                )
+            fresh.update(historical)
+
+        # Cache and add to results
+        if fresh:
+            cache.set_many(
+                {keys[occ_symbol]: snapshot for occ_symbol, snapshot in fresh.items()},
+                self.ttl_seconds,
+            )
+            results.update(fresh)
 
         return results
 
-    def _read_streaming_greeks(self, occ_symbol: str) -> dict | None:
-        """Read Greeks from streaming cache."""
+    async def fetch_historical_greeks(self, occ_symbols: Iterable[str]) -> dict[str, dict]:
+        """
+        Latest persisted Greeks for symbols a live chain snapshot could not serve.
+
+        Used by DeltaStrikeSelector, which reads streaming Greeks through
+        OptionChainGreeks and only falls back here for the misses.
+        """
+        symbols = self._deduplicate_symbols(occ_symbols)
+        if not symbols:
+            return {}
+        return await sync_to_async(self._read_historical_greeks_many)(symbols)
+
+    def _read_streaming_greeks_many(self, occ_symbols: list[str]) -> dict[str, dict]:
+        """Read Greeks for many symbols from the streaming cache in one round trip."""
         try:
             from services.streaming.options_service import StreamingOptionsDataService
 
             options_service = StreamingOptionsDataService(self.user)
-            greeks = options_service.read_greeks(occ_symbol)
-
-            if not greeks:
-                return None
-
-            return self._serialize_snapshot(greeks)
+            greeks = options_service.read_greeks_many(occ_symbols)
+            return {
+                occ_symbol: self.serialize_snapshot(snapshot)
+                for occ_symbol, snapshot in greeks.items()
+            }
         except Exception as exc:
-            logger.warning(f"Streaming Greeks lookup failed for {occ_symbol}: {exc}")
-            return None
+            logger.warning(f"Streaming Greeks lookup failed for {len(occ_symbols)} symbols: {exc}")
+            return {}
 
-    def _read_historical_greeks(self, occ_symbol: str) -> dict | None:
-        """Fetch Greeks from historical database."""
+    def _read_historical_greeks_many(self, occ_symbols: list[str]) -> dict[str, dict]:
+        """Fetch latest Greeks for many symbols from the historical database."""
         try:
-            return self.greeks_service._get_greeks_from_database(occ_symbol)
+            return self.greeks_service._get_greeks_from_database_many(occ_symbols)
         except Exception as exc:
-            logger.warning(f"Historical Greeks lookup failed for {occ_symbol}: {exc}")
-            return None
+            logger.warning(f"Historical Greeks lookup failed for {len(occ_symbols)} symbols: {exc}")
+            return {}
 
     async def _ensure_subscription(
         self,
@@ -195,7 +213,7 @@ class GreeksFetcher:
             return None
 
     @staticmethod
-    def _serialize_snapshot(snapshot: OptionGreeks) -> dict:
+    def serialize_snapshot(snapshot: OptionGreeks) -> dict:
         """Convert OptionGreeks to serializable dict."""
 
         def _to_float(value):
@@ -0,0 +1,228 @@
+"""
+Fused technical indicator kernel over contiguous float arrays.
+
+TechnicalIndicatorCalculator used to build a pandas DataFrame per analysis
+and compute RSI, MACD, Bollinger Bands, ADX and historical volatility
+separately, each with its own thread hop, cache round trips and database
+upsert. This kernel computes every indicator for a symbol in one call:
+
+- Windowed values (RSI, Bollinger Bands, SMA20, support/resistance, recent
+  move, HV) are read off the tail of the arrays with vectorized NumPy
+- Every exponential average (MACD fast/slow/signal, ADX's ATR, +DM, -DM and
+  DX smoothing) is advanced together in a single pass over the bars
+
+Values match the previous pandas implementations (rolling().mean/std,
+ewm(span=..., adjust=True) for MACD, ewm(span=..., adjust=False) for ADX).
+KERNEL_VERSION is stored with persisted results; bump it whenever a formula
+or parameter changes so old records are recomputed.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+KERNEL_VERSION = 1
+
+MIN_BARS = 20  # Fewer bars than this and indicators are reported unavailable
+
+RSI_PERIOD = 14
+MACD_FAST, MACD_SLOW, MACD_SIGNAL = 12, 26, 9
+BOLLINGER_PERIOD, BOLLINGER_STD_DEV = 20, 2.0
+ADX_PERIOD = 14
+HV_PERIOD = 30
+LEVEL_WINDOW = 20  # SMA and support/resistance lookback
+RECENT_MOVE_WINDOW = 5
+
+_EPSILON = 1e-10  # Stands in for zero denominators, as the pandas code did
+
+
+@dataclass(slots=True)
+class PriceBars:
+    """Daily OHLC bars as float64 arrays (oldest first)."""
+
+    close: np.ndarray
+    open: np.ndarray | None = None
+    high: np.ndarray | None = None
+    low: np.ndarray | None = None
+    last_date: str | None = None
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[dict]) -> PriceBars | None:
+        """
+        Build from MarketDataService.get_historical_prices rows.
+
+        Returns None when the rows carry no close prices.
+        """
+        if not rows or "close" not in rows[0]:
+            return None
+
+        def column(name: str) -> np.ndarray | None:
+            if name not in rows[0]:
+                return None
+            return np.array([row.get(name) for row in rows], dtype=np.float64)
+
+        last_date = rows[-1].get("date")
+        return cls(
+            close=column("close"),
+            open=column("open"),
+            high=column("high"),
+            low=column("low"),
+            last_date=str(last_date) if last_date is not None else None,
+        )
+
+
+def rsi(close: np.ndarray, period: int = RSI_PERIOD) -> float:
+    """Simple-average RSI over the last period price changes."""
+    deltas = np.diff(close, prepend=close[0])[-period:]
+    avg_gain = float(np.where(deltas > 0, deltas, 0.0).mean())
+    avg_loss = float(np.where(deltas < 0, -deltas, 0.0).mean())
+    rs = avg_gain / (avg_loss or _EPSILON)
+    return 100 - (100 / (1 + rs))
+
+
+def bollinger_bands(
+    close: np.ndarray, period: int = BOLLINGER_PERIOD, std_dev: float = BOLLINGER_STD_DEV
+) -> tuple[float, float, float]:
+    """(upper, middle, lower) bands of the last period closes."""
+    window = close[-period:]
+    middle = float(window.mean())
+    width = std_dev * float(window.std(ddof=1))
+    return middle + width, middle, middle - width
+
+
+def historical_volatility(close: np.ndarray, period: int = HV_PERIOD) -> float:
+    """Annualized volatility (%) of daily returns over the last period bars; 0 if too short."""
+    prices = close[-(period + 1) :]
+    if len(prices) < 3:
+        return 0.0
+    returns = prices[1:] / prices[:-1] - 1
+    return float(returns.std(ddof=1)) * math.sqrt(252) * 100
+
+
+def _exponential_pass(
+    close: np.ndarray,
+    high: np.ndarray | None,
+    low: np.ndarray | None,
+    *,
+    fast: int = MACD_FAST,
+    slow: int = MACD_SLOW,
+    signal: int = MACD_SIGNAL,
+    adx_period: int = ADX_PERIOD,
+) -> tuple[float, float, float, float | None]:
+    """
+    One pass over the bars advancing every exponential average.
+
+    MACD EMAs are bias-adjusted (pandas adjust=True); ADX uses the recursive
+    form (adjust=False), with +DM/-DM and DX starting on the second bar.
+
+    Returns:
+        (macd_line, signal_line, histogram, adx); adx is None without high/low
+    """
+    decay_fast = 1 - 2 / (fast + 1)
+    decay_slow = 1 - 2 / (slow + 1)
+    decay_signal = 1 - 2 / (signal + 1)
+    alpha_adx = 2 / (adx_period + 1)
+    with_adx = high is not None and low is not None
+
+    fast_num = fast_den = slow_num = slow_den = signal_num = signal_den = 0.0
+    macd_line = signal_line = 0.0
+    atr = plus_dm_avg = minus_dm_avg = adx_avg = 0.0
+
+    closes = close.tolist()
+    highs = high.tolist() if with_adx else None
+    lows = low.tolist() if with_adx else None
+
+    for i, price in enumerate(closes):
+        fast_num = price + decay_fast * fast_num
+        fast_den = 1 + decay_fast * fast_den
+        slow_num = price + decay_slow * slow_num
+        slow_den = 1 + decay_slow * slow_den
+        macd_line = fast_num / fast_den - slow_num / slow_den
+        signal_num = macd_line + decay_signal * signal_num
+        signal_den = 1 + decay_signal * signal_den
+        signal_line = signal_num / signal_den
+
+        if not with_adx:
+            continue
+        bar_range = highs[i] - lows[i]
+        if i == 0:
+            atr = bar_range
+            continue
+
+        prev_close = closes[i - 1]
+        true_range = max(bar_range, abs(highs[i] - prev_close), abs(lows[i] - prev_close))
+        up_move = highs[i] - highs[i - 1]
+        down_move = lows[i - 1] - lows[i]
+        plus_dm = up_move if up_move > down_move and up_move > 0 else 0.0
+        minus_dm = down_move if down_move > up_move and down_move > 0 else 0.0
+
+        atr += alpha_adx * (true_range - atr)
+        if i == 1:
+            plus_dm_avg, minus_dm_avg = plus_dm, minus_dm
+        else:
+            plus_dm_avg += alpha_adx * (plus_dm - plus_dm_avg)
+            minus_dm_avg += alpha_adx * (minus_dm - minus_dm_avg)
+
+        plus_di = 100 * plus_dm_avg / (atr or _EPSILON)
+        minus_di = 100 * minus_dm_avg / (atr or _EPSILON)
+        dx = 100 * abs(plus_di - minus_di) / ((plus_di + minus_di) or _EPSILON)
+        adx_avg = dx if i == 1 else adx_avg + alpha_adx * (dx - adx_avg)
+
+    adx_value = float(adx_avg) if with_adx and len(closes) > 1 else None
+    return macd_line, signal_line, macd_line - signal_line, adx_value
+
+
+def adx(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int = ADX_PERIOD) -> float:
+    """ADX trend strength (0-100) from OHLC arrays."""
+    return _exponential_pass(close, high, low, adx_period=period)[3] or 0.0
+
+
+def compute_indicators(bars: PriceBars) -> dict:
+    """
+    Every raw indicator for one symbol.
+
+    Returns:
+        dict with rsi, macd_line, macd_signal_line, macd_histogram,
+        bollinger_upper/middle/lower, adx, historical_volatility, sma_20,
+        support_level, resistance_level, recent_move_pct, current_price and
+        open_price (None where the bars lack the needed columns)
+    """
+    close = bars.close
+    current_price = float(close[-1])
+    macd_line, signal_line, histogram, adx_value = _exponential_pass(close, bars.high, bars.low)
+    upper, middle, lower = bollinger_bands(close)
+
+    has_range = bars.high is not None and bars.low is not None
+    if has_range:
+        recent_high = float(bars.high[-RECENT_MOVE_WINDOW:].max())
+        recent_low = float(bars.low[-RECENT_MOVE_WINDOW:].min())
+        recent_move_pct = abs((recent_high - recent_low) / current_price) * 100
+    else:
+        recent_move_pct = 0.0
+
+    return {
+        "rsi": rsi(close),
+        "macd_line": macd_line,
+        "macd_signal_line": signal_line,
+        "macd_histogram": histogram,
+        "bollinger_upper": upper,
+        "bollinger_middle": middle,
+        "bollinger_lower": lower,
+        "adx": adx_value,
+        "historical_volatility": historical_volatility(close),
+        "sma_20": float(close[-LEVEL_WINDOW:].mean()),
+        "support_level": (float(bars.low[-LEVEL_WINDOW:].min()) if bars.low is not None else None),
+        "resistance_level": (
+            float(bars.high[-LEVEL_WINDOW:].max()) if bars.high is not None else None
+        ),
+        "recent_move_pct": recent_move_pct,
+        "current_price": current_price,
+        "open_price": float(bars.open[-1]) if bars.open is not None else current_price,
+    }
@@ -2,42 +2,56 @@
 Technical Indicator Calculator - Pure calculation service
 
 Calculates technical indicators for market analysis without blocking event loop.
-Pure calculation service - no strategy decisions. Includes two-tier caching
-(memory + database) for performance.
+Pure calculation service - no strategy decisions. All indicators for a symbol
+come from one fused NumPy pass (services.market_data.indicator_kernel) and are
+stored as a single record per symbol (memory cache + database).
 """
 
 import asyncio
+from collections.abc import Iterable
 
 from django.core.cache import cache
 
+import numpy as np
+
+from services.core.cache import CacheManager, CacheTTL
+from services.core.constants import MARKET_REPORT_PREFETCH_CONCURRENCY
 from services.core.logging import get_logger
-from services.market_data.utils.indicator_utils import (
-    calculate_bollinger_bands,
-    calculate_bollinger_bands_pandas,
-    determine_bollinger_position,
+from services.market_data.indicator_kernel import (
+    KERNEL_VERSION,
+    MIN_BARS,
+    PriceBars,
+    adx,
+    compute_indicators,
+    historical_volatility,
 )
+from services.market_data.utils.indicator_utils import determine_bollinger_position
 
 logger = get_logger(__name__)
 
+INDICATOR_RECORD_TYPE = "all"  # TechnicalIndicatorCache.indicator_type of the per-symbol record
+
 
 class TechnicalIndicatorCalculator:
     """
     Calculate technical indicators for market analysis.
 
-    Pure calculation service - no strategy decisions. Uses two-tier caching:
-    - Memory cache (5 min TTL) for hot data
-    - Database persistence for historical reference
+    Pure calculation service - no strategy decisions. Each symbol has one
+    versioned record holding every indicator, valid for the bar set it was
+    computed from (last bar date and close):
+    - Memory cache for hot data
+    - Database persistence, so records computed by the nightly run are reused
+      the next day without recomputing
     """
 
-    CACHE_TTL = 300  # 5 minutes
+    # Records are validated against the latest bar, so they can live until it changes
+    CACHE_TTL = CacheTTL.HISTORICAL
+    HISTORY_DAYS = 60
 
     async def a_calculate_indicators(self, user, symbol: str, market_snapshot: dict) -> dict:
         """
         Calculate all technical indicators without blocking event loop.
 
-        PERFORMANCE FIX: Wraps CPU-bound pandas calculations in asyncio.to_thread()
-        to prevent blocking the async event loop.
-
         Returns:
             dict with:
             - rsi: float (0-100)
@@ -50,284 +64,196 @@ class TechnicalIndicatorCalculator:
             - current_price: float
             - open_price: float
         """
-        # Get historical data using MarketDataService
-        market_data = await self._get_market_data(user, symbol, days_back=60)
-
-        if market_data is None or len(market_data) < 20:
-            return self._get_default_indicators()
+        results = await self.a_calculate_indicators_many(user, [symbol])
+        return results[symbol]
 
-        try:
-            import pandas as pd
+    async def a_calculate_indicators_many(
+        self,
+        user,
+        symbols: Iterable[str],
+        concurrency: int = MARKET_REPORT_PREFETCH_CONCURRENCY,
+    ) -> dict[str, dict]:
+        """
+        Calculate indicators for many symbols at once (nightly and 10 AM batch runs).
 
-            df = pd.DataFrame(market_data)
+        Price history is loaded with bounded concurrency; stored records are
+        read with one cache get_many and one database query; all misses are
+        computed in a single worker thread and written back with one
+        set_many and one bulk upsert.
 
-            if "close" not in df.columns:
+        Returns:
+            Indicators keyed by symbol, in the a_calculate_indicators format
+            (unavailable data yields the default, data_available=False)
+        """
+        unique = list(dict.fromkeys(symbols))
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def load(symbol: str) -> PriceBars | None:
+            async with semaphore:
+                rows = await self._get_market_data(user, symbol, days_back=self.HISTORY_DAYS)
+            if not rows or len(rows) < MIN_BARS:
+                return None
+            bars = PriceBars.from_rows(rows)
+            if bars is None:
                 logger.warning(f"No close prices for {symbol}")
-                return self._get_default_indicators()
-
-            rsi = await self._get_cached_rsi(symbol, df["close"], 14)
-
-            _macd_line, _signal_line, histogram = await self._get_cached_macd(symbol, df["close"])
-
-            upper, _middle, lower = await self._get_cached_bollinger_bands(
-                symbol, df["close"], 20, 2.0
-            )
-
-            adx = await self._get_cached_adx(symbol, df, 14)
-
-            hv_30 = await self._get_cached_hv(symbol, df["close"], 30)
-
-            current_price = float(df["close"].iloc[-1])
-            open_price = float(df["open"].iloc[-1]) if "open" in df.columns else current_price
+            return bars
 
-            bollinger_position = determine_bollinger_position(current_price, upper, lower)
-
-            sma_20 = float(df["close"].rolling(window=20).mean().iloc[-1])
-
-            support_level = (
-                float(df["low"].rolling(window=20).min().iloc[-1]) if "low" in df.columns else None
-            )
-            resistance_level = (
-                float(df["high"].rolling(window=20).max().iloc[-1])
-                if "high" in df.columns
-                else None
-            )
+        loaded = await asyncio.gather(*(load(symbol) for symbol in unique))
+        bars_by_symbol = {
+            symbol: bars for symbol, bars in zip(unique, loaded, strict=True) if bars is not None
+        }
 
-            if "high" in df.columns and "low" in df.columns:
-                recent_high = float(df["high"].tail(5).max())
-                recent_low = float(df["low"].tail(5).min())
-                recent_move_pct = abs((recent_high - recent_low) / current_price) * 100
-            else:
-                recent_move_pct = 0.0
-
-            macd_signal = self._calculate_composite_direction(
-                current_price=current_price,
-                sma_20=sma_20,
-                macd_histogram=histogram,
-                rsi=rsi,
-                adx=adx,
-                bollinger_position=bollinger_position,
-                recent_move_pct=recent_move_pct,
+        indicators = await self._get_stored_many(bars_by_symbol)
+        misses = {
+            symbol: bars for symbol, bars in bars_by_symbol.items() if symbol not in indicators
+        }
+        if misses:
+            computed = await asyncio.to_thread(self._compute_many, misses)
+            await self._store_many(
+                {
+                    symbol: self._record(misses[symbol], result)
+                    for symbol, result in computed.items()
+                }
             )
+            indicators.update(computed)
 
-            return {
-                "data_available": True,
-                "rsi": rsi,
-                "macd_signal": macd_signal,
-                "bollinger_position": bollinger_position,
-                "sma_20": sma_20,
-                "support_level": support_level,
-                "resistance_level": resistance_level,
-                "recent_move_pct": recent_move_pct,
-                "current_price": current_price,
-                "open_price": open_price,
-                "adx": adx,
-                "historical_volatility": hv_30,
-            }
-
-        except ImportError:
-            logger.warning("pandas not available, using simplified calculations")
-            return await self._calculate_indicators_simple(market_data)
-        except Exception as e:
-            logger.error(f"Error calculating indicators: {e}", exc_info=True)
-            return self._get_default_indicators()
-
-    async def _get_cached_bollinger_bands(
-        self, symbol: str, prices, period: int = 20, std_dev: float = 2.0
-    ) -> tuple:
-        """
-        Get Bollinger Bands with caching.
-
-        Returns: (upper, middle, lower) tuple
-        """
-        cache_key = f"bollinger_{symbol}_1D_{period}_{std_dev}"
-
-        cached = cache.get(cache_key)
-        if cached:
-            logger.debug(f"Bollinger Bands cache HIT for {symbol}")
-            return (cached["upper"], cached["middle"], cached["lower"])
+        return {
+            symbol: indicators.get(symbol) or self._get_default_indicators() for symbol in unique
+        }
 
-        upper, middle, lower = await asyncio.to_thread(
-            calculate_bollinger_bands_pandas, prices, period, std_dev
+    def _compute_many(self, bars_by_symbol: dict[str, PriceBars]) -> dict[str, dict]:
+        """Run the kernel for every symbol (called in a worker thread)."""
+        results = {}
+        for symbol, bars in bars_by_symbol.items():
+            try:
+                results[symbol] = self._build_result(compute_indicators(bars))
+            except Exception as e:
+                logger.error(f"Error calculating indicators for {symbol}: {e}", exc_info=True)
+        return results
+
+    def _build_result(self, raw: dict) -> dict:
+        """Derive Bollinger position and composite direction from raw kernel output."""
+        current_price = raw["current_price"]
+        bollinger_position = determine_bollinger_position(
+            current_price, raw["bollinger_upper"], raw["bollinger_lower"]
         )
+        macd_signal = self._calculate_composite_direction(
+            current_price=current_price,
+            sma_20=raw["sma_20"],
+            macd_histogram=raw["macd_histogram"],
+            rsi=raw["rsi"],
+            adx=raw["adx"],
+            bollinger_position=bollinger_position,
+            recent_move_pct=raw["recent_move_pct"],
+        )
+        return {
+            "data_available": True,
+            "rsi": raw["rsi"],
+            "macd_signal": macd_signal,
+            "bollinger_position": bollinger_position,
+            "sma_20": raw["sma_20"],
+            "support_level": raw["support_level"],
+            "resistance_level": raw["resistance_level"],
+            "recent_move_pct": raw["recent_move_pct"],
+            "current_price": current_price,
+            "open_price": raw["open_price"],
+            "adx": raw["adx"],
+            "historical_volatility": raw["historical_volatility"],
+        }
 
-        bands_data = {"upper": upper, "middle": middle, "lower": lower}
-        cache.set(cache_key, bands_data, self.CACHE_TTL)
-
-        try:
-            from trading.models import TechnicalIndicatorCache
-
-            await TechnicalIndicatorCache.objects.aupdate_or_create(
-                symbol=symbol,
-                indicator_type="bollinger",
-                timeframe="1D",
-                defaults={"data": bands_data},
-            )
-        except Exception as e:
-            logger.warning(f"Failed to cache Bollinger Bands in DB: {e}")
-
-        logger.debug(f"Bollinger Bands calculated and cached for {symbol}")
-        return (upper, middle, lower)
-
-    async def _get_cached_rsi(self, symbol: str, prices, period: int = 14) -> float:
-        """
-        Get RSI with caching.
-
-        Returns: RSI value (0-100)
-        """
-        cache_key = f"rsi_{symbol}_1D_{period}"
-
-        cached = cache.get(cache_key)
-        if cached:
-            logger.debug(f"RSI cache HIT for {symbol}")
-            return cached["value"]
+    # === Per-symbol records ===
+    @staticmethod
+    def _record(bars: PriceBars, indicators: dict) -> dict:
+        return {
+            "version": KERNEL_VERSION,
+            "bar_date": bars.last_date,
+            "last_close": float(bars.close[-1]),
+            "indicators": indicators,
+        }
 
-        rsi_value = await asyncio.to_thread(self._calculate_rsi, prices, period)
+    @staticmethod
+    def _is_current(record, bars: PriceBars) -> bool:
+        """A record is reusable only for the same kernel version and latest bar."""
+        return (
+            isinstance(record, dict)
+            and record.get("version") == KERNEL_VERSION
+            and record.get("bar_date") == bars.last_date
+            and record.get("last_close") == float(bars.close[-1])
+        )
 
-        rsi_data = {"value": rsi_value}
-        cache.set(cache_key, rsi_data, self.CACHE_TTL)
+    async def _get_stored_many(self, bars_by_symbol: dict[str, PriceBars]) -> dict[str, dict]:
+        """Current records from the cache, then the database for the rest."""
+        if not bars_by_symbol:
+            return {}
 
+        keys = {CacheManager.technical_indicators(symbol): symbol for symbol in bars_by_symbol}
+        found: dict[str, dict] = {}
         try:
-            from trading.models import TechnicalIndicatorCache
-
-            await TechnicalIndicatorCache.objects.aupdate_or_create(
-                symbol=symbol,
-                indicator_type="rsi",
-                timeframe="1D",
-                defaults={"data": rsi_data},
-            )
+            for key, record in cache.get_many(list(keys)).items():
+                symbol = keys[key]
+                if self._is_current(record, bars_by_symbol[symbol]):
+                    found[symbol] = record["indicators"]
         except Exception as e:
-            logger.warning(f"Failed to cache RSI in DB: {e}")
+            logger.warning(f"Failed to read cached indicators: {e}")
 
-        logger.debug(f"RSI calculated and cached for {symbol}")
-        return rsi_value
-
-    async def _get_cached_macd(
-        self, symbol: str, prices, fast: int = 12, slow: int = 26, signal: int = 9
-    ) -> tuple:
-        """
-        Get MACD with caching.
-
-        Returns: (macd_line, signal_line, histogram) tuple
-        """
-        cache_key = f"macd_{symbol}_1D_{fast}_{slow}_{signal}"
-
-        cached = cache.get(cache_key)
-        if cached:
-            logger.debug(f"MACD cache HIT for {symbol}")
-            return (cached["macd_line"], cached["signal_line"], cached["histogram"])
-
-        macd_line, signal_line, histogram = await asyncio.to_thread(
-            self._calculate_macd, prices, fast, slow, signal
-        )
-
-        macd_data = {"macd_line": macd_line, "signal_line": signal_line, "histogram": histogram}
-        cache.set(cache_key, macd_data, self.CACHE_TTL)
+        missing = [symbol for symbol in bars_by_symbol if symbol not in found]
+        if not missing:
+            return found
 
         try:
             from trading.models import TechnicalIndicatorCache
 
-            await TechnicalIndicatorCache.objects.aupdate_or_create(
-                symbol=symbol,
-                indicator_type="macd",
-                timeframe="1D",
-                defaults={"data": macd_data},
-            )
+            warm = {}
+            rows = TechnicalIndicatorCache.objects.filter(
+                symbol__in=missing, indicator_type=INDICATOR_RECORD_TYPE, timeframe="1D"
+            ).values_list("symbol", "data")
+            async for symbol, record in rows:
+                if self._is_current(record, bars_by_symbol[symbol]):
+                    found[symbol] = record["indicators"]
+                    warm[CacheManager.technical_indicators(symbol)] = record
+            if warm:
+                cache.set_many(warm, self.CACHE_TTL)
         except Exception as e:
-            logger.warning(f"Failed to cache MACD in DB: {e}")
-
-        logger.debug(f"MACD calculated and cached for {symbol}")
-        return (macd_line, signal_line, histogram)
-
-    async def _get_cached_adx(self, symbol: str, df, period: int = 14) -> float:
-        """
-        Get ADX with caching.
-
-        Returns: ADX value (0-100)
-        """
-        cache_key = f"adx_{symbol}_1D_{period}"
-
-        cached = cache.get(cache_key)
-        if cached:
-            logger.debug(f"ADX cache HIT for {symbol}")
-            return cached["value"]
+            logger.warning(f"Failed to read stored indicators from DB: {e}")
 
-        # Calculate (requires OHLC data)
-        adx_value = await asyncio.to_thread(self._calculate_adx, df, period)
-
-        adx_data = {"value": adx_value}
-        cache.set(cache_key, adx_data, self.CACHE_TTL)
+        return found
 
+    async def _store_many(self, records: dict[str, dict]) -> None:
+        """One cache set_many and one bulk upsert for all new records."""
+        if not records:
+            return
         try:
-            from trading.models import TechnicalIndicatorCache
-
-            await TechnicalIndicatorCache.objects.aupdate_or_create(
-                symbol=symbol,
-                indicator_type="adx",
-                timeframe="1D",
-                defaults={"data": adx_data},
+            cache.set_many(
+                {
+                    CacheManager.technical_indicators(symbol): record
+                    for symbol, record in records.items()
+                },
+                self.CACHE_TTL,
             )
         except Exception as e:
-            logger.warning(f"Failed to cache ADX in DB: {e}")
-
-        logger.debug(f"ADX calculated and cached for {symbol}")
-        return adx_value
-
-    async def _get_cached_hv(self, symbol: str, prices, period: int = 30) -> float:
-        """
-        Get Historical Volatility with caching.
-
-        Returns: Annualized volatility percentage (e.g., 25.5 = 25.5%)
-        """
-        cache_key = f"hv_{symbol}_1D_{period}"
-
-        cached = cache.get(cache_key)
-        if cached:
-            logger.debug(f"HV cache HIT for {symbol}")
-            return cached["value"]
-
-        hv_value = await asyncio.to_thread(self._calculate_historical_volatility, prices, period)
-
-        hv_data = {"value": hv_value}
-        cache.set(cache_key, hv_data, self.CACHE_TTL)
+            logger.warning(f"Failed to cache indicators: {e}")
 
         try:
             from trading.models import TechnicalIndicatorCache
 
-            await TechnicalIndicatorCache.objects.aupdate_or_create(
-                symbol=symbol,
-                indicator_type="historical_volatility",
-                timeframe="1D",
-                defaults={"data": hv_data},
+            await TechnicalIndicatorCache.objects.abulk_create(
+                [
+                    TechnicalIndicatorCache(
+                        symbol=symbol,
+                        indicator_type=INDICATOR_RECORD_TYPE,
+                        timeframe="1D",
+                        data=record,
+                    )
+                    for symbol, record in records.items()
+                ],
+                update_conflicts=True,
+                unique_fields=["symbol", "indicator_type", "timeframe"],
+                update_fields=["data", "calculated_at"],
             )
         except Exception as e:
-            logger.warning(f"Failed to cache HV in DB: {e}")
-
-        logger.debug(f"HV calculated and cached for {symbol}")
-        return hv_value
+            logger.warning(f"Failed to store indicators in DB: {e}")
 
-    def _calculate_rsi(self, prices, period: int = 14) -> float:
-        """Calculate RSI (Relative Strength Index)"""
-
-        delta = prices.diff()
-        gain = delta.where(delta > 0, 0).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-
-        # Avoid division by zero
-        rs = gain / loss.replace(0, 1e-10)
-        rsi = 100 - (100 / (1 + rs))
-
-        return float(rsi.iloc[-1])
-
-    def _calculate_macd(self, prices, fast: int = 12, slow: int = 26, signal: int = 9) -> tuple:
-        """Calculate MACD (Moving Average Convergence Divergence)"""
-        ema_fast = prices.ewm(span=fast).mean()
-        ema_slow = prices.ewm(span=slow).mean()
-        macd_line = ema_fast - ema_slow
-        signal_line = macd_line.ewm(span=signal).mean()
-        histogram = macd_line - signal_line
-
-        return (float(macd_line.iloc[-1]), float(signal_line.iloc[-1]), float(histogram.iloc[-1]))
+        logger.debug(f"Indicators calculated and stored for {len(records)} symbol(s)")
 
     def _calculate_composite_direction(
         self,
@@ -430,61 +356,19 @@ class TechnicalIndicatorCalculator:
         - ADX 20-30: Moderate trend
         - ADX < 20: Weak trend/range-bound (credit spreads like Senex Trident preferred)
 
-        Steps:
-        1. Calculate True Range (TR)
-        2. Calculate Directional Movement (+DM, -DM)
-        3. Smooth TR and DM using Wilder's smoothing (EWM)
-        4. Calculate Directional Indicators (+DI, -DI)
-        5. Calculate ADX from DI values
-
         Args:
-            df: DataFrame with columns: high, low, close
+            df: DataFrame (or mapping of arrays) with columns: high, low, close
             period: Lookback period (default 14)
 
         Returns:
             float: ADX value (0-100)
         """
-        import pandas as pd
-
-        high = df["high"]
-        low = df["low"]
-        close = df["close"]
-
-        # Step 1: True Range - maximum of three values
-        tr1 = high - low
-        tr2 = abs(high - close.shift())
-        tr3 = abs(low - close.shift())
-        tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-
-        # Step 2: Directional Movement
-        up_move = high - high.shift()
-        down_move = low.shift() - low
-
-        # +DM when up_move > down_move and up_move > 0
-        plus_dm = ((up_move > down_move) & (up_move > 0)) * up_move
-        # -DM when down_move > up_move and down_move > 0
-        minus_dm = ((down_move > up_move) & (down_move > 0)) * down_move
-
-        # Step 3: Wilder's smoothing (exponential weighted moving average)
-        # Note: Wilder's smoothing uses alpha = 1/period
-        atr = tr.ewm(span=period, adjust=False).mean()
-        plus_di_raw = plus_dm.ewm(span=period, adjust=False).mean()
-        minus_di_raw = minus_dm.ewm(span=period, adjust=False).mean()
-
-        # Step 4: Calculate Directional Indicators (as percentages)
-        # Avoid division by zero
-        plus_di = 100 * (plus_di_raw / atr.replace(0, 1e-10))
-        minus_di = 100 * (minus_di_raw / atr.replace(0, 1e-10))
-
-        # Step 5: Calculate DX (Directional Index)
-        # DX = 100 * |+DI - -DI| / (+DI + -DI)
-        di_sum = plus_di + minus_di
-        dx = 100 * abs(plus_di - minus_di) / di_sum.replace(0, 1e-10)
-
-        # ADX is the smoothed average of DX
-        adx = dx.ewm(span=period, adjust=False).mean()
-
-        return float(adx.iloc[-1])
+        return adx(
+            np.asarray(df["high"], dtype=np.float64),
+            np.asarray(df["low"], dtype=np.float64),
+            np.asarray(df["close"], dtype=np.float64),
+            period,
+        )
 
     def _calculate_historical_volatility(self, prices, period: int = 30) -> float:
         """
@@ -493,40 +377,14 @@ class TechnicalIndicatorCalculator:
         Historical volatility measures realized price movement, providing context
         for implied volatility (IV) comparisons. Used in HV/IV ratio analysis.
 
-        Formula:
-        1. Calculate daily returns: (price[i] / price[i-1]) - 1
-        2. Calculate standard deviation of returns
-        3. Annualize: std_dev * sqrt(252) * 100
-
         Args:
-            prices: Series of close prices
+            prices: Series (or sequence) of close prices
             period: Lookback period for volatility calculation (default 30)
 
         Returns:
             float: Annualized volatility as percentage (e.g., 25.5 = 25.5%)
-
         """
-        import math
-
-        import numpy as np
-
-        # Use last 'period' prices
-        price_data = prices.tail(period + 1)
-
-        if len(price_data) < 2:
-            return 0.0
-
-        # Calculate daily returns
-        returns = price_data.pct_change().dropna()
-
-        if len(returns) < 2:
-            return 0.0
-
-        # Calculate standard deviation
-        std_dev = float(np.std(returns, ddof=1))  # Sample std dev
-
-        # Annualize (252 trading days per year)
-        return std_dev * math.sqrt(252) * 100
+        return historical_volatility(np.asarray(prices, dtype=np.float64), period)
 
     async def _get_market_data(self, user, symbol: str, days_back: int) -> list | None:
         """Get market data from MarketDataService"""
@@ -540,82 +398,6 @@ class TechnicalIndicatorCalculator:
             logger.error(f"Error fetching market data: {e}", exc_info=True)
             return None
 
-    async def _calculate_indicators_simple(self, market_data: list) -> dict:
-        """
-        Simplified indicator calculation without pandas.
-        Used as fallback when pandas is not available.
-        """
-        if not market_data or len(market_data) < 20:
-            return self._get_default_indicators()
-
-        try:
-            # Extract close prices
-            closes = [float(d["close"]) for d in market_data if "close" in d]
-
-            if len(closes) < 20:
-                return self._get_default_indicators()
-
-            current_price = closes[-1]
-
-            # Simple SMA
-            sma_20 = sum(closes[-20:]) / 20
-
-            # Simple RSI (14 period)
-            rsi = self._calculate_rsi_simple(closes[-15:])
-
-            # Use centralized Bollinger Bands calculation
-            bands = calculate_bollinger_bands(closes, period=20, std_dev=2.0)
-            float(bands["upper"]) if bands["upper"] is not None else current_price
-            float(bands["lower"]) if bands["lower"] is not None else current_price
-
-            bollinger_position = bands["position"]
-
-            return {
-                "data_available": True,
-                "rsi": rsi,
-                "macd_signal": "neutral",  # Simplified
-                "bollinger_position": bollinger_position,
-                "sma_20": sma_20,
-                "support_level": min(closes[-20:]),
-                "resistance_level": max(closes[-20:]),
-                "recent_move_pct": 0.0,
-                "current_price": current_price,
-                "open_price": current_price,
-            }
-
-        except Exception as e:
-            logger.error(f"Error in simple calculation: {e}", exc_info=True)
-            return self._get_default_indicators()
-
-    def _calculate_rsi_simple(self, prices: list, period: int = 14) -> float:
-        """Simple RSI calculation without pandas"""
-        if len(prices) < period + 1:
-            return 50.0
-
-        gains = []
-        losses = []
-
-        for i in range(1, len(prices)):
-            change = prices[i] - prices[i - 1]
-            if change > 0:
-                gains.append(change)
-                losses.append(0)
-            else:
-                gains.append(0)
-                losses.append(abs(change))
-
-        if len(gains) < period:
-            return 50.0
-
-        avg_gain = sum(gains[-period:]) / period
-        avg_loss = sum(losses[-period:]) / period
-
-        if avg_loss == 0:
-            return 100.0
-
-        rs = avg_gain / avg_loss
-        return 100 - (100 / (1 + rs))
-
     def _get_default_indicators(self) -> dict:
         """
         Return indicator structure when data is unavailable.
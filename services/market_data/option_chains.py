@@ -1,5 +1,6 @@
 """Option chain service with strike selection for Senex Trident strategy."""
 
+import asyncio
 from datetime import date, timedelta
 from decimal import Decimal
 
@@ -11,8 +12,11 @@ from asgiref.sync import sync_to_async
 
 from accounts.models import TradingAccount
 from services.core.cache import CacheManager, CacheTTL
+from services.core.cache_index import set_tracked
 from services.core.logging import get_logger
+from services.core.single_flight import option_chain_flight
 from services.core.utils.async_utils import run_async
+from services.market_data.chain_snapshot import ExpirationStrikes, OptionChainSnapshot
 from trading.models import Position
 
 User = get_user_model()
@@ -69,7 +73,11 @@ class OptionChainService:
         return run_async(self.a_get_nested_option_chain(user, symbol))
 
     async def a_get_nested_option_chain(self, user: User, symbol: str):
-        """Fetches the full nested option chain, using a 24-hour cache."""
+        """
+        Fetches the full nested option chain, using a 24-hour cache.
+
+        Concurrent misses for the same symbol share one API call (single-flight).
+        """
         cache_key = CacheManager.option_chain_nested(symbol)
         cached_chain = cache.get(cache_key)
         if cached_chain:
@@ -87,11 +95,16 @@ class OptionChainService:
 
             from tastytrade.instruments import NestedOptionChain
 
-            chain = await NestedOptionChain.a_get(session, symbol)
-            if chain:
-                # Cache the chain for 24 hours as it's static for the day.
-                cache.set(cache_key, chain, timeout=CacheTTL.NESTED_CHAIN)
-            return chain
+            async def fetch():
+                chain = await NestedOptionChain.a_get(session, symbol)
+                if chain:
+                    # Cache the chain for 24 hours as it's static for the day.
+                    cache.set(cache_key, chain, timeout=CacheTTL.NESTED_CHAIN)
+                return chain
+
+            return await option_chain_flight.run(
+                cache_key, fetch, cached=lambda: cache.get(cache_key)
+            )
         except Exception as e:
             logger.error(
                 f"Error fetching nested option chain for {symbol}: {e}",
@@ -99,27 +112,104 @@ class OptionChainService:
             )
             return None
 
+    async def a_get_option_chain_snapshot(
+        self, user: User, symbol: str
+    ) -> OptionChainSnapshot | None:
+        """
+        Compact all-expirations option chain for a symbol.
+
+        Cached as msgpack bytes for the trading day; expirations are decoded
+        only when accessed. Concurrent misses share one API call (single-flight).
+        """
+        snapshot = self._cached_option_chain_snapshot(symbol)
+        if snapshot is not None:
+            logger.debug(f"Using cached option chain snapshot for {symbol}")
+            return snapshot
+
+        try:
+            # Get TastyTrade session
+            from services.core.data_access import get_oauth_session
+
+            session = await get_oauth_session(user)
+            if not session:
+                logger.error(f"Failed to get OAuth session for user {user.id}")
+                return None
+
+            return await self._load_option_chain_snapshot(session, symbol)
+        except Exception as e:
+            logger.error(f"Error fetching option chain snapshot for {symbol}: {e}", exc_info=True)
+            return None
+
+    @staticmethod
+    def _cached_option_chain_snapshot(symbol: str) -> OptionChainSnapshot | None:
+        data = cache.get(CacheManager.option_chain_snapshot(symbol))
+        return OptionChainSnapshot.from_bytes(data) if data else None
+
+    async def _load_option_chain_snapshot(self, session, symbol: str) -> OptionChainSnapshot | None:
+        """Snapshot from cache, or fetched from TastyTrade at most once at a time and cached."""
+        snapshot = self._cached_option_chain_snapshot(symbol)
+        if snapshot is not None:
+            return snapshot
+
+        from tastytrade.instruments import NestedOptionChain
+
+        cache_key = CacheManager.option_chain_snapshot(symbol)
+
+        async def fetch():
+            chains = await NestedOptionChain.a_get(session, symbol)
+            if not chains:
+                logger.warning(f"No option chains available for {symbol}")
+                return None
+            snapshot = OptionChainSnapshot.from_nested_chains(
+                symbol, chains, fetched_at=timezone.now().isoformat()
+            )
+            set_tracked(
+                CacheManager.option_chain_family(timezone.localdate()),
+                cache_key,
+                snapshot.to_bytes(),
+                CacheTTL.NESTED_CHAIN,
+            )
+            return snapshot
+
+        return await option_chain_flight.run(
+            cache_key, fetch, cached=lambda: self._cached_option_chain_snapshot(symbol)
+        )
+
+    async def a_get_expiration_strikes(
+        self, user: User, symbol: str, expiration: date
+    ) -> ExpirationStrikes | None:
+        """Columnar strikes for one expiration, or None if not listed."""
+        snapshot = await self.a_get_option_chain_snapshot(user, symbol)
+        if snapshot is None:
+            return None
+        return snapshot.expiration(expiration)
+
+    async def a_get_chain_for_expiration(
+        self, user: User, symbol: str, expiration: date
+    ) -> list[dict] | None:
+        """Strike dicts (strike_price, put, call, streamer symbols) for one expiration."""
+        strikes = await self.a_get_expiration_strikes(user, symbol, expiration)
+        if strikes is None:
+            return None
+        return strikes.to_strike_dicts()
+
     def get_all_expirations(self, user: User, symbol: str) -> list[date] | None:
         """Synchronous wrapper for a_get_all_expirations."""
         return run_async(self.a_get_all_expirations(user, symbol))
 
     async def a_get_all_expirations(self, user: User, symbol: str) -> list[date] | None:
-        """Extracts all available option expiration dates from the nested chain."""
-        chains = await self.a_get_nested_option_chain(user, symbol)
-        if not chains:
+        """All available option expiration dates (ascending) from the chain snapshot."""
+        snapshot = await self.a_get_option_chain_snapshot(user, symbol)
+        if snapshot is None:
             return None
-
-        expirations = []
-        for chain in chains:
-            for expiration_data in chain.expirations:
-                expirations.append(expiration_data.expiration_date)
-
-        return sorted(expirations)
+        return snapshot.expirations
 
     async def get_option_chain(self, user: User, symbol: str, target_dte: int) -> dict | None:
         """
         Fetch options for target expiration.
 
+        Concurrent misses for the same chain share one API call (single-flight).
+
         Args:
             user: User for session access
             symbol: Underlying symbol (e.g., 'SPY', 'QQQ')
@@ -149,17 +239,9 @@ class OptionChainService:
                 return None
 
             # Fetch option chain from TastyTrade
-            chain_data = await self._fetch_tastytrade_option_chain(
-                session, symbol, target_expiration, user
+            return await self._fetch_and_cache_option_chain(
+                session, symbol, target_expiration, user, cache_key
             )
-            if not chain_data:
-                return None
-
-            # Cache the result
-            cache.set(cache_key, chain_data, CacheTTL.OPTION_CHAIN)
-            logger.info(f"Cached option chain for {symbol} {target_expiration}")
-
-            return chain_data
 
         except Exception as e:
             logger.error(f"Error fetching option chain for {symbol}: {e}", exc_info=True)
@@ -175,6 +257,8 @@ class OptionChainService:
         Unlike get_option_chain() which rounds to "next Friday", this method
         fetches the exact expiration provided.
 
+        Concurrent misses for the same chain share one API call (single-flight).
+
         Args:
             user: User for session access
             symbol: Underlying symbol (e.g., 'SPY', 'QQQ')
@@ -199,8 +283,8 @@ class OptionChainService:
                 return None
 
             # Fetch option chain for exact expiration (no DTE rounding)
-            chain_data = await self._fetch_tastytrade_option_chain(
-                session, symbol, target_expiration, user
+            chain_data = await self._fetch_and_cache_option_chain(
+                session, symbol, target_expiration, user, cache_key
             )
             if not chain_data:
                 logger.warning(
@@ -209,10 +293,6 @@ class OptionChainService:
                 )
                 return None
 
-            # Cache the result
-            cache.set(cache_key, chain_data, CacheTTL.OPTION_CHAIN)
-            logger.info(f"Cached option chain for {symbol} {target_expiration}")
-
             return chain_data
 
         except Exception as e:
@@ -222,12 +302,32 @@ class OptionChainService:
             )
             return None
 
+    async def _fetch_and_cache_option_chain(
+        self, session, symbol: str, expiration: date, user: User, cache_key: str
+    ) -> dict | None:
+        """Fetch one expiration's chain at most once at a time and cache it under cache_key."""
+
+        async def fetch():
+            chain_data = await self._fetch_tastytrade_option_chain(
+                session, symbol, expiration, user
+            )
+            if chain_data:
+                set_tracked(
+                    CacheManager.option_chain_family(timezone.localdate()),
+                    cache_key,
+                    chain_data,
+                    CacheTTL.OPTION_CHAIN,
+                )
+                logger.info(f"Cached option chain for {symbol} {expiration}")
+            return chain_data
+
+        return await option_chain_flight.run(cache_key, fetch, cached=lambda: cache.get(cache_key))
+
     async def get_multi_expiration_chains(
         self, user: User, symbol: str, target_dtes: list[int]
     ) -> dict[str, dict]:
         """
-        Fetch option chains for multiple target DTEs efficiently.
-
+        Fetch option chains for multiple target DTEs concurrently.
 
         Args:
             user: User for session access
@@ -250,21 +350,22 @@ class OptionChainService:
                 }
             }
         """
-        results = {}
 
-        for target_dte in target_dtes:
+        async def fetch(target_dte: int) -> dict | None:
             try:
                 chain = await self.get_option_chain(user, symbol, target_dte)
                 if chain:
-                    results[str(target_dte)] = chain
-                else:
-                    logger.warning(f"Could not fetch chain for {symbol} at {target_dte} DTE")
-                    results[str(target_dte)] = None
+                    return chain
+                logger.warning(f"Could not fetch chain for {symbol} at {target_dte} DTE")
             except Exception as e:
                 logger.warning(f"Error fetching chain for {target_dte} DTE: {e}")
-                results[str(target_dte)] = None
+            return None
 
-        return results
+        # Near and far legs are fetched concurrently
+        chains = await asyncio.gather(*(fetch(target_dte) for target_dte in target_dtes))
+        return {
+            str(target_dte): chain for target_dte, chain in zip(target_dtes, chains, strict=True)
+        }
 
     async def select_strikes(
         self, current_price: Decimal, chain: dict, width: int
@@ -484,85 +585,35 @@ class OptionChainService:
     async def _fetch_tastytrade_option_chain(
         self, session, symbol: str, expiration: date, user: User
     ) -> dict | None:
-        """Fetch REAL option chain data from TastyTrade API."""
+        """Fetch REAL option chain data from TastyTrade API (via the chain snapshot)."""
         try:
-            from tastytrade.instruments import NestedOptionChain
-
-            # Log the actual API call
             logger.info(
                 f"Fetching REAL option chain for {symbol} targeting EXACT expiration {expiration}"
             )
 
-            # Get all option chains for symbol using TastyTrade SDK async method
-            chains = await NestedOptionChain.a_get(session, symbol)
-
-            if not chains:
-                logger.warning(f"No option chains available for {symbol}")
+            snapshot = await self._load_option_chain_snapshot(session, symbol)
+            if snapshot is None:
                 return None
 
             # Find EXACT expiration match (not "closest")
-            target_exp = self._find_exact_expiration(chains, expiration)
-            if not target_exp:
+            expiration_strikes = snapshot.expiration(expiration)
+            if expiration_strikes is None:
                 logger.error(
                     f"EXACT expiration {expiration} not found for {symbol}. "
-                    f"This indicates a mismatch between expiration selection and available chains."
+                    f"This indicates a mismatch between expiration selection and available chains. "
+                    f"Available (sample): {snapshot.expirations[:10]}"
                 )
                 return None
+            target_exp = expiration
 
-            # Extract strikes from the matching chain
-            strikes_list = []  # Initialize to prevent UnboundLocalError
-
-            for chain_item in chains:
-                # NestedOptionChain: look through each expiration
-                if hasattr(chain_item, "expirations") and chain_item.expirations:
-                    for expiration_obj in chain_item.expirations:
-                        # Handle both datetime and date objects
-                        exp_date = expiration_obj.expiration_date
-                        if hasattr(exp_date, "date"):
-                            exp_date = exp_date.date()
+            put_strikes = expiration_strikes.put_strikes()
+            call_strikes = expiration_strikes.call_strikes()
+            logger.info(
+                f"Strikes extraction complete for {symbol} {target_exp}: "
+                f"{len(put_strikes)} puts, {len(call_strikes)} calls"
+            )
 
-                        if exp_date == target_exp:
-                            logger.debug(f"Found matching expiration: {target_exp}")
-
-                            # Extract strikes from this expiration
-                            if hasattr(expiration_obj, "strikes") and expiration_obj.strikes:
-                                strikes_list = []
-                                for strike in expiration_obj.strikes:
-                                    strike_price = Decimal(str(strike.strike_price))
-
-                                    # Build Strike dict with OCC symbols
-                                    strike_dict = {
-                                        "strike_price": str(strike_price),
-                                        "call": strike.call if hasattr(strike, "call") else None,
-                                        "put": strike.put if hasattr(strike, "put") else None,
-                                        "call_streamer_symbol": (
-                                            strike.call_streamer_symbol
-                                            if hasattr(strike, "call_streamer_symbol")
-                                            else None
-                                        ),
-                                        "put_streamer_symbol": (
-                                            strike.put_streamer_symbol
-                                            if hasattr(strike, "put_streamer_symbol")
-                                            else None
-                                        ),
-                                    }
-                                    strikes_list.append(strike_dict)
-                            else:
-                                logger.warning(f"Expiration {target_exp} has no strikes")
-                                strikes_list = []
-                            break  # Found the target expiration
-                else:
-                    logger.debug("Chain item missing expirations attribute")
-
-            logger.info(f"Strikes extraction complete for {symbol} {target_exp}:")
-            put_strikes_set = extract_put_strikes(strikes_list)
-            call_strikes_set = extract_call_strikes(strikes_list)
-            put_display = sorted(put_strikes_set) if put_strikes_set else "None"
-            logger.info(f"   Put strikes: {len(put_strikes_set)} found ({put_display})")
-            call_display = sorted(call_strikes_set) if call_strikes_set else "None"
-            logger.info(f"   Call strikes: {len(call_strikes_set)} found ({call_display})")
-
-            if not put_strikes_set and not call_strikes_set:
+            if not put_strikes and not call_strikes:
                 logger.warning(f"No valid strikes found for {symbol} {target_exp}")
                 return None
 
@@ -589,10 +640,10 @@ class OptionChainService:
             result = {
                 "symbol": symbol,
                 "expiration": target_exp.isoformat(),
-                "strikes": strikes_list,
+                "strikes": expiration_strikes.to_strike_dicts(),
                 "fetched_at": timezone.now().isoformat(),
                 "source": "tastytrade_api",
-                "total_strikes": len(put_strikes_set | call_strikes_set),
+                "total_strikes": len(set(put_strikes) | set(call_strikes)),
             }
 
             # Add current price if available
@@ -610,37 +661,6 @@ class OptionChainService:
             logger.error(f"Error fetching TastyTrade option chain: {e}", exc_info=True)
             return None
 
-    def _find_exact_expiration(self, chains: list, target: date) -> date | None:
-        """Find EXACT expiration match in chains. Returns None if not found."""
-        logger.info(f"Looking for EXACT expiration {target}")
-
-        if not chains:
-            logger.warning("No chains provided")
-            return None
-
-        expirations = []
-        for chain in chains:
-            if hasattr(chain, "expirations") and chain.expirations:
-                for expiration_obj in chain.expirations:
-                    if hasattr(expiration_obj, "expiration_date"):
-                        exp_date = expiration_obj.expiration_date
-                        if hasattr(exp_date, "date"):
-                            exp_date = exp_date.date()
-                        expirations.append(exp_date)
-
-        logger.debug(f"Found {len(expirations)} total expirations")
-
-        # Look for EXACT match
-        if target in expirations:
-            logger.info(f"Found EXACT expiration match: {target}")
-            return target
-        available_sample = sorted(set(expirations))[:10]
-        logger.error(
-            f"EXACT expiration {target} not found in chain. "
-            f"Available (sample): {available_sample}"
-        )
-        return None
-
     def _find_closest_expiration(self, chains: list, target: date) -> date | None:
         """Find the expiration date closest to target from chains."""
         chains_count = len(chains) if chains else 0
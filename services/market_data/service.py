@@ -15,7 +15,14 @@ from django.utils import timezone
 from asgiref.sync import sync_to_async
 
 from services.core.cache import CacheManager, CacheTTL
+from services.core.constants import L1_QUOTE_TTL, MARKET_METRICS_BATCH_SIZE
+from services.core.l1_cache import l1_cache
 from services.core.logging import get_logger
+from services.core.single_flight import (
+    historical_flight,
+    market_metrics_flight,
+    quote_flight,
+)
 from services.core.utils.async_utils import run_async
 
 logger = get_logger(__name__)
@@ -46,20 +53,28 @@ class MarketDataService:
         return run_async(self.get_historical_prices(symbol, days))
 
     async def get_quote(self, symbol: str) -> dict | None:
-        """Get current quote for symbol from cache or API."""
+        """
+        Get current quote for symbol from cache or API.
+
+        Concurrent misses for the same symbol share one API call (single-flight).
+        """
         cache_key = CacheManager.quote(symbol)
 
-        cached_data = cache.get(cache_key)
+        cached_data = l1_cache.get(cache_key, L1_QUOTE_TTL)
         if cached_data:
             logger.debug(f"Quote cache hit for {symbol}")
             return cached_data
 
-        logger.info(f"No cached data, fetching quote from API for {symbol}")
-        api_data = await self._fetch_quote_from_api(symbol)
+        async def fetch():
+            logger.info(f"No cached data, fetching quote from API for {symbol}")
+            api_data = await self._fetch_quote_from_api(symbol)
+            if api_data:
+                cache.set(cache_key, api_data, CacheTTL.QUOTE)
+                api_data["source"] = "tastytrade_api"
+            return api_data
 
+        api_data = await quote_flight.run(cache_key, fetch, cached=lambda: cache.get(cache_key))
         if api_data:
-            cache.set(cache_key, api_data, CacheTTL.QUOTE)
-            api_data["source"] = "tastytrade_api"
             return api_data
 
         logger.warning(f"Could not fetch quote for {symbol}")
@@ -74,7 +89,17 @@ class MarketDataService:
         4. Return data or None
 
         Returns list of dicts with: date, open, high, low, close, volume
+
+        Concurrent loads of the same symbol and window share one database
+        check and Stooq fetch (single-flight).
         """
+        return await historical_flight.run(
+            CacheManager.historical_prices(symbol, days),
+            lambda: self._load_historical_prices(symbol, days),
+        )
+
+    async def _load_historical_prices(self, symbol: str, days: int) -> list[dict] | None:
+        """Database first, then Stooq for missing days (see get_historical_prices)."""
         # TOLERANCE: Accept 95% of requested days (weekends/holidays reduce count)
         min_acceptable = int(days * 0.95)
 
@@ -112,6 +137,8 @@ class MarketDataService:
         4. Return data or None
 
         Returns dict with: iv30, iv_rank, volume, open_interest, source
+
+        Concurrent misses for the same symbol share one API call (single-flight).
         """
         cache_key = CacheManager.market_metrics(symbol)
 
@@ -121,18 +148,69 @@ class MarketDataService:
             cached_data["source"] = "cache"
             return cached_data
 
-        logger.info(f"Fetching market metrics from API for {symbol}")
-        api_data = await self._fetch_market_metrics_from_api(symbol)
+        async def fetch():
+            logger.info(f"Fetching market metrics from API for {symbol}")
+            api_data = await self._fetch_market_metrics_from_api(symbol)
+            if api_data:
+                cache.set(cache_key, api_data, CacheTTL.MARKET_METRICS)
+                api_data["source"] = "tastytrade_api"
+                await self._persist_market_metrics(symbol, api_data)
+            return api_data
 
+        api_data = await market_metrics_flight.run(
+            cache_key, fetch, cached=lambda: cache.get(cache_key)
+        )
         if api_data:
-            cache.set(cache_key, api_data, CacheTTL.MARKET_METRICS)
-            api_data["source"] = "tastytrade_api"
-            await self._persist_market_metrics(symbol, api_data)
             return api_data
 
         logger.warning(f"Could not fetch market metrics for {symbol}")
         return None
 
+    async def get_market_metrics_many(self, symbols: list[str]) -> dict[str, dict]:
+        """
+        Get market metrics for many symbols (watchlist prefetch, batch jobs).
+
+        Cache hits are read with one get_many; all misses are fetched with
+        multi-symbol API calls (MARKET_METRICS_BATCH_SIZE symbols each),
+        cached with one set_many and persisted with one bulk upsert.
+
+        Returns:
+            Metrics dicts keyed by symbol, in request order; symbols without
+            data are omitted
+        """
+        symbols = list(dict.fromkeys(symbols))
+        cache_keys = {symbol: CacheManager.market_metrics(symbol) for symbol in symbols}
+        cached = cache.get_many(list(cache_keys.values()))
+
+        results: dict[str, dict] = {}
+        missing: list[str] = []
+        for symbol, cache_key in cache_keys.items():
+            cached_data = cached.get(cache_key)
+            if cached_data:
+                cached_data["source"] = "cache"
+                results[symbol] = cached_data
+            else:
+                missing.append(symbol)
+
+        if missing:
+            logger.info(f"Fetching market metrics from API for {len(missing)} symbols")
+            fetched = await self._fetch_market_metrics_many_from_api(missing)
+            if fetched:
+                cache.set_many(
+                    {cache_keys[symbol]: data for symbol, data in fetched.items()},
+                    CacheTTL.MARKET_METRICS,
+                )
+                await self._persist_market_metrics_many(fetched)
+                for data in fetched.values():
+                    data["source"] = "tastytrade_api"
+                results.update(fetched)
+
+            not_found = len(missing) - len(fetched)
+            if not_found:
+                logger.warning(f"Could not fetch market metrics for {not_found} symbols")
+
+        return {symbol: results[symbol] for symbol in symbols if symbol in results}
+
     async def _fetch_quote_from_api(self, symbol: str) -> dict | None:
         """Fetch real-time quote from TastyTrade API using market data endpoint."""
         try:
@@ -231,64 +309,95 @@ class MarketDataService:
                 logger.warning(f"No market metrics returned for {symbol}")
                 return None
 
-            metrics = metrics_list[0]
-
-            # Extract IV Rank and multiply by 100 to get a 0-100 scale
-            # Fix: Use explicit None check to handle IV=0.0 correctly (not truthy check)
-            iv_rank_raw = getattr(metrics, "tos_implied_volatility_index_rank", None)
-            iv_rank = float(iv_rank_raw) * 100 if iv_rank_raw is not None else None
+            return self._market_metrics_to_dict(symbol, metrics_list[0])
 
-            # Extract other useful metrics
-            iv_percentile_raw = getattr(metrics, "implied_volatility_percentile", None)
-            iv_percentile = (
-                float(iv_percentile_raw) * 100 if iv_percentile_raw is not None else None
-            )
+        except Exception as e:
+            logger.error(f"Error fetching market metrics from API: {e}", exc_info=True)
+            return None
 
-            # FIX: SDK returns percentage format (22.15 for 22.15%), NOT decimal (0.2215)
-            # Store as-is, no conversion needed
-            iv_30_day_raw = getattr(metrics, "implied_volatility_30_day", None)
-            iv_30_day = float(iv_30_day_raw) if iv_30_day_raw is not None else None
-
-            # FIX: SDK returns percentage format (22.15 for 22.15%), NOT decimal (0.2215)
-            # Store as-is, no conversion needed
-            # Real data only - no clamping (market crashes can produce HV > 100)
-            hv_30_day_raw = getattr(metrics, "historical_volatility_30_day", None)
-            hv_30_day = float(hv_30_day_raw) if hv_30_day_raw is not None else None
-
-            earnings_data = None
-            if getattr(metrics, "earnings", None):
-                earnings = metrics.earnings
-                earnings_data = {
-                    "expected_report_date": (
-                        earnings.expected_report_date.isoformat()
-                        if earnings.expected_report_date
-                        else None
-                    )
-                }
+    async def _fetch_market_metrics_many_from_api(self, symbols: list[str]) -> dict[str, dict]:
+        """
+        Fetch market metrics for many symbols, MARKET_METRICS_BATCH_SIZE per API call.
 
-            dividend_next_date = getattr(metrics, "dividend_next_date", None)
-            dividend_ex_date = getattr(metrics, "dividend_ex_date", None)
+        A failed chunk is logged and skipped; the other chunks are still returned.
+        """
+        session = await self._get_session()
+        if not session:
+            return {}
+
+        from tastytrade.metrics import a_get_market_metrics
+
+        results: dict[str, dict] = {}
+        for start in range(0, len(symbols), MARKET_METRICS_BATCH_SIZE):
+            chunk = symbols[start : start + MARKET_METRICS_BATCH_SIZE]
+            try:
+                metrics_list = await a_get_market_metrics(session, chunk)
+            except Exception as e:
+                logger.error(
+                    f"Error fetching market metrics from API for {len(chunk)} symbols: {e}",
+                    exc_info=True,
+                )
+                continue
+
+            requested = set(chunk)
+            for metrics in metrics_list or []:
+                symbol = getattr(metrics, "symbol", None)
+                if symbol in requested:
+                    results[symbol] = self._market_metrics_to_dict(symbol, metrics)
+
+        return results
+
+    @staticmethod
+    def _market_metrics_to_dict(symbol: str, metrics) -> dict:
+        """Convert an SDK MarketMetricInfo into the cached metrics dict."""
+        # Extract IV Rank and multiply by 100 to get a 0-100 scale
+        # Fix: Use explicit None check to handle IV=0.0 correctly (not truthy check)
+        iv_rank_raw = getattr(metrics, "tos_implied_volatility_index_rank", None)
+        iv_rank = float(iv_rank_raw) * 100 if iv_rank_raw is not None else None
+
+        # Extract other useful metrics
+        iv_percentile_raw = getattr(metrics, "implied_volatility_percentile", None)
+        iv_percentile = float(iv_percentile_raw) * 100 if iv_percentile_raw is not None else None
+
+        # FIX: SDK returns percentage format (22.15 for 22.15%), NOT decimal (0.2215)
+        # Store as-is, no conversion needed
+        iv_30_day_raw = getattr(metrics, "implied_volatility_30_day", None)
+        iv_30_day = float(iv_30_day_raw) if iv_30_day_raw is not None else None
+
+        # FIX: SDK returns percentage format (22.15 for 22.15%), NOT decimal (0.2215)
+        # Store as-is, no conversion needed
+        # Real data only - no clamping (market crashes can produce HV > 100)
+        hv_30_day_raw = getattr(metrics, "historical_volatility_30_day", None)
+        hv_30_day = float(hv_30_day_raw) if hv_30_day_raw is not None else None
+
+        earnings_data = None
+        if getattr(metrics, "earnings", None):
+            earnings = metrics.earnings
+            earnings_data = {
+                "expected_report_date": (
+                    earnings.expected_report_date.isoformat()
+                    if earnings.expected_report_date
+                    else None
+                )
+            }
 
-            beta = getattr(metrics, "beta", None)
+        dividend_next_date = getattr(metrics, "dividend_next_date", None)
+        dividend_ex_date = getattr(metrics, "dividend_ex_date", None)
 
-            return {
-                "symbol": symbol,
-                "iv_rank": iv_rank,
-                "iv_percentile": iv_percentile,
-                "iv_30_day": iv_30_day,  # Already float or None
-                "hv_30_day": hv_30_day,  # Already float or None
-                "earnings": earnings_data,
-                "dividend_next_date": (
-                    dividend_next_date.isoformat() if dividend_next_date else None
-                ),
-                "dividend_ex_date": dividend_ex_date.isoformat() if dividend_ex_date else None,
-                "beta": float(beta) if beta else None,
-                "fetched_at": timezone.now().isoformat(),
-            }
+        beta = getattr(metrics, "beta", None)
 
-        except Exception as e:
-            logger.error(f"Error fetching market metrics from API: {e}", exc_info=True)
-            return None
+        return {
+            "symbol": symbol,
+            "iv_rank": iv_rank,
+            "iv_percentile": iv_percentile,
+            "iv_30_day": iv_30_day,  # Already float or None
+            "hv_30_day": hv_30_day,  # Already float or None
+            "earnings": earnings_data,
+            "dividend_next_date": (dividend_next_date.isoformat() if dividend_next_date else None),
+            "dividend_ex_date": dividend_ex_date.isoformat() if dividend_ex_date else None,
+            "beta": float(beta) if beta else None,
+            "fetched_at": timezone.now().isoformat(),
+        }
 
     async def _get_session(self):
         """Get TastyTrade OAuth session for API calls."""
@@ -413,38 +522,59 @@ class MarketDataService:
 
     async def _persist_market_metrics(self, symbol: str, metrics_data: dict):
         """Persist market metrics to MarketMetricsHistory model (fire-and-forget)."""
-        try:
-            from decimal import Decimal
+        await self._persist_market_metrics_many({symbol: metrics_data})
+
+    async def _persist_market_metrics_many(self, metrics_by_symbol: dict[str, dict]):
+        """
+        Persist today's metrics for many symbols with one bulk upsert (fire-and-forget).
 
+        Symbols missing an essential field (IV rank, IV percentile, IV30) are skipped.
+        """
+        try:
             from trading.models import MarketMetricsHistory
 
             today = timezone.now().date()
+            rows = []
+            for symbol, metrics_data in metrics_by_symbol.items():
+                # Extract metrics from data
+                iv_rank = metrics_data.get("iv_rank")
+                iv_percentile = metrics_data.get("iv_percentile")
+                iv_30_day = metrics_data.get("iv_30_day")
+                hv_30_day = metrics_data.get("hv_30_day")  # Optional field
+
+                # Skip if essential metrics are missing
+                if iv_rank is None or iv_percentile is None or iv_30_day is None:
+                    logger.debug(
+                        f"Skipping market metrics persistence for {symbol} - "
+                        "missing essential fields"
+                    )
+                    continue
 
-            # Extract metrics from data
-            iv_rank = metrics_data.get("iv_rank")
-            iv_percentile = metrics_data.get("iv_percentile")
-            iv_30_day = metrics_data.get("iv_30_day")
-            hv_30_day = metrics_data.get("hv_30_day")  # Optional field
-
-            # Skip if essential metrics are missing
-            if iv_rank is None or iv_percentile is None or iv_30_day is None:
-                logger.debug(
-                    f"Skipping market metrics persistence for {symbol} - missing essential fields"
+                rows.append(
+                    MarketMetricsHistory(
+                        symbol=symbol,
+                        date=today,
+                        iv_rank=Decimal(str(iv_rank)),
+                        iv_percentile=Decimal(str(iv_percentile)),
+                        iv_30_day=Decimal(str(iv_30_day)),
+                        hv_30_day=Decimal(str(hv_30_day)) if hv_30_day is not None else None,
+                    )
                 )
+
+            if not rows:
                 return
 
-            # Persist using aupdate_or_create (upsert pattern)
-            await MarketMetricsHistory.objects.aupdate_or_create(
-                symbol=symbol,
-                date=today,
-                defaults={
-                    "iv_rank": Decimal(str(iv_rank)),
-                    "iv_percentile": Decimal(str(iv_percentile)),
-                    "iv_30_day": Decimal(str(iv_30_day)),
-                    "hv_30_day": Decimal(str(hv_30_day)) if hv_30_day is not None else None,
-                },
+            # Upsert on (symbol, date)
+            await MarketMetricsHistory.objects.abulk_create(
+                rows,
+                update_conflicts=True,
+                unique_fields=["symbol", "date"],
+                update_fields=["iv_rank", "iv_percentile", "iv_30_day", "hv_30_day"],
             )
-            logger.debug(f"Persisted market metrics for {symbol} on {today}")
+            logger.debug(f"Persisted market metrics for {len(rows)} symbols on {today}")
 
         except Exception as e:
-            logger.error(f"Error persisting market metrics for {symbol}: {e}", exc_info=True)
+            logger.error(
+                f"Error persisting market metrics for {', '.join(metrics_by_symbol)}: {e}",
+                exc_info=True,
+            )
@@ -9,16 +9,73 @@ might only have even strikes, preventing strategies that need odd strikes
 (e.g., width=3 spreads needing strikes like 441, 444, 447).
 """
 
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
 from datetime import date
 from decimal import Decimal
+from typing import TypeVar
 
 from django.utils import timezone
 
+from services.core.constants import EXPIRATION_SCAN_CONCURRENCY
 from services.core.logging import get_logger
 from services.market_data.option_chains import extract_call_strikes, extract_put_strikes
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+
+async def first_passing_expiration(
+    candidates: Sequence[date],
+    evaluate: Callable[[date], Awaitable[T | None]],
+    concurrency: int = EXPIRATION_SCAN_CONCURRENCY,
+) -> tuple[date, T] | None:
+    """
+    Evaluate candidate expirations concurrently; return the first that passes.
+
+    Up to concurrency evaluations (chain fetch + strike selection) run at
+    once, started in candidate order. The result is the earliest candidate
+    (in the caller's preference order) whose evaluation returns non-None,
+    regardless of which finishes first. Queued candidates that can no longer
+    win (a preferred one already passed) are skipped; evaluations already
+    running are awaited rather than cancelled, since their chain fetches may
+    be shared with other callers through option_chain_flight.
+
+    concurrency=1 is the sequential walk (stop at the first pass).
+
+    Raises:
+        Whatever evaluate raises for a candidate preferred over any passing one
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    best_index = len(candidates)  # Preference index of the best passing candidate so far
+
+    async def run(index: int, expiration: date) -> T | None:
+        nonlocal best_index
+        async with semaphore:
+            if index > best_index:
+                return None
+            result = await evaluate(expiration)
+            if result is not None:
+                best_index = min(best_index, index)
+            return result
+
+    tasks = [
+        asyncio.create_task(run(index, expiration)) for index, expiration in enumerate(candidates)
+    ]
+    try:
+        for expiration, task in zip(candidates, tasks, strict=True):
+            result = await task
+            if result is not None:
+                return expiration, result
+        return None
+    except asyncio.CancelledError:
+        for task in tasks:
+            task.cancel()
+        raise
+    finally:
+        await asyncio.gather(*tasks, return_exceptions=True)
+
 
 async def find_expiration_with_exact_strikes(
     user,
@@ -246,6 +303,7 @@ async def find_expiration_with_optimal_strikes(
     min_dte: int = 30,
     max_dte: int = 45,
     relaxed_quality: bool = False,
+    concurrency: int = EXPIRATION_SCAN_CONCURRENCY,
 ) -> tuple[date, dict[str, Decimal], dict] | None:
     """
     Find longest DTE expiration with optimal strikes from available strikes.
@@ -253,11 +311,11 @@ async def find_expiration_with_optimal_strikes(
     This function implements the "strikes-from-available" pattern:
     1. Get all expirations in the DTE range
     2. Sort by DTE (longest first)
-    3. For each expiration:
+    3. For each expiration (up to concurrency at once):
         a. Fetch ALL available strikes from option chain
         b. Run optimizer to find best strikes from available
-        c. If quality gate passes (5% or 15% threshold), return
-    4. Return None if no expiration passes quality gate
+        c. Check the quality gate (5% or 15% threshold)
+    4. Return the longest-DTE expiration that passed, or None if none did
 
     This is the CORRECT pattern for credit spreads - we adapt to what
     strikes actually exist rather than failing if theoretical strikes
@@ -276,6 +334,8 @@ async def find_expiration_with_optimal_strikes(
         min_dte: Minimum acceptable DTE (default 30)
         max_dte: Maximum acceptable DTE (default 45)
         relaxed_quality: If True, use 15% threshold instead of 5% (for force mode)
+        concurrency: Expirations fetched and evaluated at once; 1 checks them
+            one by one. The selected expiration is the same either way.
 
     Returns:
         (expiration_date, selected_strikes_dict, option_chain_dict) or None
@@ -345,18 +405,20 @@ async def find_expiration_with_optimal_strikes(
         f"(DTE range: {min_dte}-{max_dte})"
     )
 
-    # 3. Try each expiration (longest DTE first)
+    # 3. Evaluate expirations concurrently; the longest passing DTE wins
     options_service = StreamingOptionsDataService(user)
     optimizer = StrikeOptimizer()
+    dte_by_expiration = {expiration: dte for dte, expiration in valid_expirations}
 
-    for dte, expiration in valid_expirations:
+    async def evaluate(expiration: date) -> tuple[dict[str, Decimal], dict] | None:
+        dte = dte_by_expiration[expiration]
         logger.debug(f"Checking expiration {expiration} (DTE: {dte})")
 
         # Fetch option chain for this expiration
         chain = await options_service._get_option_chain(symbol, expiration)
         if not chain:
             logger.warning(f"Could not fetch chain for {symbol} {expiration}")
-            continue
+            return None
 
         # Get available strikes (put or call based on spread type)
         strikes_list = chain.get("strikes", [])
@@ -367,7 +429,7 @@ async def find_expiration_with_optimal_strikes(
 
         if not available_strikes:
             logger.warning(f"No available strikes found in chain for {symbol} {expiration}")
-            continue
+            return None
 
         logger.debug(
             f"Found {len(available_strikes)} available strikes "
@@ -387,12 +449,7 @@ async def find_expiration_with_optimal_strikes(
         )
 
         if selected_strikes:
-            mode_info = " (relaxed mode)" if relaxed_quality else ""
-            logger.info(
-                f"Found optimal strikes for {symbol} at {expiration} "
-                f"(DTE: {dte}){mode_info}: {selected_strikes}"
-            )
-            return (expiration, selected_strikes, chain)
+            return selected_strikes, chain
 
         # Optimizer returned None - strikes failed quality gate
         threshold = "15%" if relaxed_quality else "5%"
@@ -400,6 +457,19 @@ async def find_expiration_with_optimal_strikes(
             f"Expiration {expiration} (DTE: {dte}) failed quality gate "
             f"(no strikes within {threshold} deviation threshold)"
         )
+        return None
+
+    found = await first_passing_expiration(
+        [expiration for _, expiration in valid_expirations], evaluate, concurrency
+    )
+    if found:
+        expiration, (selected_strikes, chain) = found
+        mode_info = " (relaxed mode)" if relaxed_quality else ""
+        logger.info(
+            f"Found optimal strikes for {symbol} at {expiration} "
+            f"(DTE: {dte_by_expiration[expiration]}){mode_info}: {selected_strikes}"
+        )
+        return (expiration, selected_strikes, chain)
 
     # No valid expiration found
     threshold = "15%" if relaxed_quality else "5%"
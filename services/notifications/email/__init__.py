@@ -1,5 +1,6 @@
 """Email services for Senex Trader."""
 
-from .email_service import EmailService
+from .delivery import EmailDeliveryQueue
+from .email_service import DeliveryMetrics, EmailService
 
-__all__ = ["EmailService"]
+__all__ = ["DeliveryMetrics", "EmailDeliveryQueue", "EmailService"]
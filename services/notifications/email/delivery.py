@@ -0,0 +1,102 @@
+"""
+Batched email delivery stage for bulk jobs (daily suggestions).
+
+Generating a user's suggestion email takes seconds; sending it used to happen
+inline, one fresh backend connection per email, before the next user's
+generation could use that slot. An EmailDeliveryQueue decouples the two:
+
+- Producers put() rendered messages and move on immediately
+- EMAIL_SENDER_CONCURRENCY workers drain the queue; each keeps one backend
+  (SMTP) connection open across messages and reconnects after
+  EMAIL_CONNECTION_MAX_MESSAGES or after an error
+- Sends run in worker threads (asyncio.to_thread), never on the event loop
+- Retries and backoff come from EmailService.deliver
+- Per-run DeliveryMetrics (sent, failed, retries, connections, elapsed)
+
+Usage:
+    async with EmailDeliveryQueue(email_service) as outbox:
+        outbox.put(subject, body, user.email)
+    outbox.metrics.sent
+"""
+
+import asyncio
+import time
+
+from services.core.constants import EMAIL_CONNECTION_MAX_MESSAGES, EMAIL_SENDER_CONCURRENCY
+from services.core.logging import get_logger
+from services.notifications.email.email_service import DeliveryMetrics, EmailService
+
+logger = get_logger(__name__)
+
+
+class EmailDeliveryQueue:
+    """Async queue of rendered emails drained by workers over reused connections."""
+
+    def __init__(
+        self,
+        email_service: EmailService | None = None,
+        concurrency: int = EMAIL_SENDER_CONCURRENCY,
+        max_messages_per_connection: int = EMAIL_CONNECTION_MAX_MESSAGES,
+    ):
+        self.email_service = email_service or EmailService()
+        self.concurrency = max(1, concurrency)
+        self.max_messages_per_connection = max_messages_per_connection
+        self.metrics = DeliveryMetrics()
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._workers: list[asyncio.Task] = []
+        self._started: float | None = None
+
+    async def __aenter__(self) -> "EmailDeliveryQueue":
+        self._started = time.monotonic()
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Wait until every queued message has been delivered (or has failed)."""
+        for _ in self._workers:
+            self._queue.put_nowait(None)
+        outcomes = await asyncio.gather(*self._workers, return_exceptions=True)
+        for outcome in outcomes:
+            if isinstance(outcome, DeliveryMetrics):
+                self.metrics.merge(outcome)
+            else:
+                logger.error(f"Email delivery worker failed: {outcome}", exc_info=outcome)
+        self.metrics.failed = self.metrics.queued - self.metrics.sent
+        self.metrics.elapsed = time.monotonic() - self._started
+
+        logger.info(
+            f"Email delivery: {self.metrics.sent}/{self.metrics.queued} sent, "
+            f"{self.metrics.failed} failed, {self.metrics.retries} retries over "
+            f"{self.metrics.connections} connection(s) in {self.metrics.elapsed:.1f}s"
+        )
+
+    def put(self, subject: str, body: str, recipient: str, from_email: str | None = None):
+        """Queue a rendered email for delivery; never blocks."""
+        message = self.email_service.build_message(subject, body, recipient, from_email)
+        self.metrics.queued += 1
+        self._queue.put_nowait(message)
+
+    async def _worker(self) -> DeliveryMetrics:
+        """Send queued messages over one connection; returns this worker's counters."""
+        # Only this worker's thread calls touch these counters
+        metrics = DeliveryMetrics()
+        connection = None
+        sent_on_connection = 0
+        try:
+            while (message := await self._queue.get()) is not None:
+                if connection is not None and sent_on_connection >= (
+                    self.max_messages_per_connection
+                ):
+                    await asyncio.to_thread(connection.close)
+                    connection = None
+                if connection is None:
+                    sent_on_connection = 0
+
+                connection = await asyncio.to_thread(
+                    self.email_service.deliver, message, connection, metrics
+                )
+                sent_on_connection += 1
+        finally:
+            if connection is not None:
+                await asyncio.to_thread(connection.close)
+        return metrics
@@ -2,11 +2,17 @@
 Email sending service with retry logic and connection pooling.
 
 Centralizes email sending logic to replace duplicate code across tasks and services.
+Batches (send_batch / send_messages) reuse one backend connection for all
+messages instead of opening one per email; see delivery.EmailDeliveryQueue for
+the async delivery stage used by bulk email jobs.
 """
 
+import contextlib
 import time
+from dataclasses import asdict, dataclass
 
 from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
 from django.core.mail import send_mail as django_send_mail
 
 from asgiref.sync import sync_to_async
@@ -16,6 +22,28 @@ from services.core.logging import get_logger
 logger = get_logger(__name__)
 
 
+@dataclass
+class DeliveryMetrics:
+    """Per-run delivery counters for batched sends."""
+
+    queued: int = 0
+    sent: int = 0
+    failed: int = 0
+    retries: int = 0
+    connections: int = 0  # Backend connections opened (1 per batch unless errors reconnect)
+    elapsed: float = 0.0  # Seconds from first message queued/sent to the last delivery
+
+    def merge(self, other: "DeliveryMetrics") -> None:
+        self.queued += other.queued
+        self.sent += other.sent
+        self.failed += other.failed
+        self.retries += other.retries
+        self.connections += other.connections
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
 class EmailService:
     """
     Centralized email sending service with retry logic.
@@ -171,38 +199,147 @@ class EmailService:
             fail_silently=fail_silently,
         )
 
+    def build_message(
+        self, subject: str, body: str, recipient: str, from_email: str | None = None
+    ) -> EmailMessage:
+        """Plain-text message, as send_email would send it."""
+        return EmailMessage(
+            subject=subject,
+            body=body,
+            from_email=from_email or self.default_from_email,
+            to=[recipient],
+        )
+
+    def deliver(
+        self,
+        message: EmailMessage,
+        connection=None,
+        metrics: DeliveryMetrics | None = None,
+        fail_silently: bool = True,
+    ):
+        """
+        Send one message over an open backend connection, with retries.
+
+        Opens a connection when none is given. A failed attempt closes the
+        connection (it may be broken, e.g. an SMTP idle timeout) and the
+        retry opens a new one.
+
+        Args:
+            message: Message to send
+            connection: Open backend connection to reuse, or None
+            metrics: Counters to update (sent/failed/retries/connections)
+            fail_silently: If False, re-raise after the last attempt
+
+        Returns:
+            The connection to reuse for the next message (None after a failure)
+        """
+        metrics = metrics if metrics is not None else DeliveryMetrics()
+        recipient = ", ".join(message.to)
+
+        for attempt in range(1, self.MAX_RETRIES + 1):
+            try:
+                if connection is None:
+                    connection = get_connection(fail_silently=False)
+                    connection.open()
+                    metrics.connections += 1
+
+                if connection.send_messages([message]):
+                    metrics.sent += 1
+                else:
+                    logger.warning(f"Email backend did not send message to {recipient}")
+                    metrics.failed += 1
+                return connection
+
+            except Exception as e:
+                logger.warning(
+                    f"Email send attempt {attempt}/{self.MAX_RETRIES} failed to {recipient}: {e}",
+                    extra={
+                        "recipient": recipient,
+                        "subject": message.subject,
+                        "attempt": attempt,
+                        "error": str(e),
+                        "error_type": type(e).__name__,
+                    },
+                )
+                if connection is not None:
+                    with contextlib.suppress(Exception):
+                        connection.close()
+                    connection = None
+
+                if attempt < self.MAX_RETRIES:
+                    metrics.retries += 1
+                    delay = min(
+                        self.RETRY_DELAY * (self.RETRY_BACKOFF ** (attempt - 1)), self.MAX_DELAY
+                    )
+                    time.sleep(delay)
+                else:
+                    logger.error(
+                        f"Failed to send email to {recipient} after {self.MAX_RETRIES} attempts",
+                        extra={
+                            "recipient": recipient,
+                            "subject": message.subject,
+                            "error": str(e),
+                            "error_type": type(e).__name__,
+                        },
+                    )
+                    metrics.failed += 1
+                    if not fail_silently:
+                        raise
+
+        return None
+
+    def send_messages(
+        self, messages: list[EmailMessage], fail_silently: bool = True
+    ) -> DeliveryMetrics:
+        """
+        Send messages over one reused backend connection.
+
+        Returns:
+            DeliveryMetrics for this batch
+        """
+        metrics = DeliveryMetrics(queued=len(messages))
+        started = time.monotonic()
+        connection = None
+        try:
+            for message in messages:
+                connection = self.deliver(message, connection, metrics, fail_silently)
+        finally:
+            if connection is not None:
+                connection.close()
+            metrics.elapsed = time.monotonic() - started
+
+        logger.info(
+            f"Email batch: {metrics.sent}/{metrics.queued} sent over "
+            f"{metrics.connections} connection(s), {metrics.retries} retries, "
+            f"{metrics.elapsed:.1f}s"
+        )
+        return metrics
+
     def send_batch(
         self,
         emails: list[dict],
         fail_silently: bool = True,
     ) -> dict:
         """
-        Send multiple emails.
+        Send multiple emails over one reused backend connection.
 
         Args:
             emails: List of dicts with keys: subject, body, recipient, from_email (optional)
             fail_silently: If True, continue on errors
 
         Returns:
-            Dict with 'sent' and 'failed' counts
+            Dict with 'sent' and 'failed' counts (plus the other DeliveryMetrics fields)
         """
-        results = {"sent": 0, "failed": 0}
-
-        for email_data in emails:
-            success = self.send_email(
+        messages = [
+            self.build_message(
                 subject=email_data["subject"],
                 body=email_data["body"],
                 recipient=email_data["recipient"],
                 from_email=email_data.get("from_email"),
-                fail_silently=fail_silently,
             )
-
-            if success:
-                results["sent"] += 1
-            else:
-                results["failed"] += 1
-
-        return results
+            for email_data in emails
+        ]
+        return self.send_messages(messages, fail_silently=fail_silently).as_dict()
 
     async def asend_batch(
         self,
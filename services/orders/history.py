@@ -12,12 +12,51 @@ from django.utils import timezone
 from asgiref.sync import sync_to_async
 
 from accounts.models import TradingAccount
+from services.core.constants import SYNC_BULK_BATCH_SIZE
 from services.core.logging import get_logger
+from services.orders.watermarks import (
+    ORDERS_STREAM,
+    advance_watermark,
+    get_watermark,
+    resume_date,
+)
 from trading.models import CachedOrderChain, Position, TastyTradeOrderHistory
 
 User = get_user_model()
 logger = get_logger(__name__)
 
+# Statuses after which TastyTrade never changes an order again
+TERMINAL_ORDER_STATUSES = [
+    "Filled",
+    "Cancelled",
+    "Rejected",
+    "Expired",
+    "Removed",
+    "Partially Removed",
+]
+
+# Columns rewritten when a re-fetched order conflicts on broker_order_id
+ORDER_UPSERT_FIELDS = [
+    "user",
+    "trading_account",
+    "complex_order_id",
+    "parent_order_id",
+    "replaces_order_id",
+    "replacing_order_id",
+    "underlying_symbol",
+    "order_type",
+    "status",
+    "price",
+    "price_effect",
+    "received_at",
+    "live_at",
+    "filled_at",
+    "cancelled_at",
+    "terminal_at",
+    "order_data",
+    "last_synced_at",
+]
+
 
 class OrderHistoryService:
     """
@@ -30,20 +69,29 @@ class OrderHistoryService:
         account: TradingAccount,
         days_back: int = 30,
         symbol: str | None = None,
+        full_resync: bool = False,
     ) -> dict:
         """
         Fetch and cache order history from TastyTrade.
 
+        Unfiltered syncs are incremental: they resume from the account's
+        "orders" watermark (or the oldest still-working cached order, if older)
+        instead of re-fetching the whole window, and skip orders whose payload
+        has not changed. Writes are batched into bulk upserts.
+
         Args:
             account: Trading account to sync orders for
             days_back: Number of days back to fetch order history
             symbol: Optional symbol filter (fetch only orders for this symbol)
+            full_resync: Ignore the watermark and re-fetch the whole window
 
         Returns:
             {
                 "orders_synced": 10,
                 "new_orders": 5,
-                "updated_orders": 5,
+                "updated_orders": 3,
+                "unchanged_orders": 2,
+                "incremental": True,
                 "errors": []
             }
         """
@@ -51,6 +99,8 @@ class OrderHistoryService:
             "orders_synced": 0,
             "new_orders": 0,
             "updated_orders": 0,
+            "unchanged_orders": 0,
+            "incremental": False,
             "errors": [],
         }
 
@@ -66,9 +116,17 @@ class OrderHistoryService:
                 result["errors"].append("Unable to obtain TastyTrade session")
                 return result
 
+            # Symbol-filtered syncs see a subset of orders and must not advance the watermark
+            track_watermark = symbol is None
+            start_date = (timezone.now() - timedelta(days=days_back)).date()
+            if track_watermark and not full_resync:
+                resume_from = await self._incremental_start(account)
+                if resume_from is not None:
+                    start_date = resume_date(resume_from, start_date)
+                    result["incremental"] = True
+
             # Fetch order history with pagination
             # TastyTrade API returns max 50 orders per page by default
-            start_date = (timezone.now() - timedelta(days=days_back)).date()
             tt_account = await Account.a_get(session, account.account_number)
 
             # Paginate through all orders
@@ -95,63 +153,134 @@ class OrderHistoryService:
 
                 page_offset += 1
 
-            order_history = all_orders
+            order_history = [
+                order for order in all_orders if not symbol or order.underlying_symbol == symbol
+            ]
 
             logger.info(
-                f"Fetched {len(order_history)} orders from TastyTrade for account "
-                f"{account.account_number} (days_back={days_back}, symbol={symbol}, pages={page_offset + 1})"
+                f"Fetched {len(all_orders)} orders from TastyTrade for account "
+                f"{account.account_number} (start_date={start_date}, symbol={symbol}, "
+                f"incremental={result['incremental']}, pages={page_offset + 1})"
             )
 
-            # Process each order
-            for order in order_history:
-                # Filter by symbol if specified
-                if symbol and order.underlying_symbol != symbol:
-                    continue
+            await self._bulk_cache_orders(account, user, order_history, result)
 
-                try:
-                    created = await self._cache_order(account, order)
-                    result["orders_synced"] += 1
-                    if created:
-                        result["new_orders"] += 1
-                    else:
-                        result["updated_orders"] += 1
-                except Exception as e:
-                    error_msg = f"Error caching order {order.id}: {e!s}"
-                    result["errors"].append(error_msg)
-                    logger.error(error_msg, exc_info=True)
+            if track_watermark and not result["errors"]:
+                await advance_watermark(
+                    account,
+                    ORDERS_STREAM,
+                    self._newest_timestamp(all_orders),
+                    full_sync=full_resync,
+                )
 
             logger.info(
                 f"Order history sync complete for account {account.account_number}: "
-                f"{result['new_orders']} new, {result['updated_orders']} updated"
+                f"{result['new_orders']} new, {result['updated_orders']} updated, "
+                f"{result['unchanged_orders']} unchanged"
             )
 
         except Exception as e:
+            from services.core.data_access import invalidate_oauth_session
+
+            invalidate_oauth_session(account.user_id, e)
             error_msg = f"Order history sync failed: {e!s}"
             result["errors"].append(error_msg)
             logger.error(error_msg, exc_info=True)
 
         return result
 
-    async def _cache_order(self, account: TradingAccount, order) -> bool:
+    async def _incremental_start(self, account: TradingAccount) -> datetime | None:
+        """
+        Earliest timestamp an incremental sync must cover, or None for a full window.
+
+        Orders still working at the broker can change status long after they
+        were received, so the oldest non-terminal cached order pulls the start
+        back past the watermark.
+        """
+        watermark = await get_watermark(account, ORDERS_STREAM)
+        if watermark is None or watermark.last_synced_at is None:
+            return None
+
+        oldest_open = (
+            await TastyTradeOrderHistory.objects.filter(
+                trading_account=account, received_at__isnull=False
+            )
+            .exclude(status__in=TERMINAL_ORDER_STATUSES)
+            .order_by("received_at")
+            .values_list("received_at", flat=True)
+            .afirst()
+        )
+        if oldest_open is not None and oldest_open < watermark.last_synced_at:
+            return oldest_open
+        return watermark.last_synced_at
+
+    @staticmethod
+    def _newest_timestamp(orders: list) -> datetime | None:
+        timestamps = [
+            ts
+            for order in orders
+            for ts in (getattr(order, "updated_at", None), getattr(order, "received_at", None))
+            if isinstance(ts, datetime)
+        ]
+        return max(timestamps, default=None)
+
+    async def _bulk_cache_orders(
+        self, account: TradingAccount, user, orders: list, result: dict
+    ) -> None:
+        """Upsert fetched orders in batches, skipping rows whose payload is unchanged."""
+        existing = {
+            broker_order_id: order_data
+            async for broker_order_id, order_data in TastyTradeOrderHistory.objects.filter(
+                broker_order_id__in=[str(order.id) for order in orders]
+            ).values_list("broker_order_id", "order_data")
+        }
+
+        rows = {}
+        for order in orders:
+            try:
+                fields = self._order_fields(account, user, order)
+            except Exception as e:
+                error_msg = f"Error caching order {order.id}: {e!s}"
+                result["errors"].append(error_msg)
+                logger.error(error_msg, exc_info=True)
+                continue
+
+            broker_order_id = str(order.id)
+            result["orders_synced"] += 1
+            if broker_order_id not in existing:
+                result["new_orders"] += 1
+            elif existing[broker_order_id] == fields["order_data"]:
+                result["unchanged_orders"] += 1
+                continue
+            else:
+                result["updated_orders"] += 1
+            # Later pages win if the broker returns the same order twice
+            rows[broker_order_id] = TastyTradeOrderHistory(
+                broker_order_id=broker_order_id, **fields
+            )
+
+        if rows:
+            await TastyTradeOrderHistory.objects.abulk_create(
+                list(rows.values()),
+                batch_size=SYNC_BULK_BATCH_SIZE,
+                update_conflicts=True,
+                unique_fields=["broker_order_id"],
+                update_fields=ORDER_UPSERT_FIELDS,
+            )
+
+    def _order_fields(self, account: TradingAccount, user, order) -> dict:
         """
-        Cache a single order in the database.
+        Build TastyTradeOrderHistory field values for a PlacedOrder.
 
         Args:
             account: Trading account
+            user: Owner of the account
             order: TastyTrade PlacedOrder object
 
         Returns:
-            True if order was created (new), False if updated
+            Field values (everything except broker_order_id)
         """
-        # Extract order identifiers
-        broker_order_id = order.id
-        complex_order_id = getattr(order, "complex_order_id", None)
-        parent_order_id = getattr(order, "parent_order_id", None)
-        replaces_order_id = getattr(order, "replaces_order_id", None)
-        replacing_order_id = getattr(order, "replacing_order_id", None)
-
         # Extract order data
-        underlying_symbol = order.underlying_symbol
         order_type = (
             order.order_type.value if hasattr(order.order_type, "value") else str(order.order_type)
         )
@@ -162,14 +291,8 @@ class OrderHistoryService:
             else "Credit"
         )
 
-        # Extract timestamps
-        received_at = getattr(order, "received_at", None)
-        live_at = getattr(order, "live_at", None)
-        filled_at = None
-        cancelled_at = getattr(order, "cancelled_at", None)
-        terminal_at = getattr(order, "terminal_at", None)
-
         # Extract filled_at from legs if available
+        filled_at = None
         if hasattr(order, "legs") and order.legs:
             for leg in order.legs:
                 if hasattr(leg, "fills") and leg.fills:
@@ -205,47 +328,26 @@ class OrderHistoryService:
             # For non-filled orders, use the limit price
             price = Decimal(str(order.price)) if hasattr(order, "price") and order.price else None
 
-        # Check if order already exists
-        existing_order = await TastyTradeOrderHistory.objects.filter(
-            broker_order_id=broker_order_id
-        ).afirst()
-
-        # Get user safely in async context
-        user = await sync_to_async(lambda: account.user)()
-
-        order_fields = {
+        return {
             "user": user,
             "trading_account": account,
-            "complex_order_id": complex_order_id,
-            "parent_order_id": parent_order_id,
-            "replaces_order_id": replaces_order_id,
-            "replacing_order_id": replacing_order_id,
-            "underlying_symbol": underlying_symbol,
+            "complex_order_id": getattr(order, "complex_order_id", None),
+            "parent_order_id": getattr(order, "parent_order_id", None),
+            "replaces_order_id": getattr(order, "replaces_order_id", None),
+            "replacing_order_id": getattr(order, "replacing_order_id", None),
+            "underlying_symbol": order.underlying_symbol,
             "order_type": order_type,
             "status": status,
             "price": price,
             "price_effect": price_effect,
-            "received_at": received_at,
-            "live_at": live_at,
+            "received_at": getattr(order, "received_at", None),
+            "live_at": getattr(order, "live_at", None),
             "filled_at": filled_at,
-            "cancelled_at": cancelled_at,
-            "terminal_at": terminal_at,
+            "cancelled_at": getattr(order, "cancelled_at", None),
+            "terminal_at": getattr(order, "terminal_at", None),
             "order_data": order_data,
         }
 
-        if existing_order:
-            # Update existing order
-            for field, value in order_fields.items():
-                setattr(existing_order, field, value)
-            await existing_order.asave()
-            logger.debug(f"Updated cached order {broker_order_id}")
-            return False
-        # Create new order
-        order_fields["broker_order_id"] = broker_order_id
-        await TastyTradeOrderHistory.objects.acreate(**order_fields)
-        logger.debug(f"Created new cached order {broker_order_id}")
-        return True
-
     def _serialize_order(self, order) -> dict:
         """Serialize TastyTrade PlacedOrder object to JSON-compatible dict."""
 
@@ -10,16 +10,47 @@ from datetime import date, timedelta
 from decimal import Decimal
 
 from django.contrib.auth import get_user_model
+from django.utils import timezone
 
 from asgiref.sync import sync_to_async
 
 from accounts.models import TradingAccount
+from services.core.constants import SYNC_BULK_BATCH_SIZE
 from services.core.logging import get_logger
+from services.orders.watermarks import (
+    advance_watermark,
+    get_watermark,
+    resume_date,
+    transactions_stream,
+)
 from trading.models import Position, TastyTradeTransaction
 
 User = get_user_model()
 logger = get_logger(__name__)
 
+# Columns rewritten on a full resync; related_position is owned by linking, not import
+TRANSACTION_UPSERT_FIELDS = [
+    "user",
+    "trading_account",
+    "order_id",
+    "transaction_type",
+    "transaction_sub_type",
+    "description",
+    "action",
+    "value",
+    "net_value",
+    "commission",
+    "clearing_fees",
+    "regulatory_fees",
+    "symbol",
+    "underlying_symbol",
+    "instrument_type",
+    "quantity",
+    "price",
+    "executed_at",
+    "raw_data",
+]
+
 
 class TransactionImporter:
     """
@@ -44,21 +75,31 @@ class TransactionImporter:
         start_date: date | None = None,
         underlying_symbol: str | None = None,
         transaction_types: list[str] | None = None,
+        *,
+        full_resync: bool = False,
     ) -> dict:
         """
         Import transactions from TastyTrade.
 
+        Unfiltered imports are incremental: they resume from the watermark for
+        the requested transaction types and insert only transaction ids not
+        already stored (transactions are immutable once executed). A full
+        resync re-fetches the window and upserts every row.
+
         Args:
             user: User to import transactions for
             account: Trading account to fetch from
             start_date: How far back to fetch (default: 90 days)
             underlying_symbol: Optional filter by underlying
             transaction_types: Optional filter by type (default: ["Trade"])
+            full_resync: Ignore the watermark and rewrite existing rows
 
         Returns:
             {
                 "imported": N,
                 "updated": M,
+                "skipped": K,
+                "incremental": bool,
                 "errors": [...],
                 "total_processed": X
             }
@@ -70,6 +111,8 @@ class TransactionImporter:
         result = {
             "imported": 0,
             "updated": 0,
+            "skipped": 0,
+            "incremental": False,
             "errors": [],
             "total_processed": 0,
         }
@@ -90,21 +133,29 @@ class TransactionImporter:
             if transaction_types is None:
                 transaction_types = ["Trade"]
 
+            # Underlying-filtered imports see a subset and must not advance the watermark
+            stream = transactions_stream(transaction_types)
+            track_watermark = underlying_symbol is None
+            if track_watermark and not full_resync:
+                watermark = await get_watermark(account, stream)
+                result["incremental"] = bool(watermark and watermark.last_synced_at)
+                if result["incremental"]:
+                    start_date = resume_date(watermark.last_synced_at, start_date)
+
             logger.info(
                 f"Importing transactions for user {user.id}, "
                 f"account {account.account_number}, "
-                f"start_date={start_date}, types={transaction_types}"
+                f"start_date={start_date}, types={transaction_types}, "
+                f"incremental={result['incremental']}"
             )
 
             # Fetch transactions from TastyTrade
-            # Note: get_history is synchronous in the SDK
-            transactions = await sync_to_async(tt_account.get_history)(
-                session,
-                start_date=start_date,
-            )
+            transactions = await self._fetch_history(tt_account, session, start_date)
 
             if not transactions:
                 logger.info("No transactions found")
+                if track_watermark:
+                    await advance_watermark(account, stream, None, full_sync=full_resync)
                 return result
 
             # Filter by type if specified
@@ -123,69 +174,119 @@ class TransactionImporter:
 
             logger.info(f"Processing {len(transactions)} transactions")
 
-            for tx in transactions:
-                result["total_processed"] += 1
-                try:
-                    created = await self._import_single_transaction(user, account, tx)
-                    if created:
-                        result["imported"] += 1
-                    else:
-                        result["updated"] += 1
-                except Exception as e:
-                    tx_id = getattr(tx, "id", "unknown")
-                    logger.error(f"Error importing transaction {tx_id}: {e}")
-                    result["errors"].append(
-                        {
-                            "transaction_id": tx_id,
-                            "error": str(e),
-                        }
-                    )
+            newest = await self._bulk_import_transactions(
+                user, account, transactions, full_resync, result
+            )
+
+            if track_watermark and not result["errors"]:
+                await advance_watermark(
+                    account,
+                    stream,
+                    newest[0],
+                    last_transaction_id=newest[1],
+                    full_sync=full_resync,
+                )
 
             logger.info(
                 f"Transaction import complete: "
                 f"{result['imported']} imported, "
                 f"{result['updated']} updated, "
+                f"{result['skipped']} already stored, "
                 f"{len(result['errors'])} errors"
             )
 
         except Exception as e:
+            from services.core.data_access import invalidate_oauth_session
+
+            invalidate_oauth_session(user.id, e)
             logger.error(f"Transaction import failed: {e}", exc_info=True)
             result["errors"].append({"error": str(e)})
 
         return result
 
-    async def _import_single_transaction(
+    async def _fetch_history(self, tt_account, session, start_date: date) -> list:
+        """Fetch account history, preferring the SDK's async variant when available."""
+        if hasattr(tt_account, "a_get_history"):
+            return await tt_account.a_get_history(session, start_date=start_date)
+        # Older SDKs only expose a synchronous get_history
+        return await sync_to_async(tt_account.get_history)(
+            session,
+            start_date=start_date,
+        )
+
+    async def _bulk_import_transactions(
         self,
         user: User,
         account: TradingAccount,
-        tx,
-    ) -> bool:
+        transactions: list,
+        full_resync: bool,
+        result: dict,
+    ) -> tuple:
         """
-        Import a single transaction into the database.
-
-        Args:
-            user: User to associate transaction with
-            account: Trading account
-            tx: TastyTrade Transaction object
+        Write transactions with one existence query and batched inserts/upserts.
 
         Returns:
-            True if created (new), False if updated (existing)
+            (newest executed_at, highest transaction id) among the processed rows
         """
-        # Extract transaction ID
-        tx_id = tx.id
+        existing_ids = {
+            tx_id
+            async for tx_id in TastyTradeTransaction.objects.filter(
+                transaction_id__in=[tx.id for tx in transactions]
+            ).values_list("transaction_id", flat=True)
+        }
 
-        # Check if transaction exists
-        existing = await TastyTradeTransaction.objects.filter(transaction_id=tx_id).afirst()
+        rows = {}
+        newest_at = None
+        highest_id = None
+        for tx in transactions:
+            result["total_processed"] += 1
+            try:
+                fields = self._transaction_fields(user, account, tx)
+            except Exception as e:
+                tx_id = getattr(tx, "id", "unknown")
+                logger.error(f"Error importing transaction {tx_id}: {e}")
+                result["errors"].append(
+                    {
+                        "transaction_id": tx_id,
+                        "error": str(e),
+                    }
+                )
+                continue
 
-        # Build field values
-        # Ensure executed_at is timezone-aware
-        from django.utils import timezone
+            executed_at = fields["executed_at"]
+            if executed_at is not None and (newest_at is None or executed_at > newest_at):
+                newest_at = executed_at
+            if highest_id is None or tx.id > highest_id:
+                highest_id = tx.id
+
+            if tx.id in existing_ids:
+                if not full_resync:
+                    result["skipped"] += 1
+                    continue
+                result["updated"] += 1
+            elif tx.id not in rows:
+                result["imported"] += 1
+            rows[tx.id] = TastyTradeTransaction(transaction_id=tx.id, **fields)
+
+        if rows:
+            await TastyTradeTransaction.objects.abulk_create(
+                list(rows.values()),
+                batch_size=SYNC_BULK_BATCH_SIZE,
+                update_conflicts=True,
+                unique_fields=["transaction_id"],
+                update_fields=TRANSACTION_UPSERT_FIELDS,
+            )
+
+        return newest_at, highest_id
 
+    def _transaction_fields(self, user: User, account: TradingAccount, tx) -> dict:
+        """Build TastyTradeTransaction field values (everything except transaction_id)."""
+        # Ensure executed_at is timezone-aware
         executed_at = tx.executed_at
         if executed_at is not None and timezone.is_naive(executed_at):
             executed_at = timezone.make_aware(executed_at)
 
-        tx_fields = {
+        return {
             "user": user,
             "trading_account": account,
             "order_id": getattr(tx, "order_id", None),
@@ -207,19 +308,6 @@ class TransactionImporter:
             "raw_data": self._serialize_transaction(tx),
         }
 
-        if existing:
-            # Update existing transaction
-            for field, value in tx_fields.items():
-                setattr(existing, field, value)
-            await existing.asave()
-            logger.debug(f"Updated transaction {tx_id}")
-            return False
-        # Create new transaction
-        tx_fields["transaction_id"] = tx_id
-        await TastyTradeTransaction.objects.acreate(**tx_fields)
-        logger.debug(f"Created transaction {tx_id}")
-        return True
-
     def _extract_action(self, tx) -> str | None:
         """Extract action string from transaction."""
         action = getattr(tx, "action", None)
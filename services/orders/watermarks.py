@@ -0,0 +1,68 @@
+"""
+Sync watermarks for incremental order-history and transaction imports.
+
+Each (trading account, stream) pair keeps the newest broker timestamp seen by
+the last successful sync. Routine syncs start from the watermark minus
+SYNC_WATERMARK_OVERLAP instead of re-fetching the whole lookback window; the
+overlap absorbs late status changes and clock skew, and the bulk upserts make
+re-fetched rows idempotent.
+"""
+
+from datetime import date, datetime, timedelta
+
+from django.utils import timezone
+
+from accounts.models import TradingAccount
+from services.core.constants import SYNC_WATERMARK_OVERLAP
+from trading.models import BrokerSyncWatermark
+
+ORDERS_STREAM = "orders"
+
+
+def transactions_stream(transaction_types: list[str]) -> str:
+    """Watermark stream name for a transaction type filter."""
+    return "transactions:" + ",".join(sorted(transaction_types))
+
+
+async def get_watermark(account: TradingAccount, stream: str) -> BrokerSyncWatermark | None:
+    return await BrokerSyncWatermark.objects.filter(trading_account=account, stream=stream).afirst()
+
+
+def resume_date(synced_at: datetime | None, floor: date) -> date:
+    """
+    First date to fetch for an incremental sync.
+
+    Never earlier than floor (the caller's lookback window), so a stale
+    watermark cannot widen the fetch.
+    """
+    if synced_at is None:
+        return floor
+    return max(floor, (synced_at - timedelta(seconds=SYNC_WATERMARK_OVERLAP)).date())
+
+
+async def advance_watermark(
+    account: TradingAccount,
+    stream: str,
+    synced_at: datetime | None,
+    last_transaction_id: int | None = None,
+    full_sync: bool = False,
+) -> None:
+    """
+    Move the watermark forward; never moves it backwards.
+
+    A full sync also stamps last_full_sync_at.
+    """
+    watermark, _ = await BrokerSyncWatermark.objects.aget_or_create(
+        trading_account=account, stream=stream
+    )
+    if synced_at is not None and (
+        watermark.last_synced_at is None or synced_at > watermark.last_synced_at
+    ):
+        watermark.last_synced_at = synced_at
+    if last_transaction_id is not None and (
+        watermark.last_transaction_id is None or last_transaction_id > watermark.last_transaction_id
+    ):
+        watermark.last_transaction_id = last_transaction_id
+    if full_sync:
+        watermark.last_full_sync_at = timezone.now()
+    await watermark.asave()
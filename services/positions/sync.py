@@ -1,15 +1,35 @@
-"""Position synchronization service for importing and managing TastyTrade positions."""
-
+"""
+Position synchronization service for importing and managing TastyTrade positions.
+
+Design:
+- Tier 1: app-managed positions are rebuilt from cached orders
+- Tier 2: everything else is a diff engine - local positions for the account
+  are loaded in one query and keyed by underlying symbol, inserts/updates and
+  broker-side closes are computed in memory, then written with
+  bulk_create/bulk_update in a single transaction
+- A content hash of the broker payload is kept under
+  CacheManager.position_status_hash; an unchanged payload skips both tiers
+  (force=True always runs them)
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
 from decimal import Decimal
 from zoneinfo import ZoneInfo
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.db import transaction
+from django.db.models import Q
 from django.utils import timezone as dj_timezone
 
 from asgiref.sync import sync_to_async
 
 from accounts.models import TradingAccount
+from services.core.cache import CacheManager
+from services.core.cache_index import ainvalidate_family
+from services.core.constants import POSITION_SYNC_HASH_TTL, SYNC_BULK_BATCH_SIZE
 from services.core.logging import get_logger
 from services.orders.history import OrderHistoryService
 from services.positions.lifecycle.leg_matcher import LegMatcher, OrderAwareLegMatcher
@@ -22,6 +42,52 @@ ET_TIMEZONE = ZoneInfo("America/New_York")
 User = get_user_model()
 logger = get_logger(__name__)
 
+# Local states that are closed when the symbol is no longer held at the broker
+OPEN_LIFECYCLE_STATES = ["open_full", "open_partial", "closing"]
+
+# Never overwritten by broker data on existing positions
+PROTECTED_SYNC_FIELDS = frozenset(
+    {
+        "user",
+        "trading_account",
+        "is_app_managed",  # Never overwrite app-managed status
+        "strategy_type",  # Preserve strategy type for app-managed positions
+        "profit_targets_created",  # Protect profit target tracking
+        "profit_target_details",  # Protect profit target order details
+        "initial_risk",  # Preserve calculated risk amounts
+        "spread_width",  # Keep original spread width
+        "number_of_spreads",  # Keep original spread count (use cached orders)
+        "quantity",  # Preserve quantity (use cached orders for app-managed positions)
+        "opening_price_effect",  # Preserve credit/debit status
+    }
+)
+
+# Broker position fields that feed the sync (content hash input)
+POSITION_HASH_FIELDS = (
+    "underlying_symbol",
+    "symbol",
+    "instrument_type",
+    "quantity",
+    "quantity_direction",
+    "average_open_price",
+    "close_price",
+    "mark_price",
+    "multiplier",
+    "cost_effect",
+)
+
+
+@dataclass
+class PositionDiff:
+    """Tier-2 changes computed in memory, applied in one transaction."""
+
+    creates: list[Position] = field(default_factory=list)
+    # Changed-field tuple -> positions that changed exactly those fields
+    updates: dict[tuple[str, ...], list[Position]] = field(default_factory=dict)
+    closes: list[Position] = field(default_factory=list)
+    updated: int = 0  # Existing positions matched (changed or not)
+    errors: list[str] = field(default_factory=list)
+
 
 class PositionSyncService:
     """Import and synchronize all positions from TastyTrade account."""
@@ -37,10 +103,14 @@ class PositionSyncService:
         """
         self.order_history_service = order_history_service or OrderHistoryService()
 
-    async def sync_all_positions(self, user: User) -> dict[str, object]:
+    async def sync_all_positions(self, user: User, force: bool = False) -> dict[str, object]:
         """
         Import all TastyTrade positions and categorize them.
 
+        Args:
+            user: User to sync
+            force: Run the full sync even if the broker payload is unchanged
+
         Returns:
             Dict with sync results including counts and any errors
         """
@@ -102,9 +172,26 @@ class PositionSyncService:
                     "updated": 0,
                 }
 
-            imported_count = 0
-            updated_count = 0
-            errors = []
+            # Skip the diff when the broker payload is unchanged since the last sync
+            payload_hash = self._positions_payload_hash(raw_positions)
+            hash_key = CacheManager.position_status_hash(user.id, account.account_number)
+            if not force and cache.get(hash_key) == payload_hash:
+                logger.info(
+                    "User %s: Broker positions unchanged since last sync, skipping position diff",
+                    user.id,
+                )
+                # Cancelled/rejected orders never show up in positions, so still check them
+                closed_pending = await self._sync_pending_order_statuses(user, account, session)
+                return {
+                    "success": True,
+                    "skipped": True,
+                    "positions_found": len(self._broker_symbols(raw_positions)),
+                    "imported": 0,
+                    "updated": 0,
+                    "closed_pending": closed_pending,
+                    "closed_at_broker": 0,
+                    "timestamp": dj_timezone.now().isoformat(),
+                }
 
             logger.info(
                 "User %s: Tier 1 - syncing app-managed positions from cached orders...", user.id
@@ -114,7 +201,6 @@ class PositionSyncService:
                 user, account, raw_positions
             )
             tier1_duration = time.time() - tier1_start
-            updated_count += app_managed_updated
             logger.info(
                 "User %s: Tier 1 complete - updated %s app-managed positions [%.2fs]",
                 user.id,
@@ -122,49 +208,6 @@ class PositionSyncService:
                 tier1_duration,
             )
 
-            logger.info(
-                "User %s: Tier 2 - syncing unmanaged positions via TastyTrade grouping...", user.id
-            )
-            tier2_start = time.time()
-            tt_positions = await self._group_positions_by_underlying(raw_positions)
-            group_duration = time.time() - tier2_start
-
-            for tt_position in tt_positions:
-                try:
-                    # Skip if this is an app-managed position (already synced above)
-                    symbol = tt_position.get("symbol", "")
-                    existing = await Position.objects.filter(
-                        user=user,
-                        trading_account=account,
-                        symbol=symbol,
-                        is_app_managed=True,
-                    ).afirst()
-
-                    if existing:
-                        # Already synced by app-managed logic
-                        logger.debug(f"Skipping {symbol} - already synced as app-managed position")
-                        continue
-
-                    created = await self._sync_single_position(user, account, tt_position)
-                    if created:
-                        imported_count += 1
-                    else:
-                        updated_count += 1
-                except Exception as e:
-                    pos_id = tt_position.get("id", "unknown")
-                    errors.append(f"Error syncing position {pos_id}: {e!s}")
-                    logger.error(f"Error syncing position: {e}", exc_info=True)
-
-            tier2_duration = time.time() - tier2_start
-            logger.info(
-                "User %s: Tier 2 complete - imported %s, updated %s unmanaged positions [%.2fs (grouping: %.2fs)]",
-                user.id,
-                imported_count,
-                updated_count - app_managed_updated,
-                tier2_duration,
-                group_duration,
-            )
-
             # Check order status for pending positions (cancelled/rejected orders)
             logger.info("User %s: Checking pending order statuses...", user.id)
             pending_start = time.time()
@@ -177,18 +220,36 @@ class PositionSyncService:
                 pending_duration,
             )
 
-            # Close positions that exist locally but not at broker (quantity=0)
-            logger.info("User %s: Checking for positions closed at broker...", user.id)
-            broker_close_start = time.time()
-            closed_at_broker = await self._close_positions_not_at_broker(
-                user, account, raw_positions
+            logger.info(
+                "User %s: Tier 2 - diffing unmanaged positions via TastyTrade grouping...", user.id
+            )
+            tier2_start = time.time()
+            tt_positions = await self._group_positions_by_underlying(raw_positions)
+            group_duration = time.time() - tier2_start
+
+            diff = await self._diff_positions(
+                user, account, tt_positions, self._broker_symbols(raw_positions)
             )
-            broker_close_duration = time.time() - broker_close_start
+            await self._apply_position_diff(diff)
+            if diff.creates or diff.updates:
+                # Cached position/portfolio Greeks were computed from the old legs
+                await ainvalidate_family(CacheManager.position_greeks_family(user.id))
+
+            imported_count = len(diff.creates)
+            updated_count = app_managed_updated + diff.updated
+            closed_at_broker = len(diff.closes)
+            errors = diff.errors
+
+            tier2_duration = time.time() - tier2_start
             logger.info(
-                "User %s: Closed %s positions not found at broker [%.2fs]",
+                "User %s: Tier 2 complete - imported %s, updated %s unmanaged positions, "
+                "closed %s not at broker [%.2fs (grouping: %.2fs)]",
                 user.id,
+                imported_count,
+                diff.updated,
                 closed_at_broker,
-                broker_close_duration,
+                tier2_duration,
+                group_duration,
             )
 
             total_duration = time.time() - start_time
@@ -204,10 +265,12 @@ class PositionSyncService:
 
             if errors:
                 result["errors"] = errors
+            else:
+                cache.set(hash_key, payload_hash, POSITION_SYNC_HASH_TTL)
 
             logger.info(
                 "Position sync complete for user %s: imported=%s, updated=%s, closed_pending=%s, closed_broker=%s "
-                "(total: %.2fs, breakdown: order_history=%.2fs, fetch=%.2fs, tier1=%.2fs, tier2=%.2fs, pending=%.2fs, broker_close=%.2fs)",
+                "(total: %.2fs, breakdown: order_history=%.2fs, fetch=%.2fs, tier1=%.2fs, pending=%.2fs, tier2=%.2fs)",
                 user.id,
                 imported_count,
                 updated_count,
@@ -217,9 +280,8 @@ class PositionSyncService:
                 order_duration,
                 fetch_duration,
                 tier1_duration,
-                tier2_duration,
                 pending_duration,
-                broker_close_duration,
+                tier2_duration,
             )
 
             # After successful sync, broadcast to connected clients
@@ -228,6 +290,8 @@ class PositionSyncService:
                     from streaming.services.stream_manager import GlobalStreamManager
 
                     stream_manager = await GlobalStreamManager.get_user_manager(user.id)
+                    # Stream the legs of positions that opened, drop the ones that closed
+                    await stream_manager.refresh_position_subscriptions()
 
                     await stream_manager._broadcast(
                         "position_sync_complete",
@@ -245,6 +309,9 @@ class PositionSyncService:
             return result
 
         except Exception as e:
+            from services.core.data_access import invalidate_oauth_session
+
+            invalidate_oauth_session(user.id, e)
             logger.error(f"Position sync failed for user {user.id}: {e}", exc_info=True)
             return {"error": str(e)}
 
@@ -373,77 +440,155 @@ class PositionSyncService:
             logger.error(f"Error fetching positions from TastyTrade: {e}", exc_info=True)
             return []
 
-    async def _sync_single_position(
-        self, user: User, account: TradingAccount, tt_position: dict
-    ) -> bool:
+    @staticmethod
+    def _positions_payload_hash(raw_positions: list) -> str:
+        """Order-independent content hash of the broker position fields the sync reads."""
+        rows = sorted(
+            json.dumps([str(getattr(pos, attr, None)) for attr in POSITION_HASH_FIELDS])
+            for pos in raw_positions
+        )
+        return hashlib.sha256("\n".join(rows).encode()).hexdigest()
+
+    @staticmethod
+    def _broker_symbols(raw_positions: list) -> set[str]:
+        """Underlying symbols that exist at broker."""
+        return {
+            underlying
+            for pos in raw_positions
+            if (underlying := getattr(pos, "underlying_symbol", getattr(pos, "symbol", None)))
+        }
+
+    async def _diff_positions(
+        self,
+        user: User,
+        account: TradingAccount,
+        tt_positions: list[dict],
+        broker_symbols: set[str],
+    ) -> PositionDiff:
         """
-        Sync a single position from TastyTrade.
+        Compute Tier-2 inserts/updates and broker-side closes in memory.
 
-        IMPORTANT: This method preserves the is_app_managed status
-        for existing positions. Only NEW positions will have their
-        is_app_managed status set based on categorization.
-        This prevents sync from overwriting app-managed positions.
+        All local positions that can be touched are loaded in one query: every
+        position for a symbol held at the broker, plus every open position
+        (candidates for closing). Broker positions are grouped by underlying
+        symbol, so each one is matched to the local position for that symbol
+        whose stored legs are the same option symbols, falling back to the
+        lowest id for the symbol.
 
-        Returns:
-            True if position was created (new), False if updated
+        IMPORTANT: Symbols with an app-managed position are skipped (synced by
+        Tier 1), and is_app_managed is only set on NEW positions.
         """
-        # Use symbol as unique identifier since TastyTrade doesn't provide position IDs
-        symbol = tt_position.get("symbol", "UNKNOWN")
-        if not symbol or symbol == "UNKNOWN":
-            logger.warning(f"Position missing symbol, skipping: {tt_position}")
-            return False
+        local_positions = [
+            position
+            async for position in Position.objects.filter(user=user, trading_account=account)
+            .filter(Q(symbol__in=broker_symbols) | Q(lifecycle_state__in=OPEN_LIFECYCLE_STATES))
+            .order_by("id")
+        ]
+
+        app_managed_symbols = {p.symbol for p in local_positions if p.is_app_managed}
+        positions_by_symbol: dict[str, list[Position]] = {}
+        for position in local_positions:
+            positions_by_symbol.setdefault(position.symbol, []).append(position)
+
+        diff = PositionDiff()
+
+        for tt_position in tt_positions:
+            symbol = tt_position.get("symbol", "")
+            if not symbol or symbol == "UNKNOWN":
+                logger.warning(f"Position missing symbol, skipping: {tt_position}")
+                continue
+            if symbol in app_managed_symbols:
+                # Already synced by app-managed logic
+                logger.debug(f"Skipping {symbol} - already synced as app-managed position")
+                continue
+
+            try:
+                fields = await self._broker_position_fields(tt_position)
+                existing = self._match_local_position(
+                    positions_by_symbol.get(symbol, []), tt_position.get("legs", [])
+                )
+                if existing is None:
+                    diff.creates.append(
+                        Position(
+                            user=user,
+                            trading_account=account,
+                            symbol=symbol,
+                            is_app_managed=await self._categorize_position(tt_position),
+                            **fields,
+                        )
+                    )
+                    continue
 
-        # Check if position already exists using symbol + account
-        existing_position = await Position.objects.filter(
-            user=user, trading_account=account, symbol=symbol
-        ).afirst()
+                modified_fields = self._apply_broker_fields(existing, fields)
+                diff.updated += 1
+                if modified_fields:
+                    diff.updates.setdefault(tuple(modified_fields), []).append(existing)
+            except Exception as e:
+                pos_id = tt_position.get("id", "unknown")
+                diff.errors.append(f"Error syncing position {pos_id}: {e!s}")
+                logger.error(f"Error syncing position: {e}", exc_info=True)
+
+        # Close local positions that don't exist at broker (quantity=0 at broker):
+        # closed manually, expired, or fully closed through partial closes
+        now = dj_timezone.now()
+        for position in local_positions:
+            if position.lifecycle_state not in OPEN_LIFECYCLE_STATES:
+                continue
+            if position.symbol in broker_symbols:
+                continue
 
-        if existing_position:
             logger.info(
-                f"Found existing position {existing_position.id} for {symbol}, "
-                f"is_app_managed={existing_position.is_app_managed}, "
-                f"strategy_type={existing_position.strategy_type}"
+                f"Position {position.id} ({position.symbol}, qty={position.quantity}): "
+                f"Not found at broker (quantity=0), marking as closed"
             )
-        else:
-            logger.info(f"No existing position found for {symbol}, will create new")
+            position.lifecycle_state = "closed"
+            position.quantity = 0
+            position.unrealized_pnl = Decimal("0")  # No more unrealized P&L when closed
+
+            fields_to_save = ["lifecycle_state", "quantity", "unrealized_pnl", "metadata"]
+            if not position.closed_at:
+                position.closed_at = now
+                fields_to_save.append("closed_at")
+
+            position.metadata = position.metadata or {}
+            position.metadata["closure_reason"] = "closed_at_broker"
+            position.metadata["closure_detected_at"] = now.isoformat()
+            position.metadata["closure_method"] = "position_sync_detection"
 
-        is_app_managed = await self._categorize_position(tt_position)
+            diff.closes.append(position)
+            diff.updates.setdefault(tuple(fields_to_save), []).append(position)
 
+        return diff
+
+    @staticmethod
+    def _leg_symbols(legs: list[dict]) -> frozenset[str]:
+        return frozenset(leg.get("symbol") for leg in legs if leg.get("symbol"))
+
+    def _match_local_position(
+        self, candidates: list[Position], legs: list[dict]
+    ) -> Position | None:
+        """Id-ordered candidate holding the same leg symbols, else the lowest id."""
+        if not candidates:
+            return None
+        broker_legs = self._leg_symbols(legs)
+        for position in candidates:
+            if self._leg_symbols((position.metadata or {}).get("legs", [])) == broker_legs:
+                return position
+        return candidates[0]
+
+    async def _broker_position_fields(self, tt_position: dict) -> dict:
+        """Position model fields for a grouped TastyTrade position (no identity fields)."""
         legs = tt_position.get("legs", [])
         instrument_type = "Equity Option"  # Default for options
         strategy_type = "external"  # Default for broker-discovered positions
 
-        # Check if this is a stock position (single leg with instrument_type="Equity")
-        if len(legs) == 1:
-            leg_instrument_type = legs[0].get("instrument_type", "unknown")
-            if leg_instrument_type == "Equity":
-                instrument_type = "Equity"
-                strategy_type = "stock_holding"  # Stock positions get stock_holding strategy
-                logger.info(f"Detected stock position for {symbol}: {instrument_type}")
-        elif len(legs) > 1:
-            # Multi-leg: check if all legs are equity options
-            if all(leg.get("instrument_type") == "Equity Option" for leg in legs):
-                instrument_type = "Equity Option"
-
-        position_data = {
-            "user": user,
-            "trading_account": account,
-            "symbol": symbol,
-            "quantity": int(tt_position.get("quantity", 0)),
-            "avg_price": self._safe_decimal(tt_position.get("average_price")),
-            "unrealized_pnl": self._safe_decimal(tt_position.get("unrealized_pnl")),
-            "instrument_type": instrument_type,
-            "strategy_type": strategy_type,
-            "lifecycle_state": "open_full",  # All imported positions are open
-        }
+        # Single leg with instrument_type="Equity" is a stock position
+        if len(legs) == 1 and legs[0].get("instrument_type", "unknown") == "Equity":
+            instrument_type = "Equity"
+            strategy_type = "stock_holding"
 
-        # Only set is_app_managed for NEW positions, not existing ones
-        if not existing_position:
-            position_data["is_app_managed"] = is_app_managed
-
-        # Add metadata with comprehensive broker data
-        position_data["metadata"] = {
-            "legs": tt_position.get("legs", []),  # NEW: Store all position legs
+        metadata = {
+            "legs": legs,
             "tastytrade_data": {
                 "position_type": tt_position.get("position_type"),
                 "expiration_date": (
@@ -468,171 +613,84 @@ class PositionSyncService:
         # Calculate DTE and check for attention flags
         needs_attention_reason = await self._check_needs_attention(tt_position)
         if needs_attention_reason:
-            # Store in metadata since needs_attention_reason field was removed
-            if "metadata" not in position_data:
-                position_data["metadata"] = {}
-            position_data["metadata"]["needs_attention_reason"] = needs_attention_reason
-
-        # NEW: Reconstruct position from cached orders if available
-        if existing_position and existing_position.is_app_managed:
-            # For app-managed positions, use cached orders as source of truth
-            logger.info(
-                f"Reconstructing app-managed position {existing_position.id} from cached orders"
-            )
-            try:
-                corrected_data = await self.order_history_service.reconstruct_position_from_orders(
-                    existing_position
-                )
-                if corrected_data:
-                    # Update number_of_spreads and quantity from cached orders
-                    if "number_of_spreads" in corrected_data:
-                        old_spreads = existing_position.number_of_spreads
-                        new_spreads = corrected_data["number_of_spreads"]
-                        if old_spreads != new_spreads:
-                            logger.warning(
-                                f"Position {existing_position.id} spread count correction: "
-                                f"{old_spreads} -> {new_spreads} (from cached orders)"
-                            )
-                            existing_position.number_of_spreads = new_spreads
+            metadata["needs_attention_reason"] = needs_attention_reason
 
-                    if "quantity" in corrected_data:
-                        old_qty = existing_position.quantity
-                        new_qty = corrected_data["quantity"]
-                        if old_qty != new_qty:
-                            logger.warning(
-                                f"Position {existing_position.id} quantity correction: "
-                                f"{old_qty} -> {new_qty} (from cached orders)"
-                            )
-                            existing_position.quantity = new_qty
+        return {
+            "quantity": int(tt_position.get("quantity", 0)),
+            # Rounded to the column scale so an unchanged value compares equal after a reload
+            "avg_price": self._safe_cents(tt_position.get("average_price")),
+            "unrealized_pnl": self._safe_cents(tt_position.get("unrealized_pnl")),
+            "instrument_type": instrument_type,
+            "strategy_type": strategy_type,
+            "lifecycle_state": "open_full",  # All imported positions are open
+            "metadata": metadata,
+        }
 
-                    # Merge corrected metadata
-                    if "metadata" in corrected_data:
-                        existing_metadata = existing_position.metadata or {}
-                        existing_metadata.update(corrected_data["metadata"])
-                        existing_position.metadata = existing_metadata
+    @staticmethod
+    def _apply_broker_fields(position: Position, fields: dict) -> list[str]:
+        """
+        Apply broker fields to an existing external position in memory.
 
-                    logger.info(
-                        f"Position {existing_position.id} reconstructed: "
-                        f"spreads={existing_position.number_of_spreads}, "
-                        f"quantity={existing_position.quantity}"
-                    )
+        Protected fields (quantity, strategy type, risk and profit target
+        tracking) are never overwritten; metadata is merged. sync_timestamp is
+        only refreshed when something else changed, so an unchanged position
+        is not rewritten.
 
-                    # Clear any previous reconstruction failure flag
-                    if existing_position.metadata and existing_position.metadata.get(
-                        "reconstruction_failed"
-                    ):
-                        del existing_position.metadata["reconstruction_failed"]
+        Returns:
+            Names of the fields that actually changed
+        """
+        modified_fields = []
 
-            except Exception as e:
-                # Log reconstruction failure with full context for monitoring
-                logger.error(
-                    f"Position reconstruction failed for position {existing_position.id} "
-                    f"(symbol={existing_position.symbol}, user={existing_position.user_id}, "
-                    f"opening_order_id={existing_position.opening_order_id}): {e}",
-                    exc_info=True,
-                    extra={
-                        "position_id": existing_position.id,
-                        "symbol": existing_position.symbol,
-                        "user_id": existing_position.user_id,
-                        "opening_order_id": existing_position.opening_order_id,
-                        "error_type": "position_reconstruction_failure",
-                    },
-                )
+        for name, value in fields.items():
+            if name == "metadata" or name in PROTECTED_SYNC_FIELDS:
+                continue
+            old_value = getattr(position, name, None)
+            if old_value != value:
+                logger.debug(f"Position {position.id}: Updating {name} from {old_value} to {value}")
+                setattr(position, name, value)
+                modified_fields.append(name)
+
+        broker_metadata = fields.get("metadata")
+        if broker_metadata is None:
+            return modified_fields
+
+        existing_metadata = position.metadata or {}
+        merged_metadata = existing_metadata.copy()
+        # External positions: broker is the source of truth
+        merged_metadata["legs"] = broker_metadata.get("legs", [])
+        merged_metadata["tastytrade_data"] = broker_metadata.get("tastytrade_data", {})
+        merged_metadata["sync_source"] = broker_metadata.get("sync_source")
+
+        def without_timestamp(metadata: dict) -> dict:
+            return {key: value for key, value in metadata.items() if key != "sync_timestamp"}
+
+        if modified_fields or without_timestamp(merged_metadata) != without_timestamp(
+            existing_metadata
+        ):
+            merged_metadata["sync_timestamp"] = broker_metadata.get("sync_timestamp")
+            position.metadata = merged_metadata
+            modified_fields.append("metadata")
 
-                # Mark position as having reconstruction failure
-                existing_position.metadata = existing_position.metadata or {}
-                existing_position.metadata["reconstruction_failed"] = True
-                existing_position.metadata["reconstruction_error"] = str(e)
-                existing_position.metadata["reconstruction_failed_at"] = (
-                    dj_timezone.now().isoformat()
-                )
+        return modified_fields
 
-                # Continue with sync using TastyTrade data, but flag for manual review
-
-        if existing_position:
-            # Update existing position
-            # Track which fields we actually modify to use update_fields
-            # This prevents race conditions with concurrent processes
-            protected_fields = [
-                "user",
-                "trading_account",
-                "is_app_managed",  # Never overwrite app-managed status
-                "strategy_type",  # Preserve strategy type for app-managed positions
-                "profit_targets_created",  # Protect profit target tracking
-                "profit_target_details",  # Protect profit target order details
-                "initial_risk",  # Preserve calculated risk amounts
-                "spread_width",  # Keep original spread width
-                "number_of_spreads",  # Keep original spread count (use cached orders)
-                "quantity",  # Preserve quantity (use cached orders for app-managed positions)
-                "opening_price_effect",  # Preserve credit/debit status
-            ]
+    @sync_to_async
+    def _apply_position_diff(self, diff: PositionDiff) -> None:
+        """Write a computed diff with bulk statements in a single transaction."""
+        if not diff.creates and not diff.updates:
+            return
 
-            modified_fields = []
-
-            for field, value in position_data.items():
-                if field == "metadata":
-                    # Merge metadata instead of replacing
-                    existing_metadata = existing_position.metadata or {}
-                    # Preserve critical existing metadata
-                    merged_metadata = existing_metadata.copy()
-
-                    # CRITICAL: Preserve app-managed metadata fields
-                    # - suggestion_id: Required for profit target calculations
-                    # - strikes: Used for conflict detection
-                    # - streaming_pricing: Needed for pricing
-                    # - strategy_type, is_complete_trident, expiration: Strategy data
-
-                    if existing_position.is_app_managed:
-                        # App-managed: ONLY update sync metadata
-                        merged_metadata["sync_timestamp"] = value.get("sync_timestamp")
-                        merged_metadata["sync_source"] = value.get("sync_source")
-
-                        # Update legs from broker to ensure Greeks have latest data
-                        # Critical: Trade.order_legs may not have all data
-                        if value.get("legs"):
-                            merged_metadata["legs"] = value.get("legs", [])
-
-                        # Add tastytrade_data if missing
-                        if "tastytrade_data" not in merged_metadata:
-                            merged_metadata["tastytrade_data"] = value.get("tastytrade_data", {})
-                    else:
-                        # External positions: Update from broker (source of truth)
-                        merged_metadata["legs"] = value.get("legs", [])
-                        merged_metadata["tastytrade_data"] = value.get("tastytrade_data", {})
-                        merged_metadata["sync_timestamp"] = value.get("sync_timestamp")
-                        merged_metadata["sync_source"] = value.get("sync_source")
-
-                    # Only save metadata if it actually changed
-                    if merged_metadata != existing_metadata:
-                        setattr(existing_position, field, merged_metadata)
-                        modified_fields.append("metadata")
-                elif field not in protected_fields:
-                    # Only update non-protected fields when value actually changes
-                    old_value = getattr(existing_position, field, None)
-                    if old_value != value:
-                        logger.info(
-                            f"Position {existing_position.id}: Updating {field} "
-                            f"from {old_value} to {value}"
-                        )
-                        setattr(existing_position, field, value)
-                        modified_fields.append(field)
-
-            # Use update_fields to only save modified fields
-            # This prevents overwriting concurrent changes to protected fields
-            if modified_fields:
-                await existing_position.asave(update_fields=modified_fields)
-            has_legs = bool(existing_position.metadata and existing_position.metadata.get("legs"))
-            logger.info(
-                f"Updated position {existing_position.id}: "
-                f"strategy_type={existing_position.strategy_type}, "
-                f"has_legs_in_metadata={has_legs}, "
-                f"fields_updated={modified_fields}"
-            )
-            return False
-        # Create new position
-        new_position = await Position.objects.acreate(**position_data)
-        logger.info(f"Created new position {new_position.id} for {symbol}")
-        return True
+        with transaction.atomic():
+            if diff.creates:
+                Position.objects.bulk_create(diff.creates, batch_size=SYNC_BULK_BATCH_SIZE)
+            # Grouped by changed-field set, so untouched columns are never written
+            for fields, positions in diff.updates.items():
+                Position.objects.bulk_update(positions, fields, batch_size=SYNC_BULK_BATCH_SIZE)
+
+        logger.info(
+            f"Applied position diff: {len(diff.creates)} created, "
+            f"{sum(len(p) for p in diff.updates.values())} updated "
+            f"({len(diff.closes)} closed at broker)"
+        )
 
     async def _sync_pending_order_statuses(self, user: User, account: TradingAccount, session):
         """
@@ -809,113 +867,6 @@ class PositionSyncService:
             )
             return 0
 
-    async def _close_positions_not_at_broker(
-        self, user: User, account: TradingAccount, raw_positions: list
-    ) -> int:
-        """
-        Close local positions that don't exist at broker (quantity=0 at broker).
-
-        This handles cases where:
-        - Positions were closed manually at broker
-        - Options expired and auto-closed
-        - Partial closes resulted in quantity=0 but local DB still shows quantity>0
-
-        Args:
-            user: User to check positions for
-            account: Trading account
-            raw_positions: Raw positions from broker (from tt_account.a_get_positions())
-
-        Returns:
-            int: Number of positions closed
-        """
-        try:
-            # Build set of underlying symbols that exist at broker
-            broker_symbols = set()
-            for pos in raw_positions:
-                underlying = getattr(pos, "underlying_symbol", getattr(pos, "symbol", None))
-                if underlying:
-                    broker_symbols.add(underlying)
-
-            logger.debug(
-                f"User {user.id}: Broker has positions in {len(broker_symbols)} symbols: "
-                f"{sorted(broker_symbols)}"
-            )
-
-            # Get all local positions that are not fully closed
-            local_positions = [
-                position
-                async for position in Position.objects.filter(
-                    user=user,
-                    trading_account=account,
-                    lifecycle_state__in=["open_full", "open_partial", "closing"],
-                )
-            ]
-
-            if not local_positions:
-                logger.debug(f"User {user.id}: No local open/closing positions to check")
-                return 0
-
-            logger.info(
-                f"User {user.id}: Checking {len(local_positions)} local positions "
-                f"against broker positions"
-            )
-
-            closed_count = 0
-            for position in local_positions:
-                # If position symbol exists at broker, skip (it's still open)
-                if position.symbol in broker_symbols:
-                    logger.debug(
-                        f"Position {position.id} ({position.symbol}): "
-                        f"Still exists at broker, keeping {position.lifecycle_state}"
-                    )
-                    continue
-
-                # Position doesn't exist at broker - close it
-                logger.info(
-                    f"Position {position.id} ({position.symbol}, qty={position.quantity}): "
-                    f"Not found at broker (quantity=0), marking as closed"
-                )
-
-                position.lifecycle_state = "closed"
-                position.quantity = 0
-                position.unrealized_pnl = Decimal("0")  # No more unrealized P&L when closed
-
-                # Set closed_at timestamp if not already set
-                fields_to_save = ["lifecycle_state", "quantity", "unrealized_pnl", "metadata"]
-                if not position.closed_at:
-                    position.closed_at = dj_timezone.now()
-                    fields_to_save.append("closed_at")
-
-                # Add closure metadata
-                position.metadata = position.metadata or {}
-                position.metadata["closure_reason"] = "closed_at_broker"
-                position.metadata["closure_detected_at"] = dj_timezone.now().isoformat()
-                position.metadata["closure_method"] = "position_sync_detection"
-
-                await position.asave(update_fields=fields_to_save)
-                closed_count += 1
-
-                logger.info(
-                    f"Closed position {position.id} ({position.symbol}): "
-                    f"realized_pnl=${position.total_realized_pnl}, "
-                    f"closed_at={position.closed_at.isoformat()}"
-                )
-
-            if closed_count > 0:
-                logger.info(
-                    f"User {user.id}: Closed {closed_count} positions that were "
-                    f"no longer at broker"
-                )
-
-            return closed_count
-
-        except Exception as e:
-            logger.error(
-                f"Error closing positions not at broker for user {user.id}: {e}",
-                exc_info=True,
-            )
-            return 0
-
     async def _categorize_position(self, tt_position: dict) -> bool:
         """
         Determine if position is app-managed or external.
@@ -1811,3 +1762,11 @@ class PositionSyncService:
             return Decimal(str(value))
         except Exception:
             return None
+
+    @classmethod
+    def _safe_cents(cls, value) -> Decimal | None:
+        """Safely convert value to Decimal rounded to two places."""
+        decimal_value = cls._safe_decimal(value)
+        if decimal_value is None or not decimal_value.is_finite():
+            return decimal_value
+        return decimal_value.quantize(Decimal("0.01"))
@@ -17,8 +17,19 @@ The reconciliation workflow follows this order:
 6. Validate and fix profit targets
 
 Each phase can be run independently or as part of the full workflow.
+
+Concurrent mode (ReconciliationOptions.concurrent):
+- Phases are pipelined per user instead of run across all users in lockstep:
+  user A can be in sync_positions while user B is still in sync_order_history,
+  so one slow broker account no longer stalls everyone
+- Phase order within each user is unchanged
+- At most max_concurrent_users pipelines run at once, and broker-bound phase
+  starts are spaced to broker_phase_rate per second for each broker. This
+  throttles when phases begin, not the API calls made inside a phase
+- Per-user, per-phase durations are reported in ReconciliationResult.user_timings
 """
 
+import asyncio
 import time
 from dataclasses import dataclass, field
 from decimal import Decimal
@@ -28,11 +39,24 @@ from django.contrib.auth import get_user_model
 from asgiref.sync import sync_to_async
 
 from accounts.models import TradingAccount
+from services.core.constants import (
+    RECONCILIATION_BROKER_PHASE_RATE,
+    RECONCILIATION_MAX_CONCURRENT_USERS,
+)
 from services.core.logging import get_logger
 
 User = get_user_model()
 logger = get_logger(__name__)
 
+# Phases that call the broker API and count against the per-broker phase throttle
+BROKER_PHASES = {
+    "sync_order_history",
+    "sync_transactions",
+    "sync_positions",
+    "reconcile_trades",
+    "fix_profit_targets",
+}
+
 
 @dataclass
 class ReconciliationOptions:
@@ -57,6 +81,12 @@ class ReconciliationOptions:
     cancel_orphaned_orders: bool = False  # Cancel orders at broker not in DB
     replace_cancelled_targets: bool = False  # Replace cancelled profit targets
     days_back: int = 30  # Days of order history to sync
+    full_resync: bool = False  # Ignore sync watermarks and re-fetch the whole window
+
+    # Concurrency options
+    concurrent: bool = False  # Pipeline phases per user instead of phase-by-phase
+    max_concurrent_users: int = RECONCILIATION_MAX_CONCURRENT_USERS
+    broker_phase_rate: float = RECONCILIATION_BROKER_PHASE_RATE  # Phase starts/sec per broker
 
     # Output options
     verbose: bool = False  # Extra logging
@@ -86,6 +116,7 @@ class ReconciliationResult:
     phases_failed: list = field(default_factory=list)
     phase_results: dict = field(default_factory=dict)
     summary: dict = field(default_factory=dict)
+    user_timings: dict = field(default_factory=dict)  # {user_id: {phase: seconds}}
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
@@ -107,9 +138,34 @@ class ReconciliationResult:
                 for phase, result in self.phase_results.items()
             },
             "summary": self.summary,
+            "user_timings": self.user_timings,
         }
 
 
+class BrokerPhaseThrottle:
+    """
+    Spaces out acquisitions to at most `rate` per second (shared by all callers).
+
+    Acquired once before each broker-bound phase, so it bounds phase starts per
+    broker; calls made inside a phase are not individually throttled.
+    """
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if not self.interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
 class ReconciliationOrchestrator:
     """
     Orchestrates the complete reconciliation workflow.
@@ -215,13 +271,15 @@ class ReconciliationOrchestrator:
             ),
         ]
 
-        for phase_name, enabled, handler in phases:
-            if not enabled:
-                continue
+        enabled_phases = [(name, handler) for name, enabled, handler in phases if enabled]
 
-            phase_result = await handler(users)
-            result.phase_results[phase_name] = phase_result
+        if self.options.concurrent and len(users) > 1:
+            result.phase_results = await self._run_concurrent(users, enabled_phases, result)
+        else:
+            for phase_name, handler in enabled_phases:
+                result.phase_results[phase_name] = await handler(users)
 
+        for phase_name, phase_result in result.phase_results.items():
             if phase_result.success:
                 result.phases_completed.append(phase_name)
             else:
@@ -236,6 +294,7 @@ class ReconciliationOrchestrator:
             "phases_completed": len(result.phases_completed),
             "phases_failed": len(result.phases_failed),
             "total_duration_seconds": result.total_duration_seconds,
+            "concurrent": self.options.concurrent and len(users) > 1,
         }
 
         completed = len(result.phases_completed)
@@ -248,6 +307,97 @@ class ReconciliationOrchestrator:
 
         return result
 
+    async def _run_concurrent(
+        self, users: list, phases: list, result: ReconciliationResult
+    ) -> dict:
+        """
+        Run every enabled phase for each user as an independent pipeline.
+
+        Returns:
+            Phase results merged across users, keyed by phase name in phase order.
+            Merged durations are the sum of per-user durations for that phase.
+        """
+        semaphore = asyncio.Semaphore(max(1, self.options.max_concurrent_users))
+        brokers = await self._get_user_brokers(users)
+        throttles = {
+            broker: BrokerPhaseThrottle(self.options.broker_phase_rate)
+            for broker in set(brokers.values())
+        }
+
+        async def run_user(user) -> dict:
+            async with semaphore:
+                return await self._run_user_pipeline(
+                    user, phases, throttles[brokers[user.id]], result
+                )
+
+        logger.info(
+            f"Running reconciliation pipelines for {len(users)} users "
+            f"(max_concurrent_users={self.options.max_concurrent_users}, "
+            f"broker_phase_rate={self.options.broker_phase_rate}/s)"
+        )
+        per_user = await asyncio.gather(*(run_user(user) for user in users))
+
+        return {
+            phase_name: self._merge_phase_results(
+                phase_name, [user_results[phase_name] for user_results in per_user]
+            )
+            for phase_name, _ in phases
+        }
+
+    async def _run_user_pipeline(
+        self, user, phases: list, throttle: BrokerPhaseThrottle, result: ReconciliationResult
+    ) -> dict:
+        """Run the phases for one user in order, recording per-phase timings."""
+        timings = result.user_timings.setdefault(user.id, {})
+        phase_results = {}
+
+        for phase_name, handler in phases:
+            if phase_name in BROKER_PHASES:
+                await throttle.acquire()
+
+            phase_start = time.monotonic()
+            try:
+                phase_results[phase_name] = await handler([user])
+            except Exception as e:
+                logger.error(f"User {user.id}: Phase {phase_name} failed: {e}", exc_info=True)
+                phase_results[phase_name] = PhaseResult(
+                    phase=phase_name,
+                    success=False,
+                    errors=[{"user_id": user.id, "error": str(e)}],
+                )
+            timings[phase_name] = round(time.monotonic() - phase_start, 2)
+
+        return phase_results
+
+    async def _get_user_brokers(self, users: list) -> dict:
+        """Map user id -> broker (primary account connection type) for phase throttling."""
+        user_ids = [user.id for user in users]
+        primary = {
+            user_id: connection_type
+            async for user_id, connection_type in TradingAccount.objects.filter(
+                user_id__in=user_ids, is_primary=True
+            ).values_list("user_id", "connection_type")
+        }
+        return {user_id: primary.get(user_id, "TASTYTRADE") for user_id in user_ids}
+
+    @staticmethod
+    def _merge_phase_results(phase_name: str, results: list) -> PhaseResult:
+        """Combine per-user results for one phase into a single PhaseResult."""
+        merged = PhaseResult(phase=phase_name, success=all(r.success for r in results))
+        for phase_result in results:
+            merged.duration_seconds += phase_result.duration_seconds
+            merged.items_processed += phase_result.items_processed
+            merged.items_updated += phase_result.items_updated
+            merged.items_created += phase_result.items_created
+            merged.errors.extend(phase_result.errors)
+            for key, value in phase_result.details.items():
+                if isinstance(value, int | float | Decimal) and key in merged.details:
+                    merged.details[key] += value
+                else:
+                    merged.details.setdefault(key, value)
+        merged.duration_seconds = round(merged.duration_seconds, 2)
+        return merged
+
     async def _get_users_to_process(self) -> list:
         """Get list of users to process based on options."""
         if self.options.user_id:
@@ -320,7 +470,9 @@ class ReconciliationOrchestrator:
 
                     try:
                         sync_result = await service.sync_order_history(
-                            account, days_back=self.options.days_back
+                            account,
+                            days_back=self.options.days_back,
+                            full_resync=self.options.full_resync,
                         )
                         result.items_processed += 1
                         result.items_created += sync_result.get("new_orders", 0)
@@ -403,6 +555,7 @@ class ReconciliationOrchestrator:
                             user=user,
                             account=account,
                             start_date=date.today() - timedelta(days=self.options.days_back),
+                            full_resync=self.options.full_resync,
                         )
                         link_result = await importer.link_transactions_to_positions(
                             user=user,
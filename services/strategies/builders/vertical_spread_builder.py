@@ -191,12 +191,18 @@ class VerticalSpreadBuilder:
         current_price: Decimal,
         market_context: dict | None = None,
     ) -> BuildResult:
-        """Build using delta-based strike selection."""
+        """
+        Build using delta-based strike selection.
+
+        Candidate expirations in the DTE range are tried nearest-first; their
+        chains are fetched and evaluated concurrently (first_passing_expiration).
+        """
         from datetime import timedelta
 
         from django.utils import timezone
 
         from services.market_data.option_chains import OptionChainService
+        from services.market_data.utils.expiration_utils import first_passing_expiration
         from services.strategies.strike_selection import DeltaStrikeSelector
 
         chain_service = OptionChainService()
@@ -223,46 +229,44 @@ class VerticalSpreadBuilder:
                 f"No expirations found for {symbol} in DTE range {params.dte_min}-{params.dte_max}"
             )
 
-        # Use first valid expiration (closest to min DTE)
-        expiration = sorted(valid_expirations)[0]
-
-        # Get option chain for this expiration
-        chain = await chain_service.a_get_chain_for_expiration(
-            self.user, symbol, expiration
-        )
+        # Prefer the expiration closest to min DTE; later ones are fallbacks
+        # whose chains are fetched concurrently with it
+        selector = DeltaStrikeSelector(self.user)
+        spread_type = self._get_spread_type(params)
 
-        if not chain:
-            return BuildResult.failure_result(
-                f"Could not fetch option chain for {symbol} exp {expiration}"
+        async def evaluate(expiration):
+            chain = await chain_service.a_get_chain_for_expiration(
+                self.user, symbol, expiration
             )
+            if not chain:
+                logger.warning(f"Could not fetch option chain for {symbol} exp {expiration}")
+                return None
 
-        # Build chain_strikes list for selector
-        chain_strikes = self._build_chain_strikes(chain)
+            # Build chain_strikes list for selector
+            chain_strikes = self._build_chain_strikes(chain)
+            if not chain_strikes:
+                logger.warning(f"Option chain empty for {symbol} exp {expiration}")
+                return None
 
-        if not chain_strikes:
-            return BuildResult.failure_result(
-                f"Option chain empty for {symbol} exp {expiration}"
+            return await selector.select_strikes(
+                symbol=symbol,
+                expiration=expiration,
+                chain_strikes=chain_strikes,
+                spread_type=spread_type,
+                spread_width=params.effective_width_target,
+                target_delta=params.delta_target,
+                current_price=current_price,
+                market_context=market_context,
             )
 
-        # Use DeltaStrikeSelector
-        selector = DeltaStrikeSelector(self.user)
-        spread_type = self._get_spread_type(params)
-
-        result = await selector.select_strikes(
-            symbol=symbol,
-            expiration=expiration,
-            chain_strikes=chain_strikes,
-            spread_type=spread_type,
-            spread_width=params.effective_width_target,
-            target_delta=params.delta_target,
-            current_price=current_price,
-            market_context=market_context,
-        )
-
-        if not result:
+        found = await first_passing_expiration(sorted(valid_expirations), evaluate)
+        if not found:
             return BuildResult.failure_result(
-                f"Delta selection failed for {symbol} (target delta: {params.delta_target})"
+                f"Delta selection failed for {symbol} (target delta: {params.delta_target}) "
+                f"at all {len(valid_expirations)} expirations in DTE range "
+                f"{params.dte_min}-{params.dte_max}"
             )
+        expiration, result = found
 
         # Convert StrikeQualityResult to QualityScore
         quality = QualityScore(
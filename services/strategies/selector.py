@@ -11,6 +11,7 @@ from typing import Any
 
 from django.contrib.auth.models import AbstractBaseUser
 
+from services.core.constants import STRATEGY_GENERATION_TIMEOUT, STRATEGY_SCORE_TIMEOUT
 from services.core.logging import get_logger
 from services.core.utils.logging_utils import log_error_with_context
 from services.interfaces.streaming_interface import StreamerProtocol
@@ -40,6 +41,29 @@ class StrategySelector:
     # Minimum score threshold for auto mode (credit spreads)
     MIN_AUTO_SCORE: int = 30
 
+    # Tie-breaking order when scores are equal (highest to lowest priority)
+    STRATEGY_PRIORITY: tuple[str, ...] = (
+        # Credit Spreads (highest priority - proven track record, defined risk)
+        "short_put_vertical",
+        "short_call_vertical",
+        "cash_secured_put",
+        # Debit Spreads (directional plays, defined risk)
+        "long_call_vertical",
+        "long_put_vertical",
+        # Iron Condors (range-bound, defined risk)
+        "short_iron_condor",
+        "long_iron_condor",
+        # Volatility Strategies (limited risk, rare opportunities)
+        "long_straddle",
+        "long_strangle",
+        "iron_butterfly",
+        # Advanced Multi-Leg (complex, special requirements)
+        "long_call_ratio_backspread",
+        "call_calendar",
+        "put_calendar",
+        "covered_call",
+    )
+
     def __init__(self, user: AbstractBaseUser, streamer: StreamerProtocol | None = None) -> None:
         """
         Initialize strategy selector with all registered strategies.
@@ -144,61 +168,16 @@ class StrategySelector:
             self._last_scores = {}
             return (None, None, explanation)
 
-        # Score all strategies
-        scores: dict[str, float] = {}
-        explanations: dict[str, str] = {}
-
-        for name, strategy in self.strategies.items():
-            try:
-                score, explanation = await strategy.a_score_market_conditions(report)
-                scores[name] = score
-                explanations[name] = explanation
-                logger.info(f"{name}: {score:.1f} - {explanation}")
-            except Exception as e:
-                log_error_with_context("scoring", e, context={"strategy": name})
-                scores[name] = 0.0
-                explanations[name] = f"Error: {e}"
+        # Score all strategies (concurrently)
+        scores, explanations = await self._a_score_all(report)
 
         # Store scores with explanations for API access
         self._last_scores = {
             name: {"score": scores[name], "explanation": explanations[name]} for name in scores
         }
 
-        # Find highest scoring strategy with deterministic tie-breaking
-        # When scores tie, prefer strategies in this priority order (highest to lowest)
-        strategy_priority = [
-            # Credit Spreads (highest priority - proven track record, defined risk)
-            "short_put_vertical",
-            "short_call_vertical",
-            "cash_secured_put",
-            # Debit Spreads (directional plays, defined risk)
-            "long_call_vertical",
-            "long_put_vertical",
-            # Iron Condors (range-bound, defined risk)
-            "short_iron_condor",
-            "long_iron_condor",
-            # Volatility Strategies (limited risk, rare opportunities)
-            "long_straddle",
-            "long_strangle",
-            "iron_butterfly",
-            # Advanced Multi-Leg (complex, special requirements)
-            "long_call_ratio_backspread",
-            "call_calendar",
-            "put_calendar",
-            "covered_call",
-        ]
-
-        # Sort by (score DESC, priority ASC) - ties go to highest priority strategy
-        best_strategy_name = max(
-            scores.items(),
-            key=lambda x: (
-                x[1],  # Score (higher is better)
-                (
-                    -strategy_priority.index(x[0]) if x[0] in strategy_priority else -999
-                ),  # Priority (lower index is higher priority)
-            ),
-        )[0]
-        best_score = scores[best_strategy_name]
+        # Highest score wins; ties go to the highest priority strategy
+        best_strategy_name, best_score = self._rank_strategies(scores)[0]
 
         # Check if any strategy has reasonable score
         if best_score < self.MIN_AUTO_SCORE:
@@ -596,20 +575,8 @@ class StrategySelector:
                 },
             )
 
-        # 3. Score ALL strategies
-        scores = {}
-        explanations = {}
-
-        for name, strategy in self.strategies.items():
-            try:
-                score, explanation = await strategy.a_score_market_conditions(report)
-                scores[name] = score
-                explanations[name] = explanation
-                logger.info(f"{name}: {score:.1f} - {explanation}")
-            except Exception as e:
-                logger.error(f"Error scoring {name}: {e}")
-                scores[name] = 0.0
-                explanations[name] = f"Error: {e}"
+        # 3. Score ALL strategies (concurrently)
+        scores, explanations = await self._a_score_all(report)
 
         # Store scores for API access
         self._last_scores = {
@@ -617,35 +584,7 @@ class StrategySelector:
         }
 
         # 4. Sort strategies by score (with deterministic tie-breaking)
-        strategy_priority = [
-            # Credit Spreads (highest priority - proven track record, defined risk)
-            "short_put_vertical",
-            "short_call_vertical",
-            "cash_secured_put",
-            # Debit Spreads (directional plays, defined risk)
-            "long_call_vertical",
-            "long_put_vertical",
-            # Iron Condors (range-bound, defined risk)
-            "short_iron_condor",
-            "long_iron_condor",
-            # Volatility Strategies (limited risk, rare opportunities)
-            "long_straddle",
-            "long_strangle",
-            "iron_butterfly",
-            # Advanced Multi-Leg (complex, special requirements)
-            "long_call_ratio_backspread",
-            "call_calendar",
-            "put_calendar",
-            "covered_call",
-        ]
-        sorted_strategies = sorted(
-            scores.items(),
-            key=lambda x: (
-                x[1],  # Score (higher first)
-                -strategy_priority.index(x[0]) if x[0] in strategy_priority else -999,
-            ),
-            reverse=True,
-        )
+        sorted_strategies = self._rank_strategies(scores)
 
         # 5. Filter strategies above threshold
         eligible = [
@@ -677,82 +616,209 @@ class StrategySelector:
                 },
             )
 
-        # 7. Generate suggestions for top N eligible strategies
-        suggestions = []
-        generation_failures = []
-
+        # 7. Generate suggestions for top N eligible strategies (concurrently)
         logger.info(
             f"Attempting to generate suggestions for top {min(count, len(eligible))} strategies..."
         )
+        suggestions, generation_failures = await self._a_generate_top(
+            symbol,
+            eligible,
+            count,
+            report,
+            scores=scores,
+            explanations=explanations,
+            suggestion_mode=suggestion_mode,
+        )
 
-        for strategy_name, score in eligible[:count]:
-            try:
-                strategy = self.strategies[strategy_name]
-                logger.info(f"  → Generating {strategy_name} (score: {score:.1f})...")
+        # Log generation summary
+        if suggestions:
+            logger.info(f"Generated {len(suggestions)} suggestion(s) for {symbol}")
+        elif generation_failures:
+            logger.warning(
+                f"All {len(generation_failures)} eligible strategies failed generation for {symbol}:"
+            )
+            for name, reason in generation_failures:
+                logger.warning(f"  - {name}: {reason}")
 
-                # Prepare context with suggestion_mode flag
-                context = await strategy.a_prepare_suggestion_context(
-                    symbol, report, suggestion_mode=suggestion_mode
+        # 8. Return what we successfully generated
+        global_context = {
+            "type": "suggestions" if suggestions else "generation_failures",
+            "market_report": report,
+            "all_scores": self._last_scores,
+            "generation_failures": generation_failures,
+        }
+
+        return (suggestions, global_context)
+
+    async def _a_score_all(
+        self, report: MarketConditionReport
+    ) -> tuple[dict[str, float], dict[str, str]]:
+        """
+        Score every strategy concurrently, each bounded by STRATEGY_SCORE_TIMEOUT.
+
+        A strategy that raises or times out scores 0.0 so it can never be selected.
+
+        Returns:
+            (scores, explanations) keyed by strategy name, in registry order
+        """
+
+        async def score_one(name: str, strategy) -> tuple[float, str]:
+            try:
+                score, explanation = await asyncio.wait_for(
+                    strategy.a_score_market_conditions(report), STRATEGY_SCORE_TIMEOUT
                 )
+            except TimeoutError:
+                logger.warning(f"{name}: Scoring timed out after {STRATEGY_SCORE_TIMEOUT}s")
+                return 0.0, f"Error: scoring timed out after {STRATEGY_SCORE_TIMEOUT}s"
+            except Exception as e:
+                log_error_with_context("scoring", e, context={"strategy": name})
+                return 0.0, f"Error: {e}"
+            logger.info(f"{name}: {score:.1f} - {explanation}")
+            return score, explanation
 
-                if not context:
-                    logger.warning(f"  {strategy_name}: Context preparation failed")
-                    generation_failures.append((strategy_name, "Context preparation failed"))
-                    continue
+        names = list(self.strategies)
+        results = await asyncio.gather(
+            *(score_one(name, self.strategies[name]) for name in names)
+        )
 
-                logger.info(f"  PASS: {strategy_name}: Context prepared")
+        scores = {name: score for name, (score, _) in zip(names, results, strict=True)}
+        explanations = {
+            name: explanation for name, (_, explanation) in zip(names, results, strict=True)
+        }
+        return scores, explanations
 
-                # Mark as automated/suggestion mode
-                context["is_automated"] = True
-                context["suggestion_mode"] = suggestion_mode
+    def _rank_strategies(self, scores: dict[str, float]) -> list[tuple[str, float]]:
+        """Sort by (score DESC, priority ASC) - ties go to the highest priority strategy."""
+        priority = self.STRATEGY_PRIORITY
+        return sorted(
+            scores.items(),
+            key=lambda x: (
+                x[1],  # Score (higher first)
+                -priority.index(x[0]) if x[0] in priority else -999,
+            ),
+            reverse=True,
+        )
+
+    async def _a_generate_top(
+        self,
+        symbol: str,
+        eligible: list[tuple[str, float]],
+        count: int,
+        report: MarketConditionReport,
+        *,
+        scores: dict[str, float],
+        explanations: dict[str, str],
+        suggestion_mode: bool,
+    ) -> tuple[list[tuple[str, TradingSuggestion, dict]], list[tuple[str, str]]]:
+        """
+        Generate suggestions for the best `count` eligible strategies concurrently.
 
-                # Generate via stream manager
-                from streaming.services.stream_manager import GlobalStreamManager
+        The top `count` strategies are generated at the same time, so the wait is
+        roughly the slowest one instead of the sum. When one fails, the next
+        eligible strategy takes its slot. Each attempt is bounded by
+        STRATEGY_GENERATION_TIMEOUT, and anything still running when the batch
+        ends (enough suggestions, or the caller was cancelled) is cancelled.
 
-                stream_manager = await GlobalStreamManager.get_user_manager(self.user.id)
-                suggestion = await stream_manager.a_process_suggestion_request(context)
+        Only `count` attempts run at once because pricing persists a
+        TradingSuggestion - speculative extra attempts would leave orphan rows.
+
+        Returns:
+            (suggestions in score order, [(strategy_name, reason), ...] failures)
+        """
+        from streaming.services.stream_manager import GlobalStreamManager
+
+        stream_manager = await GlobalStreamManager.get_user_manager(self.user.id)
 
-                if suggestion:
+        waiting = list(enumerate(eligible))
+        running: dict[asyncio.Task, tuple[int, str, float]] = {}
+        generated: dict[int, tuple[str, TradingSuggestion, dict]] = {}
+        generation_failures: list[tuple[str, str]] = []
+
+        def fill_slots() -> None:
+            while waiting and len(running) < count - len(generated):
+                rank, (name, score) = waiting.pop(0)
+                logger.info(f"  → Generating {name} (score: {score:.1f})...")
+                task = asyncio.create_task(
+                    self._a_generate_one(name, symbol, report, stream_manager, suggestion_mode)
+                )
+                running[task] = (rank, name, score)
+
+        fill_slots()
+        try:
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    rank, name, score = running.pop(task)
+                    suggestion, failure = task.result()
+                    if suggestion is None:
+                        generation_failures.append((name, failure))
+                        continue
                     explanation = self._build_auto_explanation(
-                        strategy_name,
+                        name,
                         score,
                         self._score_to_confidence(score),
                         scores,
                         explanations,
                         report,
                     )
-                    suggestions.append((strategy_name, suggestion, explanation))
-                    logger.info(f"  {strategy_name}: Suggestion generated successfully")
-                else:
-                    logger.warning(f"  {strategy_name}: Stream manager returned None")
-                    generation_failures.append(
-                        (strategy_name, "Suggestion generation returned None")
-                    )
+                    generated[rank] = (name, suggestion, explanation)
+                    logger.info(f"  {name}: Suggestion generated successfully")
+                fill_slots()
+        finally:
+            for task, (_, name, _) in running.items():
+                task.cancel()
+                logger.info(f"  {name}: Generation cancelled")
+            await asyncio.gather(*running, return_exceptions=True)
+
+        suggestions = [generated[rank] for rank in sorted(generated)]
+        return suggestions, generation_failures
+
+    async def _a_generate_one(
+        self,
+        strategy_name: str,
+        symbol: str,
+        report: MarketConditionReport,
+        stream_manager,
+        suggestion_mode: bool,
+    ) -> tuple[TradingSuggestion | None, str]:
+        """
+        Prepare context and price one strategy, bounded by STRATEGY_GENERATION_TIMEOUT.
 
-            except Exception as e:
-                logger.error(f"  {strategy_name}: Exception during generation: {e}")
-                generation_failures.append((strategy_name, str(e)))
-                continue
+        Returns:
+            (suggestion, "") on success, (None, failure reason) otherwise
+        """
+        strategy = self.strategies[strategy_name]
+        try:
+            async with asyncio.timeout(STRATEGY_GENERATION_TIMEOUT):
+                # Prepare context with suggestion_mode flag
+                context = await strategy.a_prepare_suggestion_context(
+                    symbol, report, suggestion_mode=suggestion_mode
+                )
+                if not context:
+                    logger.warning(f"  {strategy_name}: Context preparation failed")
+                    return None, "Context preparation failed"
 
-        # Log generation summary
-        if suggestions:
-            logger.info(f"Generated {len(suggestions)} suggestion(s) for {symbol}")
-        elif generation_failures:
+                logger.info(f"  PASS: {strategy_name}: Context prepared")
+
+                # Mark as automated/suggestion mode
+                context["is_automated"] = True
+                context["suggestion_mode"] = suggestion_mode
+
+                # Subscribe legs, wait for the cache and price via the stream manager
+                suggestion = await stream_manager.a_process_suggestion_request(context)
+        except TimeoutError:
             logger.warning(
-                f"All {len(generation_failures)} eligible strategies failed generation for {symbol}:"
+                f"  {strategy_name}: Generation timed out after {STRATEGY_GENERATION_TIMEOUT}s"
             )
-            for name, reason in generation_failures:
-                logger.warning(f"  - {name}: {reason}")
-
-        # 8. Return what we successfully generated
-        global_context = {
-            "type": "suggestions" if suggestions else "generation_failures",
-            "market_report": report,
-            "all_scores": self._last_scores,
-            "generation_failures": generation_failures,
-        }
+            return None, f"Timed out after {STRATEGY_GENERATION_TIMEOUT}s"
+        except Exception as e:
+            logger.error(f"  {strategy_name}: Exception during generation: {e}")
+            return None, str(e)
 
-        return (suggestions, global_context)
+        if not suggestion:
+            logger.warning(f"  {strategy_name}: Stream manager returned None")
+            return None, "Suggestion generation returned None"
+        return suggestion, ""
 
     def _score_to_confidence(self, score: float) -> str:
         """
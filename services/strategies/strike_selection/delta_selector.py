@@ -2,7 +2,9 @@
 Delta-based strike selector.
 
 Provides delta-targeted strike selection with:
-- Streaming Greeks primary data source
+- Streaming Greeks primary data source, read as one OptionChainGreeks snapshot
+  (the same snapshot StrikeOptimizer.find_optimal_spread_strikes_by_delta uses)
+- Historical database fallback for strikes without streaming Greeks
 - Black-Scholes model fallback
 - Quality scoring integration
 - Spread width resolution
@@ -31,7 +33,7 @@ from services.strategies.strike_selection.quality_scorer import (
 )
 
 if TYPE_CHECKING:
-    pass
+    from services.streaming.dataclasses import OptionChainGreeks
 
 logger = get_logger(__name__)
 
@@ -66,13 +68,14 @@ class DeltaStrikeSelector:
     """
     Select strikes by target delta with quality scoring.
 
-    Uses GreeksFetcher for streaming/historical Greeks, falls back to
-    Black-Scholes model when Greeks unavailable.
+    Reads streaming Greeks from a chain snapshot (OptionChainGreeks), uses
+    GreeksFetcher for the historical fallback, and falls back to the
+    Black-Scholes model when neither has Greeks.
 
     Attributes:
         user: Django user for API access
         min_quality_score: Minimum quality to accept without warning (default 40)
-        greeks_fetcher: GreeksFetcher instance
+        greeks_fetcher: GreeksFetcher instance (historical fallback)
         quality_scorer: StrikeQualityScorer instance
 
     Example:
@@ -113,6 +116,7 @@ class DeltaStrikeSelector:
         current_price: Decimal,
         market_context: dict | None = None,
         max_candidates: int = 18,
+        chain_greeks: OptionChainGreeks | None = None,
     ) -> DeltaSelectionResult | None:
         """
         Select strikes using delta targeting with quality scoring.
@@ -125,8 +129,9 @@ class DeltaStrikeSelector:
             spread_width: Width of spread in points
             target_delta: Target delta for short strike (e.g., 0.25)
             current_price: Current underlying price
-            market_context: Optional market context (IV, stress level)
+            market_context: Optional market context (current_iv for the model fallback)
             max_candidates: Max strikes to evaluate (default 18)
+            chain_greeks: Optional pre-read snapshot for this expiration and side
 
         Returns:
             DeltaSelectionResult on success, None if no valid selection
@@ -147,13 +152,11 @@ class DeltaStrikeSelector:
 
         market_context = market_context or {}
 
-        # Fetch Greeks for all candidates
-        greeks_map = await self.greeks_fetcher.fetch_greeks(
-            symbol,
-            expiration,
-            [c.occ_symbol for c in sorted_candidates if c.occ_symbol],
-            market_context.get("market_stress_level"),
-        )
+        if chain_greeks is None:
+            chain_greeks = await self._read_chain_greeks(
+                symbol, expiration, option_type, sorted_candidates
+            )
+        greeks_map = await self._build_greeks_map(sorted_candidates, chain_greeks)
 
         # Calculate time to expiration
         dte_days = max((expiration - timezone.now().date()).days, 1)
@@ -248,6 +251,45 @@ class DeltaStrikeSelector:
 
         return candidates
 
+    async def _read_chain_greeks(
+        self,
+        symbol: str,
+        expiration: date,
+        option_type: str,
+        candidates: list[_StrikeCandidate],
+    ) -> OptionChainGreeks:
+        """Subscribe the candidate legs and read their streaming Greeks in one call."""
+        from services.streaming.options_service import StreamingOptionsDataService
+
+        options_service = StreamingOptionsDataService(self.user)
+        await options_service.a_ensure_leg_stream(
+            symbol, expiration, [c.occ_symbol for c in candidates if c.occ_symbol]
+        )
+        return options_service.read_chain_greeks(
+            symbol, expiration, option_type, [c.strike for c in candidates]
+        )
+
+    async def _build_greeks_map(
+        self,
+        candidates: list[_StrikeCandidate],
+        chain_greeks: OptionChainGreeks,
+    ) -> dict[str, dict]:
+        """Map candidate OCC symbol -> Greeks, from the snapshot then the database."""
+        greeks_map: dict[str, dict] = {}
+        missing: list[str] = []
+        for candidate in candidates:
+            if not candidate.occ_symbol:
+                continue
+            snapshot = chain_greeks.get(candidate.strike)
+            if snapshot is not None and snapshot.delta is not None:
+                greeks_map[candidate.occ_symbol] = GreeksFetcher.serialize_snapshot(snapshot)
+            else:
+                missing.append(candidate.occ_symbol)
+
+        if missing:
+            greeks_map.update(await self.greeks_fetcher.fetch_historical_greeks(missing))
+        return greeks_map
+
     @staticmethod
     def _prioritize_candidates(
         current_price: Decimal,
@@ -9,10 +9,16 @@ This module implements the "strikes-from-available" pattern where we:
 This is the correct approach vs. the old "calculate-then-fail" pattern.
 """
 
+from __future__ import annotations
+
 from decimal import Decimal
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 from services.core.logging import get_logger
+from services.market_data.chain_snapshot import nearest_strike
+
+if TYPE_CHECKING:
+    from services.streaming.dataclasses import OptionChainGreeks
 
 logger = get_logger(__name__)
 
@@ -140,13 +146,12 @@ class StrikeOptimizer:
             ideal_long = closest_short + Decimal(str(spread_width))
 
         # 5. Validate long strike exists in available strikes
-        # Try exact match first
-        if ideal_long in available_strikes_sorted:
+        # Try exact match first (the closest strike is the ideal one if it's listed)
+        closest_long = self._find_closest_strike(ideal_long, available_strikes_sorted)
+        if closest_long == ideal_long:
             logger.info(f"Found exact long strike: ${ideal_long:.2f}")
             long_strike = ideal_long
         else:
-            # Find closest to ideal long strike
-            closest_long = self._find_closest_strike(ideal_long, available_strikes_sorted)
             if not closest_long:
                 logger.warning(f"No available long strike near ${ideal_long:.2f}")
                 return None
@@ -282,11 +287,11 @@ class StrikeOptimizer:
         self, target: Decimal, available_strikes: list[Decimal]
     ) -> Decimal | None:
         """
-        Find the closest available strike to a target price.
+        Find the closest available strike to a target price (binary search).
 
         Args:
             target: Target strike price
-            available_strikes: Sorted list of available strikes
+            available_strikes: Ascending list of available strikes
 
         Returns:
             Decimal: Closest available strike, or None if no strikes available
@@ -297,11 +302,7 @@ class StrikeOptimizer:
             >>> optimizer._find_closest_strike(Decimal('103'), strikes)
             Decimal('105')  # Closer to 105 than 100
         """
-        if not available_strikes:
-            return None
-
-        # Find strike with minimum absolute distance to target
-        return min(available_strikes, key=lambda strike: abs(strike - target))
+        return nearest_strike(available_strikes, target)
 
     async def find_strike_by_delta(
         self,
@@ -312,6 +313,7 @@ class StrikeOptimizer:
         target_delta: float,
         available_strikes: list[Decimal],
         options_service=None,
+        chain_greeks: OptionChainGreeks | None = None,
     ) -> tuple[Decimal | None, float | None]:
         """
         Find the strike with delta closest to target using live Greeks.
@@ -321,6 +323,9 @@ class StrikeOptimizer:
         - Time to expiration
         - Market conditions
 
+        Greeks for all strikes are read in one cache call into an
+        OptionChainGreeks snapshot, then matched to the target in one pass.
+
         Args:
             user: Django user for API access
             symbol: Underlying symbol (e.g., 'QQQ')
@@ -329,6 +334,7 @@ class StrikeOptimizer:
             target_delta: Target delta (e.g., 0.20 for 20 delta put)
             available_strikes: List of available strikes from option chain
             options_service: Optional StreamingOptionsDataService instance
+            chain_greeks: Optional pre-read snapshot to share between lookups
 
         Returns:
             (strike, actual_delta) tuple, or (None, None) if no Greeks available
@@ -346,72 +352,30 @@ class StrikeOptimizer:
             logger.warning("No available strikes provided for delta search")
             return (None, None)
 
-        # Import here to avoid circular imports
-        from services.sdk.instruments import build_occ_symbol
-        from services.streaming.options_service import StreamingOptionsDataService
-
-        if options_service is None:
-            options_service = StreamingOptionsDataService(user)
-
-        # Pre-filter strikes to a reasonable range around ATM
-        # For puts, we want strikes below current price
-        # For calls, we want strikes above current price
-        # This reduces the number of Greeks lookups needed
-
-        # For puts, target delta is negative (e.g., -0.20)
-        # For calls, target delta is positive (e.g., 0.20)
-        target_delta_signed = -abs(target_delta) if option_type == "put" else abs(target_delta)
-
-        best_strike = None
-        best_delta = None
-        best_delta_diff = float("inf")
-        strikes_with_greeks = 0
-
-        # Sort strikes for logical processing
-        sorted_strikes = sorted(available_strikes)
-
-        # For efficiency, only check strikes in a reasonable range
-        # Delta 0.10-0.30 typically falls within 3-12% OTM
-        # We'll check all strikes but log how many have Greeks
-
-        for strike in sorted_strikes:
-            # Build OCC symbol for this strike
-            occ_symbol = build_occ_symbol(
+        if chain_greeks is None:
+            chain_greeks = self._read_chain_greeks(
+                user,
                 symbol,
                 expiration,
-                strike,
-                "P" if option_type == "put" else "C",
+                option_type,
+                available_strikes,
+                options_service=options_service,
             )
 
-            # Read Greeks from cache
-            greeks = options_service.read_greeks(occ_symbol)
-
-            if greeks and greeks.delta is not None:
-                strikes_with_greeks += 1
-                actual_delta = float(greeks.delta)
-
-                # Calculate how close this delta is to target
-                delta_diff = abs(actual_delta - target_delta_signed)
-
-                if delta_diff < best_delta_diff:
-                    best_delta_diff = delta_diff
-                    best_strike = strike
-                    best_delta = actual_delta
-
-                    # Early exit if we found an exact match (within 0.01)
-                    if delta_diff < 0.01:
-                        logger.info(
-                            f"Found exact delta match: strike ${strike} "
-                            f"delta={actual_delta:.3f} (target={target_delta_signed:.3f})"
-                        )
-                        break
+        # For puts, target delta is negative (e.g., -0.20)
+        # For calls, target delta is positive (e.g., 0.20)
+        target_delta_signed = -abs(target_delta) if option_type == "put" else abs(target_delta)
 
-        if best_strike:
+        match = chain_greeks.nearest_delta(target_delta_signed)
+        if match:
+            best_strike, best_delta = match
             logger.info(
                 f"Delta search for {symbol} {option_type}: "
                 f"found strike ${best_strike} with delta={best_delta:.3f} "
-                f"(target={target_delta_signed:.3f}, diff={best_delta_diff:.3f}, "
-                f"checked {strikes_with_greeks}/{len(available_strikes)} strikes with Greeks)"
+                f"(target={target_delta_signed:.3f}, "
+                f"diff={abs(best_delta - target_delta_signed):.3f}, "
+                f"checked {chain_greeks.strikes_with_greeks}/{len(available_strikes)} "
+                f"strikes with Greeks)"
             )
             return (best_strike, best_delta)
 
@@ -421,6 +385,23 @@ class StrikeOptimizer:
         )
         return (None, None)
 
+    @staticmethod
+    def _read_chain_greeks(
+        user,
+        symbol: str,
+        expiration,
+        option_type: Literal["put", "call"],
+        strikes: list[Decimal],
+        *,
+        options_service=None,
+    ) -> OptionChainGreeks:
+        # Import here to avoid circular imports
+        from services.streaming.options_service import StreamingOptionsDataService
+
+        if options_service is None:
+            options_service = StreamingOptionsDataService(user)
+        return options_service.read_chain_greeks(symbol, expiration, option_type, strikes)
+
     async def find_optimal_spread_strikes_by_delta(
         self,
         user,
@@ -432,6 +413,7 @@ class StrikeOptimizer:
         target_delta: float = 0.20,
         options_service=None,
         available_strikes: list[Decimal] | None = None,
+        chain_greeks: OptionChainGreeks | None = None,
     ) -> dict[str, Decimal] | None:
         """
         Find optimal spread strikes using delta targeting.
@@ -449,6 +431,7 @@ class StrikeOptimizer:
             target_delta: Target delta for short strike (default 0.20)
             options_service: Optional StreamingOptionsDataService instance
             available_strikes: Pre-fetched available strikes (optional)
+            chain_greeks: Optional pre-read Greeks snapshot for the short side
 
         Returns:
             Dict with strike keys or None if no suitable strikes found
@@ -460,11 +443,6 @@ class StrikeOptimizer:
             >>> print(strikes)
             {'short_put': Decimal('608'), 'long_put': Decimal('603')}
         """
-        from services.streaming.options_service import StreamingOptionsDataService
-
-        if options_service is None:
-            options_service = StreamingOptionsDataService(user)
-
         # Determine option type based on spread
         option_type: Literal["put", "call"] = (
             "put" if spread_type == "bull_put" else "call"
@@ -475,6 +453,16 @@ class StrikeOptimizer:
             logger.warning("No available_strikes provided - caller should provide them")
             return None
 
+        if chain_greeks is None:
+            chain_greeks = self._read_chain_greeks(
+                user,
+                symbol,
+                expiration,
+                option_type,
+                available_strikes,
+                options_service=options_service,
+            )
+
         # Find short strike by delta
         short_strike, actual_delta = await self.find_strike_by_delta(
             user=user,
@@ -484,6 +472,7 @@ class StrikeOptimizer:
             target_delta=target_delta,
             available_strikes=available_strikes,
             options_service=options_service,
+            chain_greeks=chain_greeks,
         )
 
         if not short_strike:
@@ -500,7 +489,7 @@ class StrikeOptimizer:
 
         # Validate long strike exists in available strikes
         # Allow some tolerance for finding nearest available
-        closest_long = self._find_closest_strike(long_strike, available_strikes)
+        closest_long = self._find_closest_strike(long_strike, sorted(available_strikes))
         if not closest_long:
             logger.warning(f"No available long strike near ${long_strike}")
             return None
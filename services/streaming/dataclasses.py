@@ -1,12 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime
 from decimal import Decimal
 
 from django.conf import settings
 from django.utils import timezone as django_timezone
 
+import numpy as np
+
 from services.core.utils.decimal_utils import to_decimal
 
 DEFAULT_MAX_AGE = getattr(settings, "SENEX_PRICING_MAX_AGE", 60)
@@ -183,6 +185,60 @@ class OptionGreeks:
         return self.age_seconds <= DEFAULT_MAX_AGE
 
 
+@dataclass(slots=True)
+class OptionChainGreeks:
+    """
+    Greeks for every strike of one expiration and side, read in a single cache call.
+
+    Strikes are sorted ascending and deltas are held in a parallel NumPy array
+    (NaN where no fresh Greeks exist) so delta targeting is one vectorized
+    nearest-match instead of a cache read per strike.
+    """
+
+    underlying: str
+    expiration: date
+    option_type: str  # "put" or "call"
+    strikes: list[Decimal]
+    occ_symbols: list[str]
+    greeks: dict[str, OptionGreeks]
+    deltas: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.deltas = np.array(
+            [self._delta_of(self.greeks.get(occ_symbol)) for occ_symbol in self.occ_symbols],
+            dtype=float,
+        )
+
+    @staticmethod
+    def _delta_of(greeks: OptionGreeks | None) -> float:
+        if greeks is None or greeks.delta is None:
+            return np.nan
+        return float(greeks.delta)
+
+    @property
+    def strikes_with_greeks(self) -> int:
+        return int(np.count_nonzero(~np.isnan(self.deltas)))
+
+    def get(self, strike: Decimal) -> OptionGreeks | None:
+        """Greeks for a strike in this snapshot, if available."""
+        try:
+            index = self.strikes.index(Decimal(str(strike)))
+        except ValueError:
+            return None
+        return self.greeks.get(self.occ_symbols[index])
+
+    def nearest_delta(self, target_delta: float) -> tuple[Decimal, float] | None:
+        """
+        Strike whose delta is closest to target_delta (signed).
+
+        Ties resolve to the lower strike. Returns None when no strike has Greeks.
+        """
+        if not self.strikes_with_greeks:
+            return None
+        index = int(np.nanargmin(np.abs(self.deltas - target_delta)))
+        return self.strikes[index], float(self.deltas[index])
+
+
 def _parse_timestamp(payload: dict) -> datetime:
     raw = payload.get("updated_at") or payload.get("timestamp")
     if isinstance(raw, str):
@@ -2,19 +2,25 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from datetime import date
 from decimal import Decimal
 
 from django.core.cache import cache
 
 from services.core.cache import CacheManager
+from services.core.constants import L1_GREEKS_TTL, L1_QUOTE_TTL
+from services.core.l1_cache import l1_cache
 from services.core.logging import get_logger
 from services.streaming.dataclasses import (
     DEFAULT_MAX_AGE,
+    OptionChainGreeks,
     OptionGreeks,
     SenexOccBundle,
     SenexPricing,
     UnderlyingSnapshot,
 )
+from services.streaming.quote_book import quote_book
 
 logger = get_logger(__name__)
 
@@ -42,13 +48,13 @@ class OptionsCache:
 
                 streamer_symbol = Option.occ_to_streamer_symbol(occ_symbol)
                 greeks_key = CacheManager.dxfeed_greeks(streamer_symbol)
-                payload = cache.get(greeks_key)
+                payload = l1_cache.get(greeks_key, L1_GREEKS_TTL)
             except Exception as e:
                 logger.error(f"Failed to convert OCC symbol for Greeks: {e}")
         else:
             # For underlying symbols, use symbol directly
             greeks_key = CacheManager.dxfeed_greeks(occ_symbol)
-            payload = cache.get(greeks_key)
+            payload = l1_cache.get(greeks_key, L1_GREEKS_TTL)
 
         if not payload:
             logger.debug(f"No Greeks data found for {occ_symbol}")
@@ -57,20 +63,85 @@ class OptionsCache:
         greeks = OptionGreeks.from_cache(occ_symbol, payload)
         return greeks if greeks.is_fresh else None
 
-    def get_quote_payload(self, occ_symbol: str) -> dict | None:
-        occ_key = CacheManager.quote(occ_symbol)
-        payload = cache.get(occ_key)
-        logger.info(
-            f"Looking for OCC symbol {occ_symbol}, key: {occ_key}, found: {payload is not None}"
+    def get_greeks_many(self, occ_symbols: Iterable[str]) -> dict[str, OptionGreeks]:
+        """Get fresh Greeks for many option symbols (L1, then one Redis read for the rest)."""
+        keys: dict[str, str] = {}
+        for occ_symbol in occ_symbols:
+            if occ_symbol in keys:
+                continue
+            try:
+                keys[occ_symbol] = CacheManager.dxfeed_greeks(self._greeks_symbol(occ_symbol))
+            except Exception as e:
+                logger.error(f"Failed to convert OCC symbol {occ_symbol} for Greeks: {e}")
+
+        if not keys:
+            return {}
+
+        payloads = l1_cache.get_many(keys.values(), L1_GREEKS_TTL)
+        result: dict[str, OptionGreeks] = {}
+        for occ_symbol, key in keys.items():
+            payload = payloads.get(key)
+            if not payload:
+                continue
+            greeks = OptionGreeks.from_cache(occ_symbol, payload)
+            if greeks.is_fresh:
+                result[occ_symbol] = greeks
+        return result
+
+    def get_chain_greeks(
+        self,
+        underlying: str,
+        expiration: date,
+        option_type: str,
+        strikes: Iterable[Decimal],
+    ) -> OptionChainGreeks:
+        """Greeks snapshot for all given strikes of one expiration and side."""
+        from services.sdk.instruments import build_occ_symbol
+
+        sorted_strikes = sorted({Decimal(str(strike)) for strike in strikes})
+        type_code = "P" if option_type == "put" else "C"
+        occ_symbols = [
+            build_occ_symbol(underlying, expiration, strike, type_code)
+            for strike in sorted_strikes
+        ]
+        return OptionChainGreeks(
+            underlying=underlying,
+            expiration=expiration,
+            option_type=option_type,
+            strikes=sorted_strikes,
+            occ_symbols=occ_symbols,
+            greeks=self.get_greeks_many(occ_symbols),
         )
 
+    @staticmethod
+    def _greeks_symbol(occ_symbol: str) -> str:
+        """Streamer symbol Greeks are cached under (underlyings use their own symbol)."""
+        if " " not in occ_symbol:
+            return occ_symbol
+        from tastytrade.instruments import Option
+
+        return Option.occ_to_streamer_symbol(occ_symbol)
+
+    def get_quote_payload(self, occ_symbol: str) -> dict | None:
+        # Quote book holds the freshest payload when the streamer runs in this process
+        payload = quote_book.get(occ_symbol)
+        if payload is None:
+            occ_key = CacheManager.quote(occ_symbol)
+            payload = l1_cache.get(occ_key, L1_QUOTE_TTL)
+            logger.info(
+                f"Looking for OCC symbol {occ_symbol}, key: {occ_key}, "
+                f"found: {payload is not None}"
+            )
+
         if not payload and " " in occ_symbol:
             try:
                 from tastytrade.instruments import Option
 
                 streamer_symbol = Option.occ_to_streamer_symbol(occ_symbol)
                 streamer_key = CacheManager.quote(streamer_symbol)
-                payload = cache.get(streamer_key)
+                payload = quote_book.get(streamer_symbol) or l1_cache.get(
+                    streamer_key, L1_QUOTE_TTL
+                )
                 found = payload is not None
                 logger.info(
                     f"Converted to streamer: {occ_symbol} -> {streamer_symbol}, "
@@ -9,10 +9,12 @@ from threading import Lock
 
 from django.conf import settings
 from django.core.cache import cache
+from django.utils import timezone
 
 from channels.layers import get_channel_layer
 
 from services.core.cache import CacheManager
+from services.core.cache_index import set_tracked
 from services.core.constants import OPTION_CHAIN_CACHE_TTL
 from services.core.logging import get_logger
 from services.core.utils.async_utils import run_async
@@ -22,6 +24,7 @@ from services.market_data.option_chains import (
     extract_put_strikes,
 )
 from services.streaming.dataclasses import (
+    OptionChainGreeks,
     OptionGreeks,
     SenexOccBundle,
     SenexPricing,
@@ -101,6 +104,34 @@ class StreamingOptionsDataService:
             logger.error(f"Exception reading Greeks for {occ_symbol}: {e}", exc_info=True)
             return None
 
+    def read_greeks_many(self, occ_symbols: list[str]) -> dict[str, OptionGreeks]:
+        """Read fresh Greeks for many option symbols in one cache round trip."""
+        try:
+            return self.cache.get_greeks_many(occ_symbols)
+        except Exception as e:
+            logger.error(f"Exception reading Greeks for {len(occ_symbols)} symbols: {e}")
+            return {}
+
+    def read_chain_greeks(
+        self,
+        symbol: str,
+        expiration: date,
+        option_type: str,
+        strikes: list[Decimal],
+    ) -> OptionChainGreeks:
+        """
+        Read a Greeks snapshot for every strike of one expiration and side.
+
+        Example:
+            >>> snapshot = service.read_chain_greeks("SPY", exp, "put", strikes)
+            >>> strike, delta = snapshot.nearest_delta(-0.20)
+        """
+        try:
+            return self.cache.get_chain_greeks(symbol, expiration, option_type, strikes)
+        except Exception as e:
+            logger.error(f"Exception reading chain Greeks for {symbol} {expiration}: {e}")
+            return OptionChainGreeks(symbol, expiration, option_type, [], [], {})
+
     def ensure_leg_stream(self, symbol: str, expiration: date, occ_symbols: list[str]) -> None:
         """Synchronous wrapper for the async ensure_leg_stream method."""
         return run_async(self.a_ensure_leg_stream(symbol, expiration, occ_symbols))
@@ -268,7 +299,12 @@ class StreamingOptionsDataService:
             chain = {
                 "strikes": chain_data.get("strikes", []),
             }
-            cache.set(cache_key, chain, timeout=OPTION_CHAIN_CACHE_TTL)
+            set_tracked(
+                CacheManager.option_chain_family(timezone.localdate()),
+                cache_key,
+                chain,
+                OPTION_CHAIN_CACHE_TTL,
+            )
             strikes_list = chain["strikes"]
             num_puts = len(extract_put_strikes(strikes_list))
             num_calls = len(extract_call_strikes(strikes_list))
@@ -0,0 +1,96 @@
+"""In-process quote book shared by the streaming writer and same-process readers."""
+
+from __future__ import annotations
+
+import time
+
+
+class QuoteBook:
+    """
+    Per-symbol quote payloads merged from Quote/Trade/Summary events.
+
+    The streaming gateway merges every event here instead of doing a Redis
+    read-modify-write per tick, and periodically drains the dirty symbols to
+    Redis in one batched write. Readers in the same process (OptionsCache,
+    automation readiness checks) can read the latest payload directly.
+
+    Entries are replaced rather than mutated so a payload handed to a reader
+    never changes underneath it.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, dict] = {}
+        self._expires_at: dict[str, float] = {}
+        self._dirty: dict[str, int] = {}  # symbol -> TTL to write with
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, symbol: str) -> dict | None:
+        """Return the latest payload for a symbol, or None if absent or expired."""
+        payload = self._entries.get(symbol)
+        if payload is None:
+            return None
+        if self._expires_at.get(symbol, 0) < time.monotonic():
+            return None
+        return payload
+
+    def peek(self, symbol: str) -> dict | None:
+        """Return the stored payload regardless of expiry (for merging new events)."""
+        return self._entries.get(symbol)
+
+    def merge(self, symbol: str, payload: dict, ttl: int) -> None:
+        """Store a merged payload and mark it for the next flush."""
+        self._entries[symbol] = payload
+        self._expires_at[symbol] = time.monotonic() + ttl
+        self._dirty[symbol] = ttl
+
+    def drain_dirty(self) -> dict[int, dict[str, dict]]:
+        """
+        Take all dirty symbols, grouped by TTL as {ttl: {symbol: payload}}.
+
+        Symbols are considered clean after this call; callers requeue them
+        with mark_dirty() if the write fails.
+        """
+        if not self._dirty:
+            return {}
+
+        dirty, self._dirty = self._dirty, {}
+        batches: dict[int, dict[str, dict]] = {}
+        for symbol, ttl in dirty.items():
+            payload = self._entries.get(symbol)
+            if payload is not None:
+                batches.setdefault(ttl, {})[symbol] = payload
+        return batches
+
+    def mark_dirty(self, symbols: dict[str, int]) -> None:
+        """Requeue symbols (symbol -> TTL) for the next flush."""
+        for symbol, ttl in symbols.items():
+            if symbol in self._entries:
+                self._dirty.setdefault(symbol, ttl)
+
+    @property
+    def dirty_count(self) -> int:
+        return len(self._dirty)
+
+    def prune(self) -> int:
+        """Drop expired, already-flushed entries. Returns count removed."""
+        now = time.monotonic()
+        expired = [
+            symbol
+            for symbol, expires_at in self._expires_at.items()
+            if expires_at < now and symbol not in self._dirty
+        ]
+        for symbol in expired:
+            self._entries.pop(symbol, None)
+            self._expires_at.pop(symbol, None)
+        return len(expired)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._expires_at.clear()
+        self._dirty.clear()
+
+
+# Process-wide instance written by streaming.services.market_data_gateway
+quote_book = QuoteBook()
@@ -7,7 +7,9 @@ and improve maintainability.
 
 # Subscription Management
 MAX_SUBSCRIPTIONS = 500  # Prevent runaway subscription growth
-SUBSCRIPTION_CLEANUP_SECONDS = 3600  # 1 hour - remove old subscriptions
+SUBSCRIPTION_CLEANUP_SECONDS = 3600  # 1 hour - unowned (ad-hoc) subscriptions expire
+SCAN_SUBSCRIPTION_TTL = 300  # 5 minutes - strike probes from strategy scans expire
+SUBSCRIPTION_BATCH_SIZE = 200  # Symbols per DXLink subscribe/unsubscribe call
 
 # Refresh Intervals (seconds)
 QUOTE_REFRESH_INTERVAL = 0.5  # Market quote updates
@@ -41,9 +43,6 @@ SUMMARY_CACHE_TTL = 3600  # 1 hour - daily summary data
 INACTIVITY_TIMEOUT_SECONDS = 1800  # 30 minutes - mark inactive
 CLEANUP_TIMEOUT_SECONDS = 3600  # 1 hour - remove inactive managers
 
-# Automation Polling
-AUTOMATION_READY_POLL_INTERVAL = 1  # Poll delay while waiting for data readiness
-
 # Cache Defaults (seconds)
 CACHE_DEFAULT_TTL = 30  # Fallback TTL for cache entries without explicit type
 TRADE_CACHE_TTL = 30  # Real-time trade data TTL
@@ -59,3 +58,20 @@ STREAMING_AUTH_MAX_RETRIES = 2  # Streaming auth retry attempts
 
 # Cleanup Grace Periods
 STREAMING_CLEANUP_GRACE_PERIOD = 300  # 5 minutes - wait before tearing down streamers
+
+# Shared Market Data Gateway (process-wide DXLink pool)
+GATEWAY_MAX_CONNECTIONS = 4  # DXLink websockets shared by all users in this process
+GATEWAY_SYMBOLS_PER_CONNECTION = 1000  # Symbols per websocket before opening another
+GATEWAY_RECONNECT_ATTEMPTS = 3  # Attempts to re-home symbols after a dropped connection
+GATEWAY_RECONNECT_DELAY = 2.0  # Initial delay between reconnect attempts (doubles)
+QUOTE_BOOK_FLUSH_INTERVAL = 0.25  # Batched quote book -> Redis flush cadence
+QUOTE_BOOK_PRUNE_INTERVAL = 60  # Drop expired quote book entries this often
+
+# Batched HistoricalGreeks ingestion
+GREEKS_FLUSH_INTERVAL = 1.0  # Seconds between HistoricalGreeks batch writes
+GREEKS_FLUSH_BATCH_SIZE = 1000  # Rows per bulk upsert; a full batch triggers an early flush
+GREEKS_BUFFER_MAX_ROWS = 20000  # Pending rows before new samples are dropped
+GREEKS_SYMBOL_CACHE_SIZE = 10000  # Parsed OCC symbols kept before the cache is reset
+
+# WebSocket quote fan-out
+QUOTE_BROADCAST_INTERVAL = 0.25  # Seconds between conflated quotes_update frames per user (0 = off)
@@ -20,6 +20,7 @@ from channels.generic.websocket import AsyncWebsocketConsumer
 from services.core.data_access import get_primary_tastytrade_account
 from services.core.logging import get_logger
 from streaming.services.stream_manager import GlobalStreamManager, UserStreamManager
+from streaming.services.stream_subscription_manager import CONSUMER_PAGE, CONSUMER_SCAN
 from trading.models import Watchlist
 
 logger = get_logger(__name__)
@@ -38,6 +39,11 @@ class StreamingConsumer(AsyncWebsocketConsumer):
     stream_manager: UserStreamManager
     control_group_name: str
 
+    @property
+    def page_consumer(self) -> str:
+        """Subscription consumer for the legs shown on this connection's page."""
+        return f"{CONSUMER_PAGE}:{self.channel_name}"
+
     async def connect(self) -> None:
         scope_user: _AuthenticatedUser | AnonymousUser | UserLazyObject | None = self.scope.get(
             "user"
@@ -117,6 +123,7 @@ class StreamingConsumer(AsyncWebsocketConsumer):
 
         self.stream_manager.context.remove_channel(self.channel_name)
         ref_count = self.stream_manager.context.reference_count
+        await self.stream_manager.release_symbols(self.page_consumer)
 
         logger.info(
             f"User {self.user.id}: WebSocket disconnected "
@@ -159,7 +166,8 @@ class StreamingConsumer(AsyncWebsocketConsumer):
                 symbol_mapping = self.stream_manager.subscription_manager.get_symbol_mapping(
                     symbols
                 )
-                await self.stream_manager.subscribe_to_new_symbols(symbols)
+                # The page sends its full set of legs; legs it no longer shows are released
+                await self.stream_manager.replace_consumer_symbols(self.page_consumer, symbols)
                 await self.send(
                     text_data=json.dumps(
                         {
@@ -192,7 +200,8 @@ class StreamingConsumer(AsyncWebsocketConsumer):
         logger.info(f"Consumer received subscribe_legs event: {event}")
         symbols: list[str] | None = event.get("symbols")
         if symbols and hasattr(self, "stream_manager"):
-            await self.stream_manager.subscribe_to_new_symbols(symbols)
+            # Strike probes from strategy scans; nobody releases them, so they lapse
+            await self.stream_manager.subscribe_to_new_symbols(symbols, consumer=CONSUMER_SCAN)
 
     async def generate_suggestion(self, event: dict[str, Any]) -> None:
         """Handles the request to generate a trading suggestion."""
@@ -223,9 +232,13 @@ class StreamingConsumer(AsyncWebsocketConsumer):
         await self.send(text_data=json.dumps(event))
 
     async def quote_update(self, event: dict[str, Any]) -> None:
-        """Forwards quote updates to the client."""
+        """Forwards quote updates to the client, single or as a conflated batch."""
+        if "quotes" in event:
+            event = {"type": "quotes_update", "quotes": event["quotes"]}
         await self.send(text_data=json.dumps(event))
 
+    quotes_update = quote_update
+
     async def summary_update(self, event: dict[str, Any]) -> None:
         """Forwards summary updates to the client."""
         await self.send(text_data=json.dumps(event))
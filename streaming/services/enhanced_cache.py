@@ -11,7 +11,8 @@ from typing import Any
 
 from django.core.cache import cache
 
-from services.core.cache import CacheTTL
+from services.core.cache import CacheStats, CacheTTL
+from services.core.cache_index import scan_delete
 from services.core.logging import get_logger
 from streaming.constants import (
     CACHE_BASE_RETRY_DELAY,
@@ -26,47 +27,6 @@ from streaming.constants import (
 logger = get_logger(__name__)
 
 
-class CacheStats:
-    """Track cache operation statistics for monitoring."""
-
-    def __init__(self):
-        self.hits = 0
-        self.misses = 0
-        self.errors = 0
-        self.sets = 0
-        self.deletes = 0
-        self.batch_operations = 0
-        self.total_latency = 0.0
-        self.operation_count = 0
-
-    @property
-    def hit_rate(self) -> float:
-        """Calculate cache hit rate as percentage."""
-        total = self.hits + self.misses
-        return (self.hits / total * 100) if total > 0 else 0.0
-
-    @property
-    def average_latency(self) -> float:
-        """Calculate average operation latency in milliseconds."""
-        return (
-            (self.total_latency / self.operation_count * 1000) if self.operation_count > 0 else 0.0
-        )
-
-    def get_stats(self) -> dict[str, int | float]:
-        """Get all statistics as a dictionary."""
-        return {
-            "hits": self.hits,
-            "misses": self.misses,
-            "errors": self.errors,
-            "sets": self.sets,
-            "deletes": self.deletes,
-            "batch_operations": self.batch_operations,
-            "hit_rate": self.hit_rate,
-            "average_latency_ms": self.average_latency,
-            "total_operations": self.operation_count,
-        }
-
-
 class EnhancedCache:
     """
     Enhanced async cache wrapper with error handling, retry logic, and monitoring.
@@ -285,21 +245,11 @@ class EnhancedCache:
             return False
 
     async def _delete_pattern_operation(self, pattern: str) -> int:
-        """Internal delete pattern operation."""
+        """Internal delete pattern operation (incremental SCAN, never KEYS)."""
         start_time = time.time()
         try:
-            # Get keys matching pattern
-            if hasattr(cache, "delete_pattern"):
-                # Redis backend supports delete_pattern
-                deleted = await asyncio.to_thread(cache.delete_pattern, pattern)
-            # Fallback for other backends
-            elif "*" in pattern:
-                # Simple pattern matching for keys
-                prefix = pattern.replace("*", "")
-                keys = await asyncio.to_thread(cache._cache.keys, f"{prefix}*")
-                deleted = len(keys)
-                if keys:
-                    await asyncio.to_thread(cache.delete_many, keys)
+            if "*" in pattern:
+                deleted = await asyncio.to_thread(scan_delete, pattern)
             else:
                 # Single key deletion
                 await asyncio.to_thread(cache.delete, pattern)
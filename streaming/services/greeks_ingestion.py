@@ -0,0 +1,246 @@
+"""
+Greeks Ingestion Buffer - Batched HistoricalGreeks persistence for streamed Greeks.
+
+Architecture Overview:
+    MarketDataGateway._handle_greeks_event
+    └── GreeksIngestionBuffer.add()   (sync, never blocks the DXLink listener)
+        ├── Pending rows keyed by (option_symbol, second) - latest sample wins
+        ├── Parsed OCC metadata cached per streamer symbol
+        └── Bounded: new keys are dropped (and counted) once the buffer is full
+
+    GreeksIngestionBuffer.run()
+    └── Every GREEKS_FLUSH_INTERVAL (or sooner when a batch fills up):
+        one bulk_create(update_conflicts=True) per GREEKS_FLUSH_BATCH_SIZE rows
+
+Design Principles:
+- One batched upsert replaces a SELECT + INSERT/UPDATE per Greeks tick
+- Dedupe matches the table's unique (option_symbol, timestamp) at 1s resolution
+- Backpressure is explicit: dropped rows are counted, never silently queued
+- A failed batch falls back to per-row writes so one bad row cannot lose a batch
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from datetime import UTC, datetime
+from decimal import Decimal, InvalidOperation
+
+from services.core.logging import get_logger
+from services.sdk.instruments import parse_occ_symbol
+from services.sdk.symbol_conversion import streamer_to_occ_fixed
+from streaming.constants import (
+    GREEKS_BUFFER_MAX_ROWS,
+    GREEKS_FLUSH_BATCH_SIZE,
+    GREEKS_FLUSH_INTERVAL,
+    GREEKS_SYMBOL_CACHE_SIZE,
+)
+from trading.models import HistoricalGreeks
+
+logger = get_logger(__name__)
+
+GREEKS_UPDATE_FIELDS = [
+    "underlying_symbol",
+    "delta",
+    "gamma",
+    "theta",
+    "vega",
+    "rho",
+    "implied_volatility",
+    "strike",
+    "expiration_date",
+    "option_type",
+]
+
+
+def _to_decimal(value, default: Decimal | None = Decimal("0")) -> Decimal | None:
+    """Convert a streamed float to Decimal; missing/zero/non-finite use the default."""
+    if not value:
+        return default
+    try:
+        result = Decimal(str(value))
+    except (InvalidOperation, ValueError, TypeError):
+        return default
+    return result if result.is_finite() else default
+
+
+class GreeksIngestionBuffer:
+    """
+    Bounded, deduplicating buffer that writes HistoricalGreeks in batches.
+
+    Owned by the MarketDataGateway; add() is called from the Greeks event
+    handler and run() is the background flush loop.
+    """
+
+    def __init__(
+        self,
+        max_rows: int = GREEKS_BUFFER_MAX_ROWS,
+        batch_size: int = GREEKS_FLUSH_BATCH_SIZE,
+        flush_interval: float = GREEKS_FLUSH_INTERVAL,
+    ):
+        self.max_rows = max_rows
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._pending: dict[tuple[str, datetime], dict] = {}
+        self._symbols: dict[str, tuple[str, dict] | None] = {}
+        self._flush_requested = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+
+        self.received = 0
+        self.deduplicated = 0
+        self.dropped = 0
+        self.invalid = 0
+        self.rows_written = 0
+        self.rows_failed = 0
+        self.batches_written = 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def _resolve_symbol(self, event_symbol: str) -> tuple[str, dict] | None:
+        """Convert and parse a streamer symbol once; None if it is not an option."""
+        if event_symbol in self._symbols:
+            return self._symbols[event_symbol]
+
+        # Uses workaround for SDK bug that produces 22-char symbols for certain strikes
+        try:
+            occ_symbol = streamer_to_occ_fixed(event_symbol)
+        except Exception:
+            # If conversion fails, event_symbol might already be OCC format
+            occ_symbol = event_symbol
+
+        try:
+            resolved = (occ_symbol, parse_occ_symbol(occ_symbol))
+        except Exception as e:
+            logger.debug(f"Greeks ingestion: cannot parse {event_symbol}: {e}")
+            resolved = None
+
+        if len(self._symbols) >= GREEKS_SYMBOL_CACHE_SIZE:
+            self._symbols.clear()
+        self._symbols[event_symbol] = resolved
+        return resolved
+
+    def add(self, greeks_event) -> bool:
+        """
+        Buffer a Greeks event for the next batch.
+
+        Returns False if the event was rejected (unparseable symbol or buffer full).
+        """
+        self.received += 1
+        resolved = self._resolve_symbol(greeks_event.event_symbol)
+        if resolved is None:
+            self.invalid += 1
+            return False
+        occ_symbol, parsed = resolved
+
+        # Convert timestamp (milliseconds since epoch); use now if event_time is invalid
+        if greeks_event.event_time and greeks_event.event_time > 0:
+            timestamp = datetime.fromtimestamp(greeks_event.event_time / 1000, tz=UTC)
+        else:
+            timestamp = datetime.now(tz=UTC)
+
+        # Round timestamp to 1-second resolution (deduplication strategy)
+        key = (occ_symbol, timestamp.replace(microsecond=0))
+
+        if key in self._pending:
+            self.deduplicated += 1
+        elif len(self._pending) >= self.max_rows:
+            self.dropped += 1
+            if self.dropped == 1 or self.dropped % 1000 == 0:
+                logger.warning(
+                    f"Greeks ingestion: buffer full ({self.max_rows} rows), "
+                    f"{self.dropped} samples dropped so far"
+                )
+            self._flush_requested.set()
+            return False
+
+        self._pending[key] = {
+            "underlying_symbol": parsed["underlying"],
+            "delta": _to_decimal(greeks_event.delta),
+            "gamma": _to_decimal(greeks_event.gamma),
+            "theta": _to_decimal(greeks_event.theta),
+            "vega": _to_decimal(greeks_event.vega),
+            "rho": _to_decimal(getattr(greeks_event, "rho", None), default=None),
+            "implied_volatility": _to_decimal(greeks_event.volatility),
+            "strike": parsed["strike"],
+            "expiration_date": parsed["expiration"],
+            "option_type": parsed["option_type"],
+        }
+
+        if len(self._pending) >= self.batch_size:
+            self._flush_requested.set()
+        return True
+
+    async def flush(self) -> int:
+        """Write all pending rows; returns the number of rows persisted."""
+        async with self._flush_lock:
+            if not self._pending:
+                return 0
+
+            pending, self._pending = self._pending, {}
+            rows = [
+                HistoricalGreeks(option_symbol=occ_symbol, timestamp=timestamp, **fields)
+                for (occ_symbol, timestamp), fields in pending.items()
+            ]
+
+            written = 0
+            for start in range(0, len(rows), self.batch_size):
+                written += await self._write_batch(rows[start : start + self.batch_size])
+            return written
+
+    async def _write_batch(self, rows: list[HistoricalGreeks]) -> int:
+        try:
+            await self._upsert(rows)
+            self.batches_written += 1
+            self.rows_written += len(rows)
+            return len(rows)
+        except Exception as e:
+            logger.warning(f"Greeks ingestion: batch of {len(rows)} failed ({e}), retrying per row")
+
+        written = 0
+        for row in rows:
+            try:
+                await self._upsert([row])
+                written += 1
+            except Exception as e:
+                self.rows_failed += 1
+                logger.error(f"Greeks ingestion: error persisting {row.option_symbol}: {e}")
+        self.rows_written += written
+        return written
+
+    @staticmethod
+    async def _upsert(rows: list[HistoricalGreeks]) -> None:
+        await HistoricalGreeks.objects.abulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=["option_symbol", "timestamp"],
+            update_fields=GREEKS_UPDATE_FIELDS,
+        )
+
+    async def run(self) -> None:
+        """Flush on a fixed cadence, or early when a full batch is waiting."""
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=self.flush_interval)
+            self._flush_requested.clear()
+
+            try:
+                written = await self.flush()
+                if written:
+                    logger.debug(f"Greeks ingestion: persisted {written} rows")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Greeks ingestion: flush failed: {e}", exc_info=True)
+
+    def get_stats(self) -> dict:
+        return {
+            "pending": len(self._pending),
+            "received": self.received,
+            "deduplicated": self.deduplicated,
+            "dropped": self.dropped,
+            "invalid": self.invalid,
+            "rows_written": self.rows_written,
+            "rows_failed": self.rows_failed,
+            "batches_written": self.batches_written,
+        }
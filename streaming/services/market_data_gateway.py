@@ -0,0 +1,674 @@
+"""
+Market Data Gateway - Process-wide DXLink connection pool shared by all users.
+
+Architecture Overview:
+    MarketDataGateway (process singleton)
+    ├── GatewayConnection pool: a few DXLinkStreamers, capped symbols per socket
+    ├── Symbol reference counts: streamer symbol -> subscribed user ids
+    ├── Cache writes: one quote/Greeks write per event, regardless of user count
+    ├── GreeksIngestionBuffer: HistoricalGreeks rows deduped per second and
+    │   written with one bulk upsert per batch
+    ├── QuoteBook: quote/trade/summary merged in memory, dirty symbols flushed
+    │   to Redis with one set_many every QUOTE_BOOK_FLUSH_INTERVAL
+    ├── L1 cache: flushed quotes and Greeks are also put into the process's
+    │   L1Cache so same-process readers skip the Redis read
+    └── Fan-out: per-user notifications to each subscribed UserStreamManager
+
+    GatewayStreamHandle (per user)
+    └── Drop-in replacement for the user's DXLinkStreamer in UserStreamContext;
+        subscribe()/unsubscribe()/close() are routed through the gateway
+
+Design Principles:
+- Market data is identical for every user, so it is streamed and cached once
+- No Redis round trip per tick; same-process readers use the quote book
+- Account/order streams (AlertStreamer) stay per-user in UserStreamManager
+- Subscription state is keyed by streamer symbol (matches event.event_symbol)
+- A dropped connection re-homes its symbols on a fresh connection
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any
+
+from django.core.cache import cache
+
+from tastytrade import DXLinkStreamer
+from tastytrade.dxfeed import Greeks, Quote, Summary, Trade
+from websockets.exceptions import ConnectionClosedOK
+
+from services.core.cache import CacheManager
+from services.core.constants import L1_GREEKS_TTL, L1_QUOTE_TTL
+from services.core.l1_cache import l1_cache
+from services.core.logging import get_logger
+from services.streaming.quote_book import quote_book
+from streaming.constants import (
+    DXLINK_CONNECTION_TIMEOUT,
+    GATEWAY_MAX_CONNECTIONS,
+    GATEWAY_RECONNECT_ATTEMPTS,
+    GATEWAY_RECONNECT_DELAY,
+    GATEWAY_SYMBOLS_PER_CONNECTION,
+    GREEKS_CACHE_TTL,
+    QUOTE_BOOK_FLUSH_INTERVAL,
+    QUOTE_BOOK_PRUNE_INTERVAL,
+    QUOTE_CACHE_TTL,
+    STREAMER_CLOSE_TIMEOUT,
+    SUMMARY_CACHE_TTL,
+)
+from streaming.services.enhanced_cache import enhanced_cache
+from streaming.services.greeks_ingestion import GreeksIngestionBuffer
+
+from .quote_cache_service import (
+    build_quote_payload,
+    build_summary_payload,
+    build_trade_payload,
+)
+from .stream_helpers import format_timestamp, safe_float
+
+if TYPE_CHECKING:
+    from .stream_manager import UserStreamManager
+
+logger = get_logger(__name__)
+
+
+class GatewayConnection:
+    """A single pooled DXLinkStreamer and the listeners feeding the gateway."""
+
+    def __init__(self, gateway: MarketDataGateway, session, index: int):
+        self.gateway = gateway
+        self.session = session
+        self.index = index
+        self.streamer: DXLinkStreamer | None = None
+        self.symbols: set[str] = set()
+        self.error: BaseException | None = None
+        self.task: asyncio.Task | None = None
+        self._ready = asyncio.Event()
+        self._stop = asyncio.Event()
+
+    @property
+    def is_alive(self) -> bool:
+        return self.streamer is not None and not self._stop.is_set()
+
+    async def start(self) -> None:
+        """Open the websocket and wait until listeners are running."""
+        self.task = asyncio.create_task(self._run())
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout=DXLINK_CONNECTION_TIMEOUT)
+        except TimeoutError:
+            await self.close()
+            raise
+
+        if self.streamer is None:
+            if self.error:
+                raise self.error
+            raise ConnectionError(f"Gateway connection {self.index} failed to open")
+
+    async def close(self) -> None:
+        """Signal the connection to shut down and wait for the socket to close."""
+        self._stop.set()
+        if not self.task or self.task.done():
+            return
+        try:
+            await asyncio.wait_for(asyncio.shield(self.task), timeout=STREAMER_CLOSE_TIMEOUT)
+        except TimeoutError:
+            logger.warning(f"Gateway connection {self.index}: close timed out, cancelling")
+            self.task.cancel()
+        except Exception as e:
+            logger.debug(f"Gateway connection {self.index}: close raised {e}")
+
+    def abandon(self) -> None:
+        """Stop without awaiting; used when the loop that owns the socket is not running."""
+        self._stop.set()
+        if self.task and not self.task.done():
+            self.task.cancel()
+
+    async def _run(self) -> None:
+        listeners: list[asyncio.Task] = []
+        try:
+            async with DXLinkStreamer(self.session) as streamer:
+                self.streamer = streamer
+                self._ready.set()
+                logger.info(f"Gateway connection {self.index}: DXLinkStreamer connected")
+
+                listeners = [
+                    asyncio.create_task(self._listen(Quote, self.gateway._handle_quote_event)),
+                    asyncio.create_task(self._listen(Trade, self.gateway._handle_trade_event)),
+                    asyncio.create_task(self._listen(Summary, self.gateway._handle_summary_event)),
+                    asyncio.create_task(self._listen(Greeks, self.gateway._handle_greeks_event)),
+                ]
+                stop_waiter = asyncio.create_task(self._stop.wait())
+                done, _ = await asyncio.wait(
+                    [*listeners, stop_waiter], return_when=asyncio.FIRST_COMPLETED
+                )
+                stop_waiter.cancel()
+
+                for task in done:
+                    if task is not stop_waiter and not task.cancelled() and task.exception():
+                        raise task.exception()
+        except ConnectionClosedOK:
+            logger.info(f"Gateway connection {self.index}: DXLink connection closed normally")
+        except Exception as e:
+            self.error = e
+            logger.error(f"Gateway connection {self.index}: streaming error: {e}", exc_info=True)
+        finally:
+            for task in listeners:
+                task.cancel()
+            self.streamer = None
+            self._ready.set()
+            if not self._stop.is_set():
+                self._stop.set()
+                self.gateway._on_connection_lost(self)
+            logger.info(f"Gateway connection {self.index}: stopped")
+
+    async def _listen(self, event_type, handler) -> None:
+        async for event in self.streamer.listen(event_type):
+            try:
+                await handler(event)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(
+                    f"Gateway: error processing {event_type.__name__} event: {e}", exc_info=True
+                )
+
+
+class GatewayStreamHandle:
+    """
+    Per-user view of the shared gateway, stored as UserStreamContext.data_streamer.
+
+    Mirrors the subset of the DXLinkStreamer API used by StreamSubscriptionManager
+    so existing subscription code works unchanged.
+    """
+
+    def __init__(self, gateway: MarketDataGateway, user_id: int):
+        self.gateway = gateway
+        self.user_id = user_id
+        self._closed = asyncio.Event()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed.is_set()
+
+    async def subscribe(self, event_class, symbols, refresh_interval: float = 0.1) -> None:
+        await self.gateway.subscribe(self.user_id, event_class, list(symbols), refresh_interval)
+
+    async def unsubscribe(self, event_class, symbols) -> None:  # noqa: ARG002
+        # Reference counts are per symbol; all event types are released together
+        await self.gateway.release(self.user_id, list(symbols))
+
+    async def close(self) -> None:
+        if self.closed:
+            return
+        await self.gateway.detach(self.user_id)
+
+    async def wait_closed(self) -> None:
+        await self._closed.wait()
+
+    def mark_closed(self) -> None:
+        self._closed.set()
+
+
+class MarketDataGateway:
+    """
+    Owns the DXLink connection pool and reference-counts symbols across users.
+
+    Every event is written to cache once and then fanned out to the
+    UserStreamManagers that subscribed to its symbol.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = GATEWAY_MAX_CONNECTIONS,
+        symbols_per_connection: int = GATEWAY_SYMBOLS_PER_CONNECTION,
+    ):
+        self.max_connections = max_connections
+        self.symbols_per_connection = symbols_per_connection
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._reset_state()
+
+    def _reset_state(self) -> None:
+        self._connections: list[GatewayConnection] = []
+        self._managers: dict[int, UserStreamManager] = {}
+        self._handles: dict[int, GatewayStreamHandle] = {}
+        self._sessions: dict[int, Any] = {}
+        self._symbol_users: dict[str, set[int]] = {}
+        self._symbol_events: dict[str, set[type]] = {}
+        self._symbol_connection: dict[str, GatewayConnection] = {}
+        self._refresh_intervals: dict[type, float] = {}
+        self._connection_counter = 0
+        self._lock = asyncio.Lock()
+        self._greeks_buffer = GreeksIngestionBuffer()
+        self._background_tasks: set[asyncio.Task] = set()
+        self._flush_task: asyncio.Task | None = None
+        self._greeks_task: asyncio.Task | None = None
+        self.events_received = 0
+        self.notifications_sent = 0
+        self.quote_flushes = 0
+        self.quote_keys_flushed = 0
+
+    def _ensure_loop(self) -> None:
+        """
+        Reset state when called from a different event loop.
+
+        Celery tasks run each coroutine in a fresh loop; connections and locks
+        from a previous loop cannot be reused there. Refuses to rebind while
+        the previous loop is still running in another thread.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            if self._loop is not None:
+                if self._loop.is_running():
+                    raise RuntimeError(
+                        "Gateway is bound to an event loop that is still running; "
+                        "detach all users from that loop first"
+                    )
+                logger.info("Gateway: event loop changed, resetting connection pool")
+                self._abandon_previous_loop()
+            self._loop = loop
+            self._reset_state()
+
+    def _abandon_previous_loop(self) -> None:
+        """
+        Stop the previous loop's connections and cancel its tasks before reset.
+
+        The old loop is stopped, so nothing can be awaited here; cancellations
+        are delivered the next time it runs (asyncio.run's shutdown cancels
+        and awaits them before closing). Once it is closed its tasks are done.
+        """
+        if self._loop.is_closed():
+            return
+
+        for conn in self._connections:
+            conn.abandon()
+        for handle in self._handles.values():
+            handle.mark_closed()
+
+        tasks = [self._flush_task, self._greeks_task, *self._background_tasks]
+        for task in tasks:
+            if task and not task.done():
+                task.cancel()
+
+        logger.info(
+            f"Gateway: abandoned {len(self._connections)} connections and "
+            f"{sum(1 for task in tasks if task)} tasks from previous event loop"
+        )
+
+    # === Lifecycle ===
+
+    async def attach(self, manager: UserStreamManager, session) -> GatewayStreamHandle:
+        """
+        Register a user's stream manager and return its streamer handle.
+
+        Opens the first pooled connection with this user's session if none
+        is live, so connection/auth errors surface to the caller.
+        """
+        self._ensure_loop()
+        unsubscribes = {}
+        async with self._lock:
+            if not any(conn.is_alive for conn in self._connections):
+                await self._open_connection(session)
+            if self._flush_task is None or self._flush_task.done():
+                self._flush_task = asyncio.create_task(self._flush_loop())
+            if self._greeks_task is None or self._greeks_task.done():
+                self._greeks_task = asyncio.create_task(self._greeks_buffer.run())
+
+            previous = self._handles.get(manager.user_id)
+            if previous:
+                unsubscribes = self._release_locked(manager.user_id, None)
+                previous.mark_closed()
+
+            handle = GatewayStreamHandle(self, manager.user_id)
+            self._managers[manager.user_id] = manager
+            self._handles[manager.user_id] = handle
+            self._sessions[manager.user_id] = session
+
+        await self._send_unsubscribes(unsubscribes)
+
+        logger.info(
+            f"User {manager.user_id}: Attached to market data gateway "
+            f"({len(self._managers)} users, {len(self._connections)} connections)"
+        )
+        return handle
+
+    async def detach(self, user_id: int) -> None:
+        """Release all of a user's symbols and drop the pool when nobody is left."""
+        self._ensure_loop()
+        to_close: list[GatewayConnection] = []
+        flush_task = greeks_task = None
+        async with self._lock:
+            unsubscribes = self._release_locked(user_id, None)
+            self._managers.pop(user_id, None)
+            self._sessions.pop(user_id, None)
+            handle = self._handles.pop(user_id, None)
+            if handle:
+                handle.mark_closed()
+
+            if not self._managers:
+                to_close = list(self._connections)
+                self._connections.clear()
+                self._symbol_connection.clear()
+                self._symbol_events.clear()
+                self._symbol_users.clear()
+                unsubscribes = {}
+                flush_task, self._flush_task = self._flush_task, None
+                greeks_task, self._greeks_task = self._greeks_task, None
+
+        await self._send_unsubscribes(unsubscribes)
+        for conn in to_close:
+            await conn.close()
+        if flush_task:
+            flush_task.cancel()
+            await self.flush_quotes()
+        if greeks_task:
+            greeks_task.cancel()
+            await self._greeks_buffer.flush()
+
+        logger.info(f"User {user_id}: Detached from market data gateway")
+
+    # === Subscriptions ===
+
+    async def subscribe(
+        self, user_id: int, event_class, symbols: list[str], refresh_interval: float
+    ) -> None:
+        """Add user references to symbols, subscribing upstream only on first use."""
+        self._ensure_loop()
+        async with self._lock:
+            if user_id not in self._managers:
+                logger.warning(f"User {user_id}: Subscribe ignored, not attached to gateway")
+                return
+
+            self._refresh_intervals.setdefault(event_class, refresh_interval)
+            pending: dict[GatewayConnection, list[str]] = {}
+            for symbol in symbols:
+                self._symbol_users.setdefault(symbol, set()).add(user_id)
+                events = self._symbol_events.setdefault(symbol, set())
+                if event_class in events:
+                    continue
+
+                conn = self._symbol_connection.get(symbol)
+                if conn is None or not conn.is_alive:
+                    conn = await self._connection_for_new_symbol(user_id)
+                    self._symbol_connection[symbol] = conn
+                    conn.symbols.add(symbol)
+
+                events.add(event_class)
+                pending.setdefault(conn, []).append(symbol)
+
+            for conn, conn_symbols in pending.items():
+                await conn.streamer.subscribe(
+                    event_class, conn_symbols, refresh_interval=refresh_interval
+                )
+
+        new_count = sum(len(conn_symbols) for conn_symbols in pending.values())
+        logger.debug(
+            f"User {user_id}: Gateway {event_class.__name__} subscribe for {len(symbols)} "
+            f"symbols ({len(symbols) - new_count} already streaming)"
+        )
+
+    async def release(self, user_id: int, symbols: list[str] | None = None) -> None:
+        """Drop user references; symbols nobody references are unsubscribed upstream."""
+        self._ensure_loop()
+        async with self._lock:
+            unsubscribes = self._release_locked(user_id, symbols)
+        await self._send_unsubscribes(unsubscribes)
+
+    def _release_locked(
+        self, user_id: int, symbols: list[str] | None
+    ) -> dict[tuple[GatewayConnection, type], list[str]]:
+        if symbols is None:
+            symbols = [s for s, users in self._symbol_users.items() if user_id in users]
+
+        unsubscribes: dict[tuple[GatewayConnection, type], list[str]] = {}
+        for symbol in symbols:
+            users = self._symbol_users.get(symbol)
+            if not users:
+                continue
+            users.discard(user_id)
+            if users:
+                continue
+
+            self._symbol_users.pop(symbol, None)
+            events = self._symbol_events.pop(symbol, set())
+            conn = self._symbol_connection.pop(symbol, None)
+            if conn is None:
+                continue
+            conn.symbols.discard(symbol)
+            for event_class in events:
+                unsubscribes.setdefault((conn, event_class), []).append(symbol)
+
+        return unsubscribes
+
+    async def _send_unsubscribes(
+        self, unsubscribes: dict[tuple[GatewayConnection, type], list[str]]
+    ) -> None:
+        for (conn, event_class), symbols in unsubscribes.items():
+            if not conn.is_alive:
+                continue
+            try:
+                await conn.streamer.unsubscribe(event_class, symbols)
+            except Exception as e:
+                logger.warning(
+                    f"Gateway connection {conn.index}: unsubscribe "
+                    f"{event_class.__name__} failed for {len(symbols)} symbols: {e}"
+                )
+
+    # === Connection Pool ===
+
+    async def _connection_for_new_symbol(self, user_id: int) -> GatewayConnection:
+        """Pick the least-loaded live connection, opening another when all are full."""
+        live = [conn for conn in self._connections if conn.is_alive]
+        with_room = [conn for conn in live if len(conn.symbols) < self.symbols_per_connection]
+        if with_room:
+            return min(with_room, key=lambda conn: len(conn.symbols))
+
+        if len(live) < self.max_connections:
+            session = self._sessions.get(user_id) or next(iter(self._sessions.values()))
+            return await self._open_connection(session)
+
+        logger.warning(
+            f"Gateway: all {len(live)} connections at capacity "
+            f"({self.symbols_per_connection} symbols each), overfilling least-loaded"
+        )
+        return min(live, key=lambda conn: len(conn.symbols))
+
+    async def _open_connection(self, session) -> GatewayConnection:
+        self._connection_counter += 1
+        conn = GatewayConnection(self, session, self._connection_counter)
+        await conn.start()
+        self._connections.append(conn)
+        return conn
+
+    def _on_connection_lost(self, conn: GatewayConnection) -> None:
+        """Called from a connection's task when it ends without being asked to."""
+        if conn not in self._connections:
+            return
+        logger.warning(
+            f"Gateway connection {conn.index} lost with {len(conn.symbols)} symbols, "
+            f"scheduling recovery"
+        )
+        self._spawn(self._recover(conn))
+
+    async def _recover(self, lost: GatewayConnection) -> None:
+        """Re-home a dropped connection's symbols on new connections."""
+        async with self._lock:
+            if lost in self._connections:
+                self._connections.remove(lost)
+
+            orphaned: dict[type, list[str]] = {}
+            for symbol in list(lost.symbols):
+                if self._symbol_connection.get(symbol) is lost:
+                    self._symbol_connection.pop(symbol, None)
+                for event_class in self._symbol_events.pop(symbol, set()):
+                    orphaned.setdefault(event_class, []).append(symbol)
+            lost.symbols.clear()
+
+        if not orphaned:
+            return
+
+        delay = GATEWAY_RECONNECT_DELAY
+        for attempt in range(1, GATEWAY_RECONNECT_ATTEMPTS + 1):
+            if not self._managers:
+                return
+            await asyncio.sleep(delay)
+            try:
+                for event_class, symbols in orphaned.items():
+                    interval = self._refresh_intervals.get(event_class, 0.1)
+                    live = [s for s in symbols if self._symbol_users.get(s)]
+                    if not live:
+                        continue
+                    owner = next(iter(self._symbol_users[live[0]]))
+                    await self.subscribe(owner, event_class, live, interval)
+                logger.info(f"Gateway: recovered symbols from connection {lost.index}")
+                return
+            except Exception as e:
+                logger.warning(
+                    f"Gateway: recovery attempt {attempt}/{GATEWAY_RECONNECT_ATTEMPTS} "
+                    f"failed: {e}"
+                )
+                delay *= 2
+
+        logger.error(f"Gateway: giving up recovering symbols from connection {lost.index}")
+
+    # === Event Handling ===
+
+    def _spawn(self, coro) -> None:
+        """Run a fire-and-forget coroutine, keeping a reference until it finishes."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _fan_out(self, symbol: str, method: str, payload: dict) -> None:
+        """Deliver a processed event to every user subscribed to the symbol."""
+        users = self._symbol_users.get(symbol)
+        if not users:
+            return
+
+        managers = [self._managers[uid] for uid in tuple(users) if uid in self._managers]
+        self.notifications_sent += len(managers)
+        if len(managers) == 1:
+            await getattr(managers[0], method)(symbol, payload)
+            return
+
+        results = await asyncio.gather(
+            *(getattr(manager, method)(symbol, payload) for manager in managers),
+            return_exceptions=True,
+        )
+        for manager, result in zip(managers, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error(
+                    f"User {manager.user_id}: Error handling {method} for {symbol}: {result}"
+                )
+
+    def _current_quote(self, symbol: str) -> dict:
+        """Latest merged payload for a symbol; Redis is read only on first sight."""
+        existing = quote_book.peek(symbol)
+        if existing is None:
+            existing = cache.get(CacheManager.quote(symbol)) or {}
+        return existing
+
+    async def _handle_quote_event(self, quote) -> None:
+        self.events_received += 1
+        symbol = quote.event_symbol
+        payload = build_quote_payload(quote, self._current_quote(symbol))
+
+        quote_book.merge(symbol, payload, QUOTE_CACHE_TTL)
+        await self._fan_out(symbol, "on_quote_update", payload)
+
+    async def _handle_trade_event(self, trade) -> None:
+        self.events_received += 1
+        symbol = trade.event_symbol
+        payload = build_trade_payload(trade, self._current_quote(symbol))
+
+        quote_book.merge(symbol, payload, QUOTE_CACHE_TTL)
+        await self._fan_out(symbol, "on_trade_update", payload)
+
+    async def _handle_summary_event(self, summary) -> None:
+        self.events_received += 1
+        symbol = summary.event_symbol
+        payload = build_summary_payload(summary, self._current_quote(symbol))
+
+        quote_book.merge(symbol, payload, SUMMARY_CACHE_TTL)
+        await self._fan_out(symbol, "on_summary_update", payload)
+
+    async def flush_quotes(self) -> int:
+        """Write dirty quote book symbols to Redis, one set_many per TTL group."""
+        flushed = 0
+        for ttl, batch in quote_book.drain_dirty().items():
+            data = {CacheManager.quote(symbol): payload for symbol, payload in batch.items()}
+            if await enhanced_cache.set_many(data, ttl=ttl):
+                l1_cache.put_many(data, L1_QUOTE_TTL)
+                flushed += len(data)
+            else:
+                quote_book.mark_dirty(dict.fromkeys(batch, ttl))
+
+        if flushed:
+            self.quote_flushes += 1
+            self.quote_keys_flushed += flushed
+        return flushed
+
+    async def _flush_loop(self) -> None:
+        """Flush the quote book on a fixed cadence while users are attached."""
+        last_prune = time.monotonic()
+        while True:
+            await asyncio.sleep(QUOTE_BOOK_FLUSH_INTERVAL)
+            try:
+                await self.flush_quotes()
+                if time.monotonic() - last_prune >= QUOTE_BOOK_PRUNE_INTERVAL:
+                    quote_book.prune()
+                    last_prune = time.monotonic()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Gateway: quote book flush failed: {e}", exc_info=True)
+
+    async def _handle_greeks_event(self, greeks) -> None:
+        self.events_received += 1
+        key = CacheManager.dxfeed_greeks(greeks.event_symbol)
+        data = {
+            "symbol": greeks.event_symbol,
+            "theoretical_price": safe_float(greeks.price),
+            "delta": safe_float(greeks.delta),
+            "gamma": safe_float(greeks.gamma),
+            "theta": safe_float(greeks.theta),
+            "vega": safe_float(greeks.vega),
+            "rho": safe_float(greeks.rho),
+            "updated_at": format_timestamp(greeks.event_time),
+        }
+
+        await enhanced_cache.set(key, data, ttl=GREEKS_CACHE_TTL)
+        l1_cache.put(key, data, L1_GREEKS_TTL)
+        logger.debug(
+            f"Gateway: Greeks: {greeks.event_symbol} "
+            f"delta={data['delta']}, gamma={data['gamma']}, theo={data['theoretical_price']}"
+        )
+
+        self._greeks_buffer.add(greeks)
+        await self._fan_out(greeks.event_symbol, "on_greeks_update", data)
+
+    # === Introspection ===
+
+    def get_stats(self) -> dict:
+        """Get gateway pool and subscription statistics."""
+        subscription_refs = sum(len(users) for users in self._symbol_users.values())
+        return {
+            "connections": [
+                {"index": conn.index, "alive": conn.is_alive, "symbols": len(conn.symbols)}
+                for conn in self._connections
+            ],
+            "attached_users": len(self._managers),
+            "unique_symbols": len(self._symbol_users),
+            "subscription_refs": subscription_refs,
+            "events_received": self.events_received,
+            "notifications_sent": self.notifications_sent,
+            "quote_book_symbols": len(quote_book),
+            "quote_book_dirty": quote_book.dirty_count,
+            "quote_flushes": self.quote_flushes,
+            "quote_keys_flushed": self.quote_keys_flushed,
+            "greeks_ingestion": self._greeks_buffer.get_stats(),
+            "l1_cache": l1_cache.get_stats(),
+        }
+
+
+# Global instance shared by all UserStreamManagers in this process
+market_data_gateway = MarketDataGateway()
@@ -18,13 +18,15 @@ import time
 from decimal import Decimal
 from typing import Any
 
-from django.core.cache import cache
 from django.utils import timezone as dj_timezone
 
 from asgiref.sync import sync_to_async
 
 from accounts.models import AccountSnapshot, TradingAccount
 from services.core.cache import CacheManager
+from services.core.cache_index import aregister_keys
+from services.core.constants import L1_QUOTE_TTL
+from services.core.l1_cache import l1_cache
 from services.core.logging import get_logger
 from services.market_data.greeks import GreeksService
 from services.positions.lifecycle.pnl_calculator import PnLCalculator
@@ -152,6 +154,11 @@ class PositionMetricsCalculator:
             await enhanced_cache.set(
                 account_state_key, account_state_data, ttl=ACCOUNT_STATE_CACHE_TTL
             )
+            await aregister_keys(
+                CacheManager.account_state_family(self.user_id),
+                [account_state_key],
+                ACCOUNT_STATE_CACHE_TTL,
+            )
 
             # Save to database
             try:
@@ -195,18 +202,27 @@ class PositionMetricsCalculator:
                 f"User {self.user_id}: Found {len(positions)} open positions for metrics calculation"
             )
 
+            # Greeks for every position in one batch (5s cache, one leg read for misses)
+            try:
+                all_greeks = await sync_to_async(
+                    self.greeks_service.get_greeks_for_positions_cached
+                )(positions)
+            except Exception as e:
+                logger.warning(f"User {self.user_id}: Error calculating position Greeks: {e}")
+                all_greeks = {}
+
+            # Quotes for every leg in one read (L1, then a single Redis get_many)
+            quotes = self._get_position_quotes(positions)
+
             for position in positions:
                 try:
-                    # Get Greeks from cache (GreeksService reads from dxfeed:greeks cache)
-                    greeks = await sync_to_async(self.greeks_service.get_position_greeks_cached)(
-                        position
-                    )
+                    greeks = all_greeks.get(position.id)
                     logger.debug(
                         f"User {self.user_id}: Position {position.id} Greeks: {bool(greeks)}"
                     )
 
                     # Calculate P&L from cached quotes
-                    pnl = await self._calculate_position_pnl(position)
+                    pnl = await self._calculate_position_pnl(position, quotes)
                     logger.info(f"User {self.user_id}: Position {position.id} P&L: {pnl}")
 
                     # Add to metrics if we have data
@@ -278,16 +294,41 @@ class PositionMetricsCalculator:
             )
             return None
 
-    async def _calculate_position_pnl(self, position: Position) -> float | None:
+    @staticmethod
+    def _position_symbols(position: Position) -> list[str]:
+        if position.metadata and "legs" in position.metadata:
+            return [leg["symbol"] for leg in position.metadata["legs"]]
+        return [position.symbol]
+
+    def _get_position_quotes(self, positions: list[Position]) -> dict[str, dict]:
+        """Cached quotes for every symbol of the given positions, keyed by symbol."""
+        keys = {
+            CacheManager.quote(symbol): symbol
+            for position in positions
+            for symbol in self._position_symbols(position)
+        }
+        if not keys:
+            return {}
+        cached = l1_cache.get_many(keys, L1_QUOTE_TTL)
+        return {keys[key]: quote for key, quote in cached.items()}
+
+    async def _calculate_position_pnl(
+        self, position: Position, quotes: dict[str, dict] | None = None
+    ) -> float | None:
         """
         Calculate P&L for a position from cached quote data.
 
         Args:
             position: Position model instance
+            quotes: Prefetched quotes by symbol (see _get_position_quotes);
+                read from the cache when not given
 
         Returns:
             float: P&L value or None if cannot be calculated
         """
+        if quotes is None:
+            quotes = self._get_position_quotes([position])
+
         is_multi_leg = position.metadata and "legs" in position.metadata
 
         if is_multi_leg:
@@ -296,8 +337,7 @@ class PositionMetricsCalculator:
             all_legs_have_marks = True
 
             for leg in position.metadata["legs"]:
-                quote_key = CacheManager.quote(leg["symbol"])
-                cached_quote = cache.get(quote_key)
+                cached_quote = quotes.get(leg["symbol"])
 
                 if cached_quote and cached_quote.get("mark"):
                     leg_pnl = PnLCalculator.calculate_leg_pnl(
@@ -314,8 +354,7 @@ class PositionMetricsCalculator:
             return float(total_pnl) if all_legs_have_marks else None
 
         # Single-leg position
-        quote_key = CacheManager.quote(position.symbol)
-        cached_quote = cache.get(quote_key)
+        cached_quote = quotes.get(position.symbol)
 
         if cached_quote and cached_quote.get("mark") and position.avg_price:
             is_credit = position.opening_price_effect == "Credit"
@@ -0,0 +1,104 @@
+"""
+Quote conflation for WebSocket fan-out.
+
+DXFeed can deliver many ticks per second per symbol, but the browser only
+needs a few frames a second. Broadcasting every tick costs one channel-layer
+group_send through Redis (and one Daphne send per socket) per tick.
+
+Design:
+- One conflator per data group (per UserStreamManager)
+- Keeps only the latest payload per symbol; older ticks are dropped
+- At most one batched "quotes_update" message per interval
+  (STREAMING_QUOTE_BROADCAST_INTERVAL, default QUOTE_BROADCAST_INTERVAL)
+- The flush timer only runs while quotes are pending, so idle streams cost
+  nothing
+- Only quotes are conflated; order, fill and account events keep going
+  straight to the channel layer and are never delayed behind quotes
+- An interval of 0 disables conflation (each quote is sent immediately as a
+  one-element batch)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from django.conf import settings
+
+from services.core.logging import get_logger
+from streaming.constants import QUOTE_BROADCAST_INTERVAL
+
+logger = get_logger(__name__)
+
+BatchSender = Callable[[list[dict]], Awaitable[None]]
+
+
+class QuoteConflator:
+    """Latest-value-per-symbol buffer flushed as one batch per interval."""
+
+    def __init__(self, send: BatchSender, interval: float | None = None):
+        self._send = send
+        self.interval = (
+            interval
+            if interval is not None
+            else getattr(settings, "STREAMING_QUOTE_BROADCAST_INTERVAL", QUOTE_BROADCAST_INTERVAL)
+        )
+        self._pending: dict[str, dict] = {}
+        self._flush_task: asyncio.Task | None = None
+        self.quotes_received = 0
+        self.quotes_sent = 0
+        self.batches_sent = 0
+
+    async def offer(self, symbol: str, payload: dict) -> None:
+        """Queue the latest payload for symbol, replacing any unsent one."""
+        self.quotes_received += 1
+        self._pending[symbol] = payload
+
+        if self.interval <= 0:
+            await self.flush()
+            return
+
+        task = self._flush_task
+        # A task from another (closed) event loop will never finish; replace it
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        # Exits once nothing is pending; the next offer starts a new timer
+        while self._pending:
+            await asyncio.sleep(self.interval)
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Send everything pending as one batch."""
+        if not self._pending:
+            return
+
+        quotes = list(self._pending.values())
+        self._pending = {}
+        try:
+            await self._send(quotes)
+            self.quotes_sent += len(quotes)
+            self.batches_sent += 1
+        except Exception as e:
+            logger.warning(f"Failed to broadcast {len(quotes)} conflated quotes: {e}")
+
+    async def close(self) -> None:
+        """Stop the flush timer and drop pending quotes."""
+        task, self._flush_task = self._flush_task, None
+        self._pending.clear()
+        if task and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                logger.debug("Quote conflator flush task cancelled")
+
+    def get_stats(self) -> dict:
+        return {
+            "pending": len(self._pending),
+            "quotes_received": self.quotes_received,
+            "quotes_sent": self.quotes_sent,
+            "batches_sent": self.batches_sent,
+            "interval": self.interval,
+        }
@@ -8,15 +8,21 @@ Architecture Overview:
     └── Provides centralized streaming coordination
 
     UserStreamManager (Per User)
-    ├── DXLinkStreamer: Quote, Trade, Summary, and Greeks feeds
+    ├── GatewayStreamHandle: Quote, Trade, Summary, and Greeks via MarketDataGateway
     ├── AlertStreamer: Order status/account updates fan-out
     ├── WebSocket broadcasting to connected clients
-    └── StreamSubscriptionManager: First-data gating + lifecycle limits
+    └── StreamSubscriptionManager: Per-consumer symbol references + first-data gating
+
+    MarketDataGateway (Singleton, see market_data_gateway.py)
+    ├── Small pool of DXLinkStreamers shared by every UserStreamManager
+    └── Reference-counted symbols, one cache write per event, per-user fan-out
 
 Key Components:
 - GlobalStreamManager: In-memory singleton that tracks managers, activity, and cleanup
-- UserStreamManager: Owns DXLink/Alert streamers, cache wiring, broadcast helpers
-- StreamSubscriptionManager: Normalizes symbols and exposes pending-data events
+- UserStreamManager: Owns the Alert streamer and gateway handle, broadcast helpers
+- MarketDataGateway: Owns DXLink connections and writes market data to cache
+- StreamSubscriptionManager: Reference-counts symbols per consumer (watchlist, page,
+  scan, suggestion) and exposes pending-data events
 - AlertStreamer integration: Feeds OrderEventProcessor for actionable events
 
 Event Flow:
@@ -27,64 +33,57 @@ Event Flow:
 5. User disconnects/inactive → Timed cleanup closes streamers and frees resources
 
 Production facts:
-- One DXLinkStreamer per user, shared across multiple web clients
+- DXLinkStreamers are pooled per process and shared across users; symbols
+  watched by many users are subscribed and cached once
 - Redis/Enhanced cache stores quotes to reduce downstream load
-- Subscription limit enforcement + stale data cleanup
+- Symbols are unsubscribed as soon as no consumer references them; scan
+  probes and ad-hoc subscriptions lapse after a TTL
 - Inactivity and grace-period cleanup to prevent orphaned streamers
 """
 
 import asyncio
 import time
+import uuid
 from datetime import UTC, datetime
 from typing import Optional
 
-from django.core.cache import cache
-
 from channels.layers import get_channel_layer
-from tastytrade import DXLinkStreamer
-from tastytrade.dxfeed import Greeks, Quote, Summary, Trade
 from websockets.exceptions import ConnectionClosedOK
 
 from accounts.models import TradingAccount
-from services.core.cache import CacheManager
 from services.core.logging import get_logger
-from services.sdk.instruments import parse_occ_symbol
+from services.streaming.quote_book import quote_book
 from streaming.constants import (
-    AUTOMATION_READY_POLL_INTERVAL,
     AUTOMATION_TIMEOUT,
     CACHE_WAIT_TIMEOUT,
     CANCELLATION_TIMEOUT,
     CLEANUP_TIMEOUT_SECONDS,
     DXLINK_CONNECTION_TIMEOUT,
-    GREEKS_CACHE_TTL,
     INACTIVITY_TIMEOUT_SECONDS,
     METRICS_TASK_TIMEOUT,
     METRICS_UPDATE_INTERVAL,
-    QUOTE_CACHE_TTL,
     STREAMER_CLOSE_TIMEOUT,
     STREAMING_CLEANUP_GRACE_PERIOD,
     STREAMING_DATA_WAIT_TIMEOUT,
     STREAMING_TASK_TIMEOUT,
-    SUMMARY_CACHE_TTL,
 )
 from streaming.models import UserStreamContext
-from streaming.services.enhanced_cache import enhanced_cache
-from trading.models import HistoricalGreeks
 
+from .market_data_gateway import market_data_gateway
 from .order_event_processor import OrderEventProcessor
 from .position_metrics_calculator import PositionMetricsCalculator
-from .quote_cache_service import (
-    build_quote_payload,
-    build_summary_payload,
-    build_trade_payload,
+from .quote_conflator import QuoteConflator
+from .stream_helpers import extract_leg_symbols, is_option_symbol
+from .stream_subscription_manager import (
+    CONSUMER_ADHOC,
+    CONSUMER_POSITIONS,
+    CONSUMER_SUGGESTION,
+    CONSUMER_WATCHLIST,
+    DATA_GREEKS,
+    DATA_QUOTE,
+    DATA_SUMMARY,
+    StreamSubscriptionManager,
 )
-from .stream_helpers import (
-    extract_leg_symbols,
-    format_timestamp,
-    is_option_symbol,
-    safe_float,
-)
-from .stream_subscription_manager import StreamSubscriptionManager
 
 logger = get_logger(__name__)
 
@@ -103,6 +102,7 @@ class UserStreamManager:
         self.data_group_name = f"stream_data_{self.user_id}"
         self.has_received_data = False
         self.last_quote_received = None
+        self._connected_waiter: asyncio.Future | None = None
         # Connection state tracking for debugging and re-entrancy prevention
         self.connection_state = (
             "disconnected"  # disconnected, connecting, connected, error, stopped
@@ -112,12 +112,32 @@ class UserStreamManager:
         self.order_processor = OrderEventProcessor(user_id, self._broadcast)
         self.metrics_calculator = PositionMetricsCalculator(user_id)
         self.subscription_manager = StreamSubscriptionManager(user_id)
-        self._greeks_persist_semaphore = asyncio.Semaphore(25)
+        # Quotes are conflated per symbol; orders/fills still go out immediately
+        self.quote_conflator = QuoteConflator(self._broadcast_quotes)
 
     def _reset_data_flags(self) -> None:
         """Clear cached streaming state so readiness reflects fresh data."""
         self.has_received_data = False
         self.last_quote_received = None
+        self.subscription_manager.reset_data_readiness()
+        # A resolved waiter belongs to the old connection; pending ones keep waiting
+        if self._connected_waiter and self._connected_waiter.done():
+            self._connected_waiter = None
+
+    def _connected(self) -> asyncio.Future:
+        """Future that resolves once the market data gateway is attached."""
+        loop = asyncio.get_running_loop()
+        waiter = self._connected_waiter
+        if waiter is None or waiter.cancelled() or waiter.get_loop() is not loop:
+            waiter = self._connected_waiter = loop.create_future()
+        if self.is_streaming and not waiter.done():
+            waiter.set_result(True)
+        return waiter
+
+    def _signal_connected(self) -> None:
+        waiter = self._connected_waiter
+        if waiter and not waiter.done() and not waiter.get_loop().is_closed():
+            waiter.set_result(True)
 
     async def start_streaming(
         self, symbols: list[str], subscribe_to_account: bool = False, subscribe_to_pnl: bool = False
@@ -135,7 +155,7 @@ class UserStreamManager:
                     f"(state={self.connection_state}), skipping duplicate start"
                 )
                 if self.is_streaming:
-                    await self.subscribe_to_new_symbols(symbols)
+                    await self.subscribe_to_new_symbols(symbols, consumer=CONSUMER_WATCHLIST)
                 return
 
             # Set connecting state BEFORE creating task to prevent re-entrancy
@@ -206,6 +226,8 @@ class UserStreamManager:
             self.is_streaming = False
             self.connection_state = "disconnected"
             self._reset_data_flags()
+            # Closing the gateway handle releases every upstream subscription
+            self.subscription_manager.reset_subscriptions()
 
             # Collect all resources to clean
             streaming_task = self.streaming_task
@@ -219,6 +241,7 @@ class UserStreamManager:
 
             # Stop order monitoring
             await self.stop_order_monitoring()
+            await self.quote_conflator.close()
 
         async def _close_streamer(streamer, name: str, timeout: float = STREAMER_CLOSE_TIMEOUT):
             if not streamer:
@@ -234,7 +257,7 @@ class UserStreamManager:
 
         # Close streamers first - this signals listeners to exit naturally
         await _close_streamer(account_streamer, "AlertStreamer")
-        await _close_streamer(data_streamer, "DXLinkStreamer")
+        await _close_streamer(data_streamer, "market data gateway handle")
 
         async def _await_task(
             task: asyncio.Task | None, name: str, timeout: float = STREAMING_TASK_TIMEOUT
@@ -278,20 +301,31 @@ class UserStreamManager:
 
         logger.info(f"User {self.user_id}: Streaming service stopped successfully")
 
-    async def ensure_streaming_for_automation(self, symbols: list[str]) -> bool:
+    async def ensure_streaming_for_automation(
+        self, symbols: list[str], data_kinds: tuple[str, ...] = (DATA_QUOTE,)
+    ) -> bool:
         """
         Ensure streaming is active for automated tasks.
-        Matches UI readiness check: waits for both is_streaming AND has_received_data.
+        Matches UI readiness check: waits for the connection AND for actual data.
 
         This method:
         1. Starts streaming if not already active
-        2. Waits for actual data to arrive (not just connection)
+        2. Waits for the market data gateway to attach
         3. Subscribes to required symbols
-        4. Returns True when ready with data, False on failure
+        4. Waits for the first event of each data kind per symbol
+        5. Returns True when ready with data, False on failure
+
+        Waiting is event-driven (futures resolved by signal_data_received), so
+        automation continues the moment data lands. Symbols already live in
+        the shared quote book/cache (streamed for another user) are ready at once.
 
         Used by automated tasks to ensure data availability WITHOUT
         requiring active WebSocket connections.
 
+        Args:
+            symbols: Symbols the task needs
+            data_kinds: DATA_QUOTE, DATA_GREEKS and/or DATA_SUMMARY to wait for
+
         Returns:
             bool: True if streaming is ready with data, False if failed
         """
@@ -322,35 +356,87 @@ class UserStreamManager:
                     self.is_streaming = False
                 return False
 
-        # NOW MATCH UI BEHAVIOR: Wait for actual data (not just connection)
-        max_wait = STREAMING_DATA_WAIT_TIMEOUT
-        for i in range(max_wait):
-            # Check BOTH flags like UI does!
-            if self.is_streaming and self.has_received_data:
-                # Also verify we have quotes for requested symbols in cache
-                from django.core.cache import cache
-
-                from services.core.cache import CacheManager
-
-                all_symbols_ready = True
-                for symbol in symbols:
-                    quote_key = CacheManager.quote(symbol)
-                    if not cache.get(quote_key):
-                        all_symbols_ready = False
-                        break
-
-                if all_symbols_ready:
-                    logger.info(f"User {self.user_id}: Streaming ready with data after {i+1}s")
-                    # Ensure all symbols are subscribed
-                    await self.subscribe_to_new_symbols(symbols)
-                    return True
-
-            await asyncio.sleep(AUTOMATION_READY_POLL_INTERVAL)
-
-        logger.warning(
-            f"User {self.user_id}: Timeout waiting for streaming data after {max_wait}s"
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline = started + STREAMING_DATA_WAIT_TIMEOUT
+
+        # asyncio.wait never cancels the shared waiter on timeout
+        connected = self._connected()
+        await asyncio.wait([connected], timeout=STREAMING_DATA_WAIT_TIMEOUT)
+        if not connected.done():
+            logger.warning(
+                f"User {self.user_id}: Timeout waiting for streaming connection after "
+                f"{STREAMING_DATA_WAIT_TIMEOUT}s"
+            )
+            return False
+
+        # No-op for symbols this user already subscribed
+        await self.subscribe_to_new_symbols(symbols)
+
+        pending = self._pending_data(symbols, data_kinds)
+        ready = True
+        for kind in data_kinds:
+            kind_symbols = [symbol for symbol, pending_kind in pending if pending_kind == kind]
+            ready = ready and await self.subscription_manager.wait_for_data(
+                kind_symbols, (kind,), timeout=deadline - loop.time()
+            )
+
+        if not ready:
+            logger.warning(
+                f"User {self.user_id}: Timeout waiting for streaming data after "
+                f"{STREAMING_DATA_WAIT_TIMEOUT}s"
+            )
+            return False
+
+        already_live = len(symbols) * len(data_kinds) - len(pending)
+        logger.info(
+            f"User {self.user_id}: Streaming ready with data after {loop.time() - started:.2f}s "
+            f"({len(pending)} awaited, {already_live} already live)"
         )
-        return False
+        return True
+
+    def _pending_data(self, symbols: list[str], data_kinds) -> list[tuple[str, str]]:
+        """
+        (symbol, kind) pairs not yet live: quote book first, then one L1/Redis get_many.
+
+        Runs on the event loop, so every cache miss is read in a single round trip.
+        """
+        from services.core.cache import CacheManager
+        from services.core.constants import L1_GREEKS_TTL, L1_QUOTE_TTL
+        from services.core.l1_cache import l1_cache
+
+        streamer_symbols = {symbol: self._to_streamer_symbol(symbol) for symbol in symbols}
+        quote_kinds = [kind for kind in data_kinds if kind != DATA_GREEKS]
+
+        quotes = {}
+        keys = []
+        for streamer_symbol in streamer_symbols.values():
+            if quote_kinds:
+                payload = quote_book.get(streamer_symbol)
+                if payload:
+                    quotes[streamer_symbol] = payload
+                else:
+                    keys.append(CacheManager.quote(streamer_symbol))
+            if DATA_GREEKS in data_kinds:
+                keys.append(CacheManager.dxfeed_greeks(streamer_symbol))
+        cached = l1_cache.get_many(keys, min(L1_QUOTE_TTL, L1_GREEKS_TTL)) if keys else {}
+
+        def is_live(streamer_symbol: str, kind: str) -> bool:
+            if kind == DATA_GREEKS:
+                return CacheManager.dxfeed_greeks(streamer_symbol) in cached
+            payload = quotes.get(streamer_symbol) or cached.get(CacheManager.quote(streamer_symbol))
+            if not payload:
+                return False
+            if kind == DATA_SUMMARY:
+                return payload.get("previous_close") is not None
+            return True
+
+        return [
+            (symbol, kind)
+            for symbol, streamer_symbol in streamer_symbols.items()
+            for kind in data_kinds
+            if not is_live(streamer_symbol, kind)
+        ]
 
     async def ensure_subscriptions(
         self,
@@ -362,26 +448,77 @@ class UserStreamManager:
         Ensures the necessary subscriptions are active.
         """
         if symbols:
-            await self.subscribe_to_new_symbols(symbols)
+            await self.subscribe_to_new_symbols(symbols, consumer=CONSUMER_WATCHLIST)
 
         if (subscribe_to_account or subscribe_to_pnl) and not self.metrics_task:
             # Start unified metrics update task (balance + Greeks + P&L)
             self.metrics_task = asyncio.create_task(self._start_position_metrics_updates())
             logger.info(f"User {self.user_id}: Started unified metrics update task")
 
-    async def subscribe_to_new_symbols(self, symbols: list[str]):
-        """Subscribes to a new list of symbols if the streamer is active."""
+    async def subscribe_to_new_symbols(self, symbols: list[str], consumer: str = CONSUMER_ADHOC):
+        """Subscribes to a new list of symbols for a consumer if the streamer is active."""
         await self.subscription_manager.subscribe_to_new_symbols(
-            self.context.data_streamer, symbols, self.is_streaming
+            self.context.data_streamer, symbols, self.is_streaming, consumer
         )
 
+    async def replace_consumer_symbols(self, consumer: str, symbols: list[str]):
+        """Point a consumer at exactly these symbols, releasing the ones it dropped."""
+        await self.subscription_manager.replace_consumer_symbols(
+            self.context.data_streamer, consumer, symbols, self.is_streaming
+        )
+
+    async def release_symbols(self, consumer: str, symbols: list[str] | None = None) -> int:
+        """Release a consumer's symbols; unreferenced ones are unsubscribed right away."""
+        return await self.subscription_manager.release_symbols(
+            self.context.data_streamer, consumer, symbols
+        )
+
+    async def refresh_position_subscriptions(self) -> int:
+        """
+        Hold the legs of the user's open positions under CONSUMER_POSITIONS.
+
+        Automation and the position metrics loop need these legs whether or
+        not a positions page is open, so they are not tied to page sockets.
+        Called on connect, after position sync and on every metrics cycle;
+        legs of positions that closed since the last call are released.
+
+        Returns:
+            int: Number of symbols held for open positions
+        """
+        from trading.models import Position
+
+        symbols = set()
+        open_positions = Position.objects.filter(
+            user_id=self.user_id, lifecycle_state__in=["open_full", "open_partial", "closing"]
+        ).values_list("symbol", "metadata")
+        async for symbol, metadata in open_positions:
+            legs = (metadata or {}).get("legs")
+            if legs:
+                symbols.update(leg["symbol"] for leg in legs if leg.get("symbol"))
+            else:
+                symbols.add(symbol)
+
+        manager = self.subscription_manager
+        wanted = {manager.to_streamer_symbol(symbol) for symbol in symbols}
+        if wanted != manager.consumer_symbols(CONSUMER_POSITIONS):
+            await self.replace_consumer_symbols(CONSUMER_POSITIONS, sorted(symbols))
+        return len(symbols)
+
     async def a_process_suggestion_request(self, context: dict):
         """
         Processes a suggestion request: subscribes to legs, waits for data,
         calculates suggestion, and sends result to the client.
 
-        Supports multiple strategies via strategy dispatch pattern.
+        Supports multiple strategies via strategy dispatch pattern. The legs
+        are held only while the request is in flight.
         """
+        consumer = f"{CONSUMER_SUGGESTION}:{uuid.uuid4().hex[:12]}"
+        try:
+            return await self._process_suggestion_request(context, consumer)
+        finally:
+            await self.release_symbols(consumer)
+
+    async def _process_suggestion_request(self, context: dict, consumer: str):
         logger.info(f"User {self.user_id}: Suggestion request started - processing context")
 
         is_automated = context.get("is_automated", False)
@@ -396,7 +533,7 @@ class UserStreamManager:
             f"User {self.user_id}: Extracted {len(leg_symbols)} leg symbols: {leg_symbols}"
         )
 
-        await self.subscribe_to_new_symbols(leg_symbols)
+        await self.subscribe_to_new_symbols(leg_symbols, consumer=consumer)
 
         # Wait for cache to be populated
         cache_ready = await self._wait_for_cache(leg_symbols)
@@ -711,10 +848,10 @@ class UserStreamManager:
         subscribe_to_account: bool = False,
         subscribe_to_pnl: bool = False,
     ):
-        """The main streaming loop, using the mandatory async context manager."""
+        """The main streaming loop: attach to the shared gateway and listen for orders."""
         try:
             self.connection_state = "connecting"
-            logger.info(f"User {self.user_id}: Attempting DXLink connection...")
+            logger.info(f"User {self.user_id}: Attaching to market data gateway...")
 
             # Initialize AlertStreamer for account events if requested
             alert_streamer = None
@@ -735,7 +872,6 @@ class UserStreamManager:
                     logger.error(f"User {self.user_id}: Failed to initialize AlertStreamer: {e}")
                     alert_streamer = None
 
-            # Add timeout wrapper for connection establishment
             if session and hasattr(session, "session_token"):
                 token_suffix = session.session_token[-8:]
                 logger.info(
@@ -748,86 +884,76 @@ class UserStreamManager:
                 )
 
             try:
-                async with DXLinkStreamer(session) as streamer:
-                    # Only timeout the connection and initial setup phase
-                    try:
-                        async with asyncio.timeout(DXLINK_CONNECTION_TIMEOUT):
-                            self.context.data_streamer = streamer
-                            self.is_streaming = True
-                            self.connection_state = "connected"
-                            logger.info(
-                                f"User {self.user_id}: DXLinkStreamer connected "
-                                f"successfully. Starting listeners."
-                            )
-
-                            logger.debug(
-                                f"User {self.user_id}: About to subscribe to symbols: {symbols}, "
-                                f"is_streaming={self.is_streaming}, "
-                                f"streamer={self.context.data_streamer is not None}"
-                            )
-                            await self.subscribe_to_new_symbols(symbols)
-                            logger.debug(
-                                f"User {self.user_id}: Finished subscribe_to_new_symbols call"
-                            )
+                # Only timeout the connection and initial setup phase
+                try:
+                    async with asyncio.timeout(DXLINK_CONNECTION_TIMEOUT):
+                        handle = await market_data_gateway.attach(self, session)
+                        self.context.data_streamer = handle
+                        self.is_streaming = True
+                        self.connection_state = "connected"
+                        self._signal_connected()
+                        logger.info(
+                            f"User {self.user_id}: Market data gateway attached. "
+                            f"Starting listeners."
+                        )
 
-                            if subscribe_to_account or subscribe_to_pnl:
-                                await self.ensure_subscriptions(
-                                    subscribe_to_account=subscribe_to_account,
-                                    subscribe_to_pnl=subscribe_to_pnl,
-                                )
+                        await self.subscribe_to_new_symbols(symbols, consumer=CONSUMER_WATCHLIST)
+                        await self.refresh_position_subscriptions()
 
-                            logger.info(
-                                f"User {self.user_id}: Connection setup complete, "
-                                f"starting indefinite streaming..."
+                        if subscribe_to_account or subscribe_to_pnl:
+                            await self.ensure_subscriptions(
+                                subscribe_to_account=subscribe_to_account,
+                                subscribe_to_pnl=subscribe_to_pnl,
                             )
 
-                    except TimeoutError:
-                        self.connection_state = "error"
-                        logger.error(
-                            f"User {self.user_id}: DXLink connection timeout after "
-                            f"{DXLINK_CONNECTION_TIMEOUT}s. This often indicates an invalid session token "
-                            f"or a network issue."
+                        logger.info(
+                            f"User {self.user_id}: Connection setup complete, "
+                            f"starting indefinite streaming..."
                         )
-                        self.is_streaming = False
-                        raise  # Re-raise to exit the streamer context
-
-                    # Listeners run indefinitely WITHOUT timeout
-                    listeners = [
-                        self._listen_quotes(),
-                        self._listen_trades(),
-                        self._listen_summary(),
-                        self._listen_greeks(),
-                    ]
-                    if alert_streamer:
-                        listeners.append(self._listen_orders())
 
-                    logger.info(
-                        f"User {self.user_id}: 🎧 Starting {len(listeners)} listeners "
-                        f"for indefinite streaming"
+                except TimeoutError:
+                    self.connection_state = "error"
+                    logger.error(
+                        f"User {self.user_id}: DXLink connection timeout after "
+                        f"{DXLINK_CONNECTION_TIMEOUT}s. This often indicates an invalid session token "
+                        f"or a network issue."
                     )
-                    results = await asyncio.gather(*listeners, return_exceptions=True)
-
-                    first_exception: BaseException | None = None
-                    for result in results:
-                        if isinstance(result, BaseException):
-                            if isinstance(result, asyncio.CancelledError):
-                                logger.info(f"User {self.user_id}: Listener cancelled: {result}")
-                                continue
-
-                            logger.error(
-                                f"User {self.user_id}: Listener error: {result}",
-                                exc_info=(
-                                    type(result),
-                                    result,
-                                    result.__traceback__,
-                                ),
-                            )
-                            if not first_exception:
-                                first_exception = result
+                    self.is_streaming = False
+                    raise
+
+                # Market data arrives via gateway callbacks; this task lives until
+                # the handle is closed (stop_streaming) and relays order events.
+                listeners = [handle.wait_closed()]
+                if alert_streamer:
+                    listeners.append(self._listen_orders())
+
+                logger.info(
+                    f"User {self.user_id}: 🎧 Starting {len(listeners)} listeners "
+                    f"for indefinite streaming"
+                )
+                results = await asyncio.gather(*listeners, return_exceptions=True)
+
+                first_exception: BaseException | None = None
+                for result in results:
+                    if isinstance(result, BaseException):
+                        if isinstance(result, asyncio.CancelledError):
+                            logger.info(f"User {self.user_id}: Listener cancelled: {result}")
+                            continue
+
+                        logger.error(
+                            f"User {self.user_id}: Listener error: {result}",
+                            exc_info=(
+                                type(result),
+                                result,
+                                result.__traceback__,
+                            ),
+                        )
+                        if not first_exception:
+                            first_exception = result
 
-                    if first_exception:
-                        self.connection_state = "error"
-                        raise first_exception
+                if first_exception:
+                    self.connection_state = "error"
+                    raise first_exception
 
             except ConnectionClosedOK:
                 # Normal websocket closure - user disconnected or streamer closed cleanly
@@ -838,7 +964,7 @@ class UserStreamManager:
                 # Check if OAuth related error FIRST
                 if await self._is_oauth_error(e):
                     await self._handle_oauth_error(e)
-                    raise  # Re-raise to exit the streamer context
+                    raise
                 self.connection_state = "error"
                 logger.error(
                     f"User {self.user_id}: An unexpected error occurred during "
@@ -864,7 +990,13 @@ class UserStreamManager:
             self.is_streaming = False
             self._reset_data_flags()
 
+            data_streamer = self.context.data_streamer
             self.context.data_streamer = None
+            if data_streamer:
+                try:
+                    await data_streamer.close()
+                except Exception as e:
+                    logger.error(f"User {self.user_id}: Error detaching from gateway: {e}")
             if self.context.account_streamer:
                 try:
                     await self.context.account_streamer.close()
@@ -874,173 +1006,38 @@ class UserStreamManager:
                     self.context.account_streamer = None
             logger.info(f"User {self.user_id}: Streaming stopped.")
 
-    async def _listen_stream(self, event_type, handler, label: str):
-        streamer = self.context.data_streamer
-        if not streamer:
-            return
+    # === Market data callbacks (invoked by MarketDataGateway after caching) ===
 
-        async for event in streamer.listen(event_type):
-            try:
-                await handler(event)
-            except asyncio.CancelledError:
-                # Propagate cancellation so stop_streaming() can unwind cleanly
-                raise
-            except Exception as e:
-                logger.error(f"Error processing {label}: {e}", exc_info=True)
-
-    async def _listen_quotes(self):
-        await self._listen_stream(Quote, self._handle_quote_event, "quote")
-
-    async def _listen_trades(self):
-        await self._listen_stream(Trade, self._handle_trade_event, "trade")
-
-    async def _listen_summary(self):
-        await self._listen_stream(Summary, self._handle_summary_event, "summary")
-
-    async def _listen_greeks(self):
-        await self._listen_stream(Greeks, self._handle_greeks_event, "greeks")
-
-    async def _handle_quote_event(self, quote):
+    async def on_quote_update(self, symbol: str, payload: dict):
         if not self.has_received_data:
             self.has_received_data = True
             from django.utils import timezone
 
             self.last_quote_received = timezone.now()
 
-        key = CacheManager.quote(quote.event_symbol)
-        existing_quote = cache.get(key) or {}
-        payload = build_quote_payload(quote, existing_quote)
-
-        await enhanced_cache.set(key, payload, ttl=QUOTE_CACHE_TTL)
-        self.subscription_manager.signal_data_received(quote.event_symbol)
+        self.subscription_manager.signal_data_received(symbol)
 
-        if is_option_symbol(quote.event_symbol):
-            bid_price = payload.get("bid")
-            ask_price = payload.get("ask")
+        if is_option_symbol(symbol):
             logger.debug(
-                f"User {self.user_id}: Option quote: {quote.event_symbol} "
-                f"bid={bid_price}, ask={ask_price}"
+                f"User {self.user_id}: Option quote: {symbol} "
+                f"bid={payload.get('bid')}, ask={payload.get('ask')}"
             )
 
-        await self._broadcast("quote_update", payload)
-
-    async def _handle_trade_event(self, trade):
-        quote_key = CacheManager.quote(trade.event_symbol)
-        existing_quote = cache.get(quote_key) or {}
-        payload = build_trade_payload(trade, existing_quote)
+        await self.quote_conflator.offer(symbol, payload)
 
-        await enhanced_cache.set(quote_key, payload, ttl=QUOTE_CACHE_TTL)
-        self.subscription_manager.signal_data_received(trade.event_symbol)
+    async def on_trade_update(self, symbol: str, payload: dict):  # noqa: ARG002
+        self.subscription_manager.signal_data_received(symbol)
 
-    async def _handle_summary_event(self, summary):
-        quote_key = CacheManager.quote(summary.event_symbol)
-        existing_quote = cache.get(quote_key) or {}
-        payload = build_summary_payload(summary, existing_quote)
+    async def on_greeks_update(self, symbol: str, payload: dict):  # noqa: ARG002
+        self.subscription_manager.signal_data_received(symbol, DATA_GREEKS)
 
-        await enhanced_cache.set(quote_key, payload, ttl=SUMMARY_CACHE_TTL)
+    async def on_summary_update(self, symbol: str, payload: dict):
+        self.subscription_manager.signal_data_received(symbol, DATA_SUMMARY)
         await self._broadcast(
             "summary_update",
-            {"symbol": summary.event_symbol, "prev_day_close": payload.get("previous_close")},
+            {"symbol": symbol, "prev_day_close": payload.get("previous_close")},
         )
 
-    async def _handle_greeks_event(self, greeks):
-        key = CacheManager.dxfeed_greeks(greeks.event_symbol)
-        data = {
-            "symbol": greeks.event_symbol,
-            "theoretical_price": safe_float(greeks.price),
-            "delta": safe_float(greeks.delta),
-            "gamma": safe_float(greeks.gamma),
-            "theta": safe_float(greeks.theta),
-            "vega": safe_float(greeks.vega),
-            "rho": safe_float(greeks.rho),
-            "updated_at": format_timestamp(greeks.event_time),
-        }
-
-        await enhanced_cache.set(key, data, ttl=GREEKS_CACHE_TTL)
-        logger.debug(
-            f"User {self.user_id}: Greeks: {greeks.event_symbol} "
-            f"delta={data['delta']}, gamma={data['gamma']}, theo={data['theoretical_price']}"
-        )
-
-        asyncio.create_task(self._persist_greeks_limited(greeks))
-
-    async def _persist_greeks_limited(self, greeks_event):
-        """Throttle persistence tasks so they cannot exhaust the event loop."""
-        await self._greeks_persist_semaphore.acquire()
-        try:
-            await self._persist_greeks(greeks_event)
-        finally:
-            self._greeks_persist_semaphore.release()
-
-    async def _persist_greeks(self, greeks_event):
-        """Persist Greeks data to HistoricalGreeks model (fire-and-forget)."""
-        try:
-            # Parse OCC symbol to extract components
-            # Greeks event_symbol is in streamer format, need to convert back to OCC
-            from decimal import Decimal
-
-            from services.sdk.symbol_conversion import streamer_to_occ_fixed
-
-            # Convert streamer symbol back to OCC format for parsing
-            # Uses workaround for SDK bug that produces 22-char symbols for certain strikes
-            try:
-                occ_symbol = streamer_to_occ_fixed(greeks_event.event_symbol)
-            except Exception:
-                # If conversion fails, event_symbol might already be OCC format
-                occ_symbol = greeks_event.event_symbol
-
-            # Parse the OCC symbol
-            parsed = parse_occ_symbol(occ_symbol)
-
-            # Convert timestamp (milliseconds since epoch) to datetime
-            # Use current time if event_time is invalid (0 or None)
-            from datetime import datetime
-
-            if greeks_event.event_time and greeks_event.event_time > 0:
-                timestamp = datetime.fromtimestamp(greeks_event.event_time / 1000, tz=UTC)
-            else:
-                timestamp = datetime.now(tz=UTC)
-
-            # Round timestamp to 1-second resolution (deduplication strategy)
-            timestamp = timestamp.replace(microsecond=0)
-
-            # Persist using aupdate_or_create (upsert pattern)
-            await HistoricalGreeks.objects.aupdate_or_create(
-                option_symbol=occ_symbol,
-                timestamp=timestamp,
-                defaults={
-                    "underlying_symbol": parsed["underlying"],
-                    "delta": (
-                        Decimal(str(greeks_event.delta)) if greeks_event.delta else Decimal("0")
-                    ),
-                    "gamma": (
-                        Decimal(str(greeks_event.gamma)) if greeks_event.gamma else Decimal("0")
-                    ),
-                    "theta": (
-                        Decimal(str(greeks_event.theta)) if greeks_event.theta else Decimal("0")
-                    ),
-                    "vega": Decimal(str(greeks_event.vega)) if greeks_event.vega else Decimal("0"),
-                    "rho": (
-                        Decimal(str(greeks_event.rho))
-                        if hasattr(greeks_event, "rho") and greeks_event.rho
-                        else None
-                    ),
-                    "implied_volatility": (
-                        Decimal(str(greeks_event.volatility))
-                        if greeks_event.volatility
-                        else Decimal("0")
-                    ),
-                    "strike": parsed["strike"],
-                    "expiration_date": parsed["expiration"],
-                    "option_type": parsed["option_type"],
-                },
-            )
-            logger.debug(f"User {self.user_id}: Persisted Greeks for {occ_symbol} at {timestamp}")
-        except Exception as e:
-            logger.error(
-                f"User {self.user_id}: Error persisting Greeks for {greeks_event.event_symbol}: {e}"
-            )
-
     async def _start_position_metrics_updates(self):
         """
         Unified metrics update service - broadcasts balance, Greeks, and P&L every 30 seconds.
@@ -1056,6 +1053,11 @@ class UserStreamManager:
         # Update loop
         while self.is_streaming:
             try:
+                # Unsubscribe scan probes and ad-hoc symbols whose TTL lapsed
+                await self.subscription_manager.collect_garbage(self.context.data_streamer)
+                # Follow positions opened or closed since the last cycle
+                await self.refresh_position_subscriptions()
+
                 # Delegate to metrics calculator helper
                 update_data = await self.metrics_calculator.calculate_unified_metrics()
 
@@ -1101,6 +1103,10 @@ class UserStreamManager:
         """Broadcasts a message to the user's data group."""
         await self.channel_layer.group_send(self.data_group_name, {"type": message_type, **data})
 
+    async def _broadcast_quotes(self, quotes: list[dict]):
+        """Broadcasts one conflated batch of quotes (latest payload per symbol)."""
+        await self._broadcast("quotes_update", {"quotes": quotes})
+
     async def start_order_monitoring(self):
         """Order monitoring is handled by AlertStreamer in real-time - no action needed."""
         logger.info(
@@ -1129,6 +1135,11 @@ class UserStreamManager:
         """Handle OAuth expiration by notifying clients."""
         logger.warning(f"User {self.user_id}: OAuth error detected, notifying client: {error}")
 
+        # The pooled session is no longer good; the next caller must re-create it
+        from services.core.data_access import invalidate_oauth_session
+
+        invalidate_oauth_session(self.user_id)
+
         # Broadcast OAuth error to client
         await self._broadcast(
             "oauth_error",
@@ -1279,16 +1290,29 @@ class GlobalStreamManager:
         return {
             "active_users": len(cls._user_managers),
             "pending_cleanups": len(cls._cleanup_tasks),
+            "gateway": market_data_gateway.get_stats(),
             "managers": {
                 user_id: {
                     "ref_count": manager.context.reference_count,
                     "channels": len(manager.context.connected_channels),
                     "is_streaming": manager.is_streaming,
+                    "subscriptions": len(manager.subscription_manager.subscribed_symbols),
                 }
                 for user_id, manager in cls._user_managers.items()
             },
         }
 
+    @classmethod
+    def get_subscription_stats(cls, user_id: int) -> dict | None:
+        """Live subscriptions (consumers, event rates) for a user, None without a manager."""
+        manager = cls._user_managers.get(user_id)
+        if manager is None:
+            return None
+        return {
+            "is_streaming": manager.is_streaming,
+            **manager.subscription_manager.get_subscription_stats(),
+        }
+
     @classmethod
     async def get_last_activity(cls, user_id: int) -> datetime | None:
         """Get the last activity timestamp for a user."""
@@ -2,18 +2,27 @@
 Stream Subscription Manager - Manages symbol subscriptions and lifecycle.
 
 Responsibility:
-- Manage subscribed symbols set and timestamps
-- Handle subscription cleanup and lifecycle
+- Reference-count subscribed symbols per consumer (watchlist, positions, page, scan,
+  suggestion)
+- Unsubscribe a symbol as soon as its last consumer releases it
 - Enforce subscription limits
-- Coordinate with DXLinkStreamer for subscriptions
+- Coordinate with DXLinkStreamer for subscriptions, in chunked batches
+- Expose first-data readiness (quote, Greeks, summary) as awaitable futures
+- Introspection: live consumers and event rates per symbol
 
 Design Principles:
 - Encapsulates subscription state
 - No circular dependencies (receives streamer as parameter)
 - Clear separation of concerns (state vs. streaming logic)
+- Consumers either hold symbols until they release them, or (scan and
+  ad-hoc callers that never release) hold references that lapse after a TTL
+- Readiness is event-driven: signal_data_received resolves the waiters the
+  moment data lands, so callers never poll the cache
 """
 
 import asyncio
+import time
+from collections import Counter
 from datetime import UTC, datetime
 
 from tastytrade import DXLinkStreamer
@@ -26,6 +35,8 @@ from streaming.constants import (
     GREEKS_REFRESH_INTERVAL,
     MAX_SUBSCRIPTIONS,
     QUOTE_REFRESH_INTERVAL,
+    SCAN_SUBSCRIPTION_TTL,
+    SUBSCRIPTION_BATCH_SIZE,
     SUBSCRIPTION_CLEANUP_SECONDS,
     SUBSCRIPTION_DELAY,
     SUMMARY_REFRESH_INTERVAL,
@@ -35,91 +46,150 @@ from streaming.services.stream_helpers import is_option_symbol
 
 logger = get_logger(__name__)
 
+# First-data readiness kinds (see StreamSubscriptionManager.data_ready)
+DATA_QUOTE = "quote"  # Quote or trade (anything that prices the symbol)
+DATA_GREEKS = "greeks"
+DATA_SUMMARY = "summary"
+
+# Subscription consumers; per-instance consumers are "<kind>:<id>"
+CONSUMER_ADHOC = "adhoc"  # Callers that never release (expires, SUBSCRIPTION_CLEANUP_SECONDS)
+CONSUMER_SCAN = "scan"  # Strike probes from strategy scans (expires, SCAN_SUBSCRIPTION_TTL)
+CONSUMER_WATCHLIST = "watchlist"  # Watchlist/underlyings streamed for the session
+CONSUMER_POSITIONS = "positions"  # Legs of open positions, refreshed from the database
+CONSUMER_PAGE = "page"  # Legs shown on a browser page, released on disconnect
+CONSUMER_SUGGESTION = "suggestion"  # Legs of an in-flight suggestion request
+
+# Consumer kinds whose references lapse on their own (seconds)
+EXPIRING_CONSUMERS = {
+    CONSUMER_ADHOC: SUBSCRIPTION_CLEANUP_SECONDS,
+    CONSUMER_SCAN: SCAN_SUBSCRIPTION_TTL,
+}
+
 
 class StreamSubscriptionManager:
     """Manages streaming subscriptions for symbols with lifecycle control."""
 
     def __init__(self, user_id: int):
         self.user_id = user_id
-        self.subscribed_symbols: set[str] = set()
+        self.subscribed_symbols: set[str] = set()  # Streamer symbols subscribed upstream
         self.subscription_timestamps: dict[str, datetime] = {}
+        # Streamer symbol -> consumer -> expiry (time.monotonic) or None while held
+        self._refs: dict[str, dict[str, float | None]] = {}
         self.pending_symbol_events: dict[str, asyncio.Event] = {}  # First data arrival tracking
+        # First-data readiness per (kind, streamer symbol); reset when streaming stops
+        self._data_seen: set[tuple[str, str]] = set()
+        self._data_waiters: dict[tuple[str, str], asyncio.Future] = {}
+        # wait_for_data calls currently awaiting each waiter
+        self._data_wait_counts: Counter[tuple[str, str]] = Counter()
         # OCC to streamer symbol mapping for option symbols
         self.occ_to_streamer: dict[str, str] = {}
+        # Introspection counters
+        self.event_counts: Counter[str] = Counter()
+        self.subscribe_calls = 0
+        self.unsubscribe_calls = 0
+        self.symbols_released = 0
+
+    # === Reference counting ===
+
+    def _acquire(self, streamer_symbol: str, consumer: str, now: float) -> None:
+        ttl = EXPIRING_CONSUMERS.get(consumer.split(":", 1)[0])
+        self._refs.setdefault(streamer_symbol, {})[consumer] = now + ttl if ttl else None
+
+    def _drop_references(
+        self, consumer: str, streamer_symbols: list[str] | None = None
+    ) -> list[str]:
+        """Remove a consumer's references; returns symbols nobody references any more."""
+        if streamer_symbols is None:
+            streamer_symbols = [s for s, consumers in self._refs.items() if consumer in consumers]
+
+        unreferenced = []
+        for symbol in streamer_symbols:
+            consumers = self._refs.get(symbol)
+            if not consumers or consumer not in consumers:
+                continue
+            del consumers[consumer]
+            if not consumers:
+                del self._refs[symbol]
+                unreferenced.append(symbol)
+        return unreferenced
+
+    def _expire_references(self) -> list[str]:
+        """Drop lapsed scan/ad-hoc references; returns symbols left without any reference."""
+        now = time.monotonic()
+        unreferenced = []
+        for symbol, consumers in list(self._refs.items()):
+            for consumer, expires_at in list(consumers.items()):
+                if expires_at is not None and expires_at <= now:
+                    del consumers[consumer]
+            if not consumers:
+                del self._refs[symbol]
+                unreferenced.append(symbol)
+
+        if unreferenced:
+            logger.info(
+                f"User {self.user_id}: {len(unreferenced)} subscriptions expired (no consumer left)"
+            )
+        return unreferenced
 
-    def cleanup_old_subscriptions(self) -> int:
-        """
-        Remove subscriptions older than 1 hour. Returns count removed.
-
-        Returns:
-            int: Number of subscriptions removed
+    def enforce_subscription_limits(
+        self, new_symbols_count: int, keep: set[str] | frozenset[str] = frozenset()
+    ) -> list[str]:
         """
-        if not self.subscription_timestamps:
-            return 0
-
-        current_time = datetime.now(UTC)
-        expired = [
-            symbol
-            for symbol, ts in self.subscription_timestamps.items()
-            if (current_time - ts).total_seconds() > SUBSCRIPTION_CLEANUP_SECONDS
-        ]
-
-        for symbol in expired:
-            self.subscribed_symbols.discard(symbol)
-            self.subscription_timestamps.pop(symbol, None)
-
-        if expired:
-            logger.info(f"User {self.user_id}: Cleaned up {len(expired)} expired subscriptions")
+        Make room for new symbols by evicting expiring references, soonest first.
 
-        return len(expired)
-
-    def enforce_subscription_limits(self, new_symbols_count: int) -> None:
-        """
-        Enforce subscription limits by removing oldest if necessary.
+        Symbols held by a consumer (watchlist, page, suggestion) are never
+        evicted; if they alone exceed the limit a warning is logged.
 
         Args:
             new_symbols_count: Number of new symbols about to be added
-        """
-        current_count = len(self.subscribed_symbols)
-        future_count = current_count + new_symbols_count
-
-        if future_count <= MAX_SUBSCRIPTIONS:
-            return
+            keep: Streamer symbols requested right now (not evicted)
 
-        # Need to make room - remove oldest subscriptions
-        to_remove = future_count - MAX_SUBSCRIPTIONS
-        oldest = sorted(self.subscription_timestamps.items(), key=lambda x: x[1])[:to_remove]
-
-        for symbol, _ in oldest:
-            self.subscribed_symbols.discard(symbol)
-            self.subscription_timestamps.pop(symbol, None)
+        Returns:
+            list[str]: Evicted streamer symbols (to unsubscribe)
+        """
+        overflow = len(self.subscribed_symbols) + new_symbols_count - MAX_SUBSCRIPTIONS
+        if overflow <= 0:
+            return []
+
+        evictable = sorted(
+            (max(consumers.values()), symbol)
+            for symbol, consumers in self._refs.items()
+            if symbol in self.subscribed_symbols
+            and symbol not in keep
+            and None not in consumers.values()
+        )
+        evicted = [symbol for _, symbol in evictable[:overflow]]
+        for symbol in evicted:
+            del self._refs[symbol]
 
         logger.warning(
             f"User {self.user_id}: Subscription limit reached. "
-            f"Removed {to_remove} oldest subscriptions. "
-            f"Current: {len(self.subscribed_symbols)}/{MAX_SUBSCRIPTIONS}"
+            f"Evicting {len(evicted)} expiring subscriptions "
+            f"({overflow - len(evicted)} over the limit of {MAX_SUBSCRIPTIONS} remain held)"
         )
+        return evicted
+
+    # === Subscribe / release ===
 
     async def subscribe_to_new_symbols(
         self,
         streamer: DXLinkStreamer | None,
         symbols: list[str],
         is_streaming: bool,
+        consumer: str = CONSUMER_ADHOC,
     ) -> None:
         """
-        Subscribe to a list of symbols if streamer is active.
+        Reference symbols for a consumer, subscribing those not yet streaming.
 
         Args:
             streamer: DXLinkStreamer instance (or None if not active)
             symbols: List of symbols to subscribe to (prefer OCC format; streamer
                 symbols are tolerated and auto-detected via stream_helpers.is_option_symbol)
             is_streaming: Whether streaming is currently active
+            consumer: Who needs the symbols (CONSUMER_* or "<kind>:<id>"); held
+                consumers must call release_symbols when done
         """
-        logger.info(f"User {self.user_id}: Subscribe request - symbols: {symbols}")
-        logger.info(
-            f"User {self.user_id}: Current streaming status: {is_streaming}, "
-            f"streamer exists: {streamer is not None}, streamer type: {type(streamer).__name__ if streamer else 'None'}"
-        )
+        logger.debug(f"User {self.user_id}: Subscribe request from {consumer}: {symbols}")
 
         if not is_streaming or not streamer:
             logger.warning(
@@ -128,10 +198,8 @@ class StreamSubscriptionManager:
             )
             return
 
-        logger.info(f"User {self.user_id}: Proceeding with subscription (checks passed)")
-
-        # Step 1: Cleanup old subscriptions
-        self.cleanup_old_subscriptions()
+        # Step 1: Expire lapsed scan/ad-hoc references
+        unreferenced = self._expire_references()
 
         # Step 2: Convert symbols to streamer format for consistent keying
         # CRITICAL: Store everything keyed by streamer symbol to match what listeners receive
@@ -140,37 +208,159 @@ class StreamSubscriptionManager:
             streamer_symbol = self.to_streamer_symbol(symbol)
             streamer_symbols_map[streamer_symbol] = symbol
 
-        # Step 3: Get new symbols (using streamer format for comparison)
+        # Step 3: Reference every requested symbol, then find the ones not yet streaming
+        now = time.monotonic()
+        for streamer_symbol in streamer_symbols_map:
+            self._acquire(streamer_symbol, consumer, now)
+
         new_streamer_symbols = [s for s in streamer_symbols_map if s not in self.subscribed_symbols]
+        if new_streamer_symbols:
+            unreferenced += self.enforce_subscription_limits(
+                len(new_streamer_symbols), keep=set(streamer_symbols_map)
+            )
+        await self._release_upstream(streamer, unreferenced)
+
         if not new_streamer_symbols:
-            logger.info(f"User {self.user_id}: All symbols already subscribed")
+            logger.debug(f"User {self.user_id}: All symbols already subscribed")
             return
 
-        self.enforce_subscription_limits(len(new_streamer_symbols))
-
         # Step 4: Subscribe to new symbols with timestamps and events
         # Use STREAMER symbol as key for all tracking (matches quote.event_symbol, trade.event_symbol)
         current_time = datetime.now(UTC)
         new_occ_symbols = []
         for streamer_symbol in new_streamer_symbols:
-            occ_symbol = streamer_symbols_map[streamer_symbol]
-            new_occ_symbols.append(occ_symbol)
+            new_occ_symbols.append(streamer_symbols_map[streamer_symbol])
 
             # Store using STREAMER symbol as key (matches what listeners receive from DXFeed)
             self.subscribed_symbols.add(streamer_symbol)
             self.subscription_timestamps[streamer_symbol] = current_time
             self.pending_symbol_events[streamer_symbol] = asyncio.Event()
-            logger.debug(
-                f"User {self.user_id}: Created pending event for {streamer_symbol} (OCC: {occ_symbol})"
-            )
 
-        logger.info(f"User {self.user_id}: Subscribing to NEW symbols: {new_occ_symbols}")
         logger.info(
-            f"User {self.user_id}: Total subscriptions: "
-            f"{len(self.subscribed_symbols)}/{MAX_SUBSCRIPTIONS}"
+            f"User {self.user_id}: Subscribing to {len(new_occ_symbols)} new symbols "
+            f"for {consumer} (total: {len(self.subscribed_symbols)}/{MAX_SUBSCRIPTIONS})"
         )
         await self._subscribe_symbols_to_streamer(streamer, new_occ_symbols)
 
+    async def replace_consumer_symbols(
+        self,
+        streamer: DXLinkStreamer | None,
+        consumer: str,
+        symbols: list[str],
+        is_streaming: bool,
+    ) -> None:
+        """Make a consumer reference exactly these symbols (e.g. a page's current legs)."""
+        wanted = {self.to_streamer_symbol(symbol) for symbol in symbols}
+        stale = [s for s in self.consumer_symbols(consumer) if s not in wanted]
+        await self.subscribe_to_new_symbols(streamer, symbols, is_streaming, consumer)
+        await self._release_upstream(streamer, self._drop_references(consumer, stale))
+
+    def consumer_symbols(self, consumer: str) -> set[str]:
+        """Streamer symbols a consumer currently references."""
+        return {s for s, consumers in self._refs.items() if consumer in consumers}
+
+    async def release_symbols(
+        self,
+        streamer: DXLinkStreamer | None,
+        consumer: str,
+        symbols: list[str] | None = None,
+    ) -> int:
+        """
+        Drop a consumer's references (all of them if symbols is None).
+
+        Symbols left without any consumer are unsubscribed right away.
+
+        Returns:
+            int: Number of symbols unsubscribed
+        """
+        streamer_symbols = (
+            None if symbols is None else [self.to_streamer_symbol(s) for s in symbols]
+        )
+        unreferenced = self._drop_references(consumer, streamer_symbols)
+        return await self._release_upstream(streamer, unreferenced)
+
+    async def collect_garbage(self, streamer: DXLinkStreamer | None) -> int:
+        """Unsubscribe symbols whose scan/ad-hoc references have lapsed."""
+        return await self._release_upstream(streamer, self._expire_references())
+
+    def reset_subscriptions(self) -> None:
+        """Forget all subscriptions and references (the data connection is gone)."""
+        self.subscribed_symbols.clear()
+        self.subscription_timestamps.clear()
+        self._refs.clear()
+        self.pending_symbol_events.clear()
+        self.event_counts.clear()
+
+    async def _release_upstream(
+        self, streamer: DXLinkStreamer | None, streamer_symbols: list[str]
+    ) -> int:
+        """Unsubscribe symbols that are still subscribed and no longer referenced."""
+        symbols = [
+            s for s in streamer_symbols if s in self.subscribed_symbols and s not in self._refs
+        ]
+        if not symbols:
+            return 0
+
+        for symbol in symbols:
+            self.subscribed_symbols.discard(symbol)
+            self.subscription_timestamps.pop(symbol, None)
+            self.pending_symbol_events.pop(symbol, None)
+            self.event_counts.pop(symbol, None)
+            # Cached data goes stale once unsubscribed; re-subscribing waits for fresh data
+            keys = [(kind, symbol) for kind in (DATA_QUOTE, DATA_GREEKS, DATA_SUMMARY)]
+            self._data_seen.difference_update(keys)
+            self._drop_idle_waiters(keys)
+        self.symbols_released += len(symbols)
+
+        if streamer is not None:
+            option_symbols = [s for s in symbols if is_option_symbol(s)]
+            underlying_symbols = [s for s in symbols if not is_option_symbol(s)]
+            try:
+                if option_symbols:
+                    await self._unsubscribe_batched(streamer, (Quote, Greeks), option_symbols)
+                if underlying_symbols:
+                    await self._unsubscribe_batched(
+                        streamer, (Quote, Trade, Summary), underlying_symbols
+                    )
+            except ConnectionClosedOK:
+                logger.info(f"User {self.user_id}: Streamer closed normally during unsubscribe")
+            except Exception as e:
+                logger.warning(
+                    f"User {self.user_id}: Error unsubscribing {len(symbols)} symbols: {e}"
+                )
+
+        logger.info(
+            f"User {self.user_id}: Unsubscribed {len(symbols)} unreferenced symbols "
+            f"(remaining: {len(self.subscribed_symbols)})"
+        )
+        return len(symbols)
+
+    async def _subscribe_batched(
+        self,
+        streamer: DXLinkStreamer,
+        event_class,
+        symbols: list[str],
+        refresh_interval: float | None = None,
+    ) -> None:
+        """Subscribe in chunks of SUBSCRIPTION_BATCH_SIZE symbols per DXLink call."""
+        kwargs = {} if refresh_interval is None else {"refresh_interval": refresh_interval}
+        for start in range(0, len(symbols), SUBSCRIPTION_BATCH_SIZE):
+            await streamer.subscribe(
+                event_class, symbols[start : start + SUBSCRIPTION_BATCH_SIZE], **kwargs
+            )
+            self.subscribe_calls += 1
+
+    async def _unsubscribe_batched(
+        self, streamer: DXLinkStreamer, event_classes: tuple, symbols: list[str]
+    ) -> None:
+        """Unsubscribe in chunks of SUBSCRIPTION_BATCH_SIZE symbols per DXLink call."""
+        for event_class in event_classes:
+            for start in range(0, len(symbols), SUBSCRIPTION_BATCH_SIZE):
+                await streamer.unsubscribe(
+                    event_class, symbols[start : start + SUBSCRIPTION_BATCH_SIZE]
+                )
+                self.unsubscribe_calls += 1
+
     async def _subscribe_symbols_to_streamer(
         self, streamer: DXLinkStreamer, symbols: list[str]
     ) -> None:
@@ -208,11 +398,6 @@ class StreamSubscriptionManager:
             streamer: DXLinkStreamer instance
             option_symbols: List of option symbols (OCC format with spaces)
         """
-        logger.info(
-            f"User {self.user_id}: Option symbols detected - "
-            f"converting OCC to streamer format"
-        )
-
         from tastytrade.instruments import Option
 
         streamer_symbols = []
@@ -221,7 +406,7 @@ class StreamSubscriptionManager:
                 streamer_symbol = Option.occ_to_streamer_symbol(occ_symbol)
                 streamer_symbols.append(streamer_symbol)
                 self.occ_to_streamer[occ_symbol] = streamer_symbol
-                logger.info(f"User {self.user_id}: Converted {occ_symbol} -> {streamer_symbol}")
+                logger.debug(f"User {self.user_id}: Converted {occ_symbol} -> {streamer_symbol}")
             except Exception as e:
                 logger.error(f"User {self.user_id}: Failed to convert symbol {occ_symbol}: {e}")
                 # Fall back to original symbol if conversion fails
@@ -231,30 +416,22 @@ class StreamSubscriptionManager:
                     f"User {self.user_id}: Using original symbol as fallback: {occ_symbol}"
                 )
 
-        logger.info(
-            f"User {self.user_id}: About to subscribe to DXFeed with "
-            f"streamer symbols: {streamer_symbols}"
-        )
-
         # Subscribe with streamer symbols
         try:
-            logger.info(
-                f"User {self.user_id}: Calling streamer.subscribe(Quote, {streamer_symbols}, refresh_interval={QUOTE_REFRESH_INTERVAL})"
-            )
-            await streamer.subscribe(
-                Quote, streamer_symbols, refresh_interval=QUOTE_REFRESH_INTERVAL
+            await self._subscribe_batched(
+                streamer, Quote, streamer_symbols, refresh_interval=QUOTE_REFRESH_INTERVAL
             )
-            logger.info(
+            logger.debug(
                 f"User {self.user_id}: Subscribed to Quote events for "
                 f"{len(streamer_symbols)} symbols"
             )
 
             await asyncio.sleep(SUBSCRIPTION_DELAY)
 
-            await streamer.subscribe(
-                Greeks, streamer_symbols, refresh_interval=GREEKS_REFRESH_INTERVAL
+            await self._subscribe_batched(
+                streamer, Greeks, streamer_symbols, refresh_interval=GREEKS_REFRESH_INTERVAL
             )
-            logger.info(
+            logger.debug(
                 f"User {self.user_id}: Subscribed to Greeks events for "
                 f"{len(streamer_symbols)} symbols"
             )
@@ -286,22 +463,25 @@ class StreamSubscriptionManager:
             logger.debug(
                 f"User {self.user_id}: Subscribing to Quote for {underlying_symbols}"
             )
-            await streamer.subscribe(
-                Quote, underlying_symbols, refresh_interval=UNDERLYING_QUOTE_REFRESH_INTERVAL
+            await self._subscribe_batched(
+                streamer,
+                Quote,
+                underlying_symbols,
+                refresh_interval=UNDERLYING_QUOTE_REFRESH_INTERVAL,
             )
             await asyncio.sleep(CHANNEL_RACE_DELAY)
 
             logger.debug(
                 f"User {self.user_id}: Subscribing to Trade for {underlying_symbols}"
             )
-            await streamer.subscribe(Trade, underlying_symbols)
+            await self._subscribe_batched(streamer, Trade, underlying_symbols)
             await asyncio.sleep(CHANNEL_RACE_DELAY)
 
             logger.debug(
                 f"User {self.user_id}: Subscribing to Summary for {underlying_symbols}"
             )
-            await streamer.subscribe(
-                Summary, underlying_symbols, refresh_interval=SUMMARY_REFRESH_INTERVAL
+            await self._subscribe_batched(
+                streamer, Summary, underlying_symbols, refresh_interval=SUMMARY_REFRESH_INTERVAL
             )
             logger.info(
                 f"User {self.user_id}: Subscribed to all events for "
@@ -386,18 +566,105 @@ class StreamSubscriptionManager:
         """
         return self.pending_symbol_events.get(symbol)
 
-    def signal_data_received(self, symbol: str) -> None:
+    def signal_data_received(self, symbol: str, kind: str = DATA_QUOTE) -> None:
         """
-        Signal that first data has been received for a symbol.
+        Signal that data has been received for a symbol.
+
+        Called for every event; only the first of each kind does any work.
 
         Args:
-            symbol: Symbol that received data
+            symbol: Symbol that received data (streamer format)
+            kind: DATA_QUOTE, DATA_GREEKS or DATA_SUMMARY
         """
-        if symbol in self.pending_symbol_events:
+        self.event_counts[symbol] += 1
+        key = (kind, symbol)
+        if key not in self._data_seen:
+            self._data_seen.add(key)
+            waiter = self._data_waiters.pop(key, None)
+            if waiter and not waiter.done() and not waiter.get_loop().is_closed():
+                waiter.set_result(True)
+
+        if kind == DATA_QUOTE and symbol in self.pending_symbol_events:
             self.pending_symbol_events[symbol].set()
             logger.info(f"User {self.user_id}: First data received for {symbol}")
             self.pending_symbol_events.pop(symbol)
 
+    def data_ready(self, symbol: str, kind: str = DATA_QUOTE) -> asyncio.Future:
+        """
+        Future that resolves when the first `kind` event for symbol arrives.
+
+        Already-resolved if the data has been seen since streaming started.
+        Waiters for the same symbol share one future, so wait on it with
+        asyncio.wait (or shield it) rather than cancelling it. Unresolved
+        futures not being awaited by wait_for_data are dropped when a wait
+        times out, the symbol is unsubscribed or readiness is reset.
+
+        Args:
+            symbol: OCC, streamer or underlying symbol
+            kind: DATA_QUOTE, DATA_GREEKS or DATA_SUMMARY
+        """
+        key = (kind, self.to_streamer_symbol(symbol))
+        loop = asyncio.get_running_loop()
+
+        if key in self._data_seen:
+            ready = loop.create_future()
+            ready.set_result(True)
+            return ready
+
+        waiter = self._data_waiters.get(key)
+        # Futures from another (closed) event loop or a cancelled waiter are replaced
+        if waiter is None or waiter.cancelled() or waiter.get_loop() is not loop:
+            waiter = loop.create_future()
+            self._data_waiters[key] = waiter
+        return waiter
+
+    async def wait_for_data(
+        self,
+        symbols: list[str],
+        kinds: tuple[str, ...] = (DATA_QUOTE,),
+        timeout: float | None = None,
+    ) -> bool:
+        """
+        Wait until every symbol has received every kind of data.
+
+        Returns:
+            bool: True if all data arrived, False on timeout
+        """
+        keys = list(
+            dict.fromkeys(
+                (kind, self.to_streamer_symbol(symbol)) for symbol in symbols for kind in kinds
+            )
+        )
+        waiters = [self.data_ready(symbol, kind) for kind, symbol in keys]
+        if not waiters:
+            return True
+        if timeout is not None and timeout <= 0:
+            ready = all(waiter.done() for waiter in waiters)
+            self._drop_idle_waiters(keys)
+            return ready
+
+        self._data_wait_counts.update(keys)
+        try:
+            _, pending = await asyncio.wait(waiters, timeout=timeout)
+        finally:
+            self._data_wait_counts.subtract(keys)
+            # Timed-out waiters nobody else awaits would otherwise stay registered forever
+            self._drop_idle_waiters(keys)
+        return not pending
+
+    def reset_data_readiness(self) -> None:
+        """Forget seen data (streaming stopped); awaited waiters stay registered."""
+        self._data_seen.clear()
+        self._drop_idle_waiters(list(self._data_waiters))
+
+    def _drop_idle_waiters(self, keys: list[tuple[str, str]]) -> None:
+        """Unregister unresolved waiters that no wait_for_data call is awaiting."""
+        for key in keys:
+            if self._data_wait_counts[key] > 0:
+                continue
+            self._data_wait_counts.pop(key, None)
+            self._data_waiters.pop(key, None)
+
     def remove_pending_event(self, symbol: str) -> None:
         """
         Remove pending event for symbol after data received.
@@ -406,3 +673,35 @@ class StreamSubscriptionManager:
             symbol: Symbol to cleanup
         """
         self.pending_symbol_events.pop(symbol, None)
+
+    # === Introspection ===
+
+    def get_subscription_stats(self) -> dict:
+        """Live subscriptions with their consumers and event rates per symbol."""
+        now = datetime.now(UTC)
+        consumer_counts: Counter[str] = Counter()
+        symbols = {}
+        for symbol in sorted(self.subscribed_symbols):
+            consumers = self._refs.get(symbol, {})
+            consumer_counts.update(consumers)
+            subscribed_at = self.subscription_timestamps.get(symbol)
+            age = (now - subscribed_at).total_seconds() if subscribed_at else 0.0
+            events = self.event_counts.get(symbol, 0)
+            symbols[symbol] = {
+                "consumers": sorted(consumers),
+                "ref_count": len(consumers),
+                "held": None in consumers.values(),
+                "subscribed_at": subscribed_at.isoformat() if subscribed_at else None,
+                "events": events,
+                "events_per_second": round(events / age, 3) if age > 0 else 0.0,
+            }
+
+        return {
+            "subscribed": len(self.subscribed_symbols),
+            "max_subscriptions": MAX_SUBSCRIPTIONS,
+            "consumers": dict(consumer_counts),
+            "subscribe_calls": self.subscribe_calls,
+            "unsubscribe_calls": self.unsubscribe_calls,
+            "symbols_released": self.symbols_released,
+            "symbols": symbols,
+        }
@@ -18,7 +18,10 @@ from channels.testing import WebsocketCommunicator
 from tastytrade import Session
 from tastytrade.dxfeed import Quote
 
+from services.brokers.tastytrade.session_pool import session_pool
 from services.core.cache import CacheManager
+from services.market_data.analysis_cache import market_report_cache
+from services.streaming.quote_book import quote_book
 from streaming.consumers import StreamingConsumer
 from streaming.services.stream_manager import GlobalStreamManager
 
@@ -33,11 +36,16 @@ class StreamingTestMixin:
         # Clear cache before each test
         cache.clear()
 
+        quote_book.clear()
+        session_pool.clear()
+        market_report_cache.clear()
+
         # Clear global stream manager
         GlobalStreamManager._user_managers.clear()
 
     def tearDown(self):
         cache.clear()
+        quote_book.clear()
         GlobalStreamManager._user_managers.clear()
         super().tearDown()
 
@@ -194,12 +202,16 @@ class MockDXLinkStreamer:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.close()
 
-    async def subscribe(self, event_type, symbols):
+    async def subscribe(self, event_type, symbols, refresh_interval=0.1):
         """Mock subscription."""
         if event_type not in self.subscriptions:
             self.subscriptions[event_type] = set()
         self.subscriptions[event_type].update(symbols)
 
+    async def unsubscribe(self, event_type, symbols):
+        """Mock unsubscription."""
+        self.subscriptions.get(event_type, set()).difference_update(symbols)
+
     async def listen(self, event_type):
         """Mock listener that yields from queue."""
         while not self.is_closed:
@@ -228,8 +240,10 @@ class StreamingTestPatches:
         self.patches = []
 
     def __enter__(self):
-        # Patch DXLinkStreamer to use our mock
-        dxlink_patch = patch("streaming.services.stream_manager.DXLinkStreamer", MockDXLinkStreamer)
+        # Patch DXLinkStreamer (owned by the shared market data gateway) to use our mock
+        dxlink_patch = patch(
+            "streaming.services.market_data_gateway.DXLinkStreamer", MockDXLinkStreamer
+        )
         self.patches.append(dxlink_patch)
 
         # NOTE: Removed TradingAccount patch - we now create real TradingAccount objects
@@ -4,6 +4,8 @@ Pytest configuration for streaming tests.
 
 import os
 
+import pytest
+
 # Configure Django settings BEFORE any Django imports
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "senextrader.settings.development")
 
@@ -17,3 +19,13 @@ if "FIELD_ENCRYPTION_KEY" not in os.environ:
 import django
 
 django.setup()
+
+
+@pytest.fixture(autouse=True)
+def clear_l1_cache():
+    """Keep in-process L1 payloads from leaking between tests."""
+    from services.core.l1_cache import l1_cache
+
+    l1_cache.clear()
+    yield
+    l1_cache.clear()
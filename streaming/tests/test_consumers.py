@@ -155,6 +155,31 @@ class StreamingConsumerTests(AsyncStreamingTestCase):
 
             await self.disconnect_websocket(communicator)
 
+    async def test_conflated_quotes_forwarding(self):
+        """Test that a conflated quotes_update batch reaches the client as one frame."""
+        with StreamingTestPatches():
+            communicator, user = await self.connect_websocket()
+
+            from channels.layers import get_channel_layer
+
+            from streaming.services.stream_manager import GlobalStreamManager
+
+            user_manager = await GlobalStreamManager().get_user_manager(user.id)
+            quotes = [
+                self.create_test_quote_data("QQQ", 451.25),
+                self.create_test_quote_data("SPY", 601.5),
+            ]
+
+            await get_channel_layer().group_send(
+                user_manager.data_group_name, {"type": "quotes_update", "quotes": quotes}
+            )
+
+            message = await communicator.receive_json_from()
+            assert message["type"] == "quotes_update"
+            assert [quote["symbol"] for quote in message["quotes"]] == ["QQQ", "SPY"]
+
+            await self.disconnect_websocket(communicator)
+
     async def test_multiple_connections_same_user(self):
         """Test multiple WebSocket connections for same user (multi-tab support)."""
         user = await self.acreate_test_user()
@@ -0,0 +1,111 @@
+"""
+Tests for event-driven first-data readiness.
+
+Validates that readiness futures resolve on signal_data_received, that
+ensure_streaming_for_automation returns as soon as data lands (or at once when
+the symbol is already live), and that it still times out without data.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+from services.core.cache import CacheManager
+from services.streaming.quote_book import quote_book
+from streaming.services.stream_manager import UserStreamManager
+from streaming.services.stream_subscription_manager import (
+    DATA_GREEKS,
+    DATA_QUOTE,
+    StreamSubscriptionManager,
+)
+from streaming.tests.base import AsyncStreamingTestCase
+
+
+class DataReadinessTests(AsyncStreamingTestCase):
+    """Tests for StreamSubscriptionManager readiness and automation startup."""
+
+    def _streaming_manager(self) -> UserStreamManager:
+        manager = UserStreamManager(1)
+        manager.is_streaming = True
+        manager.subscribe_to_new_symbols = AsyncMock()
+        return manager
+
+    async def test_readiness_future_resolves_on_first_data(self):
+        subscriptions = StreamSubscriptionManager(1)
+        quote_ready = subscriptions.data_ready("SPY")
+        greeks_ready = subscriptions.data_ready("SPY", DATA_GREEKS)
+
+        subscriptions.signal_data_received("SPY")
+
+        assert quote_ready.done()
+        assert not greeks_ready.done()
+        assert subscriptions.data_ready("SPY").done()  # seen data resolves at once
+        assert not await subscriptions.wait_for_data(["SPY"], (DATA_GREEKS,), timeout=0.01)
+
+        subscriptions.reset_data_readiness()
+        assert not subscriptions.data_ready("SPY", DATA_QUOTE).done()
+
+    async def test_automation_continues_when_data_lands(self):
+        manager = self._streaming_manager()
+        loop = asyncio.get_running_loop()
+        loop.call_later(0.05, manager.subscription_manager.signal_data_received, "QQQ")
+
+        started = loop.time()
+        assert await manager.ensure_streaming_for_automation(["QQQ"])
+
+        assert loop.time() - started < 1
+        manager.subscribe_to_new_symbols.assert_awaited_once_with(["QQQ"])
+
+    async def test_already_live_symbols_are_ready_immediately(self):
+        manager = self._streaming_manager()
+        quote_book.merge("SPY", {"symbol": "SPY", "bid": 500.0, "ask": 500.1}, 60)
+
+        with patch("streaming.services.stream_manager.STREAMING_DATA_WAIT_TIMEOUT", 0):
+            assert await manager.ensure_streaming_for_automation(["SPY"])
+
+    async def test_cached_data_checked_in_one_read(self):
+        manager = self._streaming_manager()
+        quote_book.merge("SPY", {"symbol": "SPY", "bid": 500.0, "ask": 500.1}, 60)
+        cached = {
+            CacheManager.quote("QQQ"): {"symbol": "QQQ", "bid": 400.0},
+            CacheManager.dxfeed_greeks("SPY"): {"delta": 0.5},
+            CacheManager.dxfeed_greeks("QQQ"): {"delta": 0.5},
+        }
+
+        with (
+            patch("services.core.l1_cache.cache") as mock_cache,
+            patch("streaming.services.stream_manager.STREAMING_DATA_WAIT_TIMEOUT", 0),
+        ):
+            mock_cache.get_many.return_value = cached
+            assert await manager.ensure_streaming_for_automation(
+                ["SPY", "QQQ"], (DATA_QUOTE, DATA_GREEKS)
+            )
+
+        # SPY's quote came from the quote book; everything else in one get_many
+        mock_cache.get_many.assert_called_once()
+        assert set(mock_cache.get_many.call_args[0][0]) == set(cached)
+        mock_cache.get.assert_not_called()
+
+    async def test_times_out_without_data(self):
+        manager = self._streaming_manager()
+
+        with patch("streaming.services.stream_manager.STREAMING_DATA_WAIT_TIMEOUT", 0.05):
+            assert not await manager.ensure_streaming_for_automation(["IWM"])
+
+        # The abandoned waiter is dropped; the next caller gets a fresh one
+        assert not manager.subscription_manager._data_waiters
+        waiter = manager.subscription_manager.data_ready("IWM")
+        manager.subscription_manager.signal_data_received("IWM")
+        assert waiter.result() is True
+
+    async def test_timed_out_waiter_kept_while_another_caller_waits(self):
+        subscriptions = StreamSubscriptionManager(1)
+        patient = asyncio.create_task(subscriptions.wait_for_data(["SPY"], timeout=5))
+        await asyncio.sleep(0)
+
+        assert not await subscriptions.wait_for_data(["SPY"], timeout=0.01)
+        assert (DATA_QUOTE, "SPY") in subscriptions._data_waiters
+
+        subscriptions.signal_data_received("SPY")
+        assert await patient
+        assert not subscriptions._data_waiters
+        assert not subscriptions._data_wait_counts
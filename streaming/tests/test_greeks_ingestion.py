@@ -0,0 +1,87 @@
+"""
+Tests for the batched HistoricalGreeks ingestion buffer.
+
+Validates per-second deduplication, bounded backpressure, and that
+flushes upsert rows in batches instead of one write per event.
+"""
+
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+
+from asgiref.sync import sync_to_async
+from tastytrade.dxfeed import Greeks
+
+from streaming.services.greeks_ingestion import GreeksIngestionBuffer
+from streaming.tests.base import AsyncStreamingTestCase
+from trading.models import HistoricalGreeks
+
+STREAMER_SYMBOL = ".SPY251219C600"
+OCC_SYMBOL = "SPY   251219C00600000"
+EVENT_TIME_MS = int(datetime(2025, 11, 3, 15, 30, tzinfo=UTC).timestamp() * 1000)
+
+
+def make_greeks(symbol=STREAMER_SYMBOL, event_time=EVENT_TIME_MS, delta=0.5):
+    event = MagicMock(spec=Greeks)
+    event.event_symbol = symbol
+    event.event_time = event_time
+    event.delta = delta
+    event.gamma = 0.01
+    event.theta = -0.2
+    event.vega = 0.3
+    event.rho = 0.05
+    event.volatility = 0.18
+    return event
+
+
+class GreeksIngestionBufferTests(AsyncStreamingTestCase):
+    """Tests for GreeksIngestionBuffer."""
+
+    async def test_same_second_samples_deduplicate_to_latest(self):
+        buffer = GreeksIngestionBuffer()
+
+        assert buffer.add(make_greeks(delta=0.40))
+        assert buffer.add(make_greeks(event_time=EVENT_TIME_MS + 500, delta=0.45))
+        assert buffer.add(make_greeks(event_time=EVENT_TIME_MS + 1000, delta=0.50))
+
+        assert len(buffer) == 2
+        assert buffer.get_stats()["deduplicated"] == 1
+
+        assert await buffer.flush() == 2
+        rows = await sync_to_async(list)(
+            HistoricalGreeks.objects.filter(option_symbol=OCC_SYMBOL).order_by("timestamp")
+        )
+        assert [str(row.delta) for row in rows] == ["0.4500", "0.5000"]
+        assert rows[0].underlying_symbol == "SPY"
+        assert buffer.get_stats()["batches_written"] == 1
+
+    async def test_flush_updates_existing_rows(self):
+        buffer = GreeksIngestionBuffer()
+        buffer.add(make_greeks(delta=0.40))
+        await buffer.flush()
+
+        buffer.add(make_greeks(delta=0.55))
+        await buffer.flush()
+
+        rows = await sync_to_async(list)(HistoricalGreeks.objects.filter(option_symbol=OCC_SYMBOL))
+        assert len(rows) == 1
+        assert str(rows[0].delta) == "0.5500"
+
+    async def test_full_buffer_drops_new_keys(self):
+        buffer = GreeksIngestionBuffer(max_rows=2)
+
+        assert buffer.add(make_greeks())
+        assert buffer.add(make_greeks(event_time=EVENT_TIME_MS + 1000))
+        assert not buffer.add(make_greeks(event_time=EVENT_TIME_MS + 2000))
+        # Updates to an already buffered second are still accepted
+        assert buffer.add(make_greeks(delta=0.6))
+
+        stats = buffer.get_stats()
+        assert stats["dropped"] == 1
+        assert stats["pending"] == 2
+
+    async def test_unparseable_symbol_is_rejected(self):
+        buffer = GreeksIngestionBuffer()
+
+        assert not buffer.add(make_greeks(symbol="SPY"))
+        assert buffer.get_stats()["invalid"] == 1
+        assert await buffer.flush() == 0
@@ -0,0 +1,177 @@
+"""
+Tests for the shared MarketDataGateway.
+
+Validates symbol reference counting across users, batched quote
+flushes, per-user fan-out, and pool teardown when the last user detaches.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from tastytrade.dxfeed import Quote
+
+from services.core.cache import CacheManager
+from services.core.l1_cache import l1_cache
+from services.streaming.quote_book import quote_book
+from streaming.services.market_data_gateway import GatewayConnection, MarketDataGateway
+from streaming.services.stream_manager import UserStreamManager
+from streaming.tests.base import AsyncStreamingTestCase, MockDXLinkStreamer
+
+
+class MarketDataGatewayTests(AsyncStreamingTestCase):
+    """Tests for MarketDataGateway pooling and fan-out."""
+
+    def _make_manager(self, user_id: int) -> UserStreamManager:
+        manager = UserStreamManager(user_id)
+        manager._broadcast = AsyncMock()
+        return manager
+
+    async def test_shared_symbol_subscribed_once_upstream(self):
+        """Two users watching SPY share one upstream subscription."""
+        gateway = MarketDataGateway()
+        manager_a = self._make_manager(1)
+        manager_b = self._make_manager(2)
+
+        with patch("streaming.services.market_data_gateway.DXLinkStreamer", MockDXLinkStreamer):
+            handle_a = await gateway.attach(manager_a, session=object())
+            handle_b = await gateway.attach(manager_b, session=object())
+
+            streamer = gateway._connections[0].streamer
+            streamer.subscribe = AsyncMock(wraps=streamer.subscribe)
+
+            await handle_a.subscribe(Quote, ["SPY", "QQQ"])
+            await handle_b.subscribe(Quote, ["SPY"])
+
+            assert streamer.subscribe.await_count == 1
+            assert streamer.subscriptions[Quote] == {"SPY", "QQQ"}
+            assert len(gateway._connections) == 1
+
+            stats = gateway.get_stats()
+            assert stats["attached_users"] == 2
+            assert stats["unique_symbols"] == 2
+            assert stats["subscription_refs"] == 3
+
+            await gateway.detach(1)
+            await gateway.detach(2)
+
+    async def test_quote_written_once_and_fanned_out(self):
+        """A quote is merged once, flushed in one batch, and delivered to subscribers."""
+        gateway = MarketDataGateway()
+        manager_a = self._make_manager(1)
+        manager_b = self._make_manager(2)
+        manager_c = self._make_manager(3)
+
+        with patch("streaming.services.market_data_gateway.DXLinkStreamer", MockDXLinkStreamer):
+            handle_a = await gateway.attach(manager_a, session=object())
+            handle_b = await gateway.attach(manager_b, session=object())
+            handle_c = await gateway.attach(manager_c, session=object())
+            await handle_a.subscribe(Quote, ["SPY"])
+            await handle_b.subscribe(Quote, ["SPY"])
+            await handle_c.subscribe(Quote, ["QQQ"])
+
+            with patch(
+                "streaming.services.market_data_gateway.enhanced_cache.set_many",
+                new=AsyncMock(return_value=True),
+            ) as mock_set_many:
+                await gateway._handle_quote_event(self.mock_tastytrade_quote("SPY", 500.0))
+                await gateway._handle_quote_event(self.mock_tastytrade_quote("SPY", 501.0))
+
+                assert round(quote_book.get("SPY")["bid"], 2) == 500.99
+                mock_set_many.assert_not_awaited()
+
+                await gateway.flush_quotes()
+
+            assert mock_set_many.await_count == 1
+            assert list(mock_set_many.await_args.args[0]) == [CacheManager.quote("SPY")]
+            # Same-process readers get the flushed payload from L1, not Redis
+            assert l1_cache.get(CacheManager.quote("SPY"), 1) is quote_book.get("SPY")
+            assert l1_cache.get_stats()["hits"] == 1
+            # Both ticks reach each subscriber, conflated into one broadcast
+            assert manager_a.quote_conflator.quotes_received == 2
+            await manager_a.quote_conflator.flush()
+            await manager_b.quote_conflator.flush()
+            assert manager_a._broadcast.await_count == 1
+            assert manager_b._broadcast.await_count == 1
+            message_type, data = manager_a._broadcast.await_args.args
+            assert message_type == "quotes_update"
+            assert len(data["quotes"]) == 1
+            assert round(data["quotes"][0]["bid"], 2) == 500.99
+            manager_c._broadcast.assert_not_awaited()
+            assert manager_a.has_received_data
+            assert not manager_c.has_received_data
+
+            for user_id in (1, 2, 3):
+                await gateway.detach(user_id)
+
+    async def test_release_unsubscribes_when_last_reference_drops(self):
+        """Upstream unsubscribe happens only after every user releases a symbol."""
+        gateway = MarketDataGateway()
+        manager_a = self._make_manager(1)
+        manager_b = self._make_manager(2)
+
+        with patch("streaming.services.market_data_gateway.DXLinkStreamer", MockDXLinkStreamer):
+            handle_a = await gateway.attach(manager_a, session=object())
+            handle_b = await gateway.attach(manager_b, session=object())
+            await handle_a.subscribe(Quote, ["SPY"])
+            await handle_b.subscribe(Quote, ["SPY"])
+            streamer = gateway._connections[0].streamer
+
+            await handle_a.unsubscribe(Quote, ["SPY"])
+            assert streamer.subscriptions[Quote] == {"SPY"}
+
+            await handle_b.unsubscribe(Quote, ["SPY"])
+            assert streamer.subscriptions[Quote] == set()
+            assert gateway.get_stats()["unique_symbols"] == 0
+
+            await gateway.detach(1)
+            await gateway.detach(2)
+
+    async def test_last_detach_closes_pool(self):
+        """The DXLink pool is torn down once no user is attached."""
+        gateway = MarketDataGateway()
+        manager = self._make_manager(1)
+
+        with patch("streaming.services.market_data_gateway.DXLinkStreamer", MockDXLinkStreamer):
+            handle = await gateway.attach(manager, session=object())
+            streamer = gateway._connections[0].streamer
+
+            await handle.close()
+
+            assert handle.closed
+            assert streamer.is_closed
+            assert gateway.get_stats()["connections"] == []
+
+    async def test_loop_change_cancels_previous_loop_work(self):
+        """Rebinding to a new loop stops the old loop's connections and tasks."""
+        gateway = MarketDataGateway()
+        old_loop = asyncio.new_event_loop()
+        try:
+            conn = GatewayConnection(gateway, session=object(), index=1)
+            conn.task = old_loop.create_task(asyncio.sleep(60))
+            flush_task = old_loop.create_task(asyncio.sleep(60))
+            gateway._loop = old_loop
+            gateway._connections.append(conn)
+            gateway._flush_task = flush_task
+
+            gateway._ensure_loop()
+
+            assert not conn.is_alive
+            assert conn.task.cancelling()
+            assert flush_task.cancelling()
+            assert gateway._connections == []
+            assert gateway._loop is asyncio.get_running_loop()
+        finally:
+            old_loop.close()
+
+    async def test_refuses_to_rebind_while_previous_loop_runs(self):
+        """A gateway still serving another running loop is not silently reset."""
+        gateway = MarketDataGateway()
+        gateway._loop = MagicMock(is_running=MagicMock(return_value=True))
+        conn = GatewayConnection(gateway, session=object(), index=1)
+        gateway._connections.append(conn)
+
+        with pytest.raises(RuntimeError):
+            gateway._ensure_loop()
+
+        assert gateway._connections == [conn]
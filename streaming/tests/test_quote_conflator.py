@@ -0,0 +1,79 @@
+"""
+Tests for conflated WebSocket quote fan-out.
+
+Validates latest-value-per-symbol batching, the flush interval, that
+order/fill events bypass conflation, and the consumer's batched form.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+from streaming.services.quote_conflator import QuoteConflator
+from streaming.services.stream_manager import UserStreamManager
+from streaming.tests.base import AsyncStreamingTestCase
+
+
+class QuoteConflatorTests(AsyncStreamingTestCase):
+    """Tests for QuoteConflator and its UserStreamManager wiring."""
+
+    async def test_ticks_conflate_to_latest_per_symbol(self):
+        send = AsyncMock()
+        conflator = QuoteConflator(send, interval=0.05)
+
+        for price in (500.0, 500.5, 501.0):
+            await conflator.offer("SPY", {"symbol": "SPY", "last": price})
+        await conflator.offer("QQQ", {"symbol": "QQQ", "last": 450.0})
+        send.assert_not_awaited()
+
+        await asyncio.sleep(0.1)
+
+        send.assert_awaited_once()
+        quotes = send.await_args.args[0]
+        assert {quote["symbol"]: quote["last"] for quote in quotes} == {
+            "SPY": 501.0,
+            "QQQ": 450.0,
+        }
+        stats = conflator.get_stats()
+        assert (stats["quotes_received"], stats["quotes_sent"], stats["batches_sent"]) == (4, 2, 1)
+
+    async def test_at_most_one_batch_per_interval(self):
+        send = AsyncMock()
+        conflator = QuoteConflator(send, interval=0.05)
+
+        for i in range(20):
+            await conflator.offer("SPY", {"symbol": "SPY", "last": 500.0 + i})
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.06)
+
+        # ~200ms of ticks at 50ms windows, instead of 20 sends
+        assert 3 <= send.await_count <= 5
+        assert send.await_args.args[0][0]["last"] == 519.0
+        await conflator.close()
+
+    async def test_zero_interval_sends_immediately(self):
+        send = AsyncMock()
+        conflator = QuoteConflator(send, interval=0)
+
+        await conflator.offer("SPY", {"symbol": "SPY", "last": 500.0})
+
+        send.assert_awaited_once_with([{"symbol": "SPY", "last": 500.0}])
+
+    async def test_order_events_bypass_quote_conflation(self):
+        manager = UserStreamManager(1)
+        manager.channel_layer = AsyncMock()
+        manager.quote_conflator.interval = 10
+
+        await manager.on_quote_update("SPY", {"symbol": "SPY", "last": 500.0})
+        await manager._broadcast("order_fill", {"order_id": "1"})
+
+        # The fill went out at once; the quote is still waiting for its window
+        manager.channel_layer.group_send.assert_awaited_once_with(
+            manager.data_group_name, {"type": "order_fill", "order_id": "1"}
+        )
+
+        await manager.quote_conflator.flush()
+        assert manager.channel_layer.group_send.await_args.args[1] == {
+            "type": "quotes_update",
+            "quotes": [{"symbol": "SPY", "last": 500.0}],
+        }
+        await manager.quote_conflator.close()
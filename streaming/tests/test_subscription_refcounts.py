@@ -0,0 +1,165 @@
+"""
+Tests for reference-counted, batched stream subscriptions.
+
+Validates that symbols stay subscribed while any consumer holds them, are
+unsubscribed as soon as the last consumer releases them, that scan probes
+lapse after their TTL, that DXLink calls are chunked, and that open
+position legs stay streamed without a positions page.
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from tastytrade.dxfeed import Quote, Trade
+
+from accounts.models import TradingAccount
+from streaming.services.stream_manager import UserStreamManager
+from streaming.services.stream_subscription_manager import (
+    CONSUMER_POSITIONS,
+    CONSUMER_SCAN,
+    CONSUMER_WATCHLIST,
+    StreamSubscriptionManager,
+)
+from streaming.tests.base import AsyncStreamingTestCase
+from trading.models import Position
+
+MODULE = "streaming.services.stream_subscription_manager"
+
+
+def mock_streamer() -> MagicMock:
+    streamer = MagicMock()
+    streamer.subscribe = AsyncMock()
+    streamer.unsubscribe = AsyncMock()
+    return streamer
+
+
+def unsubscribed(streamer: MagicMock, event_class) -> list[str]:
+    return [
+        symbol
+        for call in streamer.unsubscribe.await_args_list
+        if call.args[0] is event_class
+        for symbol in call.args[1]
+    ]
+
+
+@patch(f"{MODULE}.SUBSCRIPTION_DELAY", 0)
+@patch(f"{MODULE}.CHANNEL_RACE_DELAY", 0)
+class SubscriptionRefcountTests(AsyncStreamingTestCase):
+    """Tests for StreamSubscriptionManager consumers and GC."""
+
+    async def test_symbol_is_unsubscribed_when_last_consumer_releases(self):
+        manager = StreamSubscriptionManager(1)
+        streamer = mock_streamer()
+
+        await manager.subscribe_to_new_symbols(streamer, ["SPY"], True, CONSUMER_WATCHLIST)
+        await manager.subscribe_to_new_symbols(streamer, ["SPY", "QQQ"], True, "suggestion:a")
+
+        assert await manager.release_symbols(streamer, "suggestion:a") == 1
+        assert unsubscribed(streamer, Quote) == ["QQQ"]
+        assert manager.subscribed_symbols == {"SPY"}
+
+        assert await manager.release_symbols(streamer, CONSUMER_WATCHLIST) == 1
+        assert manager.subscribed_symbols == set()
+
+    async def test_scan_probes_lapse_after_ttl(self):
+        manager = StreamSubscriptionManager(1)
+        streamer = mock_streamer()
+
+        await manager.subscribe_to_new_symbols(streamer, ["SPY"], True, CONSUMER_WATCHLIST)
+        with patch.dict(f"{MODULE}.EXPIRING_CONSUMERS", {CONSUMER_SCAN: -1}):
+            await manager.subscribe_to_new_symbols(streamer, ["IWM", "SPY"], True, CONSUMER_SCAN)
+
+        assert await manager.collect_garbage(streamer) == 1
+        assert manager.subscribed_symbols == {"SPY"}
+        assert unsubscribed(streamer, Trade) == ["IWM"]
+
+    async def test_page_consumer_releases_legs_it_no_longer_shows(self):
+        manager = StreamSubscriptionManager(1)
+        streamer = mock_streamer()
+
+        await manager.replace_consumer_symbols(streamer, "page:abc", ["SPY", "QQQ"], True)
+        await manager.replace_consumer_symbols(streamer, "page:abc", ["QQQ", "IWM"], True)
+
+        assert manager.subscribed_symbols == {"QQQ", "IWM"}
+        assert unsubscribed(streamer, Quote) == ["SPY"]
+
+    async def test_subscribe_calls_are_chunked(self):
+        manager = StreamSubscriptionManager(1)
+        streamer = mock_streamer()
+        symbols = ["SPY", "QQQ", "IWM", "DIA", "TLT"]
+
+        with patch(f"{MODULE}.SUBSCRIPTION_BATCH_SIZE", 2):
+            await manager.subscribe_to_new_symbols(streamer, symbols, True, CONSUMER_WATCHLIST)
+
+        quote_calls = [c for c in streamer.subscribe.await_args_list if c.args[0] is Quote]
+        assert [len(c.args[1]) for c in quote_calls] == [2, 2, 1]
+        # Quote, Trade and Summary, three chunks each
+        assert manager.subscribe_calls == 9
+
+    async def test_limit_evicts_expiring_references_only(self):
+        manager = StreamSubscriptionManager(1)
+        streamer = mock_streamer()
+
+        with patch(f"{MODULE}.MAX_SUBSCRIPTIONS", 2):
+            await manager.subscribe_to_new_symbols(streamer, ["SPY"], True, CONSUMER_WATCHLIST)
+            await manager.subscribe_to_new_symbols(streamer, ["IWM"], True, CONSUMER_SCAN)
+            await manager.subscribe_to_new_symbols(streamer, ["QQQ"], True, "suggestion:a")
+
+        assert manager.subscribed_symbols == {"SPY", "QQQ"}
+
+    async def test_stats_report_consumers_and_event_rates(self):
+        manager = StreamSubscriptionManager(1)
+        streamer = mock_streamer()
+
+        await manager.subscribe_to_new_symbols(streamer, ["SPY"], True, CONSUMER_WATCHLIST)
+        await manager.subscribe_to_new_symbols(streamer, ["SPY"], True, "page:abc")
+        for _ in range(3):
+            manager.signal_data_received("SPY")
+
+        stats = manager.get_subscription_stats()
+        assert stats["subscribed"] == 1
+        assert stats["consumers"] == {CONSUMER_WATCHLIST: 1, "page:abc": 1}
+        spy = stats["symbols"]["SPY"]
+        assert spy["ref_count"] == 2
+        assert spy["held"] is True
+        assert spy["events"] == 3
+
+
+@patch(f"{MODULE}.SUBSCRIPTION_DELAY", 0)
+@patch(f"{MODULE}.CHANNEL_RACE_DELAY", 0)
+class PositionSubscriptionTests(AsyncStreamingTestCase):
+    """Tests for the positions consumer on UserStreamManager."""
+
+    async def test_position_legs_stay_subscribed_without_page_sockets(self):
+        user = await self.create_test_user()
+        account = await TradingAccount.objects.aget(user=user)
+        legs = ["SPY   260320P00550000", "SPY   260320P00545000"]
+        position = await Position.objects.acreate(
+            user=user,
+            trading_account=account,
+            symbol="SPY",
+            lifecycle_state="open_full",
+            metadata={"legs": [{"symbol": leg} for leg in legs]},
+        )
+        manager = UserStreamManager(user.id)
+        streamer = mock_streamer()
+        manager.context.data_streamer = streamer
+        manager.is_streaming = True
+        subscriptions = manager.subscription_manager
+        leg_streamer_symbols = {subscriptions.to_streamer_symbol(leg) for leg in legs}
+
+        # A positions page shows the same legs, then its last tab closes
+        await manager.replace_consumer_symbols("page:abc", legs)
+        assert await manager.refresh_position_subscriptions() == 2
+        await manager.release_symbols("page:abc")
+
+        assert subscriptions.subscribed_symbols == leg_streamer_symbols
+        assert subscriptions.consumer_symbols(CONSUMER_POSITIONS) == leg_streamer_symbols
+        streamer.unsubscribe.assert_not_awaited()
+
+        # Closing the position releases its legs on the next refresh
+        position.lifecycle_state = "closed"
+        await position.asave()
+        assert await manager.refresh_position_subscriptions() == 0
+
+        assert subscriptions.subscribed_symbols == set()
+        assert sorted(unsubscribed(streamer, Quote)) == sorted(leg_streamer_symbols)
@@ -45,6 +45,16 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def clear_l1_cache():
+    """Keep in-process L1 payloads from leaking between tests."""
+    from services.core.l1_cache import l1_cache
+
+    l1_cache.clear()
+    yield
+    l1_cache.clear()
+
+
 @pytest.fixture
 def clear_cache():
     """Clear Django cache before and after each test."""
@@ -269,6 +279,16 @@ def allow_async_unsafe():
     os.environ.pop("DJANGO_ALLOW_ASYNC_UNSAFE", None)
 
 
+@pytest.fixture(autouse=True)
+def clear_market_report_cache():
+    """Keep shared market analysis reports from leaking between tests."""
+    from services.market_data.analysis_cache import market_report_cache
+
+    market_report_cache.clear()
+    yield
+    market_report_cache.clear()
+
+
 # Database fixtures
 @pytest.fixture
 def transactional_db():
@@ -0,0 +1,72 @@
+"""Tests for the batched EmailDeliveryQueue."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from services.notifications.email import EmailDeliveryQueue, EmailService
+
+
+@pytest.fixture
+def email_service():
+    return EmailService(default_from_email="test@example.com")
+
+
+def make_connection(sent_to: list[str], fail_first: int = 0):
+    connection = MagicMock()
+    failures = iter(range(fail_first))
+
+    def send_messages(messages):
+        if next(failures, None) is not None:
+            raise ConnectionError("Server disconnected")
+        sent_to.extend(recipient for message in messages for recipient in message.to)
+        return len(messages)
+
+    connection.send_messages.side_effect = send_messages
+    return connection
+
+
+@pytest.mark.asyncio
+async def test_queue_delivers_all_messages_over_reused_connections(email_service):
+    sent_to = []
+    connection = make_connection(sent_to)
+    recipients = [f"user{i}@example.com" for i in range(7)]
+
+    with patch(
+        "services.notifications.email.email_service.get_connection", return_value=connection
+    ) as mock_conn:
+        async with EmailDeliveryQueue(
+            email_service, concurrency=2, max_messages_per_connection=3
+        ) as outbox:
+            for recipient in recipients:
+                outbox.put("Subject", "Body", recipient)
+
+    assert sorted(sent_to) == sorted(recipients)
+    assert outbox.metrics.queued == 7
+    assert outbox.metrics.sent == 7
+    assert outbox.metrics.failed == 0
+    # Far fewer connections than messages; each worker reconnects every 3 messages
+    assert 2 <= mock_conn.call_count < len(recipients)
+    assert outbox.metrics.connections == mock_conn.call_count
+    assert connection.close.call_count == mock_conn.call_count
+
+
+@pytest.mark.asyncio
+async def test_queue_reconnects_and_retries_after_error(email_service):
+    sent_to = []
+    connection = make_connection(sent_to, fail_first=1)
+
+    with (
+        patch(
+            "services.notifications.email.email_service.get_connection", return_value=connection
+        ) as mock_conn,
+        patch("services.notifications.email.email_service.time.sleep"),
+    ):
+        async with EmailDeliveryQueue(email_service, concurrency=1) as outbox:
+            outbox.put("Subject", "Body", "user1@example.com")
+            outbox.put("Subject", "Body", "user2@example.com")
+
+    assert sent_to == ["user1@example.com", "user2@example.com"]
+    assert outbox.metrics.sent == 2
+    assert outbox.metrics.retries == 1
+    assert mock_conn.call_count == 2
@@ -122,18 +122,23 @@ class TestEmailService:
             mock_send.assert_called_once()
 
     def test_send_batch_success(self, email_service):
-        """Test batch email sending."""
+        """Test batch email sending reuses one connection."""
         emails = [
             {"subject": "Email 1", "body": "Body 1", "recipient": "user1@example.com"},
             {"subject": "Email 2", "body": "Body 2", "recipient": "user2@example.com"},
             {"subject": "Email 3", "body": "Body 3", "recipient": "user3@example.com"},
         ]
 
-        with patch("services.notifications.email.email_service.django_send_mail"):
+        with patch("services.notifications.email.email_service.get_connection") as mock_conn:
+            mock_conn.return_value.send_messages.return_value = 1
             results = email_service.send_batch(emails)
 
             assert results["sent"] == 3
             assert results["failed"] == 0
+            assert results["connections"] == 1
+            mock_conn.assert_called_once()
+            assert mock_conn.return_value.send_messages.call_count == 3
+            mock_conn.return_value.close.assert_called_once()
 
     def test_send_batch_partial_failure(self, email_service):
         """Test batch sending with some failures."""
@@ -142,20 +147,23 @@ class TestEmailService:
             {"subject": "Email 2", "body": "Body 2", "recipient": "user2@example.com"},
         ]
 
-        with patch("services.notifications.email.email_service.django_send_mail") as mock_send:
+        with patch("services.notifications.email.email_service.get_connection") as mock_conn:
             with patch("services.notifications.email.email_service.time.sleep"):
                 # First email fails all retries, second succeeds
-                mock_send.side_effect = [
+                mock_conn.return_value.send_messages.side_effect = [
                     Exception("Fail"),
                     Exception("Fail"),
                     Exception("Fail"),
-                    None,
+                    1,
                 ]
 
                 results = email_service.send_batch(emails, fail_silently=True)
 
                 assert results["sent"] == 1
                 assert results["failed"] == 1
+                assert results["retries"] == 2
+                # Every failed attempt drops the connection and the next one reconnects
+                assert results["connections"] == 4
 
     @pytest.mark.asyncio
     async def test_asend_batch_success(self, email_service):
@@ -165,7 +173,8 @@ class TestEmailService:
             {"subject": "Email 2", "body": "Body 2", "recipient": "user2@example.com"},
         ]
 
-        with patch("services.notifications.email.email_service.django_send_mail"):
+        with patch("services.notifications.email.email_service.get_connection") as mock_conn:
+            mock_conn.return_value.send_messages.return_value = 1
             results = await email_service.asend_batch(emails)
 
             assert results["sent"] == 2
@@ -0,0 +1,96 @@
+"""
+Tests for the shared MarketConditionReport cache.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from services.market_data.analysis import MarketAnalyzer, MarketConditionReport
+from services.market_data.analysis_cache import MarketReportCache, market_report_cache
+
+
+def make_factory(calls: list, delay: float = 0.01, stale: bool = False):
+    async def factory(symbol):
+        calls.append(symbol)
+        await asyncio.sleep(delay)
+        return MarketConditionReport(symbol=symbol, current_price=500.0, is_data_stale=stale)
+
+    return factory
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_computation():
+    cache = MarketReportCache()
+    calls = []
+    factory = make_factory(calls)
+
+    reports = await asyncio.gather(*(cache.get_or_compute("SPY", factory) for _ in range(5)))
+    again = await cache.get_or_compute("spy", factory)
+
+    assert calls == ["SPY"]
+    assert all(report.current_price == 500.0 for report in reports)
+    # Each caller gets its own copy
+    assert len({id(report) for report in [*reports, again]}) == 6
+    stats = cache.get_stats()
+    assert (stats["misses"], stats["coalesced"], stats["hits"]) == (1, 4, 1)
+
+
+@pytest.mark.asyncio
+async def test_expired_stale_and_failed_reports_are_recomputed():
+    calls = []
+
+    expiring = MarketReportCache(ttl=0)
+    await expiring.get_or_compute("QQQ", make_factory(calls))
+    await expiring.get_or_compute("QQQ", make_factory(calls))
+
+    stale = MarketReportCache()
+    await stale.get_or_compute("IWM", make_factory(calls, stale=True))
+    await stale.get_or_compute("IWM", make_factory(calls, stale=True))
+
+    failing = MarketReportCache()
+    with pytest.raises(RuntimeError):
+        await failing.get_or_compute("DIA", AsyncMock(side_effect=RuntimeError("api down")))
+    await failing.get_or_compute("DIA", make_factory(calls))
+
+    assert calls == ["QQQ", "QQQ", "IWM", "IWM", "DIA"]
+
+
+@pytest.mark.asyncio
+async def test_prefetch_dedupes_symbols_and_skips_failures():
+    cache = MarketReportCache()
+    calls = []
+    ok = make_factory(calls)
+
+    async def factory(symbol):
+        if symbol == "BAD":
+            raise ValueError("no data")
+        return await ok(symbol)
+
+    reports = await cache.prefetch(["SPY", "qqq", "SPY", "BAD"], factory, concurrency=2)
+
+    assert set(reports) == {"SPY", "QQQ"}
+    assert sorted(calls) == ["QQQ", "SPY"]
+    assert cache.get("qqq") is not None
+
+
+@pytest.mark.asyncio
+async def test_analyzer_shares_reports_across_users():
+    calls = []
+    factory = make_factory(calls)
+
+    async def compute(user, symbol, snapshot):
+        return await factory(symbol)
+
+    with patch.object(MarketAnalyzer, "_a_compute_market_conditions", side_effect=compute):
+        first = await MarketAnalyzer().a_analyze_market_conditions("user-a", "SPY", {})
+        second = await MarketAnalyzer().a_analyze_market_conditions("user-b", "SPY")
+        # An explicit snapshot changes the analysis, so it bypasses the cache
+        await MarketAnalyzer().a_analyze_market_conditions(
+            "user-c", "SPY", {"is_range_bound": True}
+        )
+
+    assert first.current_price == second.current_price == 500.0
+    assert calls == ["SPY", "SPY"]
+    assert market_report_cache.get_stats()["hits"] == 1
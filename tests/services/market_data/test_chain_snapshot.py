@@ -0,0 +1,129 @@
+"""
+Tests for the compact option chain snapshot.
+"""
+
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from services.market_data.chain_snapshot import (
+    ExpirationStrikes,
+    OptionChainSnapshot,
+    nearest_strike,
+)
+
+FEB = date(2025, 2, 21)
+MAR = date(2025, 3, 21)
+
+
+def make_strike(price, put=True, call=True):
+    return SimpleNamespace(
+        strike_price=Decimal(str(price)),
+        put=f"SPY P{price}" if put else None,
+        call=f"SPY C{price}" if call else None,
+        put_streamer_symbol=f".SPYP{price}" if put else None,
+        call_streamer_symbol=f".SPYC{price}" if call else None,
+    )
+
+
+@pytest.fixture
+def snapshot():
+    chain = SimpleNamespace(
+        expirations=[
+            SimpleNamespace(
+                expiration_date=MAR,
+                strikes=[make_strike(p) for p in (505, 495, 500)],
+            ),
+            SimpleNamespace(
+                expiration_date=FEB,
+                strikes=[
+                    make_strike(490),
+                    make_strike(492.5, call=False),
+                    make_strike(495),
+                    make_strike(497.5, put=False),
+                    make_strike(500),
+                ],
+            ),
+        ]
+    )
+    return OptionChainSnapshot.from_nested_chains("SPY", [chain], fetched_at="2025-01-02")
+
+
+def test_round_trip_decodes_expirations_lazily(snapshot):
+    restored = OptionChainSnapshot.from_bytes(snapshot.to_bytes())
+
+    assert restored.symbol == "SPY"
+    assert restored.fetched_at == "2025-01-02"
+    assert restored.expirations == [FEB, MAR]
+    assert restored._decoded == {}
+
+    mar = restored.expiration(MAR)
+    assert list(restored._decoded) == [MAR]
+    assert mar.put_strikes() == [Decimal("495"), Decimal("500"), Decimal("505")]
+    assert restored.expiration(date(2025, 4, 17)) is None
+
+
+def test_unreadable_payload_is_a_miss():
+    assert OptionChainSnapshot.from_bytes(b"\x00garbage") is None
+
+
+def test_sides_only_list_strikes_with_that_option(snapshot):
+    feb = snapshot.expiration(FEB)
+
+    assert feb.put_strikes() == [Decimal(s) for s in ("490", "492.5", "495", "500")]
+    assert feb.call_strikes() == [Decimal(s) for s in ("490", "495", "497.5", "500")]
+    assert feb.has_strike(Decimal("492.5"), "put")
+    assert not feb.has_strike(Decimal("492.5"), "call")
+    assert feb.symbols_for(Decimal("497.5"), "call") == ("SPY C497.5", ".SPYC497.5")
+    assert feb.symbols_for(Decimal("497.5"), "put") == (None, None)
+
+
+def test_nearest_and_offset_strike(snapshot):
+    feb = snapshot.expiration(FEB)
+
+    assert feb.nearest_strike(Decimal("493")) == Decimal("492.5")
+    assert feb.nearest_strike(Decimal("493"), "call") == Decimal("495")
+    # Ties resolve to the lower strike
+    assert feb.nearest_strike(Decimal("491.25"), "put") == Decimal("490")
+    assert feb.nearest_strike(Decimal("600")) == Decimal("500")
+    assert feb.offset_strike(Decimal("495"), -5, "put") == Decimal("490")
+    assert feb.offset_strike(Decimal("495"), 2.5, "call") == Decimal("497.5")
+
+
+def test_iter_by_delta_walks_from_far_otm(snapshot):
+    feb = snapshot.expiration(FEB)
+
+    assert list(feb.iter_by_delta("put"))[0] == Decimal("490")
+    assert list(feb.iter_by_delta("call"))[0] == Decimal("500")
+
+
+def test_to_strike_dicts_matches_legacy_format(snapshot):
+    strikes = snapshot.expiration(FEB).to_strike_dicts()
+
+    assert strikes[1] == {
+        "strike_price": "492.5",
+        "call": None,
+        "put": "SPY P492.5",
+        "call_streamer_symbol": None,
+        "put_streamer_symbol": ".SPYP492.5",
+    }
+    assert [s["strike_price"] for s in strikes] == ["490.0", "492.5", "495.0", "497.5", "500.0"]
+
+
+def test_from_rows_deduplicates_and_sorts():
+    strikes = ExpirationStrikes.from_rows(
+        FEB, [(Decimal("510"), "P", "C", None, None), (Decimal("505"), "P", None, None, None)]
+    )
+
+    assert strikes.strikes.tolist() == [505.0, 510.0]
+    assert strikes.calls == [None, "C"]
+
+
+def test_nearest_strike_helper():
+    strikes = [Decimal("100"), Decimal("105"), Decimal("110")]
+
+    assert nearest_strike(strikes, Decimal("103")) == Decimal("105")
+    assert nearest_strike(strikes, Decimal("102.5")) == Decimal("100")
+    assert nearest_strike([], Decimal("100")) is None
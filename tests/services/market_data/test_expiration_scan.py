@@ -0,0 +1,109 @@
+"""
+Tests for the concurrent expiration scan behind find_expiration_with_optimal_strikes.
+"""
+
+import asyncio
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from django.utils import timezone
+
+import pytest
+
+from services.market_data.utils.expiration_utils import (
+    find_expiration_with_optimal_strikes,
+    first_passing_expiration,
+)
+
+EXPIRATIONS = [date(2026, 3, 20), date(2026, 3, 13), date(2026, 3, 6)]
+
+
+def make_evaluate(passing: set[date], delays: dict[date, float], calls: list):
+    async def evaluate(expiration):
+        calls.append(expiration)
+        await asyncio.sleep(delays.get(expiration, 0))
+        return f"strikes@{expiration}" if expiration in passing else None
+
+    return evaluate
+
+
+@pytest.mark.asyncio
+async def test_preferred_passing_expiration_wins_over_faster_ones():
+    calls = []
+    # The shortest expiration passes first, but the preferred (longest) one passes too
+    evaluate = make_evaluate(
+        passing={EXPIRATIONS[0], EXPIRATIONS[2]},
+        delays={EXPIRATIONS[0]: 0.05},
+        calls=calls,
+    )
+
+    result = await first_passing_expiration(EXPIRATIONS, evaluate, concurrency=3)
+
+    assert result == (EXPIRATIONS[0], f"strikes@{EXPIRATIONS[0]}")
+    assert sorted(calls) == sorted(EXPIRATIONS)
+
+
+@pytest.mark.asyncio
+async def test_sequential_mode_stops_at_first_pass():
+    calls = []
+    evaluate = make_evaluate(passing={EXPIRATIONS[1], EXPIRATIONS[2]}, delays={}, calls=calls)
+
+    result = await first_passing_expiration(EXPIRATIONS, evaluate, concurrency=1)
+
+    assert result == (EXPIRATIONS[1], f"strikes@{EXPIRATIONS[1]}")
+    assert calls == EXPIRATIONS[:2]
+
+
+@pytest.mark.asyncio
+async def test_no_passing_expiration_returns_none():
+    calls = []
+    evaluate = make_evaluate(passing=set(), delays={}, calls=calls)
+
+    assert await first_passing_expiration(EXPIRATIONS, evaluate) is None
+    assert len(calls) == len(EXPIRATIONS)
+
+
+@pytest.mark.asyncio
+async def test_optimal_strikes_picks_longest_passing_expiration():
+    today = timezone.now().date()
+    expirations = [today + timedelta(days=dte) for dte in (31, 38, 45)]
+    chains = {
+        expiration: {"strikes": [{"strike_price": dte, "put": f"P{dte}"}]}
+        for dte, expiration in zip((31, 38, 45), expirations, strict=True)
+    }
+
+    async def get_chain(symbol, expiration):
+        # Longer expirations answer last
+        await asyncio.sleep((expiration - today).days / 1000)
+        return chains[expiration]
+
+    options_service = MagicMock()
+    options_service._get_option_chain = AsyncMock(side_effect=get_chain)
+    optimizer = MagicMock()
+    # The 45 DTE chain fails the quality gate; 38 and 31 pass
+    optimizer.find_optimal_spread_strikes.side_effect = lambda available_strikes, **kwargs: (
+        None if available_strikes == [Decimal("45")] else {"short_put": available_strikes[0]}
+    )
+    criteria = {
+        "spread_type": "bull_put",
+        "otm_pct": 0.03,
+        "spread_width": 5,
+        "current_price": Decimal("450"),
+    }
+
+    with (
+        patch(
+            "services.market_data.option_chains.OptionChainService.a_get_all_expirations",
+            new=AsyncMock(return_value=expirations),
+        ),
+        patch(
+            "services.streaming.options_service.StreamingOptionsDataService",
+            return_value=options_service,
+        ),
+        patch("services.strategies.utils.strike_optimizer.StrikeOptimizer", return_value=optimizer),
+    ):
+        result = await find_expiration_with_optimal_strikes(MagicMock(), "SPY", criteria)
+
+    assert result == (expirations[1], {"short_put": Decimal("38")}, chains[expirations[1]])
+    assert options_service._get_option_chain.await_count == 3
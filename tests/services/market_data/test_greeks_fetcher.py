@@ -81,17 +81,19 @@ class TestFetchGreeks:
             "SPY   251219P00575000",
         ]
 
-        with patch("django.core.cache.cache.get", return_value=None):
-            with patch("django.core.cache.cache.set"):
+        with patch("django.core.cache.cache.get_many", return_value={}):
+            with patch("django.core.cache.cache.set_many"):
                 with patch.object(
-                    fetcher, "_read_streaming_greeks"
+                    fetcher, "_read_streaming_greeks_many"
                 ) as mock_streaming:
                     mock_streaming.return_value = {
-                        "delta": -0.25,
-                        "gamma": 0.02,
-                        "theta": -0.15,
-                        "vega": 0.30,
-                        "rho": -0.05,
+                        occ_symbols[0]: {
+                            "delta": -0.25,
+                            "gamma": 0.02,
+                            "theta": -0.15,
+                            "vega": 0.30,
+                            "rho": -0.05,
+                        }
                     }
 
                     with patch.object(fetcher, "_ensure_subscription", new_callable=AsyncMock):
@@ -125,12 +127,12 @@ class TestFetchGreeks:
             "SPY   251219P00575000",
         ]
 
-        with patch("django.core.cache.cache.get", return_value=None):
-            with patch("django.core.cache.cache.set"):
+        with patch("django.core.cache.cache.get_many", return_value={}):
+            with patch("django.core.cache.cache.set_many"):
                 with patch.object(
-                    fetcher, "_read_streaming_greeks"
+                    fetcher, "_read_streaming_greeks_many"
                 ) as mock_streaming:
-                    mock_streaming.return_value = {"delta": -0.25}
+                    mock_streaming.return_value = {}
 
                     with patch.object(fetcher, "_ensure_subscription", new_callable=AsyncMock):
                         await fetcher.fetch_greeks(
@@ -139,8 +141,8 @@ class TestFetchGreeks:
                             occ_symbols=occ_symbols,
                         )
 
-                        # Should only call for unique symbols (2, not 3)
-                        assert mock_streaming.call_count == 2
+                        # One batch read for the unique symbols (2, not 3)
+                        mock_streaming.assert_called_once_with(occ_symbols[1:])
 
 
 # =============================================================================
@@ -169,11 +171,11 @@ class TestGreeksFetcherCache:
         occ_symbol = "SPY   251219P00580000"
         cached_greeks = {"delta": -0.25, "gamma": 0.02}
 
-        with patch("django.core.cache.cache.get") as mock_cache_get:
-            mock_cache_get.return_value = cached_greeks
+        with patch("django.core.cache.cache.get_many") as mock_cache_get:
+            mock_cache_get.return_value = {f"greeks_fetcher:{occ_symbol}": cached_greeks}
 
             with patch.object(
-                fetcher, "_read_streaming_greeks"
+                fetcher, "_read_streaming_greeks_many"
             ) as mock_streaming:
                 result = await fetcher.fetch_greeks(
                     symbol="SPY",
@@ -191,15 +193,15 @@ class TestGreeksFetcherCache:
         occ_symbol = "SPY   251219P00580000"
         fresh_greeks = {"delta": -0.30, "gamma": 0.03}
 
-        with patch("django.core.cache.cache.get") as mock_cache_get:
-            mock_cache_get.return_value = None  # Cache miss
+        with patch("django.core.cache.cache.get_many") as mock_cache_get:
+            mock_cache_get.return_value = {}  # Cache miss
 
             with patch.object(
-                fetcher, "_read_streaming_greeks"
+                fetcher, "_read_streaming_greeks_many"
             ) as mock_streaming:
-                mock_streaming.return_value = fresh_greeks
+                mock_streaming.return_value = {occ_symbol: fresh_greeks}
 
-                with patch("django.core.cache.cache.set") as mock_cache_set:
+                with patch("django.core.cache.cache.set_many") as mock_cache_set:
                     result = await fetcher.fetch_greeks(
                         symbol="SPY",
                         expiration=date(2025, 12, 19),
@@ -216,9 +218,9 @@ class TestGreeksFetcherCache:
         """Cache should use configured TTL."""
         occ_symbol = "SPY   251219P00580000"
 
-        with patch("django.core.cache.cache.get", return_value=None), patch.object(
-            fetcher, "_read_streaming_greeks", return_value={"delta": -0.25}
-        ), patch("django.core.cache.cache.set") as mock_cache_set:
+        with patch("django.core.cache.cache.get_many", return_value={}), patch.object(
+            fetcher, "_read_streaming_greeks_many", return_value={occ_symbol: {"delta": -0.25}}
+        ), patch("django.core.cache.cache.set_many") as mock_cache_set:
             await fetcher.fetch_greeks(
                 symbol="SPY",
                 expiration=date(2025, 12, 19),
@@ -227,7 +229,7 @@ class TestGreeksFetcherCache:
 
             # Verify TTL is passed (90 seconds)
             call_args = mock_cache_set.call_args
-            assert call_args[0][2] == 90  # Third arg is TTL
+            assert call_args[0][1] == 90  # Second arg is TTL
 
 
 # =============================================================================
@@ -257,13 +259,13 @@ class TestMarketStressBypass:
         cached_greeks = {"delta": -0.25, "source": "cached"}
         fresh_greeks = {"delta": -0.30, "source": "fresh"}
 
-        with patch("django.core.cache.cache.get") as mock_cache_get:
-            mock_cache_get.return_value = cached_greeks
+        with patch("django.core.cache.cache.get_many") as mock_cache_get:
+            mock_cache_get.return_value = {f"greeks_fetcher:{occ_symbol}": cached_greeks}
 
-            with patch("django.core.cache.cache.set"), patch.object(
-                fetcher, "_read_streaming_greeks"
+            with patch("django.core.cache.cache.set_many"), patch.object(
+                fetcher, "_read_streaming_greeks_many"
             ) as mock_streaming:
-                mock_streaming.return_value = fresh_greeks
+                mock_streaming.return_value = {occ_symbol: fresh_greeks}
 
                 with patch.object(fetcher, "_ensure_subscription", new_callable=AsyncMock):
                     result = await fetcher.fetch_greeks(
@@ -283,11 +285,11 @@ class TestMarketStressBypass:
         occ_symbol = "SPY   251219P00580000"
         cached_greeks = {"delta": -0.25, "source": "cached"}
 
-        with patch("django.core.cache.cache.get") as mock_cache_get:
-            mock_cache_get.return_value = cached_greeks
+        with patch("django.core.cache.cache.get_many") as mock_cache_get:
+            mock_cache_get.return_value = {f"greeks_fetcher:{occ_symbol}": cached_greeks}
 
             with patch.object(
-                fetcher, "_read_streaming_greeks"
+                fetcher, "_read_streaming_greeks_many"
             ) as mock_streaming:
                 with patch.object(fetcher, "_ensure_subscription", new_callable=AsyncMock):
                     result = await fetcher.fetch_greeks(
@@ -307,11 +309,11 @@ class TestMarketStressBypass:
         occ_symbol = "SPY   251219P00580000"
         cached_greeks = {"delta": -0.25}
 
-        with patch("django.core.cache.cache.get") as mock_cache_get:
-            mock_cache_get.return_value = cached_greeks
+        with patch("django.core.cache.cache.get_many") as mock_cache_get:
+            mock_cache_get.return_value = {f"greeks_fetcher:{occ_symbol}": cached_greeks}
 
             with patch.object(
-                fetcher, "_read_streaming_greeks"
+                fetcher, "_read_streaming_greeks_many"
             ) as mock_streaming:
                 with patch.object(fetcher, "_ensure_subscription", new_callable=AsyncMock):
                     result = await fetcher.fetch_greeks(
@@ -354,15 +356,15 @@ class TestGreeksFallback:
             "age_seconds": 300,
         }
 
-        with patch("django.core.cache.cache.get", return_value=None):
-            with patch("django.core.cache.cache.set"):
+        with patch("django.core.cache.cache.get_many", return_value={}):
+            with patch("django.core.cache.cache.set_many"):
                 with patch.object(
-                    fetcher, "_read_streaming_greeks", return_value=None
+                    fetcher, "_read_streaming_greeks_many", return_value={}
                 ):
                     with patch.object(
-                        fetcher, "_read_historical_greeks"
+                        fetcher, "_read_historical_greeks_many"
                     ) as mock_historical:
-                        mock_historical.return_value = historical_greeks
+                        mock_historical.return_value = {occ_symbol: historical_greeks}
 
                         with patch.object(fetcher, "_ensure_subscription", new_callable=AsyncMock):
                             result = await fetcher.fetch_greeks(
@@ -379,10 +381,10 @@ class TestGreeksFallback:
         """No streaming or historical data should skip symbol in result."""
         occ_symbol = "SPY   251219P00580000"
 
-        with patch("django.core.cache.cache.get", return_value=None), patch.object(
-            fetcher, "_read_streaming_greeks", return_value=None
+        with patch("django.core.cache.cache.get_many", return_value={}), patch.object(
+            fetcher, "_read_streaming_greeks_many", return_value={}
         ), patch.object(
-            fetcher, "_read_historical_greeks", return_value=None
+            fetcher, "_read_historical_greeks_many", return_value={}
         ), patch.object(fetcher, "_ensure_subscription", new_callable=AsyncMock):
             result = await fetcher.fetch_greeks(
                 symbol="SPY",
@@ -393,6 +395,27 @@ class TestGreeksFallback:
             # Symbol not in result when no data available
             assert occ_symbol not in result
 
+    @pytest.mark.asyncio
+    async def test_fetch_historical_greeks_reads_database_once(self, fetcher):
+        """Historical-only fallback skips the cache and streaming reads."""
+        occ_symbols = ["SPY   251219P00580000", "SPY   251219P00575000"]
+
+        with (
+            patch("django.core.cache.cache.get_many") as mock_get_many,
+            patch.object(fetcher, "_read_streaming_greeks_many") as mock_streaming,
+            patch.object(
+                fetcher,
+                "_read_historical_greeks_many",
+                return_value={occ_symbols[0]: {"delta": -0.28}},
+            ) as mock_historical,
+        ):
+            result = await fetcher.fetch_historical_greeks([*occ_symbols, occ_symbols[0]])
+
+        mock_historical.assert_called_once_with(occ_symbols)
+        mock_get_many.assert_not_called()
+        mock_streaming.assert_not_called()
+        assert result == {occ_symbols[0]: {"delta": -0.28}}
+
 
 # =============================================================================
 # Data Format Tests
@@ -421,7 +444,7 @@ class TestGreeksDataFormat:
             source="streaming",
         )
 
-        result = GreeksFetcher._serialize_snapshot(snapshot)
+        result = GreeksFetcher.serialize_snapshot(snapshot)
 
         assert result["delta"] == -0.25
         assert result["gamma"] == 0.02
@@ -450,7 +473,7 @@ class TestGreeksDataFormat:
             source="streaming",
         )
 
-        result = GreeksFetcher._serialize_snapshot(snapshot)
+        result = GreeksFetcher.serialize_snapshot(snapshot)
 
         assert result["delta"] == -0.25
         assert result["gamma"] is None
@@ -0,0 +1,117 @@
+"""
+Tests for the fused technical indicator kernel and per-symbol indicator records.
+"""
+
+from datetime import date, timedelta
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from services.market_data import indicators as indicators_module
+from services.market_data.indicator_kernel import PriceBars, compute_indicators
+from services.market_data.indicators import INDICATOR_RECORD_TYPE, TechnicalIndicatorCalculator
+from trading.models import TechnicalIndicatorCache
+
+pytestmark = pytest.mark.usefixtures("clear_cache")
+
+
+def make_rows(count: int, seed: int = 7, start: date = date(2025, 1, 2)) -> list[dict]:
+    rng = np.random.default_rng(seed)
+    closes = 100 + np.cumsum(rng.normal(0, 1, count))
+    return [
+        {
+            "date": start + timedelta(days=i),
+            "open": close - 0.5,
+            "high": close + rng.uniform(0, 2),
+            "low": close - rng.uniform(0, 2),
+            "close": close,
+        }
+        for i, close in enumerate(closes)
+    ]
+
+
+def test_kernel_matches_pandas_reference():
+    rows = make_rows(60)
+    df = pd.DataFrame(rows)
+    close = df["close"]
+
+    result = compute_indicators(PriceBars.from_rows(rows))
+
+    delta = close.diff()
+    gain = delta.where(delta > 0, 0).rolling(14).mean().iloc[-1]
+    loss = (-delta.where(delta < 0, 0)).rolling(14).mean().iloc[-1]
+    assert result["rsi"] == pytest.approx(100 - 100 / (1 + gain / loss))
+
+    macd = close.ewm(span=12).mean() - close.ewm(span=26).mean()
+    histogram = macd - macd.ewm(span=9).mean()
+    assert result["macd_histogram"] == pytest.approx(histogram.iloc[-1])
+
+    std = close.rolling(20).std().iloc[-1]
+    assert result["bollinger_upper"] == pytest.approx(close.rolling(20).mean().iloc[-1] + 2 * std)
+    assert result["sma_20"] == pytest.approx(close.tail(20).mean())
+    assert result["support_level"] == pytest.approx(df["low"].tail(20).min())
+    assert result["open_price"] == pytest.approx(rows[-1]["open"])
+
+
+def test_kernel_without_high_low_skips_adx():
+    rows = [{"date": row["date"], "close": row["close"]} for row in make_rows(30)]
+
+    result = compute_indicators(PriceBars.from_rows(rows))
+
+    assert result["adx"] is None
+    assert result["support_level"] is None
+    assert result["recent_move_pct"] == 0.0
+    assert result["open_price"] == result["current_price"]
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+async def test_batch_computes_once_and_stores_one_record_per_symbol():
+    history = {"SPY": make_rows(60, seed=1), "QQQ": make_rows(60, seed=2), "NEW": make_rows(5)}
+    calculator = TechnicalIndicatorCalculator()
+
+    with (
+        patch.object(
+            calculator,
+            "_get_market_data",
+            new=AsyncMock(side_effect=lambda user, symbol, days_back: history[symbol]),
+        ),
+        patch.object(indicators_module, "compute_indicators", wraps=compute_indicators) as kernel,
+    ):
+        first = await calculator.a_calculate_indicators_many(None, ["SPY", "QQQ", "NEW", "SPY"])
+        second = await calculator.a_calculate_indicators(None, "QQQ", {})
+
+    assert list(first) == ["SPY", "QQQ", "NEW"]
+    assert first["SPY"]["data_available"] is True
+    assert first["NEW"]["data_available"] is False
+    assert second == first["QQQ"]
+    assert kernel.call_count == 2
+
+    records = [
+        record
+        async for record in TechnicalIndicatorCache.objects.filter(
+            indicator_type=INDICATOR_RECORD_TYPE
+        )
+    ]
+    assert sorted(record.symbol for record in records) == ["QQQ", "SPY"]
+    assert all(record.data["bar_date"] == str(history["SPY"][-1]["date"]) for record in records)
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+async def test_new_bar_invalidates_stored_record():
+    rows = make_rows(60)
+    calculator = TechnicalIndicatorCalculator()
+    market_data = AsyncMock(return_value=rows)
+
+    with (
+        patch.object(calculator, "_get_market_data", new=market_data),
+        patch.object(indicators_module, "compute_indicators", wraps=compute_indicators) as kernel,
+    ):
+        await calculator.a_calculate_indicators(None, "SPY", {})
+        market_data.return_value = [*rows[1:], {**rows[-1], "date": date(2025, 3, 31)}]
+        await calculator.a_calculate_indicators(None, "SPY", {})
+
+    assert kernel.call_count == 2
@@ -0,0 +1,173 @@
+"""
+Tests for watermark-based incremental order history and transaction sync.
+"""
+
+from datetime import timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+import pytest
+from asgiref.sync import sync_to_async
+
+from accounts.models import TradingAccount
+from services.orders.history import OrderHistoryService
+from services.orders.transactions import TransactionImporter
+from services.orders.watermarks import ORDERS_STREAM, transactions_stream
+from trading.models import BrokerSyncWatermark, TastyTradeOrderHistory, TastyTradeTransaction
+
+User = get_user_model()
+
+
+def make_order(order_id, status="Filled", received_at=None, price="1.50"):
+    received_at = received_at or timezone.now()
+    return SimpleNamespace(
+        id=order_id,
+        underlying_symbol="SPY",
+        order_type="Limit",
+        status=status,
+        price=Decimal(price),
+        price_effect=SimpleNamespace(value="Credit"),
+        received_at=received_at,
+        updated_at=received_at,
+        legs=[],
+    )
+
+
+def make_transaction(tx_id, executed_at):
+    return SimpleNamespace(
+        id=tx_id,
+        order_id=1000 + tx_id,
+        transaction_type="Trade",
+        transaction_sub_type="Sell to Open",
+        description="Sold 1 SPY put",
+        action="Sell to Open",
+        value=Decimal("150"),
+        net_value=Decimal("149"),
+        symbol="SPY   251107P00590000",
+        underlying_symbol="SPY",
+        instrument_type="Equity Option",
+        quantity=Decimal("1"),
+        price=Decimal("1.50"),
+        executed_at=executed_at,
+    )
+
+
+@pytest.fixture
+def account(db):
+    user = User.objects.create_user(
+        email="sync@example.com", username="syncuser", password="testpass123"
+    )
+    return TradingAccount.objects.create(
+        user=user,
+        account_number="5WT00001",
+        connection_type="TASTYTRADE",
+        is_primary=True,
+        is_active=True,
+    )
+
+
+def patch_broker(tt_account):
+    session = Mock()
+    return (
+        patch(
+            "services.core.data_access.get_oauth_session",
+            AsyncMock(return_value=session),
+        ),
+        patch("tastytrade.Account.a_get", AsyncMock(return_value=tt_account), create=True),
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+async def test_order_sync_resumes_from_watermark_and_skips_unchanged(account):
+    service = OrderHistoryService()
+    now = timezone.now()
+    orders = [make_order("1001", received_at=now - timedelta(days=3)), make_order("1002")]
+
+    tt_account = Mock()
+    tt_account.a_get_order_history = AsyncMock(return_value=orders)
+    session_patch, account_patch = patch_broker(tt_account)
+    with session_patch, account_patch:
+        first = await service.sync_order_history(account, days_back=30)
+
+        orders[1] = make_order("1002", price="1.75")
+        orders.append(make_order("1003"))
+        second = await service.sync_order_history(account, days_back=30)
+
+    assert first["incremental"] is False
+    assert first["new_orders"] == 2
+    assert second["incremental"] is True
+    assert (second["new_orders"], second["updated_orders"], second["unchanged_orders"]) == (
+        1,
+        1,
+        1,
+    )
+
+    # Second fetch starts one overlap period before the watermark, not 30 days back
+    second_start = tt_account.a_get_order_history.await_args_list[1].kwargs["start_date"]
+    assert second_start >= (now - timedelta(days=2)).date()
+
+    updated = await TastyTradeOrderHistory.objects.aget(broker_order_id="1002")
+    assert updated.price == Decimal("1.75")
+    assert await TastyTradeOrderHistory.objects.acount() == 3
+
+    watermark = await BrokerSyncWatermark.objects.aget(trading_account=account)
+    assert watermark.stream == ORDERS_STREAM
+    assert watermark.last_synced_at is not None
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+async def test_open_orders_and_full_resync_widen_the_window(account):
+    service = OrderHistoryService()
+    now = timezone.now()
+    working = make_order("2001", status="Live", received_at=now - timedelta(days=10))
+
+    tt_account = Mock()
+    tt_account.a_get_order_history = AsyncMock(return_value=[working, make_order("2002")])
+    session_patch, account_patch = patch_broker(tt_account)
+    with session_patch, account_patch:
+        await service.sync_order_history(account, days_back=30)
+        await service.sync_order_history(account, days_back=30)
+        full = await service.sync_order_history(account, days_back=30, full_resync=True)
+
+    starts = [call.kwargs["start_date"] for call in tt_account.a_get_order_history.await_args_list]
+    # The still-working order pulls the incremental start back to its received date
+    assert starts[1] <= (now - timedelta(days=10)).date()
+    assert starts[2] == (now - timedelta(days=30)).date()
+    assert full["incremental"] is False
+
+    watermark = await BrokerSyncWatermark.objects.aget(trading_account=account)
+    assert watermark.last_full_sync_at is not None
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+async def test_transaction_import_inserts_only_new_ids(account):
+    importer = TransactionImporter()
+    user = await sync_to_async(lambda: account.user)()
+    now = timezone.now()
+    transactions = [make_transaction(1, now - timedelta(days=2)), make_transaction(2, now)]
+
+    tt_account = Mock(spec=["a_get_history"])
+    tt_account.a_get_history = AsyncMock(return_value=transactions)
+    session_patch, account_patch = patch_broker(tt_account)
+    with session_patch, account_patch:
+        first = await importer.import_transactions(user, account)
+        transactions.append(make_transaction(3, now))
+        second = await importer.import_transactions(user, account)
+        full = await importer.import_transactions(user, account, full_resync=True)
+
+    assert (first["imported"], first["incremental"]) == (2, False)
+    assert (second["imported"], second["skipped"], second["incremental"]) == (1, 2, True)
+    assert (full["imported"], full["updated"]) == (0, 3)
+    assert await TastyTradeTransaction.objects.acount() == 3
+
+    watermark = await BrokerSyncWatermark.objects.aget(
+        trading_account=account, stream=transactions_stream(["Trade"])
+    )
+    assert watermark.last_transaction_id == 3
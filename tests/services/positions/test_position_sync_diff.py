@@ -0,0 +1,232 @@
+"""
+Tests for set-based Tier-2 position sync.
+
+Validates that unmanaged positions are diffed in memory and written in bulk
+(create, update, close at broker), that app-managed symbols are left to
+Tier 1, and that an unchanged broker payload skips the diff entirely.
+"""
+
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+
+import pytest
+from asgiref.sync import sync_to_async
+
+from accounts.models import TradingAccount
+from services.positions.sync import PositionSyncService
+from trading.models import Position
+
+User = get_user_model()
+
+
+def make_leg(symbol: str, underlying: str, quantity: int, mark_price: float = 1.0):
+    leg = MagicMock()
+    leg.symbol = symbol
+    leg.underlying_symbol = underlying
+    leg.quantity = quantity
+    leg.quantity_direction = "Long" if quantity > 0 else "Short"
+    leg.average_open_price = 1.50
+    leg.close_price = mark_price
+    leg.mark_price = mark_price
+    leg.instrument_type = "Equity Option"
+    leg.multiplier = 100
+    leg.cost_effect = "Debit" if quantity > 0 else "Credit"
+    return leg
+
+
+@pytest.mark.django_db
+class TestPositionSyncDiff(TestCase):
+    """Tests for _diff_positions / _apply_position_diff and the unchanged-payload skip."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="sync@example.com", username="syncuser", password="testpass123"
+        )
+        self.account = TradingAccount.objects.create(
+            user=self.user,
+            connection_type="TASTYTRADE",
+            account_number="5WT99999",
+            is_primary=True,
+            is_active=True,
+        )
+        self.service = PositionSyncService(order_history_service=MagicMock())
+
+        # Existing external position still held at broker
+        self.existing = Position.objects.create(
+            user=self.user,
+            trading_account=self.account,
+            symbol="SPY",
+            strategy_type="external",
+            quantity=1,
+            lifecycle_state="open_full",
+            is_app_managed=False,
+            metadata={"notes": "keep me"},
+        )
+        # External position no longer at broker
+        self.gone = Position.objects.create(
+            user=self.user,
+            trading_account=self.account,
+            symbol="IWM",
+            strategy_type="external",
+            quantity=2,
+            lifecycle_state="open_full",
+            is_app_managed=False,
+        )
+        # App-managed position; Tier 2 must not touch it
+        self.managed = Position.objects.create(
+            user=self.user,
+            trading_account=self.account,
+            symbol="QQQ",
+            strategy_type="short_put_vertical",
+            quantity=1,
+            lifecycle_state="open_full",
+            is_app_managed=True,
+            unrealized_pnl=Decimal("12.00"),
+        )
+
+        self.raw_positions = [
+            make_leg("SPY   251219P00500000", "SPY", -3, mark_price=2.0),
+            make_leg("SPY   251219P00495000", "SPY", 3, mark_price=1.0),
+            make_leg("QQQ   251219P00400000", "QQQ", -1),
+            make_leg("DIA   251219C00450000", "DIA", 1),
+        ]
+
+    async def _run_diff(self):
+        tt_positions = await self.service._group_positions_by_underlying(self.raw_positions)
+        diff = await self.service._diff_positions(
+            self.user,
+            self.account,
+            tt_positions,
+            self.service._broker_symbols(self.raw_positions),
+        )
+        await self.service._apply_position_diff(diff)
+        return diff
+
+    @pytest.mark.asyncio
+    async def test_diff_creates_updates_and_closes_in_bulk(self):
+        diff = await self._run_diff()
+
+        assert [p.symbol for p in diff.creates] == ["DIA"]
+        assert [p.id for p in diff.closes] == [self.gone.id]
+        assert diff.updated == 1
+        assert not diff.errors
+
+        spy = await Position.objects.aget(id=self.existing.id)
+        assert spy.quantity == 1  # protected field is never overwritten
+        assert spy.metadata["notes"] == "keep me"
+        assert len(spy.metadata["legs"]) == 2
+        assert spy.unrealized_pnl is not None
+
+        dia = await Position.objects.aget(user=self.user, symbol="DIA")
+        assert dia.lifecycle_state == "open_full"
+        assert dia.strategy_type == "external"
+
+        gone = await Position.objects.aget(id=self.gone.id)
+        assert gone.lifecycle_state == "closed"
+        assert gone.quantity == 0
+        assert gone.closed_at is not None
+        assert gone.metadata["closure_reason"] == "closed_at_broker"
+
+        managed = await Position.objects.aget(id=self.managed.id)
+        assert managed.unrealized_pnl == Decimal("12.00")
+        assert not managed.metadata or "legs" not in managed.metadata
+
+    @pytest.mark.asyncio
+    async def test_unchanged_fields_are_not_rewritten(self):
+        await self._run_diff()
+        synced_at = (await Position.objects.aget(id=self.existing.id)).metadata["sync_timestamp"]
+
+        diff = await self._run_diff()
+
+        # Nothing changed at the broker, so nothing is written (not even the timestamp)
+        assert not diff.creates
+        assert not diff.closes
+        assert not diff.updates
+        spy = await Position.objects.aget(id=self.existing.id)
+        assert spy.metadata["sync_timestamp"] == synced_at
+        count = await sync_to_async(Position.objects.filter(user=self.user, symbol="DIA").count)()
+        assert count == 1
+
+        self.raw_positions[0].mark_price = 2.5
+        diff = await self._run_diff()
+
+        assert [p.id for fields, positions in diff.updates.items() for p in positions] == [
+            self.existing.id
+        ]
+        spy = await Position.objects.aget(id=self.existing.id)
+        assert spy.metadata["sync_timestamp"] != synced_at
+
+    @pytest.mark.asyncio
+    async def test_broker_position_matched_by_legs(self):
+        spread = await Position.objects.acreate(
+            user=self.user,
+            trading_account=self.account,
+            symbol="SPY",
+            strategy_type="external",
+            quantity=3,
+            lifecycle_state="open_full",
+            is_app_managed=False,
+            metadata={
+                "legs": [
+                    {"symbol": "SPY   251219P00495000"},
+                    {"symbol": "SPY   251219P00500000"},
+                ]
+            },
+        )
+
+        diff = await self._run_diff()
+
+        updated = [p.id for positions in diff.updates.values() for p in positions]
+        assert spread.id in updated
+        assert self.existing.id not in updated
+
+    def test_payload_hash_ignores_leg_order(self):
+        reordered = list(reversed(self.raw_positions))
+        assert self.service._positions_payload_hash(
+            self.raw_positions
+        ) == self.service._positions_payload_hash(reordered)
+
+        changed = [*self.raw_positions[:-1], make_leg("DIA   251219C00450000", "DIA", 2)]
+        assert self.service._positions_payload_hash(
+            self.raw_positions
+        ) != self.service._positions_payload_hash(changed)
+
+    @pytest.mark.asyncio
+    async def test_unchanged_payload_skips_diff_unless_forced(self):
+        tt_account = MagicMock()
+        tt_account.a_get_positions = AsyncMock(return_value=self.raw_positions)
+        self.service.order_history_service.sync_order_history = AsyncMock(
+            return_value={"orders_synced": 0}
+        )
+
+        with (
+            patch(
+                "services.core.data_access.get_oauth_session",
+                AsyncMock(return_value=MagicMock()),
+            ),
+            patch("tastytrade.Account.a_get", AsyncMock(return_value=tt_account), create=True),
+            patch.object(self.service, "_sync_app_managed_from_orders", AsyncMock(return_value=1)),
+            patch.object(
+                self.service, "_sync_pending_order_statuses", AsyncMock(return_value=0)
+            ) as pending_statuses,
+            patch.object(
+                self.service, "_diff_positions", wraps=self.service._diff_positions
+            ) as diff_positions,
+        ):
+            first = await self.service.sync_all_positions(self.user)
+            second = await self.service.sync_all_positions(self.user)
+            forced = await self.service.sync_all_positions(self.user, force=True)
+
+        assert first["success"]
+        assert not first.get("skipped")
+        assert second["skipped"] is True
+        assert second["positions_found"] == 3
+        assert not forced.get("skipped")
+        assert diff_positions.await_count == 2
+        # The pending-order check still runs on a skipped sync
+        assert pending_statuses.await_count == 3
@@ -0,0 +1,80 @@
+"""
+Tests for chain-level Greeks snapshots used by delta strike search.
+"""
+
+from datetime import date
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+from django.utils import timezone
+
+import pytest
+
+from services.core.cache import CacheManager
+from services.strategies.utils.strike_optimizer import StrikeOptimizer
+from services.streaming.options_service import StreamingOptionsDataService
+
+EXPIRATION = date(2025, 12, 19)
+STRIKES = [Decimal(strike) for strike in ("570", "575", "580", "585", "590")]
+PUT_DELTAS = {"570": -0.12, "575": -0.16, "580": -0.21, "590": -0.35}
+
+
+def greeks_payloads(deltas: dict[str, float]) -> dict[str, dict]:
+    """Cache payloads keyed the way the streamer writes them."""
+    now = timezone.now().isoformat()
+    return {
+        CacheManager.dxfeed_greeks(f".SPY251219P{strike}"): {"delta": delta, "updated_at": now}
+        for strike, delta in deltas.items()
+    }
+
+
+@pytest.fixture
+def mock_cache():
+    with patch("services.core.l1_cache.cache") as cache:
+        cache.get_many.return_value = greeks_payloads(PUT_DELTAS)
+        yield cache
+
+
+def test_chain_snapshot_reads_all_strikes_in_one_call(mock_cache):
+    service = StreamingOptionsDataService(MagicMock())
+
+    snapshot = service.read_chain_greeks("SPY", EXPIRATION, "put", reversed(STRIKES))
+
+    mock_cache.get_many.assert_called_once()
+    assert len(mock_cache.get_many.call_args[0][0]) == len(STRIKES)
+    mock_cache.get.assert_not_called()
+    assert snapshot.strikes == STRIKES
+    assert snapshot.strikes_with_greeks == 4
+    assert snapshot.get(Decimal("585")) is None
+    assert float(snapshot.get(580).delta) == -0.21
+    assert snapshot.nearest_delta(-0.30) == (Decimal("590"), -0.35)
+
+
+@pytest.mark.asyncio
+async def test_spread_search_shares_one_snapshot(mock_cache):
+    optimizer = StrikeOptimizer()
+
+    strikes = await optimizer.find_optimal_spread_strikes_by_delta(
+        user=MagicMock(),
+        symbol="SPY",
+        expiration=EXPIRATION,
+        current_price=Decimal("600"),
+        spread_width=5,
+        spread_type="bull_put",
+        target_delta=0.20,
+        available_strikes=STRIKES,
+    )
+
+    assert strikes == {"short_put": Decimal("580"), "long_put": Decimal("575")}
+    mock_cache.get_many.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_delta_search_without_greeks_returns_none(mock_cache):
+    mock_cache.get_many.return_value = {}
+
+    result = await StrikeOptimizer().find_strike_by_delta(
+        MagicMock(), "SPY", EXPIRATION, "put", 0.20, STRIKES
+    )
+
+    assert result == (None, None)
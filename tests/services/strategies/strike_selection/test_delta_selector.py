@@ -8,12 +8,50 @@ Tests delta-based strike selection:
 - Result composition
 """
 
-from datetime import date
+from contextlib import contextmanager
+from datetime import UTC, date, datetime
 from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from services.streaming.dataclasses import OptionChainGreeks, OptionGreeks
+
+EXPIRATION = date(2025, 12, 19)
+
+
+def chain_snapshot(option_type: str, deltas: dict[str, float]) -> OptionChainGreeks:
+    """Chain Greeks snapshot with streaming deltas for the given strikes."""
+    type_code = "P" if option_type == "put" else "C"
+    strikes = sorted(Decimal(strike) for strike in deltas)
+    occ_symbols = [f"SPY   251219{type_code}00{int(strike)}000" for strike in strikes]
+    greeks = {
+        occ_symbol: OptionGreeks(
+            occ_symbol=occ_symbol,
+            delta=Decimal(str(deltas[str(strike)])),
+            gamma=None,
+            theta=None,
+            vega=None,
+            rho=None,
+            implied_volatility=None,
+            as_of=datetime.now(UTC),
+        )
+        for strike, occ_symbol in zip(strikes, occ_symbols, strict=True)
+    }
+    return OptionChainGreeks("SPY", EXPIRATION, option_type, strikes, occ_symbols, greeks)
+
+
+@contextmanager
+def patched_greeks(selector, snapshot: OptionChainGreeks, historical: dict | None = None):
+    """Serve the selector's chain read from snapshot and its fallback from historical."""
+    with (
+        patch.object(selector, "_read_chain_greeks", AsyncMock(return_value=snapshot)) as read,
+        patch.object(selector, "greeks_fetcher") as mock_fetcher,
+    ):
+        mock_fetcher.fetch_historical_greeks = AsyncMock(return_value=historical or {})
+        yield read, mock_fetcher
+
+
 # =============================================================================
 # DeltaSelectionResult Tests
 # =============================================================================
@@ -112,15 +150,7 @@ class TestSelectStrikes:
 
         selector = DeltaStrikeSelector(user=mock_user)
 
-        # Mock Greeks fetcher
-        with patch.object(selector, "greeks_fetcher") as mock_fetcher:
-            mock_fetcher.fetch_greeks = AsyncMock(
-                return_value={
-                    "SPY   251219P00580000": {"delta": -0.25},
-                    "SPY   251219P00575000": {"delta": -0.20},
-                }
-            )
-
+        with patched_greeks(selector, chain_snapshot("put", {"580": -0.25, "575": -0.20})):
             result = await selector.select_strikes(
                 symbol="SPY",
                 expiration=date(2025, 12, 19),
@@ -142,14 +172,7 @@ class TestSelectStrikes:
 
         selector = DeltaStrikeSelector(user=mock_user)
 
-        with patch.object(selector, "greeks_fetcher") as mock_fetcher:
-            mock_fetcher.fetch_greeks = AsyncMock(
-                return_value={
-                    "SPY   251219C00605000": {"delta": 0.25},
-                    "SPY   251219C00610000": {"delta": 0.20},
-                }
-            )
-
+        with patched_greeks(selector, chain_snapshot("call", {"605": 0.25, "610": 0.20})):
             result = await selector.select_strikes(
                 symbol="SPY",
                 expiration=date(2025, 12, 19),
@@ -171,16 +194,7 @@ class TestSelectStrikes:
 
         selector = DeltaStrikeSelector(user=mock_user)
 
-        with patch.object(selector, "greeks_fetcher") as mock_fetcher:
-            mock_fetcher.fetch_greeks = AsyncMock(
-                return_value={
-                    "SPY   251219P00580000": {
-                        "delta": -0.25,
-                        "source": "streaming",
-                    },
-                }
-            )
-
+        with patched_greeks(selector, chain_snapshot("put", {"580": -0.25})):
             result = await selector.select_strikes(
                 symbol="SPY",
                 expiration=date(2025, 12, 19),
@@ -191,7 +205,8 @@ class TestSelectStrikes:
                 current_price=Decimal("595"),
             )
 
-            assert result.delta_source in ["streaming", "model", "database"]
+            assert result.strikes["short_put"] == Decimal("580")
+            assert result.delta_source == "dxfeed_stream"
 
     @pytest.mark.asyncio
     async def test_select_strikes_includes_quality(self, mock_user, chain_strikes):
@@ -200,13 +215,7 @@ class TestSelectStrikes:
 
         selector = DeltaStrikeSelector(user=mock_user)
 
-        with patch.object(selector, "greeks_fetcher") as mock_fetcher:
-            mock_fetcher.fetch_greeks = AsyncMock(
-                return_value={
-                    "SPY   251219P00580000": {"delta": -0.25},
-                }
-            )
-
+        with patched_greeks(selector, chain_snapshot("put", {"580": -0.25})):
             result = await selector.select_strikes(
                 symbol="SPY",
                 expiration=date(2025, 12, 19),
@@ -250,9 +259,7 @@ class TestBlackScholesFallback:
 
         selector = DeltaStrikeSelector(user=mock_user)
 
-        with patch.object(selector, "greeks_fetcher") as mock_fetcher:
-            mock_fetcher.fetch_greeks = AsyncMock(return_value={})  # No Greeks
-
+        with patched_greeks(selector, chain_snapshot("put", {})):  # No Greeks
             result = await selector.select_strikes(
                 symbol="SPY",
                 expiration=date(2025, 12, 19),
@@ -516,31 +523,37 @@ class TestMarketContextIntegration:
         ]
 
     @pytest.mark.asyncio
-    async def test_high_stress_passed_to_greeks_fetcher(self, mock_user, chain_strikes):
-        """High market stress should be passed to Greeks fetcher."""
+    async def test_shared_snapshot_used_with_historical_fallback(self, mock_user, chain_strikes):
+        """A passed-in chain snapshot is used as-is; only its misses hit the database."""
         from services.strategies.strike_selection import DeltaStrikeSelector
 
         selector = DeltaStrikeSelector(user=mock_user)
+        chain_strikes = [
+            *chain_strikes,
+            {"strike_price": Decimal("570"), "put": "SPY   251219P00570000"},
+        ]
+        snapshot = chain_snapshot("put", {"580": -0.30})
+        historical = {"SPY   251219P00575000": {"delta": -0.24, "source": "database"}}
 
-        with patch.object(selector, "greeks_fetcher") as mock_fetcher:
-            mock_fetcher.fetch_greeks = AsyncMock(return_value={})
-
-            await selector.select_strikes(
+        with patched_greeks(selector, snapshot, historical) as (read, mock_fetcher):
+            result = await selector.select_strikes(
                 symbol="SPY",
-                expiration=date(2025, 12, 19),
+                expiration=EXPIRATION,
                 chain_strikes=chain_strikes,
                 spread_type="bull_put",
                 spread_width=5,
                 target_delta=0.25,
                 current_price=Decimal("595"),
-                market_context={"market_stress_level": 80.0},
+                chain_greeks=snapshot,
             )
 
-            # Verify fetch_greeks was called
-            mock_fetcher.fetch_greeks.assert_called_once()
-            # The market_stress_level should be passed as positional arg
-            call_args = mock_fetcher.fetch_greeks.call_args
-            assert 80.0 in call_args[0] or call_args[1].get("market_stress_level") == 80.0
+        read.assert_not_called()
+        mock_fetcher.fetch_historical_greeks.assert_awaited_once_with(
+            ["SPY   251219P00575000", "SPY   251219P00570000"]
+        )
+        mock_fetcher.fetch_greeks.assert_not_called()
+        assert result.strikes == {"short_put": Decimal("575"), "long_put": Decimal("570")}
+        assert result.delta_source == "database"
 
     @pytest.mark.asyncio
     async def test_iv_from_context_affects_model(self, mock_user, chain_strikes):
@@ -549,9 +562,7 @@ class TestMarketContextIntegration:
 
         selector = DeltaStrikeSelector(user=mock_user)
 
-        with patch.object(selector, "greeks_fetcher") as mock_fetcher:
-            mock_fetcher.fetch_greeks = AsyncMock(return_value={})  # Force model fallback
-
+        with patched_greeks(selector, chain_snapshot("put", {})):  # Force model fallback
             # The selector will use the IV from context when computing model delta
             result = await selector.select_strikes(
                 symbol="SPY",
@@ -0,0 +1,156 @@
+"""
+Tests for concurrent scoring and top-N generation in StrategySelector.
+
+Validates that strategies are scored and generated at the same time, that
+per-strategy timeouts are enforced, and that failed strategies are replaced
+by the next eligible one while results keep score order.
+"""
+
+import asyncio
+import time
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from services.market_data.analysis import MarketConditionReport
+from services.strategies.selector import StrategySelector
+from streaming.services.stream_manager import GlobalStreamManager
+
+
+def make_report() -> MarketConditionReport:
+    return MarketConditionReport(
+        symbol="SPY",
+        current_price=450.0,
+        open_price=448.0,
+        rsi=55.0,
+        macd_signal="neutral",
+        bollinger_position="within_bands",
+        sma_20=445.0,
+        support_level=440.0,
+        resistance_level=460.0,
+        is_range_bound=False,
+        range_bound_days=0,
+        current_iv=0.25,
+        iv_rank=65.0,
+        iv_percentile=60.0,
+        market_stress_level=30.0,
+        recent_move_pct=1.5,
+        is_data_stale=False,
+        last_update=datetime.now(UTC),
+        no_trade_reasons=[],
+    )
+
+
+def fake_strategy(name: str, score: float, score_delay: float = 0.0) -> MagicMock:
+    async def score_market_conditions(report):
+        await asyncio.sleep(score_delay)
+        return score, f"{name} fits"
+
+    strategy = MagicMock()
+    strategy.a_score_market_conditions = score_market_conditions
+    strategy.a_prepare_suggestion_context = AsyncMock(return_value={"strategy": name})
+    return strategy
+
+
+def make_selector(strategies: dict[str, MagicMock]) -> StrategySelector:
+    user = MagicMock()
+    user.id = 1
+    selector = StrategySelector(user)
+    selector.strategies = strategies
+    return selector
+
+
+def stream_manager_with_delays(delays: dict[str, float | None]) -> MagicMock:
+    """Each strategy prices after its delay; None means pricing fails."""
+
+    async def process(context):
+        delay = delays[context["strategy"]]
+        if delay is None:
+            return None
+        await asyncio.sleep(delay)
+        return f"suggestion:{context['strategy']}"
+
+    manager = MagicMock()
+    manager.a_process_suggestion_request = AsyncMock(side_effect=process)
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_scoring_runs_concurrently_with_timeout():
+    selector = make_selector(
+        {
+            "short_put_vertical": fake_strategy("short_put_vertical", 70, score_delay=0.1),
+            "short_call_vertical": fake_strategy("short_call_vertical", 60, score_delay=0.1),
+            "long_straddle": fake_strategy("long_straddle", 90, score_delay=5),
+        }
+    )
+
+    started = time.monotonic()
+    with patch("services.strategies.selector.STRATEGY_SCORE_TIMEOUT", 0.3):
+        scores, explanations = await selector._a_score_all(make_report())
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 0.6
+    assert scores == {"short_put_vertical": 70, "short_call_vertical": 60, "long_straddle": 0.0}
+    assert explanations["long_straddle"].startswith("Error: scoring timed out")
+
+
+@pytest.mark.asyncio
+async def test_top_suggestions_generated_concurrently_in_score_order():
+    selector = make_selector(
+        {
+            "short_put_vertical": fake_strategy("short_put_vertical", 80),
+            "short_call_vertical": fake_strategy("short_call_vertical", 70),
+            "long_call_vertical": fake_strategy("long_call_vertical", 60),
+        }
+    )
+    manager = stream_manager_with_delays(
+        {"short_put_vertical": 0.2, "short_call_vertical": 0.05, "long_call_vertical": 0.05}
+    )
+
+    started = time.monotonic()
+    with (
+        patch.object(selector.analyzer, "a_analyze_market_conditions", return_value=make_report()),
+        patch.object(GlobalStreamManager, "get_user_manager", AsyncMock(return_value=manager)),
+    ):
+        suggestions, context = await selector.a_select_top_suggestions("SPY", count=2)
+    elapsed = time.monotonic() - started
+
+    # Both top strategies priced together; the third was never started
+    assert elapsed < 0.35
+    assert [name for name, _, _ in suggestions] == ["short_put_vertical", "short_call_vertical"]
+    assert manager.a_process_suggestion_request.await_count == 2
+    assert context["type"] == "suggestions"
+
+
+@pytest.mark.asyncio
+async def test_failed_and_timed_out_strategies_are_replaced():
+    selector = make_selector(
+        {
+            "short_put_vertical": fake_strategy("short_put_vertical", 80),
+            "short_call_vertical": fake_strategy("short_call_vertical", 70),
+            "long_call_vertical": fake_strategy("long_call_vertical", 60),
+            "long_put_vertical": fake_strategy("long_put_vertical", 50),
+        }
+    )
+    manager = stream_manager_with_delays(
+        {
+            "short_put_vertical": 5,  # straggler, cut by the timeout
+            "short_call_vertical": None,  # pricing fails
+            "long_call_vertical": 0.01,
+            "long_put_vertical": 0.01,
+        }
+    )
+
+    with (
+        patch("services.strategies.selector.STRATEGY_GENERATION_TIMEOUT", 0.2),
+        patch.object(selector.analyzer, "a_analyze_market_conditions", return_value=make_report()),
+        patch.object(GlobalStreamManager, "get_user_manager", AsyncMock(return_value=manager)),
+    ):
+        suggestions, context = await selector.a_select_top_suggestions("SPY", count=2)
+
+    assert [name for name, _, _ in suggestions] == ["long_call_vertical", "long_put_vertical"]
+    failures = dict(context["generation_failures"])
+    assert failures["short_call_vertical"] == "Suggestion generation returned None"
+    assert failures["short_put_vertical"].startswith("Timed out")
@@ -0,0 +1,100 @@
+"""
+Tests for the cache key registry (index-tracked invalidation).
+"""
+
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+
+import pytest
+
+from services.core import cache_index
+from services.core.cache import CacheManager
+from services.core.cache_index import (
+    invalidate_family,
+    register_keys,
+    scan_delete,
+    set_tracked,
+)
+
+FAMILY = CacheManager.option_chain_family(date(2025, 1, 2))
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def test_invalidate_family_deletes_only_registered_keys():
+    set_tracked(FAMILY, "option_chain:SPY:2025-02-21:2025-01-02", {"strikes": []}, 300)
+    set_tracked(FAMILY, "option_chain:QQQ:dte_45:2025-01-02", {"strikes": []}, 300)
+    cache.set("option_chain:IWM:dte_45:2025-01-03", {"strikes": []}, 300)
+
+    removed = invalidate_family(FAMILY)
+
+    assert removed == 2
+    assert cache.get("option_chain:SPY:2025-02-21:2025-01-02") is None
+    assert cache.get("option_chain:QQQ:dte_45:2025-01-02") is None
+    assert cache.get("option_chain:IWM:dte_45:2025-01-03") is not None
+    # Index is gone too, so a second invalidation is a no-op
+    assert invalidate_family(FAMILY) == 0
+
+
+def test_registering_same_key_twice_tracks_it_once():
+    register_keys(FAMILY, ["option_chain:SPY:dte_45:2025-01-02"], 300)
+    register_keys(FAMILY, ["option_chain:SPY:dte_45:2025-01-02"], 300)
+
+    assert invalidate_family(FAMILY) == 1
+
+
+def test_families_are_independent():
+    set_tracked(CacheManager.position_greeks_family(1), CacheManager.portfolio_greeks(1), {}, 5)
+    set_tracked(CacheManager.position_greeks_family(2), CacheManager.portfolio_greeks(2), {}, 5)
+
+    invalidate_family(CacheManager.position_greeks_family(1))
+
+    assert cache.get(CacheManager.portfolio_greeks(1)) is None
+    assert cache.get(CacheManager.portfolio_greeks(2)) == {}
+
+
+def test_overwriting_a_live_key_skips_registration():
+    key = CacheManager.portfolio_greeks(1)
+    family = CacheManager.position_greeks_family(1)
+
+    with patch.object(cache_index, "register_keys", wraps=register_keys) as register:
+        set_tracked(family, key, {"delta": 1.0}, 5)
+        set_tracked(family, key, {"delta": 2.0}, 5)
+
+    register.assert_called_once()
+    assert cache.get(key) == {"delta": 2.0}
+    assert invalidate_family(family) == 1
+    assert cache.get(key) is None
+
+
+def test_registry_failure_does_not_fail_the_write():
+    with patch.object(cache_index, "_redis_client", side_effect=RuntimeError("redis down")):
+        set_tracked(FAMILY, "option_chain:SPY:dte_45:2025-01-02", {"strikes": []}, 300)
+
+    assert cache.get("option_chain:SPY:dte_45:2025-01-02") == {"strikes": []}
+
+
+def test_scan_delete_uses_scan_not_keys():
+    client = MagicMock()
+    client.scan_iter.return_value = iter([b"senex_cache:1:option_chain:SPY:dte_45:2025-01-02"])
+    client.delete.return_value = 1
+
+    with patch.object(cache_index, "_redis_client", return_value=client):
+        deleted = scan_delete("option_chain:*:*:2025-01-02")
+
+    assert deleted == 1
+    client.scan_iter.assert_called_once()
+    assert client.scan_iter.call_args.kwargs["match"].endswith("option_chain:*:*:2025-01-02")
+    client.keys.assert_not_called()
+
+
+def test_scan_delete_without_redis_is_a_noop():
+    with patch.object(cache_index, "_redis_client", return_value=None):
+        assert scan_delete("option_chain:*") == 0
@@ -0,0 +1,113 @@
+"""
+Tests for chunked, resumable HistoricalGreeks rollups.
+"""
+
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.utils import timezone
+
+import pytest
+
+from services.account.utils import greeks_aggregation
+from services.account.utils.greeks_aggregation import (
+    aggregate_greeks_to_1min,
+    aggregate_greeks_to_5min,
+)
+from services.core.cache import CacheManager
+from trading.models import HistoricalGreeks
+
+SYMBOL = "SPY   251219P00580000"
+
+pytestmark = pytest.mark.usefixtures("clear_cache")
+
+
+def add_greeks(timestamp: datetime, delta: str, symbol: str = SYMBOL) -> None:
+    HistoricalGreeks.objects.create(
+        option_symbol=symbol,
+        underlying_symbol="SPY",
+        timestamp=timestamp,
+        delta=Decimal(delta),
+        gamma=Decimal("0.01"),
+        theta=Decimal("-0.05"),
+        vega=Decimal("0.10"),
+        implied_volatility=Decimal("0.20"),
+        strike=Decimal("580"),
+        expiration_date=date(2025, 12, 19),
+        option_type="PUT",
+    )
+
+
+def days_ago(days: int, hour: int = 15, minute: int = 30, second: int = 0) -> datetime:
+    day = (timezone.now() - timedelta(days=days)).date()
+    return datetime(day.year, day.month, day.day, hour, minute, second, tzinfo=UTC)
+
+
+@pytest.mark.django_db
+def test_rollup_keeps_last_value_per_minute_and_recent_rows():
+    minute = days_ago(40)
+    add_greeks(minute + timedelta(seconds=5), "-0.20")
+    add_greeks(minute + timedelta(seconds=50), "-0.22")
+    add_greeks(minute + timedelta(minutes=1, seconds=10), "-0.25")
+    add_greeks(days_ago(40, second=0, minute=45), "-0.30")  # already on a boundary
+    add_greeks(days_ago(5, second=7), "-0.10")  # too recent
+
+    result = aggregate_greeks_to_1min()
+
+    assert result["status"] == "success"
+    assert (result["aggregated"], result["deleted"]) == (3, 3)
+    rows = {
+        row.timestamp: row.delta
+        for row in HistoricalGreeks.objects.filter(timestamp__lt=days_ago(30)).order_by("timestamp")
+    }
+    assert rows == {
+        minute: Decimal("-0.22"),
+        minute + timedelta(minutes=1): Decimal("-0.25"),
+        days_ago(40, minute=45): Decimal("-0.30"),
+    }
+    assert HistoricalGreeks.objects.count() == 4
+
+
+@pytest.mark.django_db
+def test_rollup_resumes_from_checkpoint():
+    for days in (45, 44, 43):
+        add_greeks(days_ago(days, second=15), "-0.20")
+
+    first = aggregate_greeks_to_1min(max_chunks=1)
+    checkpoint = cache.get(CacheManager.greeks_rollup_checkpoint("1min"))
+
+    assert (first["chunks"], first["deleted"], first["complete"]) == (1, 1, False)
+    assert checkpoint == datetime.combine(days_ago(44).date(), datetime.min.time(), tzinfo=UTC)
+
+    with patch.object(
+        greeks_aggregation,
+        "_rollup_chunk_batched",
+        wraps=greeks_aggregation._rollup_chunk_batched,
+    ) as roll_chunk:
+        second = aggregate_greeks_to_1min()
+
+    # Resumed at the checkpoint: the first day is not scanned again
+    assert roll_chunk.call_args_list[0].args[1] == checkpoint
+    assert (second["deleted"], second["complete"]) == (2, True)
+    assert not HistoricalGreeks.objects.exclude(timestamp__second=0).exists()
+
+
+@pytest.mark.django_db
+def test_dry_run_estimates_without_writing():
+    start = days_ago(400, minute=0)
+    for minute in range(10):
+        add_greeks(start + timedelta(minutes=minute), "-0.20")
+
+    estimate = aggregate_greeks_to_5min(dry_run=True)
+
+    assert estimate["status"] == "dry_run"
+    assert (estimate["rows"], estimate["symbols"]) == (10, 1)
+    assert estimate["chunks"] >= 1
+    assert HistoricalGreeks.objects.count() == 10
+    assert cache.get(CacheManager.greeks_rollup_checkpoint("5min")) is None
+
+    result = aggregate_greeks_to_5min()
+
+    assert (result["aggregated"], result["deleted"]) == (2, 8)
@@ -0,0 +1,140 @@
+"""Tests for batched position/portfolio Greeks in GreeksService."""
+
+from datetime import date, timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+
+import pytest
+
+from accounts.models import TradingAccount
+from services.core.cache import CacheManager
+from services.market_data.greeks import GreeksService
+from trading.models import HistoricalGreeks, Position
+
+User = get_user_model()
+
+SHORT_PUT = "QQQ   251107P00590000"
+LONG_PUT = "QQQ   251107P00580000"
+SHORT_CALL = "QQQ   251107C00620000"
+
+
+class TestBatchedGreeks(TestCase):
+    """Greeks for many positions come from one cache read and one DB query."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="test@example.com", username="testuser", password="testpass123"
+        )
+        self.trading_account = TradingAccount.objects.create(
+            user=self.user,
+            connection_type="TASTYTRADE",
+            account_number="12345",
+            is_primary=True,
+            is_active=True,
+        )
+        self.service = GreeksService()
+        cache.clear()
+
+        cache.set(
+            CacheManager.dxfeed_greeks(".QQQ251107P590"),
+            {"delta": -0.30, "gamma": 0.02, "theta": -0.05, "vega": 0.10, "rho": -0.01},
+        )
+        cache.set(
+            CacheManager.dxfeed_greeks(".QQQ251107P580"),
+            {"delta": -0.20, "gamma": 0.01, "theta": -0.03, "vega": 0.08, "rho": -0.01},
+        )
+
+    def _position(self, legs):
+        return Position.objects.create(
+            user=self.user,
+            trading_account=self.trading_account,
+            symbol="QQQ",
+            strategy_type="short_put_vertical",
+            quantity=1,
+            lifecycle_state="open_full",
+            is_app_managed=True,
+            metadata={"legs": legs},
+        )
+
+    def test_positions_share_one_cache_read(self):
+        spread = self._position(
+            [
+                {"symbol": SHORT_PUT, "quantity": 2, "quantity_direction": "Short"},
+                {"symbol": LONG_PUT, "quantity": 2, "quantity_direction": "Long"},
+            ]
+        )
+        single = self._position([{"symbol": SHORT_PUT, "quantity": -1}])
+
+        with patch("services.core.l1_cache.cache.get_many", wraps=cache.get_many) as mock_get_many:
+            result = self.service.get_greeks_for_positions([spread, single])
+
+        assert mock_get_many.call_count == 1
+        # Short 2 x -0.30 + long 2 x -0.20, x100 multiplier
+        assert result[spread.id]["delta"] == pytest.approx(20.0)
+        assert result[spread.id]["theta"] == pytest.approx(4.0)
+        assert result[single.id]["delta"] == pytest.approx(30.0)
+
+        portfolio = self.service.aggregate_portfolio(result)
+        assert portfolio["position_count"] == 2
+        assert portfolio["delta"] == pytest.approx(50.0)
+
+    def test_cached_batch_reuses_position_greeks_within_ttl(self):
+        spread = self._position(
+            [
+                {"symbol": SHORT_PUT, "quantity": 1, "quantity_direction": "Short"},
+                {"symbol": LONG_PUT, "quantity": 1, "quantity_direction": "Long"},
+            ]
+        )
+        single = self._position([{"symbol": SHORT_PUT, "quantity": -1}])
+        # Cached by the single-position endpoint; the batch must reuse it
+        cached_single = self.service.get_position_greeks_cached(single)
+
+        with patch.object(
+            self.service, "get_greeks_for_positions", wraps=self.service.get_greeks_for_positions
+        ) as compute:
+            first = self.service.get_greeks_for_positions_cached([spread, single])
+            second = self.service.get_greeks_for_positions_cached([spread, single])
+
+        # Only the uncached spread was computed, and only on the first poll
+        compute.assert_called_once_with([spread])
+        assert first == second
+        assert first[single.id] == cached_single
+        assert first[spread.id]["delta"] == pytest.approx(10.0)
+
+    def test_cache_misses_use_one_database_query(self):
+        now = timezone.now()
+        for age_minutes, delta in ((30, "0.1000"), (5, "0.2500")):
+            HistoricalGreeks.objects.create(
+                option_symbol=SHORT_CALL,
+                underlying_symbol="QQQ",
+                timestamp=now - timedelta(minutes=age_minutes),
+                delta=Decimal(delta),
+                gamma=Decimal("0.01"),
+                theta=Decimal("-0.04"),
+                vega=Decimal("0.09"),
+                implied_volatility=Decimal("0.2"),
+                strike=Decimal("620"),
+                expiration_date=date(2025, 11, 7),
+                option_type="CALL",
+            )
+
+        with self.assertNumQueries(1):
+            greeks = self.service.get_greeks_many([SHORT_PUT, SHORT_CALL])
+
+        assert greeks[SHORT_PUT]["delta"] == -0.30
+        assert greeks[SHORT_CALL]["delta"] == 0.25
+        assert greeks[SHORT_CALL]["source"] == "database_fallback"
+
+    def test_portfolio_greeks_aggregates_open_positions(self):
+        self._position([{"symbol": SHORT_PUT, "quantity": 1, "quantity_direction": "Short"}])
+        self._position([{"symbol": LONG_PUT, "quantity": 1, "quantity_direction": "Long"}])
+
+        portfolio = self.service.get_portfolio_greeks(self.user)
+
+        assert portfolio["position_count"] == 2
+        assert portfolio["delta"] == pytest.approx(30.0 - 20.0)
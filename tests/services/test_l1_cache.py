@@ -0,0 +1,83 @@
+"""
+Tests for the in-process L1 cache in front of Redis.
+"""
+
+from unittest.mock import patch
+
+from django.core.cache import cache
+
+import pytest
+
+from services.core.l1_cache import L1Cache
+
+QUOTE_KEY = "quote:SPY"
+
+
+@pytest.fixture
+def l1():
+    cache.clear()
+    yield L1Cache(max_entries=2)
+    cache.clear()
+
+
+def test_reads_through_to_redis_once(l1):
+    cache.set(QUOTE_KEY, {"bid": 500.0})
+
+    with patch("services.core.l1_cache.cache.get", wraps=cache.get) as redis_get:
+        first = l1.get(QUOTE_KEY, ttl=5)
+        second = l1.get(QUOTE_KEY, ttl=5)
+
+    assert first == second == {"bid": 500.0}
+    assert redis_get.call_count == 1
+    stats = l1.get_stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+def test_put_serves_without_redis(l1):
+    l1.put(QUOTE_KEY, {"bid": 501.0}, ttl=5)
+
+    with patch("services.core.l1_cache.cache") as redis:
+        assert l1.get(QUOTE_KEY, ttl=5) == {"bid": 501.0}
+
+    redis.get.assert_not_called()
+
+
+def test_expired_entries_read_redis_again(l1):
+    l1.put(QUOTE_KEY, {"bid": 499.0}, ttl=-1)
+    cache.set(QUOTE_KEY, {"bid": 502.0})
+
+    assert l1.get(QUOTE_KEY, ttl=5) == {"bid": 502.0}
+
+
+def test_misses_are_not_cached(l1):
+    assert l1.get(QUOTE_KEY, ttl=5) is None
+    cache.set(QUOTE_KEY, {"bid": 503.0})
+
+    assert l1.get(QUOTE_KEY, ttl=5) == {"bid": 503.0}
+
+
+def test_get_many_reads_only_missing_keys_in_one_call(l1):
+    l1.put("greeks:a", {"delta": 0.1}, ttl=5)
+    cache.set_many({"greeks:b": {"delta": 0.2}})
+
+    with patch("services.core.l1_cache.cache.get_many", wraps=cache.get_many) as redis_get_many:
+        result = l1.get_many(["greeks:a", "greeks:b", "greeks:c", "greeks:a"], ttl=5)
+
+    assert result == {"greeks:a": {"delta": 0.1}, "greeks:b": {"delta": 0.2}}
+    redis_get_many.assert_called_once_with(["greeks:b", "greeks:c"])
+    assert l1.get_stats()["batch_operations"] == 1
+
+
+def test_least_recently_used_entry_is_evicted(l1):
+    l1.put("a", 1, ttl=5)
+    l1.put("b", 2, ttl=5)
+    l1.get("a", ttl=5)
+    l1.put("c", 3, ttl=5)
+
+    with patch("services.core.l1_cache.cache") as redis:
+        redis.get.return_value = None
+        assert l1.get("b", ttl=5) is None
+        assert l1.get("a", ttl=5) == 1
+
+    assert len(l1) == 2
+    assert l1.get_stats()["evictions"] == 1
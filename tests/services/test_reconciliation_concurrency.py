@@ -0,0 +1,139 @@
+"""
+Tests for concurrent (per-user pipelined) reconciliation.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from services.reconciliation.orchestrator import (
+    BrokerPhaseThrottle,
+    PhaseResult,
+    ReconciliationOptions,
+    ReconciliationOrchestrator,
+)
+
+USERS = [SimpleNamespace(id=user_id) for user_id in (1, 2, 3)]
+
+
+def make_orchestrator(events: list, delays: dict | None = None, **options):
+    """Orchestrator whose phase handlers record (user, phase, start/end) events."""
+    delays = delays or {}
+    orchestrator = ReconciliationOrchestrator(
+        options=ReconciliationOptions(
+            concurrent=True,
+            discover_positions=False,
+            process_closures=False,
+            reconcile_trades=False,
+            broker_phase_rate=0,
+            **options,
+        )
+    )
+
+    def make_handler(phase):
+        async def handler(users):
+            (user,) = users
+            events.append((user.id, phase, "start"))
+            await asyncio.sleep(delays.get((user.id, phase), 0.01))
+            events.append((user.id, phase, "end"))
+            return PhaseResult(
+                phase=phase,
+                success=user.id != 3 or phase != "sync_positions",
+                items_processed=1,
+                errors=[] if user.id != 3 or phase != "sync_positions" else [{"user_id": 3}],
+                details={"checked": 2},
+            )
+
+        return handler
+
+    for phase in (
+        "sync_order_history",
+        "sync_transactions",
+        "sync_positions",
+        "fix_profit_targets",
+    ):
+        setattr(orchestrator, f"_phase_{phase}", make_handler(phase))
+
+    orchestrator._get_users_to_process = AsyncMock(return_value=USERS)
+    orchestrator._get_user_brokers = AsyncMock(
+        return_value={user.id: "TASTYTRADE" for user in USERS}
+    )
+    return orchestrator
+
+
+@pytest.mark.asyncio
+async def test_phases_pipeline_per_user_in_order():
+    events = []
+    # User 1 is slow in its first phase; the others must not wait for it
+    orchestrator = make_orchestrator(events, delays={(1, "sync_order_history"): 0.2})
+
+    result = await orchestrator.run()
+
+    for user in USERS:
+        phases = [
+            phase for user_id, phase, kind in events if user_id == user.id and kind == "start"
+        ]
+        assert phases == [
+            "sync_order_history",
+            "sync_transactions",
+            "sync_positions",
+            "fix_profit_targets",
+        ]
+    assert events.index((2, "fix_profit_targets", "end")) < events.index(
+        (1, "sync_order_history", "end")
+    )
+
+    assert set(result.user_timings) == {1, 2, 3}
+    assert result.user_timings[1]["sync_order_history"] >= 0.2
+    assert result.phase_results["sync_transactions"].items_processed == 3
+    assert result.phase_results["sync_transactions"].details == {"checked": 6}
+    assert result.phases_failed == ["sync_positions"]
+    assert result.success is False
+
+
+@pytest.mark.asyncio
+async def test_global_concurrency_limit():
+    events = []
+    orchestrator = make_orchestrator(events, max_concurrent_users=1)
+
+    await orchestrator.run()
+
+    # With one slot, each user's pipeline finishes before the next starts
+    users_in_order = [user_id for user_id, _, _ in events]
+    assert users_in_order == sorted(users_in_order)
+
+
+@pytest.mark.asyncio
+async def test_sequential_mode_is_unchanged():
+    events = []
+    orchestrator = make_orchestrator(
+        events, sync_transactions=False, sync_positions=False, fix_profit_targets=False
+    )
+    orchestrator.options.concurrent = False
+    calls = []
+
+    async def all_users_handler(users):
+        calls.append([user.id for user in users])
+        return PhaseResult(phase="sync_order_history", success=True)
+
+    orchestrator._phase_sync_order_history = all_users_handler
+    with patch.object(orchestrator, "_run_concurrent") as run_concurrent:
+        result = await orchestrator.run()
+
+    run_concurrent.assert_not_called()
+    assert calls == [[1, 2, 3]]
+    assert result.user_timings == {}
+
+
+@pytest.mark.asyncio
+async def test_broker_phase_throttle_spaces_acquisitions():
+    throttle = BrokerPhaseThrottle(rate=50)
+
+    start = time.monotonic()
+    await asyncio.gather(*(throttle.acquire() for _ in range(6)))
+
+    # First slot is immediate, the remaining five are 20ms apart
+    assert time.monotonic() - start >= 0.09
@@ -0,0 +1,141 @@
+"""
+Tests for the TastyTrade session pool.
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from services.brokers.tastytrade.session import TastyTradeSessionService
+from services.brokers.tastytrade.session_pool import TastyTradeSessionPool, session_pool
+from services.core.data_access import get_oauth_session, invalidate_oauth_session
+
+
+def make_session(expires_in: float = 900):
+    session = Mock(spec=["session_expiration", "refresh"])
+    session.session_expiration = time.time() + expires_in
+    session.refresh = AsyncMock()
+    return session
+
+
+def make_factory(*sessions):
+    created = iter(sessions)
+
+    async def factory(refresh_token):
+        await asyncio.sleep(0)
+        return {"success": True, "session": next(created)}
+
+    return AsyncMock(side_effect=factory)
+
+
+@pytest.mark.asyncio
+async def test_reuses_session_until_near_expiry():
+    pool = TastyTradeSessionPool()
+    session = make_session()
+    factory = make_factory(session)
+
+    first = await pool.acquire(1, "token", False, factory)
+    second = await pool.acquire(1, "token", False, factory)
+
+    assert first["session"] is second["session"] is session
+    assert second["validated"] is True
+    assert factory.await_count == 1
+    assert pool.get_stats()["hits"] == 1
+    assert pool.get_stats()["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_creation():
+    pool = TastyTradeSessionPool()
+    factory = make_factory(make_session())
+
+    results = await asyncio.gather(*(pool.acquire(1, "token", False, factory) for _ in range(5)))
+
+    assert factory.await_count == 1
+    assert len({id(result["session"]) for result in results}) == 1
+
+
+@pytest.mark.asyncio
+async def test_near_expiry_refreshes_in_place():
+    pool = TastyTradeSessionPool(refresh_margin=120)
+    session = make_session(expires_in=60)
+    factory = make_factory(session)
+
+    await pool.acquire(1, "token", False, factory)
+    result = await pool.acquire(1, "token", False, factory)
+
+    assert result["session"] is session
+    session.refresh.assert_awaited_once_with(force=True)
+    assert factory.await_count == 1
+    assert pool.get_stats()["refreshes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_keys_by_environment_and_evicts_on_new_refresh_token():
+    pool = TastyTradeSessionPool()
+    factory = make_factory(make_session(), make_session(), make_session())
+
+    live = await pool.acquire(1, "token", False, factory)
+    cert = await pool.acquire(1, "token", True, factory)
+    rotated = await pool.acquire(1, "new-token", False, factory)
+
+    assert live["session"] is not cert["session"]
+    assert rotated["session"] is not live["session"]
+    assert factory.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_creation_is_not_pooled():
+    pool = TastyTradeSessionPool()
+    factory = AsyncMock(return_value={"success": False, "error": "invalid_grant"})
+
+    result = await pool.acquire(1, "token", False, factory)
+    await pool.acquire(1, "token", False, factory)
+
+    assert result["success"] is False
+    assert factory.await_count == 2
+    assert pool.get_stats()["failures"] == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidate_drops_user_sessions():
+    pool = TastyTradeSessionPool()
+    factory = make_factory(make_session(), make_session())
+
+    await pool.acquire(1, "token", False, factory)
+    pool.invalidate(1)
+    await pool.acquire(1, "token", False, factory)
+
+    assert factory.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_auth_failure_evicts_pooled_session_for_next_get_oauth_session():
+    session_pool.clear()
+    user = Mock(id=1)
+    account = Mock(refresh_token="token", is_test=False)
+    sessions = [make_session(), make_session()]
+    create_session = AsyncMock(side_effect=[{"success": True, "session": s} for s in sessions])
+
+    with (
+        patch(
+            "services.core.data_access.get_primary_tastytrade_account",
+            new=AsyncMock(return_value=account),
+        ),
+        patch.object(TastyTradeSessionService, "_get_default_config", return_value=Mock()),
+        patch.object(TastyTradeSessionService, "create_session", new=create_session),
+    ):
+        first = await get_oauth_session(user)
+        assert await get_oauth_session(user) is first
+
+        # Transient errors keep the pooled session; auth errors evict it
+        assert invalidate_oauth_session(1, ConnectionError("connection reset")) is False
+        assert invalidate_oauth_session(1, Exception("401 Unauthorized")) is True
+        second = await get_oauth_session(user)
+
+    assert first is sessions[0]
+    assert second is sessions[1]
+    assert create_session.await_count == 2
+    session_pool.clear()
@@ -0,0 +1,109 @@
+"""
+Tests for single-flight fetch coalescing.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+from django.core.cache import cache
+
+import pytest
+
+from services.core.cache import CacheManager
+from services.core.single_flight import SingleFlight, single_flight_stats
+
+KEY = "option_chain:SPY:dte_45:2025-01-02"
+
+
+@pytest.fixture
+def flight():
+    cache.clear()
+    flight = SingleFlight("test_flight", wait_timeout=1, poll_interval=0.01)
+    yield flight
+    cache.clear()
+
+
+def slow_fetch(result, delay: float = 0.05):
+    async def fetch():
+        await asyncio.sleep(delay)
+        return result
+
+    return AsyncMock(side_effect=fetch)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_share_one_fetch(flight):
+    fetch = slow_fetch({"strikes": [500]})
+
+    results = await asyncio.gather(*(flight.run(KEY, fetch) for _ in range(5)))
+
+    assert fetch.await_count == 1
+    assert all(result == {"strikes": [500]} for result in results)
+    # Waiters get copies, so one caller cannot mutate another's result
+    assert len({id(result) for result in results}) == 5
+    stats = flight.get_stats()
+    assert stats["leaders"] == 1
+    assert stats["coalesced"] == 4
+    assert single_flight_stats()["test_flight"] == stats
+
+
+@pytest.mark.asyncio
+async def test_failure_reaches_waiters_and_is_not_remembered(flight):
+    async def failing():
+        await asyncio.sleep(0.05)
+        raise RuntimeError("rate limited")
+
+    results = await asyncio.gather(
+        *(flight.run(KEY, failing) for _ in range(3)), return_exceptions=True
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert flight.get_stats()["failures"] == 1
+
+    # The next miss fetches again
+    assert await flight.run(KEY, slow_fetch("ok", delay=0)) == "ok"
+
+
+@pytest.mark.asyncio
+async def test_lease_is_released_after_fetch(flight):
+    await flight.run(KEY, slow_fetch("ok", delay=0), cached=lambda: cache.get(KEY))
+
+    assert cache.get(CacheManager.data_fetch_lock(f"test_flight:{KEY}")) is None
+
+
+@pytest.mark.asyncio
+async def test_waits_for_other_worker_instead_of_fetching(flight):
+    lease_key = CacheManager.data_fetch_lock(f"test_flight:{KEY}")
+    cache.add(lease_key, "other-worker", 30)
+    fetch = slow_fetch("mine", delay=0)
+
+    async def other_worker_finishes():
+        await asyncio.sleep(0.05)
+        cache.set(KEY, "theirs", 30)
+
+    result, _ = await asyncio.gather(
+        flight.run(KEY, fetch, cached=lambda: cache.get(KEY)), other_worker_finishes()
+    )
+
+    assert result == "theirs"
+    fetch.assert_not_awaited()
+    assert flight.get_stats()["remote_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_fetches_when_other_worker_releases_without_result(flight):
+    lease_key = CacheManager.data_fetch_lock(f"test_flight:{KEY}")
+    cache.add(lease_key, "other-worker", 30)
+    fetch = slow_fetch("mine", delay=0)
+
+    async def other_worker_fails():
+        await asyncio.sleep(0.05)
+        cache.delete(lease_key)
+
+    result, _ = await asyncio.gather(
+        flight.run(KEY, fetch, cached=lambda: cache.get(KEY)), other_worker_fails()
+    )
+
+    assert result == "mine"
+    fetch.assert_awaited_once()
+    assert flight.get_stats()["lease_timeouts"] == 0
@@ -0,0 +1,54 @@
+from unittest.mock import patch
+
+from services.streaming.quote_book import QuoteBook
+
+
+def test_merge_replaces_payload_and_marks_dirty():
+    book = QuoteBook()
+    book.merge("SPY", {"bid": 1.0}, ttl=60)
+    book.merge("SPY", {"bid": 2.0}, ttl=60)
+
+    assert book.get("SPY") == {"bid": 2.0}
+    assert book.dirty_count == 1
+
+
+def test_drain_dirty_groups_by_ttl_and_clears():
+    book = QuoteBook()
+    book.merge("SPY", {"bid": 1.0}, ttl=60)
+    book.merge("QQQ", {"bid": 2.0}, ttl=60)
+    book.merge("SPY  251219C00600000", {"bid": 3.0}, ttl=300)
+
+    batches = book.drain_dirty()
+
+    assert batches == {
+        60: {"SPY": {"bid": 1.0}, "QQQ": {"bid": 2.0}},
+        300: {"SPY  251219C00600000": {"bid": 3.0}},
+    }
+    assert book.dirty_count == 0
+    assert book.drain_dirty() == {}
+
+
+def test_mark_dirty_requeues_failed_flush():
+    book = QuoteBook()
+    book.merge("SPY", {"bid": 1.0}, ttl=60)
+    batches = book.drain_dirty()
+
+    book.mark_dirty(dict.fromkeys(batches[60], 60))
+
+    assert book.drain_dirty() == {60: {"SPY": {"bid": 1.0}}}
+
+
+def test_expired_entries_hidden_and_pruned_after_flush():
+    book = QuoteBook()
+    with patch("services.streaming.quote_book.time.monotonic", return_value=100.0):
+        book.merge("SPY", {"bid": 1.0}, ttl=60)
+
+    with patch("services.streaming.quote_book.time.monotonic", return_value=200.0):
+        assert book.get("SPY") is None
+        assert book.peek("SPY") == {"bid": 1.0}
+        # Still dirty, so it survives pruning until flushed
+        assert book.prune() == 0
+        book.drain_dirty()
+        assert book.prune() == 1
+
+    assert len(book) == 0
@@ -0,0 +1,118 @@
+"""
+Tests for the low-overhead logging pipeline: async queue handlers and rate limiting.
+"""
+
+import logging
+import threading
+
+import pytest
+
+from services.core.logging import (
+    AsyncQueueHandler,
+    RateLimitFilter,
+    SensitiveDataFilter,
+    async_logging,
+)
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        self.messages = []
+        self.threads = set()
+
+    def emit(self, record):
+        self.messages.append(self.format(record))
+        self.threads.add(threading.get_ident())
+
+
+@pytest.fixture
+def isolated_logger():
+    logger = logging.getLogger("tests.logging_pipeline")
+    logger.propagate = False
+    logger.setLevel(logging.DEBUG)
+    yield logger
+    async_logging.stop()
+    logger.handlers.clear()
+    logger.filters.clear()
+
+
+def test_async_handlers_redact_and_emit_on_listener_thread(isolated_logger):
+    handler = RecordingHandler()
+    handler.addFilter(SensitiveDataFilter())
+    errors = RecordingHandler(level=logging.ERROR)
+    isolated_logger.addHandler(handler)
+    isolated_logger.addHandler(errors)
+
+    async_logging.start([isolated_logger])
+    assert all(isinstance(h, AsyncQueueHandler) for h in isolated_logger.handlers)
+
+    payload = {"bid": 1.5}
+    isolated_logger.info("quote %s with password=%s", payload, "hunter2")
+    payload["bid"] = 9.9  # Mutated after the call; the message keeps the old value
+    isolated_logger.error("failed for %s", "SPY")
+    async_logging.stop()
+
+    assert handler.messages == [
+        "quote {'bid': 1.5} with password=[REDACTED_PASSWORD]",
+        "failed for SPY",
+    ]
+    assert errors.messages == ["failed for SPY"]
+    assert threading.get_ident() not in handler.threads
+    # Original handlers are restored
+    assert handler in isolated_logger.handlers
+    assert errors in isolated_logger.handlers
+    assert not any(isinstance(h, AsyncQueueHandler) for h in isolated_logger.handlers)
+
+
+def test_rate_limit_filter_samples_per_call_site(isolated_logger, monkeypatch):
+    handler = RecordingHandler()
+    isolated_logger.addHandler(handler)
+    rate_limit = RateLimitFilter(burst=2, interval=10)
+    isolated_logger.addFilter(rate_limit)
+
+    clock = [100.0]
+    monkeypatch.setattr("services.core.logging.time.monotonic", lambda: clock[0])
+
+    def tick(i):
+        isolated_logger.info("tick %d", i)
+
+    for i in range(5):
+        tick(i)
+    isolated_logger.warning("warnings always pass")
+    clock[0] += 10
+    tick(5)
+
+    assert handler.messages == [
+        "tick 0",
+        "tick 1",
+        "warnings always pass",
+        "tick 5 [3 similar records suppressed]",
+    ]
+
+
+def test_rate_limit_filter_prunes_expired_windows(isolated_logger, monkeypatch):
+    handler = RecordingHandler()
+    isolated_logger.addHandler(handler)
+    rate_limit = RateLimitFilter(burst=1, interval=10)
+    isolated_logger.addFilter(rate_limit)
+
+    clock = [100.0]
+    monkeypatch.setattr("services.core.logging.time.monotonic", lambda: clock[0])
+
+    def quiet_site():
+        isolated_logger.info("quiet")
+
+    def busy_site():
+        isolated_logger.info("busy")
+
+    quiet_site()
+    quiet_site()
+    busy_site()
+    clock[0] += 10
+    busy_site()
+
+    # The quiet call site's window expired and was dropped along with its
+    # suppressed count, which is never reported
+    assert len(rate_limit._windows) == 1
+    assert handler.messages == ["quiet", "busy", "busy"]
@@ -12,6 +12,7 @@ from django.utils import timezone
 
 import pytest
 
+from services.core.cache import CacheManager
 from services.market_data.service import MarketDataService
 from trading.models import MarketMetricsHistory
 
@@ -176,3 +177,53 @@ async def test_historical_volatility_extracted():
         assert metrics.hv_30_day == Decimal(
             "22.0"
         ), "HV should persist as 22.0 (SDK percentage format)"
+
+
+@pytest.mark.asyncio
+@pytest.mark.django_db
+async def test_market_metrics_many_batches_misses():
+    """Cache hits skip the API; misses are fetched in chunked multi-symbol calls."""
+    cache.clear()
+
+    def make_metrics(symbol, iv_rank):
+        metrics = MagicMock(spec=[])
+        metrics.symbol = symbol
+        metrics.tos_implied_volatility_index_rank = iv_rank
+        metrics.implied_volatility_percentile = 0.5
+        metrics.implied_volatility_30_day = 25.0
+        metrics.historical_volatility_30_day = 20.0
+        return metrics
+
+    async def fake_get_metrics(session, symbols):
+        return [make_metrics(symbol, 0.4) for symbol in symbols if symbol != "MISSING"]
+
+    mock_get_metrics = AsyncMock(side_effect=fake_get_metrics)
+
+    user = MagicMock()
+    user.id = 1
+    service = MarketDataService(user=user)
+    service._get_session = AsyncMock(return_value=AsyncMock())
+    cache.set(CacheManager.market_metrics("SPY"), {"symbol": "SPY", "iv_rank": 10.0})
+
+    with (
+        patch("tastytrade.metrics.a_get_market_metrics", mock_get_metrics),
+        patch("services.market_data.service.MARKET_METRICS_BATCH_SIZE", 2),
+    ):
+        result = await service.get_market_metrics_many(["SPY", "QQQ", "IWM", "DIA", "MISSING"])
+
+    assert list(result) == ["SPY", "QQQ", "IWM", "DIA"]
+    assert result["SPY"]["source"] == "cache"
+    assert result["QQQ"]["source"] == "tastytrade_api"
+    assert result["QQQ"]["iv_rank"] == pytest.approx(40.0)
+    assert [call.args[1] for call in mock_get_metrics.await_args_list] == [
+        ["QQQ", "IWM"],
+        ["DIA", "MISSING"],
+    ]
+
+    today = timezone.now().date()
+    persisted = [
+        row.symbol
+        async for row in MarketMetricsHistory.objects.filter(date=today).order_by("symbol")
+    ]
+    assert persisted == ["DIA", "IWM", "QQQ"]
+    assert cache.get(CacheManager.market_metrics("IWM"))["iv_rank"] == pytest.approx(40.0)
@@ -0,0 +1,130 @@
+"""Tests for the persist_greeks_from_cache Celery task."""
+
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+
+import pytest
+from tastytrade.instruments import Option
+
+from accounts.models import TradingAccount
+from services.core.cache import CacheManager
+from trading.models import HistoricalGreeks, Position
+from trading.tasks import _async_persist_greeks_from_cache
+
+User = get_user_model()
+
+SHORT_PUT = "SPY   251219P00500000"
+LONG_PUT = "SPY   251219P00495000"
+
+
+@pytest.fixture
+def open_spread(db):
+    """Two open positions sharing a leg, plus a closed one that must be ignored."""
+    cache.clear()
+    user = User.objects.create_user(
+        email="greeks@example.com", username="greeks_user", password="testpass123"
+    )
+    account = TradingAccount.objects.create(
+        user=user,
+        connection_type="TASTYTRADE",
+        account_number="GRK123",
+        is_primary=True,
+        is_active=True,
+    )
+    legs = [{"symbol": SHORT_PUT}, {"symbol": LONG_PUT}]
+    for state, position_legs in (
+        ("open_full", legs),
+        ("open_partial", legs[:1]),
+        ("closed", [{"symbol": "QQQ   251219P00400000"}]),
+    ):
+        Position.objects.create(
+            user=user,
+            trading_account=account,
+            symbol="SPY",
+            quantity=1,
+            lifecycle_state=state,
+            metadata={"legs": position_legs},
+        )
+    yield
+    cache.clear()
+
+
+def cache_greeks(occ_symbol: str, delta: float, updated_at: str, *, streamer: bool = True):
+    symbol = Option.occ_to_streamer_symbol(occ_symbol) if streamer else occ_symbol
+    cache.set(
+        CacheManager.dxfeed_greeks(symbol),
+        {"delta": delta, "gamma": 0.01, "theta": -0.05, "vega": 0.1, "updated_at": updated_at},
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+async def test_persists_changed_symbols_in_bulk(open_spread):
+    cache_greeks(SHORT_PUT, -0.30, "2025-11-01T14:30:00")
+    cache_greeks(LONG_PUT, -0.20, "2025-11-01T14:30:00", streamer=False)
+
+    summary = await _async_persist_greeks_from_cache()
+
+    assert summary["symbols_checked"] == 2
+    assert summary["records_persisted"] == 2
+    short_put = await HistoricalGreeks.objects.aget(option_symbol=SHORT_PUT)
+    assert short_put.delta == Decimal("-0.3000")
+    assert short_put.underlying_symbol == "SPY"
+    assert short_put.strike == Decimal("500.00")
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+async def test_skips_symbols_unchanged_since_last_snapshot(open_spread):
+    cache_greeks(SHORT_PUT, -0.30, "2025-11-01T14:30:00")
+    cache_greeks(LONG_PUT, -0.20, "2025-11-01T14:30:00")
+    await _async_persist_greeks_from_cache()
+
+    cache_greeks(SHORT_PUT, -0.35, "2025-11-01T14:35:00")
+    summary = await _async_persist_greeks_from_cache()
+
+    assert summary["records_persisted"] == 1
+    assert summary["symbols_unchanged"] == 1
+    assert await HistoricalGreeks.objects.filter(option_symbol=SHORT_PUT).acount() == 2
+    assert await HistoricalGreeks.objects.filter(option_symbol=LONG_PUT).acount() == 1
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+async def test_no_cached_greeks_persists_nothing(open_spread):
+    summary = await _async_persist_greeks_from_cache()
+
+    assert summary["status"] == "success"
+    assert summary["records_persisted"] == 0
+    assert await HistoricalGreeks.objects.acount() == 0
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.asyncio
+async def test_rows_already_stored_are_not_counted(open_spread):
+    now = datetime(2025, 11, 1, 19, 30, tzinfo=UTC)
+    await HistoricalGreeks.objects.acreate(
+        option_symbol=SHORT_PUT,
+        underlying_symbol="SPY",
+        timestamp=now,
+        delta=Decimal("-0.30"),
+        gamma=Decimal("0.01"),
+        theta=Decimal("-0.05"),
+        vega=Decimal("0.1"),
+        implied_volatility=Decimal("0.2"),
+        strike=Decimal("500.00"),
+        expiration_date=date(2025, 12, 19),
+        option_type="P",
+    )
+    cache_greeks(SHORT_PUT, -0.30, "2025-11-01T14:30:00")
+    cache_greeks(LONG_PUT, -0.20, "2025-11-01T14:30:00")
+
+    with patch("trading.tasks.timezone.now", return_value=now):
+        summary = await _async_persist_greeks_from_cache()
+
+    assert summary["records_persisted"] == 1
+    assert await HistoricalGreeks.objects.acount() == 2
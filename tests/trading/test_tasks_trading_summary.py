@@ -0,0 +1,37 @@
+"""Tests for the generate_trading_summary Celery task."""
+
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+
+import pytest
+
+from trading.tasks import generate_trading_summary
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+def test_failing_user_does_not_block_other_summaries():
+    User.objects.create_user(email="broken@example.com", username="broken", password="testpass123")
+    User.objects.create_user(email="active@example.com", username="active", password="testpass123")
+
+    def build_summary(user, today):
+        if user.username == "broken":
+            raise ValueError("bad position metadata")
+        return f"Summary for {user.username}"
+
+    with (
+        patch("trading.tasks._build_trading_summary", side_effect=build_summary),
+        patch(
+            "services.notifications.email.EmailService.send_batch",
+            return_value={"sent": 1, "failed": 0},
+        ) as send_batch,
+    ):
+        result = generate_trading_summary()
+
+    emails = send_batch.call_args.args[0]
+    assert [email["recipient"] for email in emails] == ["active@example.com"]
+    assert result["status"] == "success"
+    assert result["failed_users"] == 1
+    assert result["emails_sent"] == 1
@@ -262,6 +262,22 @@ async def check_streamer_readiness(request):
         )
 
 
+@login_required
+@require_http_methods(["GET"])
+async def get_streamer_subscriptions(request):
+    """
+    Live streaming subscriptions for the current user.
+    Returns per-symbol consumers, reference counts and event rates.
+    """
+    from streaming.services.stream_manager import GlobalStreamManager
+
+    user_id = await async_get_user_id(request)
+    stats = GlobalStreamManager.get_subscription_stats(user_id)
+    if stats is None:
+        return JsonResponse({"is_streaming": False, "subscribed": 0, "symbols": {}})
+    return JsonResponse(stats)
+
+
 # Dynamic Strategy API Endpoints
 
 
@@ -774,7 +790,8 @@ def sync_positions(request):
         from services.positions.sync import PositionSyncService
 
         service = PositionSyncService()
-        result = async_to_sync(service.sync_all_positions)(request.user)
+        # Explicit user request: always run the full sync
+        result = async_to_sync(service.sync_all_positions)(request.user, force=True)
 
         logger.info(f"Position sync result: {result}")
         return JsonResponse(result)
@@ -1176,14 +1193,9 @@ async def get_all_positions_greeks(request):
 
         from asgiref.sync import sync_to_async
 
+        # Fetch Greeks for all positions in one batch (5s cache, one leg read for misses)
         service = GreeksService()
-        result = {}
-
-        # Fetch Greeks for each position using cached service method
-        for position in positions:
-            greeks = await sync_to_async(service.get_position_greeks_cached)(position)
-            if greeks:
-                result[position.id] = greeks
+        result = await sync_to_async(service.get_greeks_for_positions_cached)(positions)
 
         return JsonResponse({"success": True, "positions": result, "count": len(result)})
 
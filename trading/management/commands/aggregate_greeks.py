@@ -0,0 +1,42 @@
+"""
+Roll HistoricalGreeks up to 1-minute / 5-minute resolution on demand.
+
+Usage:
+    # Estimate the pending work without writing anything
+    python manage.py aggregate_greeks --dry-run
+
+    # Roll up at most 10 day-sized chunks per step (resumes next run)
+    python manage.py aggregate_greeks --max-chunks=10
+"""
+
+from django.core.management.base import BaseCommand
+
+from trading.tasks import aggregate_historical_greeks
+
+
+class Command(BaseCommand):
+    help = "Aggregate HistoricalGreeks to progressive resolution (same as the nightly task)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only estimate rows, symbols and chunks pending for each step",
+        )
+        parser.add_argument(
+            "--max-chunks",
+            type=int,
+            default=None,
+            help="Stop each step after this many chunks; the next run resumes from the checkpoint",
+        )
+
+    def handle(self, *args, **options):  # noqa: ARG002
+        results = aggregate_historical_greeks(
+            dry_run=options["dry_run"], max_chunks=options["max_chunks"]
+        )
+
+        for step, result in results.items():
+            style = self.style.ERROR if result.get("status") == "error" else self.style.SUCCESS
+            self.stdout.write(style(step))
+            for key, value in result.items():
+                self.stdout.write(f"   {key.replace('_', ' ').title()}: {value}")
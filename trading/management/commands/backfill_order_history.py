@@ -130,7 +130,10 @@ class Command(AsyncCommand):
                     self.stdout.write(
                         f"\nSyncing order history for account {account.account_number}..."
                     )
-                    result = await service.sync_order_history(account, days_back=days_back)
+                    # Backfill covers the whole window, not just changes since the watermark
+                    result = await service.sync_order_history(
+                        account, days_back=days_back, full_resync=True
+                    )
                     self.stdout.write(
                         self.style.SUCCESS(
                             f"  Synced {result['orders_synced']} orders "
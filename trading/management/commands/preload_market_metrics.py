@@ -1,7 +1,3 @@
-import asyncio
-
-from tqdm import tqdm
-
 from services.management.utils import AsyncCommand, add_user_arguments, aget_user_from_options
 from services.market_data.service import MarketDataService
 
@@ -12,11 +8,9 @@ class Command(AsyncCommand):
     def add_arguments(self, parser):
         add_user_arguments(parser, required=False, allow_superuser_fallback=True)
         parser.add_argument("--symbols", nargs="+", default=["QQQ", "SPY"])
-        parser.add_argument("--delay", type=float, default=1.0)
 
     async def async_handle(self, *args, **options):
         symbols = options["symbols"]
-        delay = options["delay"]
 
         # Get user using utility function
         user = await aget_user_from_options(options, require_user=True)
@@ -25,22 +19,27 @@ class Command(AsyncCommand):
         self.stdout.write(f"Using user: {user.email}")
         self.stdout.write(self.style.WARNING("Note: TastyTrade API provides current metrics only."))
 
-        await self._preload_current_metrics(user, symbols, delay)
+        await self._preload_current_metrics(user, symbols)
 
-    async def _preload_current_metrics(self, user, symbols, delay):
+    async def _preload_current_metrics(self, user, symbols):
         service = MarketDataService(user=user)
 
-        for symbol in tqdm(symbols, desc="Loading metrics"):
-            try:
-                metrics = await service.get_market_metrics(symbol)
-                if metrics and metrics.get("iv_rank") is not None:
-                    self.stdout.write(
-                        self.style.SUCCESS(f"[OK] {symbol}: IV Rank {metrics['iv_rank']:.2f}")
-                    )
-                else:
-                    self.stdout.write(
-                        self.style.ERROR(f"[FAIL] {symbol}: Failed to fetch metrics or IV Rank is null.")
+        # One batched fetch (multi-symbol API calls) instead of a request per symbol
+        try:
+            metrics_by_symbol = await service.get_market_metrics_many(symbols)
+        except Exception as e:
+            self.stdout.write(self.style.ERROR(f"[FAIL] Batch fetch failed: {e}"))
+            return
+
+        for symbol in symbols:
+            metrics = metrics_by_symbol.get(symbol)
+            if metrics and metrics.get("iv_rank") is not None:
+                self.stdout.write(
+                    self.style.SUCCESS(f"[OK] {symbol}: IV Rank {metrics['iv_rank']:.2f}")
+                )
+            else:
+                self.stdout.write(
+                    self.style.ERROR(
+                        f"[FAIL] {symbol}: Failed to fetch metrics or IV Rank is null."
                     )
-                await asyncio.sleep(delay)  # Rate limiting
-            except Exception as e:
-                self.stdout.write(self.style.ERROR(f"[FAIL] {symbol}: {e}"))
+                )
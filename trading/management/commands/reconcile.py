@@ -22,6 +22,12 @@ Usage:
     # Specific position
     python manage.py reconcile --position=123
 
+    # Ignore sync watermarks and re-fetch the whole --days-back window
+    python manage.py reconcile --all --full-resync
+
+    # Reconcile users concurrently (phases pipelined per user)
+    python manage.py reconcile --all --concurrent --max-concurrent-users=4
+
     # Dry run mode (see what would change)
     python manage.py reconcile --user=user@example.com --dry-run
 
@@ -32,6 +38,7 @@ Usage:
 from django.contrib.auth import get_user_model
 from django.core.management.base import BaseCommand
 
+from services.core.constants import RECONCILIATION_MAX_CONCURRENT_USERS
 from services.core.utils.async_utils import run_async
 from services.reconciliation.orchestrator import (
     ReconciliationOptions,
@@ -99,6 +106,25 @@ class Command(BaseCommand):
             default=30,
             help="Days of order history to sync (default: 30)",
         )
+        parser.add_argument(
+            "--full-resync",
+            action="store_true",
+            help="Ignore sync watermarks and re-fetch orders/transactions for the whole window",
+        )
+        parser.add_argument(
+            "--concurrent",
+            action="store_true",
+            help="Pipeline phases per user and reconcile several users at once",
+        )
+        parser.add_argument(
+            "--max-concurrent-users",
+            type=int,
+            default=RECONCILIATION_MAX_CONCURRENT_USERS,
+            help=(
+                "Users reconciled at once with --concurrent "
+                f"(default: {RECONCILIATION_MAX_CONCURRENT_USERS})"
+            ),
+        )
 
         # Fix options
         parser.add_argument(
@@ -187,6 +213,11 @@ class Command(BaseCommand):
             cancel_orphaned_orders=options.get("cancel_orphaned", False),
             replace_cancelled_targets=options.get("replace_cancelled", False),
             days_back=options.get("days_back", 30),
+            full_resync=options.get("full_resync", False),
+            concurrent=options.get("concurrent", False),
+            max_concurrent_users=options.get(
+                "max_concurrent_users", RECONCILIATION_MAX_CONCURRENT_USERS
+            ),
             # Django's verbosity: 0=silent, 1=normal, 2+=verbose
             verbose=options.get("verbosity", 1) >= 2,
         )
@@ -256,6 +287,16 @@ class Command(BaseCommand):
                     for error in phase_result.errors[:5]:  # Show first 5 errors
                         self.stdout.write(f"      - {error}")
 
+        # Per-user timings (concurrent mode), slowest users first
+        if result.user_timings and options.get("verbosity", 1) >= 2:
+            self.stdout.write("\nPer-user timings:")
+            by_total = sorted(
+                result.user_timings.items(), key=lambda item: sum(item[1].values()), reverse=True
+            )
+            for user_id, timings in by_total:
+                phases = ", ".join(f"{phase}={seconds}s" for phase, seconds in timings.items())
+                self.stdout.write(f"   User {user_id}: {phases}")
+
         # Print summary
         self.stdout.write("\n" + "-" * 80)
         completed = len(result.phases_completed)
@@ -51,7 +51,7 @@ class Command(BaseCommand):
 
         self.stdout.write(f"\nUsers with summary preference: {users_wanting_summaries.count()}")
 
-        emails_sent = 0
+        emails = []
         users_with_activity = 0
 
         for user in users_wanting_summaries:
@@ -149,25 +149,21 @@ class Command(BaseCommand):
                 self.stdout.write(f"  {line}")
             self.stdout.write("  " + "-" * 70)
 
-            # Send email
-            self.stdout.write(f"\n  Sending email to {user.email}...")
-            try:
-                success = email_service.send_email(
-                    subject=f"Daily Trading Summary - {target_date.strftime('%b %d')}",
-                    body=email_body,
-                    recipient=user.email,
-                    fail_silently=False,
-                )
-                if success:
-                    emails_sent += 1
-                    self.stdout.write(self.style.SUCCESS("  Email sent successfully!"))
-                else:
-                    self.stderr.write(self.style.ERROR("  Email send returned False"))
-            except Exception as e:
-                self.stderr.write(self.style.ERROR(f"  Email send failed: {e}"))
-                import traceback
-
-                traceback.print_exc()
+            emails.append(
+                {
+                    "subject": f"Daily Trading Summary - {target_date.strftime('%b %d')}",
+                    "body": email_body,
+                    "recipient": user.email,
+                }
+            )
+
+        # Send all summaries over one reused SMTP connection
+        if emails:
+            self.stdout.write(f"\nSending {len(emails)} email(s)...")
+        delivery = email_service.send_batch(emails, fail_silently=True)
+        emails_sent = delivery["sent"]
+        if delivery["failed"]:
+            self.stderr.write(self.style.ERROR(f"  {delivery['failed']} email(s) failed to send"))
 
         # Summary
         self.stdout.write("\n" + "=" * 80)
@@ -0,0 +1,46 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0001_initial"),
+        ("trading", "0006_migrate_profit_target_spread_types"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BrokerSyncWatermark",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("stream", models.CharField(max_length=100)),
+                ("last_synced_at", models.DateTimeField(blank=True, null=True)),
+                ("last_transaction_id", models.BigIntegerField(blank=True, null=True)),
+                ("last_full_sync_at", models.DateTimeField(blank=True, null=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "trading_account",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="sync_watermarks",
+                        to="accounts.tradingaccount",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "broker_sync_watermarks",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("trading_account", "stream"),
+                        name="unique_sync_watermark_account_stream",
+                    )
+                ],
+            },
+        ),
+    ]
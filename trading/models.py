@@ -1017,6 +1017,46 @@ class TastyTradeTransaction(models.Model):
         return f"{action} {self.symbol} @ {self.executed_at}"
 
 
+class BrokerSyncWatermark(models.Model):
+    """
+    High-water mark for incremental broker syncs, one row per account and stream.
+
+    **Purpose:**
+    Routine order-history and transaction syncs fetch only what changed since
+    the last run instead of re-pulling the whole lookback window.
+
+    **Streams:**
+    - "orders": last_synced_at = newest PlacedOrder.updated_at seen
+    - "transactions:<types>": last_synced_at = newest executed_at seen,
+      last_transaction_id = highest transaction id seen
+
+    A full resync (explicit mode) ignores the watermark and rewrites it.
+    """
+
+    trading_account = models.ForeignKey(
+        "accounts.TradingAccount",
+        on_delete=models.CASCADE,
+        related_name="sync_watermarks",
+    )
+    stream = models.CharField(max_length=100)
+    last_synced_at = models.DateTimeField(null=True, blank=True)
+    last_transaction_id = models.BigIntegerField(null=True, blank=True)
+    last_full_sync_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = "broker_sync_watermarks"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["trading_account", "stream"],
+                name="unique_sync_watermark_account_stream",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.trading_account_id} {self.stream} @ {self.last_synced_at}"
+
+
 class TechnicalIndicatorCache(models.Model):
     """
     Cache for technical indicator calculations.
@@ -404,20 +404,6 @@ class AutomatedTradingService:
                 logger.error("User %s: Failed to start streaming for automation", user.id)
                 return None
 
-            # DATA FRESHNESS: Wait for streaming data to stabilize
-            # At market open (9:30-10:00 AM ET), DXFeed may have stale/wide spreads.
-            # Give the streaming pipeline time to receive and cache fresh quotes.
-            import asyncio
-
-            DATA_STABILIZATION_DELAY = 3  # seconds
-            logger.info(
-                "User %s: Waiting %.1f seconds for streaming data to stabilize...",
-                user.id,
-                DATA_STABILIZATION_DELAY,
-            )
-            await asyncio.sleep(DATA_STABILIZATION_DELAY)
-            logger.info("User %s: Data stabilization period complete, proceeding...", user.id)
-
             logger.info("User %s: Streaming ready, preparing suggestion context...", user.id)
             strategy = SenexTridentStrategy(user)
             context = await strategy.a_prepare_suggestion_context()
@@ -65,6 +65,8 @@ def batch_sync_data_task(self):
             sync_positions=True,
             reconcile_trades=True,
             fix_profit_targets=True,
+            # Pipeline users so one slow account doesn't push the run past its beat window
+            concurrent=True,
         )
 
         result = run_reconciliation_sync(options)
@@ -407,7 +409,7 @@ def cleanup_old_records_task():
 
 
 @shared_task
-def aggregate_historical_greeks():
+def aggregate_historical_greeks(dry_run: bool = False, max_chunks: int | None = None):
     """
     Aggregate HistoricalGreeks data to reduce storage with progressive resolution.
 
@@ -432,6 +434,10 @@ def aggregate_historical_greeks():
     - Old (indefinite @ 5min): ~28,470 rows/year
 
     Total: ~861K rows per symbol per year
+
+    Each step runs in day-sized chunks and resumes from its checkpoint, so a
+    run cut short by max_chunks (or a failure) continues where it stopped.
+    dry_run=True only reports the pending work.
     """
     from services.account.utils.greeks_aggregation import (
         aggregate_greeks_to_1min,
@@ -442,11 +448,11 @@ def aggregate_historical_greeks():
 
     # Step 1: Aggregate 30+ day old data to 1-minute resolution
     logger.info("Starting Greeks aggregation: 1-second → 1-minute (in-place)")
-    results["to_1min"] = aggregate_greeks_to_1min()
+    results["to_1min"] = aggregate_greeks_to_1min(dry_run=dry_run, max_chunks=max_chunks)
 
     # Step 2: Aggregate 1+ year old data to 5-minute resolution
     logger.info("Starting Greeks aggregation: 1-minute → 5-minute (in-place)")
-    results["to_5min"] = aggregate_greeks_to_5min()
+    results["to_5min"] = aggregate_greeks_to_5min(dry_run=dry_run, max_chunks=max_chunks)
 
     logger.info(f"Greeks aggregation complete: {results}")
     return results
@@ -460,37 +466,24 @@ def clear_expired_option_chains():
     Cache Bug 5 Fix: Option chain cache keys now include current date suffix.
     This task cleans up old caches to prevent unbounded Redis growth.
 
+    Keys are registered per day in a cache key family, so cleanup deletes
+    exactly yesterday's keys without walking the keyspace. Keys written
+    before the registry existed are left to expire on their own TTL.
+
     Runs daily at 12:05 AM to clear previous day's caches.
 
     Returns:
         dict: Cleanup statistics including keys deleted
     """
-    from datetime import date, timedelta
+    from datetime import timedelta
 
-    from django.core.cache import cache
+    from services.core.cache_index import invalidate_family
 
     try:
-        # Clear yesterday's and older caches
-        yesterday = date.today() - timedelta(days=1)
-        patterns = [
-            f"option_chain:*:*:{yesterday.isoformat()}",  # Specific expiration format
-            f"option_chain:full:*:{yesterday.isoformat()}",  # Full chain format
-        ]
+        # Clear yesterday's caches (keys are dated in the market timezone)
+        yesterday = timezone.localdate() - timedelta(days=1)
 
-        total_deleted = 0
-        for pattern in patterns:
-            try:
-                # Note: Redis keys() method - may need adjustment for non-Redis cache backends
-                keys = cache.keys(pattern) if hasattr(cache, "keys") else []
-                if keys:
-                    cache.delete_many(keys)
-                    deleted = len(keys)
-                    total_deleted += deleted
-                    logger.info(
-                        f"Cleared {deleted} expired option chain caches matching pattern: {pattern}"
-                    )
-            except Exception as e:
-                logger.error(f"Error clearing cache pattern {pattern}: {e}")
+        total_deleted = invalidate_family(CacheManager.option_chain_family(yesterday))
 
         result = {
             "status": "success",
@@ -521,7 +514,8 @@ def generate_trading_summary():
     - Profit targets filled today
     - Cancelled/rejected trades
 
-    Runs once per day 30 minutes after market close.
+    Runs once per day 30 minutes after market close. Summaries are built for
+    every user first, then sent as one batch over a single SMTP connection.
     """
     from services.notifications.email import EmailService
 
@@ -533,130 +527,36 @@ def generate_trading_summary():
         # Get users who want daily summaries
         users_wanting_summaries = User.objects.filter(preferences__email_preference="summary")
 
-        emails_sent = 0
+        emails = []
         users_with_activity = 0
+        failed_users = 0
 
         for user in users_wanting_summaries:
-            # Get today's trades for this user
-            todays_trades = Trade.objects.filter(
-                user=user, submitted_at__date=today
-            ).select_related("position")
-
-            # Categorize trades
-            new_positions = todays_trades.filter(trade_type="open", status="filled")
-            profit_targets = todays_trades.filter(trade_type="close", status="filled")
-            cancelled = todays_trades.filter(status__in=["cancelled", "rejected", "expired"])
-
-            # Skip users with no activity
-            if not (new_positions.exists() or profit_targets.exists() or cancelled.exists()):
+            try:
+                email_body = _build_trading_summary(user, today)
+            except Exception as e:
+                logger.error(f"User {user.id}: Error building trading summary: {e}", exc_info=True)
+                failed_users += 1
                 continue
 
-            users_with_activity += 1
+            if email_body is None:
+                continue
 
-            # Build email content
-            email_body = f"Daily Trading Summary - {today.strftime('%B %d, %Y')}\n\n"
-
-            # New positions section
-            if new_positions.exists():
-                email_body += f"NEW POSITIONS OPENED ({new_positions.count()})\n\n"
-                for trade in new_positions:
-                    pos = trade.position
-                    credit = trade.fill_price or "N/A"
-
-                    # Format strategy name
-                    strategy_display = pos.strategy_type.replace("_", " ").title()
-
-                    # Format expiration from metadata
-                    from datetime import datetime
-
-                    exp_str = pos.metadata.get("expiration", "Unknown")
-                    try:
-                        if exp_str != "Unknown":
-                            exp_dt = (
-                                datetime.fromisoformat(exp_str)
-                                if isinstance(exp_str, str)
-                                else exp_str
-                            )
-                            exp_date = exp_dt.strftime("%b %d, %Y")
-                        else:
-                            exp_date = "Unknown"
-                    except (ValueError, AttributeError):
-                        exp_date = "Unknown"
-
-                    # Position header
-                    email_body += f"{pos.symbol} {strategy_display} - Exp: {exp_date}\n"
-                    email_body += f"  Entry: ${credit} credit\n"
-
-                    # Show strike prices based on strategy
-                    strikes = []
-                    if pos.short_put_strike and pos.long_put_strike:
-                        put_str = f"{int(pos.short_put_strike)}/{int(pos.long_put_strike)}"
-                        # Check for double put spreads (Senex Trident)
-                        if pos.strategy_type == "senex_trident" and pos.put_spread_quantity == 2:
-                            put_str += " (2x)"
-                        strikes.append(f"Put Spread: {put_str}")
-
-                    if pos.short_call_strike and pos.long_call_strike:
-                        call_str = f"{int(pos.short_call_strike)}/{int(pos.long_call_strike)}"
-                        strikes.append(f"Call Spread: {call_str}")
-
-                    if strikes:
-                        email_body += f"  Strikes: {', '.join(strikes)}\n"
-
-                    # Show profit targets if created
-                    if pos.profit_targets_created and pos.profit_target_details:
-                        email_body += "  Profit Targets:\n"
-                        for spread_type, details in pos.profit_target_details.items():
-                            spread_label = spread_type.replace("_", " ").title()
-                            percent = details.get("percent", "N/A")
-                            price = details.get("target_price", "N/A")
-                            if isinstance(price, (int, float)):
-                                price = f"${price:.2f}"
-                            email_body += f"    • {spread_label}: {percent}% @ {price}\n"
-
-                    email_body += "\n"
-
-            # Profit targets section
-            if profit_targets.exists():
-                email_body += f"PROFIT TARGETS FILLED ({profit_targets.count()})\n\n"
-                for trade in profit_targets:
-                    pos = trade.position
-                    profit = trade.fill_price or "N/A"
-                    strategy_display = pos.strategy_type.replace("_", " ").title()
-
-                    email_body += f"{pos.symbol} {strategy_display}\n"
-                    email_body += f"  Closed @ ${profit}\n"
-
-                    # Show which spread if we have the info
-                    if trade.trade_type == "exit" and hasattr(trade, "notes") and trade.notes:
-                        email_body += f"  {trade.notes}\n"
-
-                    email_body += "\n"
-
-            # Cancelled/rejected section
-            if cancelled.exists():
-                email_body += f"CANCELLED/REJECTED ({cancelled.count()})\n\n"
-                for trade in cancelled:
-                    pos = trade.position
-                    strategy_display = pos.strategy_type.replace("_", " ").title()
-                    email_body += f"{pos.symbol} {strategy_display} - {trade.status}\n"
-                email_body += "\n"
-
-            email_body += f"\nView full details in your dashboard at {settings.APP_BASE_URL}"
-
-            # Send email
-            success = email_service.send_email(
-                subject=f"Daily Trading Summary - {today.strftime('%b %d')}",
-                body=email_body,
-                recipient=user.email,
-                fail_silently=True,
+            users_with_activity += 1
+            emails.append(
+                {
+                    "subject": f"Daily Trading Summary - {today.strftime('%b %d')}",
+                    "body": email_body,
+                    "recipient": user.email,
+                }
             )
-            if success:
-                emails_sent += 1
+
+        delivery = email_service.send_batch(emails, fail_silently=True)
+        emails_sent = delivery["sent"]
 
         logger.info(
             f"Daily trading summary: {emails_sent} emails sent to "
-            f"{users_with_activity} users with activity"
+            f"{users_with_activity} users with activity ({failed_users} users failed)"
         )
 
         return {
@@ -664,6 +564,8 @@ def generate_trading_summary():
             "date": today.isoformat(),
             "emails_sent": emails_sent,
             "users_with_activity": users_with_activity,
+            "failed_users": failed_users,
+            "delivery": delivery,
         }
 
     except Exception as e:
@@ -671,6 +573,114 @@ def generate_trading_summary():
         return {"status": "error", "message": str(e)}
 
 
+def _build_trading_summary(user, today) -> str | None:
+    """Build one user's daily summary body, or None when they had no activity."""
+    # Get today's trades for this user
+    todays_trades = Trade.objects.filter(user=user, submitted_at__date=today).select_related(
+        "position"
+    )
+
+    # Categorize trades
+    new_positions = todays_trades.filter(trade_type="open", status="filled")
+    profit_targets = todays_trades.filter(trade_type="close", status="filled")
+    cancelled = todays_trades.filter(status__in=["cancelled", "rejected", "expired"])
+
+    # Skip users with no activity
+    if not (new_positions.exists() or profit_targets.exists() or cancelled.exists()):
+        return None
+
+    # Build email content
+    email_body = f"Daily Trading Summary - {today.strftime('%B %d, %Y')}\n\n"
+
+    # New positions section
+    if new_positions.exists():
+        email_body += f"NEW POSITIONS OPENED ({new_positions.count()})\n\n"
+        for trade in new_positions:
+            pos = trade.position
+            credit = trade.fill_price or "N/A"
+
+            # Format strategy name
+            strategy_display = pos.strategy_type.replace("_", " ").title()
+
+            # Format expiration from metadata
+            from datetime import datetime
+
+            exp_str = pos.metadata.get("expiration", "Unknown")
+            try:
+                if exp_str != "Unknown":
+                    exp_dt = (
+                        datetime.fromisoformat(exp_str) if isinstance(exp_str, str) else exp_str
+                    )
+                    exp_date = exp_dt.strftime("%b %d, %Y")
+                else:
+                    exp_date = "Unknown"
+            except (ValueError, AttributeError):
+                exp_date = "Unknown"
+
+            # Position header
+            email_body += f"{pos.symbol} {strategy_display} - Exp: {exp_date}\n"
+            email_body += f"  Entry: ${credit} credit\n"
+
+            # Show strike prices based on strategy
+            strikes = []
+            if pos.short_put_strike and pos.long_put_strike:
+                put_str = f"{int(pos.short_put_strike)}/{int(pos.long_put_strike)}"
+                # Check for double put spreads (Senex Trident)
+                if pos.strategy_type == "senex_trident" and pos.put_spread_quantity == 2:
+                    put_str += " (2x)"
+                strikes.append(f"Put Spread: {put_str}")
+
+            if pos.short_call_strike and pos.long_call_strike:
+                call_str = f"{int(pos.short_call_strike)}/{int(pos.long_call_strike)}"
+                strikes.append(f"Call Spread: {call_str}")
+
+            if strikes:
+                email_body += f"  Strikes: {', '.join(strikes)}\n"
+
+            # Show profit targets if created
+            if pos.profit_targets_created and pos.profit_target_details:
+                email_body += "  Profit Targets:\n"
+                for spread_type, details in pos.profit_target_details.items():
+                    spread_label = spread_type.replace("_", " ").title()
+                    percent = details.get("percent", "N/A")
+                    price = details.get("target_price", "N/A")
+                    if isinstance(price, (int, float)):
+                        price = f"${price:.2f}"
+                    email_body += f"    • {spread_label}: {percent}% @ {price}\n"
+
+            email_body += "\n"
+
+    # Profit targets section
+    if profit_targets.exists():
+        email_body += f"PROFIT TARGETS FILLED ({profit_targets.count()})\n\n"
+        for trade in profit_targets:
+            pos = trade.position
+            profit = trade.fill_price or "N/A"
+            strategy_display = pos.strategy_type.replace("_", " ").title()
+
+            email_body += f"{pos.symbol} {strategy_display}\n"
+            email_body += f"  Closed @ ${profit}\n"
+
+            # Show which spread if we have the info
+            if trade.trade_type == "exit" and hasattr(trade, "notes") and trade.notes:
+                email_body += f"  {trade.notes}\n"
+
+            email_body += "\n"
+
+    # Cancelled/rejected section
+    if cancelled.exists():
+        email_body += f"CANCELLED/REJECTED ({cancelled.count()})\n\n"
+        for trade in cancelled:
+            pos = trade.position
+            strategy_display = pos.strategy_type.replace("_", " ").title()
+            email_body += f"{pos.symbol} {strategy_display} - {trade.status}\n"
+        email_body += "\n"
+
+    email_body += f"\nView full details in your dashboard at {settings.APP_BASE_URL}"
+
+    return email_body
+
+
 @shared_task
 @monitor_task
 def generate_and_email_daily_suggestions():
@@ -692,13 +702,19 @@ def generate_and_email_daily_suggestions():
 
 
 async def _async_generate_and_email_daily_suggestions():
-    """Async implementation of daily trade suggestion email task."""
-    from django.conf import settings
+    """
+    Async implementation of daily trade suggestion email task.
 
-    from services.notifications.email import EmailService
-    from services.strategies.selector import StrategySelector
+    Market analysis is the same for every user, so the union of all watchlists
+    is analyzed once up front into the shared MarketConditionReport cache; per-user
+    suggestion generation then fans out with SUGGESTION_USER_CONCURRENCY users at a time.
+    Rendered emails go onto an EmailDeliveryQueue, so sending (over reused SMTP
+    connections) never holds up the next user's generation.
+    """
+    import asyncio
 
-    email_service = EmailService()
+    from services.core.constants import SUGGESTION_USER_CONCURRENCY
+    from services.notifications.email import EmailDeliveryQueue
 
     logger.info("Starting daily trade suggestion email generation...")
 
@@ -713,136 +729,168 @@ async def _async_generate_and_email_daily_suggestions():
     logger.info(f"Found {len(eligible_users)} users opted-in for daily trade suggestions")
 
     results = {"emails_sent": 0, "failed": 0, "skipped": 0}
+    if not eligible_users:
+        return results
 
     # Initialize email builder
     email_builder = SuggestionEmailBuilder(base_url=settings.APP_BASE_URL)
 
-    for user in eligible_users:
-        logger.info(f"Generating suggestion for: {user.email}")
+    # All watchlists in one query; empty watchlists default to SPY
+    from trading.models import Watchlist
 
-        try:
-            # Get user's watchlist symbols (default to SPY if empty)
-            from trading.models import Watchlist
+    watchlists: dict[int, list[str]] = {}
+    watchlist_items = Watchlist.objects.filter(user__in=eligible_users).order_by("user_id", "order")
+    async for item in watchlist_items:
+        watchlists.setdefault(item.user_id, []).append(item.symbol)
 
-            watchlist_items = [
-                item async for item in Watchlist.objects.filter(user=user).order_by("order")
-            ]
+    all_symbols = list(
+        dict.fromkeys(
+            symbol for user in eligible_users for symbol in watchlists.get(user.id) or ["SPY"]
+        )
+    )
+    await _prefetch_market_reports(eligible_users[0], all_symbols)
 
-            selector = StrategySelector(user)
+    semaphore = asyncio.Semaphore(SUGGESTION_USER_CONCURRENCY)
 
-            # Initialize streaming for suggestion generation (matching automated cycle pattern)
-            from streaming.services.stream_manager import GlobalStreamManager
+    async with EmailDeliveryQueue() as outbox:
 
-            manager = await GlobalStreamManager.get_user_manager(user.id)
+        async def process_user(user):
+            async with semaphore:
+                return await _email_suggestions_for_user(
+                    user, watchlists.get(user.id, []), outbox, email_builder
+                )
 
-            # Get symbols for streaming initialization
-            stream_symbols = (
-                [item.symbol for item in watchlist_items] if watchlist_items else ["SPY"]
-            )
+        outcomes = await asyncio.gather(*(process_user(user) for user in eligible_users))
 
-            logger.info(f"User {user.id}: Starting streaming for {len(stream_symbols)} symbols...")
-            streaming_ready = await manager.ensure_streaming_for_automation(
-                stream_symbols
-            )  # Subscribe to ALL symbols
+    results["emails_sent"] = outbox.metrics.sent
+    results["failed"] = outcomes.count("failed") + outbox.metrics.failed
+    results["delivery"] = outbox.metrics.as_dict()
 
-            if not streaming_ready:
-                logger.error(
-                    f"User {user.id}: Failed to start streaming - skipping email generation"
-                )
-                results["failed"] += 1
-                continue
+    logger.info(
+        f"Daily suggestions complete. Sent: {results['emails_sent']}, "
+        f"Failed: {results['failed']}, Skipped: {results['skipped']}"
+    )
 
-            # Wait for data stabilization (matching automated cycle pattern)
-            import asyncio
+    return results
 
-            DATA_STABILIZATION_DELAY = 3
-            logger.info(
-                f"User {user.id}: Waiting {DATA_STABILIZATION_DELAY}s for streaming data..."
-            )
-            await asyncio.sleep(DATA_STABILIZATION_DELAY)
 
-            # Determine flow based on watchlist size
-            if not watchlist_items:
-                # Case 1: Empty watchlist → Default to SPY (backward compatibility)
-                symbol = "SPY"
-                logger.info(f"User {user.email} has empty watchlist, defaulting to SPY")
+async def _prefetch_market_reports(user, symbols: list[str]) -> None:
+    """
+    Analyze every symbol once into the shared report cache before per-user work.
 
-                # Single-symbol flow (all strategies, Senex excluded)
-                suggestions_list, global_context = await selector.a_select_top_suggestions(
-                    symbol=symbol, count=2, suggestion_mode=True  # Top 2 strategies
-                )
+    Indicators for all symbols are computed in one batch first, then streams
+    through one user's manager so quotes are live; failures only cost the
+    optimization (each user then computes on demand).
+    """
+    from services.market_data.analysis import MarketAnalyzer
+    from services.market_data.indicators import TechnicalIndicatorCalculator
+    from streaming.services.stream_manager import GlobalStreamManager
 
-                subject, body = email_builder.build_single_symbol_email(
-                    user=user, suggestions_list=suggestions_list, global_context=global_context
-                )
+    try:
+        await TechnicalIndicatorCalculator().a_calculate_indicators_many(user, symbols)
+    except Exception as e:
+        logger.warning(f"Indicator prefetch failed: {e}", exc_info=True)
 
-            elif len(watchlist_items) == 1:
-                # Case 2: Single symbol → Use original single-symbol flow
-                symbol = watchlist_items[0].symbol
-                logger.info(f"User {user.email} watchlist: single symbol {symbol}")
+    try:
+        manager = await GlobalStreamManager.get_user_manager(user.id)
+        if not await manager.ensure_streaming_for_automation(symbols):
+            logger.warning(f"User {user.id}: Streaming unavailable, skipping analysis prefetch")
+            return
 
-                suggestions_list, global_context = await selector.a_select_top_suggestions(
-                    symbol=symbol, count=2, suggestion_mode=True  # Top 2 strategies
-                )
+        logger.info(f"Prefetching market analysis for {len(symbols)} watchlist symbols")
+        await MarketAnalyzer(user).a_prefetch_market_conditions(symbols)
+    except Exception as e:
+        logger.warning(f"Market analysis prefetch failed: {e}", exc_info=True)
 
-                subject, body = email_builder.build_single_symbol_email(
-                    user=user, suggestions_list=suggestions_list, global_context=global_context
-                )
 
+async def _email_suggestions_for_user(user, watchlist: list[str], outbox, email_builder) -> str:
+    """
+    Generate one user's daily suggestion email and queue it for delivery.
+
+    Returns:
+        "queued", or "failed" if the email could not be generated
+    """
+    from services.strategies.selector import StrategySelector
+    from streaming.services.stream_manager import GlobalStreamManager
+
+    logger.info(f"Generating suggestion for: {user.email}")
+    manager = None
+
+    try:
+        selector = StrategySelector(user)
+
+        # Initialize streaming for suggestion generation (matching automated cycle pattern)
+        manager = await GlobalStreamManager.get_user_manager(user.id)
+
+        # Get symbols for streaming initialization
+        stream_symbols = watchlist or ["SPY"]
+
+        logger.info(f"User {user.id}: Starting streaming for {len(stream_symbols)} symbols...")
+        streaming_ready = await manager.ensure_streaming_for_automation(
+            stream_symbols
+        )  # Subscribe to ALL symbols
+
+        if not streaming_ready:
+            logger.error(f"User {user.id}: Failed to start streaming - skipping email generation")
+            return "failed"
+
+        # Determine flow based on watchlist size
+        if len(watchlist) <= 1:
+            # Empty watchlist → Default to SPY (backward compatibility)
+            # Single symbol → Use original single-symbol flow
+            symbol = watchlist[0] if watchlist else "SPY"
+            if watchlist:
+                logger.info(f"User {user.email} watchlist: single symbol {symbol}")
             else:
-                # Case 3: Multiple symbols → Use multi-symbol parallel flow
-                symbols = [item.symbol for item in watchlist_items]
-                logger.info(
-                    f"User {user.email} watchlist: {len(symbols)} symbols "
-                    f"({', '.join(symbols[:5])}{'...' if len(symbols) > 5 else ''})"
-                )
+                logger.info(f"User {user.email} has empty watchlist, defaulting to SPY")
 
-                # Process all symbols in parallel, get top candidates
-                result = await _process_symbols_parallel(selector, symbols)
-                candidates = result["candidates"]
-                failed_symbols = result["failed_symbols"]
-
-                # Build consolidated multi-symbol email
-                subject, body = email_builder.build_multi_symbol_email(
-                    user=user,
-                    candidates=candidates,
-                    failed_symbols=failed_symbols,
-                    watchlist=symbols,
-                )
+            # Single-symbol flow (all strategies, Senex excluded)
+            suggestions_list, global_context = await selector.a_select_top_suggestions(
+                symbol=symbol, count=2, suggestion_mode=True  # Top 2 strategies
+            )
 
-            # Send email
-            success = await email_service.asend_email(
-                subject=subject,
-                body=body,
-                recipient=user.email,
-                fail_silently=True,
+            subject, body = email_builder.build_single_symbol_email(
+                user=user, suggestions_list=suggestions_list, global_context=global_context
             )
 
-            if success:
-                results["emails_sent"] += 1
-                logger.info(f"Sent daily suggestion email to {user.email}")
+        else:
+            # Multiple symbols → Use multi-symbol parallel flow
+            symbols = watchlist
+            logger.info(
+                f"User {user.email} watchlist: {len(symbols)} symbols "
+                f"({', '.join(symbols[:5])}{'...' if len(symbols) > 5 else ''})"
+            )
 
-            # Clean up streaming (matching automated cycle pattern)
-            await manager.stop_streaming()
-            logger.info(f"User {user.id}: Streaming stopped after email generation")
+            # Process all symbols in parallel, get top candidates
+            result = await _process_symbols_parallel(selector, symbols)
+            candidates = result["candidates"]
+            failed_symbols = result["failed_symbols"]
 
-        except Exception as exc:
-            logger.error(f"Failed to send suggestion to {user.email}: {exc}", exc_info=True)
-            results["failed"] += 1
-            # Ensure streaming is stopped even on error
-            try:
-                if "manager" in locals():
-                    await manager.stop_streaming()
-            except Exception:
-                pass
-            continue
+            # Build consolidated multi-symbol email
+            subject, body = email_builder.build_multi_symbol_email(
+                user=user,
+                candidates=candidates,
+                failed_symbols=failed_symbols,
+                watchlist=symbols,
+            )
 
-    logger.info(
-        f"Daily suggestions complete. Sent: {results['emails_sent']}, "
-        f"Failed: {results['failed']}, Skipped: {results['skipped']}"
-    )
+        # Delivered by the outbox's workers; generation moves on to the next user
+        outbox.put(subject=subject, body=body, recipient=user.email)
+        logger.info(f"Queued daily suggestion email for {user.email}")
+        return "queued"
 
-    return results
+    except Exception as exc:
+        logger.error(f"Failed to generate suggestion for {user.email}: {exc}", exc_info=True)
+        return "failed"
+
+    finally:
+        # Clean up streaming (matching automated cycle pattern), even on error
+        if manager is not None:
+            try:
+                await manager.stop_streaming()
+                logger.info(f"User {user.id}: Streaming stopped after email generation")
+            except Exception as e:
+                logger.debug(f"User {user.id}: Error stopping streaming: {e}")
 
 
 async def _process_symbols_parallel(selector, symbols: list[str]) -> list[dict]:
@@ -972,6 +1020,9 @@ def automated_daily_trade_cycle():
 
 async def _async_automated_daily_trade_cycle():
     """Async implementation of automated daily trade cycle."""
+    import asyncio
+
+    from services.core.constants import SUGGESTION_USER_CONCURRENCY
     from trading.services.automated_trading_service import AutomatedTradingService
 
     logger.info("Starting automated daily trade cycle...")
@@ -990,15 +1041,27 @@ async def _async_automated_daily_trade_cycle():
     results = {"processed": 0, "succeeded": 0, "failed": 0, "skipped": 0}
     service = AutomatedTradingService()
 
-    for account in eligible_accounts:
+    # Accounts run concurrently; users analyzing the same symbol share one
+    # MarketConditionReport via the single-flight report cache
+    semaphore = asyncio.Semaphore(SUGGESTION_USER_CONCURRENCY)
+
+    async def process_account(account) -> dict | None:
         user = account.user
-        logger.info(f"Processing automated trade for: {user.email}")
+        async with semaphore:
+            logger.info(f"Processing automated trade for: {user.email}")
+            try:
+                # Use async version to stay in same event loop
+                return await service.a_process_account(account)
+            except Exception as exc:  # pragma: no cover - defensive logging
+                logger.error(f"Failed for {user.email}: {exc}", exc_info=True)
+                return None
+
+    account_results = await asyncio.gather(
+        *(process_account(account) for account in eligible_accounts)
+    )
 
-        try:
-            # Use async version to stay in same event loop
-            result = await service.a_process_account(account)
-        except Exception as exc:  # pragma: no cover - defensive logging
-            logger.error(f"Failed for {user.email}: {exc}", exc_info=True)
+    for result in account_results:
+        if result is None:
             results["failed"] += 1
             continue
 
@@ -1265,6 +1328,7 @@ def ensure_historical_data(self):
     - Fills gaps automatically using HistoricalDataProvider
     - Logs warnings if fetch fails (non-blocking)
     - Deduplicates symbols across users for efficiency
+    - Precomputes technical indicators for every symbol in one batch
 
     P1.2: Medium-duration task with 5min/10min timeout
     """
@@ -1323,6 +1387,20 @@ def ensure_historical_data(self):
             f"{results['symbols_failed']} failed"
         )
 
+        # Precompute tomorrow's indicator records from today's closing bars
+        try:
+            from services.market_data.indicators import TechnicalIndicatorCalculator
+
+            calculator = TechnicalIndicatorCalculator()
+            indicators = run_async(
+                calculator.a_calculate_indicators_many(None, sorted(all_symbols))
+            )
+            results["indicators_computed"] = sum(
+                1 for data in indicators.values() if data["data_available"]
+            )
+        except Exception as e:
+            logger.warning(f"Indicator precompute failed: {e}", exc_info=True)
+
         return results
 
     except Exception as e:
@@ -1381,93 +1459,134 @@ def persist_greeks_from_cache(self):
 
 
 async def _async_persist_greeks_from_cache():
-    """Async implementation of Greeks persistence from cache."""
+    """
+    Async implementation of Greeks persistence from cache.
+
+    Leg symbols come from a values-only query, all Greeks (OCC and streamer
+    key formats) plus the last-persisted markers are read with one get_many,
+    and only symbols whose cached updated_at moved since the last snapshot
+    are written, in a single bulk_create.
+    """
     from decimal import Decimal
 
     from django.core.cache import cache
 
+    from tastytrade.instruments import Option
+
+    from services.core.constants import GREEKS_PERSIST_MARKER_TTL, SYNC_BULK_BATCH_SIZE
+    from services.sdk.instruments import parse_occ_symbol
     from trading.models import HistoricalGreeks
 
     summary = {
         "status": "success",
         "symbols_checked": 0,
         "records_persisted": 0,
+        "symbols_unchanged": 0,
         "errors": [],
     }
 
     try:
-        # Get all active positions to know which Greeks to persist
-        active_positions = [
-            pos
-            async for pos in Position.objects.filter(
+        # Only the legs are needed, not full Position rows
+        legs_per_position = [
+            legs
+            async for legs in Position.objects.filter(
                 lifecycle_state__in=["open_full", "open_partial", "closing"]
-            ).select_related("user")
+            ).values_list("metadata__legs", flat=True)
         ]
 
-        logger.info(f"Checking Greeks for {len(active_positions)} active positions")
+        logger.info(f"Checking Greeks for {len(legs_per_position)} active positions")
 
         # Collect unique option symbols from all positions
-        option_symbols = set()
-        for position in active_positions:
-            if position.metadata and "legs" in position.metadata:
-                for leg in position.metadata["legs"]:
-                    option_symbol = leg.get("symbol")
-                    if option_symbol:
-                        option_symbols.add(option_symbol)
+        option_symbols = {
+            leg["symbol"]
+            for legs in legs_per_position
+            if isinstance(legs, list)
+            for leg in legs
+            if isinstance(leg, dict) and leg.get("symbol")
+        }
 
         summary["symbols_checked"] = len(option_symbols)
+        if not option_symbols:
+            return summary
 
-        # Persist Greeks for each option symbol
+        # Greeks are cached under the OCC symbol or the streamer symbol; read
+        # both formats and the last-persisted markers in one round trip
+        greeks_keys: dict[str, list[str]] = {}
+        marker_keys: dict[str, str] = {}
         for option_symbol in option_symbols:
+            keys = [CacheManager.dxfeed_greeks(option_symbol)]
             try:
-                # Try to get Greeks from cache (set by StreamManager)
-                greeks_data = cache.get(CacheManager.dxfeed_greeks(option_symbol))
-
-                if not greeks_data:
-                    # Try streamer format as fallback
-                    from tastytrade.instruments import Option
-
-                    try:
-                        streamer_symbol = Option.occ_to_streamer_symbol(option_symbol)
-                        greeks_data = cache.get(CacheManager.dxfeed_greeks(streamer_symbol))
-                    except Exception:
-                        pass
-
-                if greeks_data:
-                    # Parse option symbol to extract components
-                    from services.sdk.instruments import parse_occ_symbol
+                keys.append(CacheManager.dxfeed_greeks(Option.occ_to_streamer_symbol(option_symbol)))
+            except Exception:
+                logger.debug(f"No streamer symbol for {option_symbol}, using OCC key only")
+            greeks_keys[option_symbol] = keys
+            marker_keys[option_symbol] = CacheManager.greeks_persisted_at(option_symbol)
+
+        all_keys = [key for keys in greeks_keys.values() for key in keys]
+        cached = cache.get_many([*all_keys, *marker_keys.values()])
+
+        now = timezone.now()
+        records = []
+        new_markers = {}
+        for option_symbol, keys in greeks_keys.items():
+            greeks_data = next((cached[key] for key in keys if cached.get(key)), None)
+            if not greeks_data:
+                continue
 
-                    parsed = parse_occ_symbol(option_symbol)
+            updated_at = greeks_data.get("updated_at")
+            marker_key = marker_keys[option_symbol]
+            if updated_at and cached.get(marker_key) == updated_at:
+                summary["symbols_unchanged"] += 1
+                continue
 
-                    # Create or update historical record
-                    await HistoricalGreeks.objects.aupdate_or_create(
+            try:
+                parsed = parse_occ_symbol(option_symbol)
+                records.append(
+                    HistoricalGreeks(
                         option_symbol=option_symbol,
-                        timestamp=timezone.now(),
-                        defaults={
-                            "underlying_symbol": parsed["underlying"],
-                            "delta": Decimal(str(greeks_data.get("delta", 0))),
-                            "gamma": Decimal(str(greeks_data.get("gamma", 0))),
-                            "theta": Decimal(str(greeks_data.get("theta", 0))),
-                            "vega": Decimal(str(greeks_data.get("vega", 0))),
-                            "rho": Decimal(str(greeks_data.get("rho", 0))),
-                            "implied_volatility": Decimal(
-                                str(greeks_data.get("implied_volatility", 0))
-                            ),
-                            "strike": parsed["strike"],
-                            "expiration_date": parsed["expiration"],
-                            "option_type": parsed["option_type"],
-                        },
+                        timestamp=now,
+                        underlying_symbol=parsed["underlying"],
+                        delta=Decimal(str(greeks_data.get("delta", 0))),
+                        gamma=Decimal(str(greeks_data.get("gamma", 0))),
+                        theta=Decimal(str(greeks_data.get("theta", 0))),
+                        vega=Decimal(str(greeks_data.get("vega", 0))),
+                        rho=Decimal(str(greeks_data.get("rho", 0))),
+                        implied_volatility=Decimal(str(greeks_data.get("implied_volatility", 0))),
+                        strike=parsed["strike"],
+                        expiration_date=parsed["expiration"],
+                        option_type=parsed["option_type"],
                     )
-
-                    summary["records_persisted"] += 1
-
+                )
             except Exception as e:
                 logger.warning(f"Failed to persist Greeks for {option_symbol}: {e}")
                 summary["errors"].append({"symbol": option_symbol, "error": str(e)})
+                continue
+
+            if updated_at:
+                new_markers[marker_key] = updated_at
+
+        if records:
+            # (option_symbol, timestamp) is unique; rows already stored at this
+            # timestamp are skipped so the summary counts only new rows
+            existing = {
+                option_symbol
+                async for option_symbol in HistoricalGreeks.objects.filter(
+                    option_symbol__in=[record.option_symbol for record in records],
+                    timestamp=now,
+                ).values_list("option_symbol", flat=True)
+            }
+            records = [record for record in records if record.option_symbol not in existing]
+            # ignore_conflicts still covers a concurrent run inserting the same rows
+            await HistoricalGreeks.objects.abulk_create(
+                records, batch_size=SYNC_BULK_BATCH_SIZE, ignore_conflicts=True
+            )
+            cache.set_many(new_markers, GREEKS_PERSIST_MARKER_TTL)
+            summary["records_persisted"] = len(records)
 
         logger.info(
             f"Greeks persistence complete: {summary['records_persisted']} records "
-            f"persisted from {summary['symbols_checked']} symbols"
+            f"persisted from {summary['symbols_checked']} symbols "
+            f"({summary['symbols_unchanged']} unchanged)"
         )
 
         return summary
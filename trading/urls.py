@@ -16,6 +16,11 @@ urlpatterns = [
     path("api/risk-budget/", api_views.get_risk_budget, name="api_risk_budget"),
     path("api/validate-trade-risk/", api_views.validate_trade_risk, name="api_validate_trade_risk"),
     path("api/streamer/status/", api_views.check_streamer_readiness, name="streamer_status"),
+    path(
+        "api/streamer/subscriptions/",
+        api_views.get_streamer_subscriptions,
+        name="streamer_subscriptions",
+    ),
     path("api/risk-settings/", api_views.save_risk_settings, name="api_risk_settings"),
     # Strategy Selector API endpoints
     path("api/suggestions/auto/", api_views.generate_suggestion_auto, name="api_suggestions_auto"),